@@ -17,7 +17,8 @@ from enum import Enum
 class BasePairsTradingAlphaModel(AlphaModel):
     '''This alpha model is designed to accept every possible pair combination
     from securities selected by the universe selection model
-    This model generates alternating long ratio/short ratio insights emitted as a group'''
+    This model generates alternating long ratio/short ratio insights emitted as a group
+    The pairs are tested when their last security is added and their state is kept in numpy arrays, updated once per slice'''
 
     def __init__(self, lookback = 1,
             resolution = Resolution.Daily,
@@ -32,8 +33,10 @@ class BasePairsTradingAlphaModel(AlphaModel):
         self.threshold = threshold
         self.predictionInterval = Time.Multiply(Extensions.ToTimeSpan(self.resolution), self.lookback)
 
-        self.pairs = dict()
+        self.pairs = self.Pairs(self.predictionInterval, self.threshold)
         self.Securities = list()
+        # the symbols whose pairs were tested, with their sort key
+        self.sortKeyBySymbol = dict()
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         self.Name = f'{self.__class__.__name__}({self.lookback},{resolutionString},{Extensions.NormalizeToStr(threshold)})'
@@ -47,12 +50,7 @@ class BasePairsTradingAlphaModel(AlphaModel):
             data: The new data available
         Returns:
             The new insights generated'''
-        insights = []
-
-        for key, pair in self.pairs.items():
-            insights.extend(pair.GetInsightGroup())
-
-        return insights
+        return self.pairs.Update(data)
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
@@ -67,35 +65,50 @@ class BasePairsTradingAlphaModel(AlphaModel):
             if security in self.Securities:
                 self.Securities.remove(security)
 
-        self.UpdatePairs(algorithm)
-
-        for security in changes.RemovedSecurities:
-            keys = [k for k in self.pairs.keys() if security.Symbol in k]
+        removedSymbols = set(x.Symbol for x in changes.RemovedSecurities)
+        self.UpdatePairs(algorithm, [x.Symbol for x in changes.AddedSecurities if x.Symbol not in removedSymbols])
 
-            for key in keys:
-                self.pairs.pop(key)
+        for symbol in removedSymbols:
+            self.sortKeyBySymbol.pop(symbol, None)
+            self.pairs.RemoveSymbol(symbol)
 
-    def UpdatePairs(self, algorithm):
-
-        symbols = sorted([x.Symbol for x in self.Securities], key=lambda x: str(x.ID))
+    def UpdatePairs(self, algorithm, addedSymbols):
+        '''Tests the pairs of the added symbols with the symbols of the model, so each pair is tested once, when its last symbol is added
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            addedSymbols: The symbols of the added securities'''
+        symbols = list(self.sortKeyBySymbol)
 
-        for i in range(0, len(symbols)):
-            asset_i = symbols[i]
+        for symbol in addedSymbols:
+            if symbol in self.sortKeyBySymbol:
+                continue
+            self.sortKeyBySymbol[symbol] = str(symbol.ID)
 
-            for j in range(1 + i, len(symbols)):
-                asset_j = symbols[j]
+            for other in symbols:
+                self.TestPair(algorithm, symbol, other)
+            symbols.append(symbol)
 
-                pair_symbol = (asset_i, asset_j)
-                invert = (asset_j, asset_i)
+    def TestPair(self, algorithm, asset1, asset2):
+        '''Creates the pair of the assets if it doesn't exist and it passes the pairs trading test.
+        The assets of a pair are ordered by their security identifier, and both must be securities of the model
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            asset1: The first asset's symbol in the pair
+            asset2: The second asset's symbol in the pair'''
+        sortKey1 = self.sortKeyBySymbol.get(asset1)
+        sortKey2 = self.sortKeyBySymbol.get(asset2)
+        if sortKey1 is None or sortKey2 is None:
+            return
+        if sortKey2 < sortKey1:
+            asset1, asset2 = asset2, asset1
 
-                if pair_symbol in self.pairs or invert in self.pairs:
-                    continue
+        if (asset1, asset2) in self.pairs:
+            return
 
-                if not self.HasPassedTest(algorithm, asset_i, asset_j):
-                    continue
+        if not self.HasPassedTest(algorithm, asset1, asset2):
+            return
 
-                pair = self.Pair(algorithm, asset_i, asset_j, self.predictionInterval, self.threshold)
-                self.pairs[pair_symbol] = pair
+        self.pairs.Add(asset1, asset2)
 
     def HasPassedTest(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
@@ -107,68 +120,167 @@ class BasePairsTradingAlphaModel(AlphaModel):
             True if the statistical test for the pair is successful'''
         return True
 
-    class Pair:
+    class Pairs:
+        '''The pairs and their state in numpy arrays, one element per pair.
+        The ratio of the prices of a pair is updated once both prices were updated since its previous update,
+        and its mean is an exponential moving average of the ratio. Removing a pair moves the last pair to its position'''
 
         class State(Enum):
             ShortRatio = -1
             FlatRatio = 0
             LongRatio = 1
 
-        def __init__(self, algorithm, asset1, asset2, predictionInterval, threshold):
-            '''Create a new pair
+        def __init__(self, predictionInterval, threshold, period = 500):
+            '''Create the pairs
             Args:
-                algorithm: The algorithm instance that experienced the change in securities
-                asset1: The first asset's symbol in the pair
-                asset2: The second asset's symbol in the pair
                 predictionInterval: Period over which this insight is expected to come to fruition
-                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight'''
-            self.state = self.State.FlatRatio
-
-            self.asset1 = asset1
-            self.asset2 = asset2
-
-            self.asset1Price = algorithm.Identity(asset1)
-            self.asset2Price = algorithm.Identity(asset2)
-
-            self.ratio = IndicatorExtensions.Over(self.asset1Price, self.asset2Price)
-            self.mean = IndicatorExtensions.Of(ExponentialMovingAverage(500), self.ratio)
-
-            upper = ConstantIndicator[IndicatorDataPoint]("ct", 1 + threshold / 100)
-            self.upperThreshold = IndicatorExtensions.Times(self.mean, upper)
-
-            lower = ConstantIndicator[IndicatorDataPoint]("ct", 1 - threshold / 100)
-            self.lowerThreshold = IndicatorExtensions.Times(self.mean, lower)
-
+                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
+                period: The period of the exponential moving average of the ratio'''
             self.predictionInterval = predictionInterval
-
-        def GetInsightGroup(self):
-            '''Gets the insights group for the pair
+            self.upperThreshold = 1 + threshold / 100
+            self.lowerThreshold = 1 - threshold / 100
+            self.period = period
+            self.smoothingFactor = 2 / (period + 1)
+
+            # the securities of the pairs, a slot is reused once its security has no pair
+            self.slotBySymbol = {}
+            self.freeSlots = []
+            self.prices = np.zeros(8)
+
+            self.keys = []
+            self.positionByKey = {}
+            self.keysBySymbol = {}
+            self.slots = np.zeros((8, 2), dtype = int)
+            self.pending = np.zeros((8, 2), dtype = bool)
+            self.ratio = np.zeros(8)
+            self.mean = np.zeros(8)
+            self.samples = np.zeros(8, dtype = int)
+            self.state = np.zeros(8, dtype = np.int8)
+
+        def __contains__(self, key):
+            return key in self.positionByKey
+
+        def __iter__(self):
+            return iter(self.keys)
+
+        def __len__(self):
+            return len(self.keys)
+
+        def Add(self, asset1, asset2):
+            '''Adds the (asset1, asset2) pair'''
+            position = len(self.keys)
+            if position == len(self.ratio):
+                for name in ['slots', 'pending', 'ratio', 'mean', 'samples', 'state']:
+                    array = getattr(self, name)
+                    setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+
+            key = (asset1, asset2)
+            self.keys.append(key)
+            self.positionByKey[key] = position
+            self.slots[position] = [self.get_slot(asset1), self.get_slot(asset2)]
+            self.pending[position] = False
+            self.ratio[position] = 0
+            self.mean[position] = 0
+            self.samples[position] = 0
+            self.state[position] = self.State.FlatRatio.value
+            for symbol in key:
+                self.keysBySymbol.setdefault(symbol, set()).add(key)
+
+        def Remove(self, key):
+            '''Removes the pair'''
+            position = self.positionByKey.pop(key, None)
+            if position is None:
+                return
+
+            last = len(self.keys) - 1
+            if position != last:
+                for array in [self.slots, self.pending, self.ratio, self.mean, self.samples, self.state]:
+                    array[position] = array[last]
+                self.keys[position] = self.keys[last]
+                self.positionByKey[self.keys[position]] = position
+            self.keys.pop()
+
+            for symbol in key:
+                keys = self.keysBySymbol[symbol]
+                keys.discard(key)
+                if not keys:
+                    del self.keysBySymbol[symbol]
+                    self.freeSlots.append(self.slotBySymbol.pop(symbol))
+
+        def RemoveSymbol(self, symbol):
+            '''Removes the pairs of the symbol'''
+            for key in list(self.keysBySymbol.get(symbol, [])):
+                self.Remove(key)
+
+        def Update(self, data):
+            '''Updates the prices of the securities in the slice, then the ratio and mean of the pairs, and gets the insights of their signals
+            Args:
+                data: The new data available
             Returns:
-                Insights grouped by an unique group id'''
-
-            if not self.mean.IsReady:
+                Insights grouped by an unique group id for each pair with a new signal'''
+            count = len(self.keys)
+            if count == 0:
                 return []
 
-            # don't re-emit the same direction
-            if self.state is not self.State.LongRatio and self.ratio > self.upperThreshold:
-                self.state = self.State.LongRatio
-
-                # asset1/asset2 is more than 2 std away from mean, short asset1, long asset2
-                shortAsset1 = Insight.Price(self.asset1, self.predictionInterval, InsightDirection.Down)
-                longAsset2 = Insight.Price(self.asset2, self.predictionInterval, InsightDirection.Up)
-
-                # creates a group id and set the GroupId property on each insight object
-                return Insight.Group(shortAsset1, longAsset2)
+            updated = np.zeros(len(self.prices), dtype = bool)
+            for symbol, slot in self.slotBySymbol.items():
+                if data.ContainsKey(symbol):
+                    self.prices[slot] = float(data[symbol].Value)
+                    updated[slot] = True
+
+            slots = self.slots[:count]
+            pending = self.pending[:count]
+            pending |= updated[slots]
+            ready = pending[:, 0] & pending[:, 1]
+            pending[ready] = False
+
+            # a zero price doesn't update the ratio
+            denominator = self.prices[slots[:, 1]]
+            positions = np.flatnonzero(ready & (denominator != 0))
+            if len(positions) > 0:
+                ratio = self.prices[slots[positions, 0]] / denominator[positions]
+                self.ratio[positions] = ratio
+                self.samples[positions] += 1
+                first = self.samples[positions] == 1
+                self.mean[positions] = np.where(first, ratio, ratio * self.smoothingFactor + self.mean[positions] * (1 - self.smoothingFactor))
+
+            ratio = self.ratio[:count]
+            mean = self.mean[:count]
+            state = self.state[:count]
+            isReady = self.samples[:count] >= self.period
 
             # don't re-emit the same direction
-            if self.state is not self.State.ShortRatio and self.ratio < self.lowerThreshold:
-                self.state = self.State.ShortRatio
-
-                # asset1/asset2 is less than 2 std away from mean, long asset1, short asset2
-                longAsset1 = Insight.Price(self.asset1, self.predictionInterval, InsightDirection.Up)
-                shortAsset2 = Insight.Price(self.asset2, self.predictionInterval, InsightDirection.Down)
-
-                # creates a group id and set the GroupId property on each insight object
-                return Insight.Group(longAsset1, shortAsset2)
-
-            return []
+            longRatio = isReady & (state != self.State.LongRatio.value) & (ratio > mean * self.upperThreshold)
+            shortRatio = isReady & ~longRatio & (state != self.State.ShortRatio.value) & (ratio < mean * self.lowerThreshold)
+            state[longRatio] = self.State.LongRatio.value
+            state[shortRatio] = self.State.ShortRatio.value
+
+            insights = []
+            for position in np.flatnonzero(longRatio | shortRatio):
+                asset1, asset2 = self.keys[position]
+                if longRatio[position]:
+                    # asset1/asset2 is more than 2 std away from mean, short asset1, long asset2
+                    insights.extend(Insight.Group(
+                        Insight.Price(asset1, self.predictionInterval, InsightDirection.Down),
+                        Insight.Price(asset2, self.predictionInterval, InsightDirection.Up)))
+                else:
+                    # asset1/asset2 is less than 2 std away from mean, long asset1, short asset2
+                    insights.extend(Insight.Group(
+                        Insight.Price(asset1, self.predictionInterval, InsightDirection.Up),
+                        Insight.Price(asset2, self.predictionInterval, InsightDirection.Down)))
+
+            return insights
+
+        def get_slot(self, symbol):
+            '''Gets the slot of the price of the symbol, adding it if needed'''
+            slot = self.slotBySymbol.get(symbol)
+            if slot is None:
+                if self.freeSlots:
+                    slot = self.freeSlots.pop()
+                else:
+                    slot = len(self.slotBySymbol)
+                    if slot == len(self.prices):
+                        self.prices = np.concatenate([self.prices, np.zeros_like(self.prices)])
+                self.slotBySymbol[symbol] = slot
+                self.prices[slot] = 0
+            return slot
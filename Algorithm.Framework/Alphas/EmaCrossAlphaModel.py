@@ -12,8 +12,9 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorThresholdAlphaModel import IndicatorThresholdAlphaModel
 
-class EmaCrossAlphaModel(AlphaModel):
+class EmaCrossAlphaModel(IndicatorThresholdAlphaModel):
     '''Alpha model that uses an EMA cross to create insights'''
 
     def __init__(self,
@@ -29,34 +30,23 @@ class EmaCrossAlphaModel(AlphaModel):
         self.resolution = resolution
         self.predictionInterval = Time.Multiply(Extensions.ToTimeSpan(resolution), fastPeriod)
         self.symbolDataBySymbol = {}
+        # the state of a symbol is 1 if the fast is above the slow, otherwise 0.
+        # This is used to prevent emitting the same signal repeatedly
+        super().__init__(2, 0, self.predictionInterval)
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         self.Name = '{}({},{},{})'.format(self.__class__.__name__, fastPeriod, slowPeriod, resolutionString)
 
+    def GetStates(self, values, isReady, states):
+        '''Emits a Down insight when the slow crosses above the fast and an Up insight when the fast crosses above the slow,
+        once both are ready'''
+        fast = values[:, 0]
+        slow = values[:, 1]
+        isReady = isReady.all(axis = 1)
 
-    def Update(self, algorithm, data):
-        '''Updates this alpha model with the latest data from the algorithm.
-        This is called each time the algorithm receives data for subscribed securities
-        Args:
-            algorithm: The algorithm instance
-            data: The new data available
-        Returns:
-            The new insights generated'''
-        insights = []
-        for symbol, symbolData in self.symbolDataBySymbol.items():
-            if symbolData.Fast.IsReady and symbolData.Slow.IsReady:
-
-                if symbolData.FastIsOverSlow:
-                    if symbolData.Slow > symbolData.Fast:
-                        insights.append(Insight.Price(symbolData.Symbol, self.predictionInterval, InsightDirection.Down))
-
-                elif symbolData.SlowIsOverFast:
-                    if symbolData.Fast > symbolData.Slow:
-                        insights.append(Insight.Price(symbolData.Symbol, self.predictionInterval, InsightDirection.Up))
-
-            symbolData.FastIsOverSlow = symbolData.Fast > symbolData.Slow
-
-        return insights
+        down = isReady & (states == 1) & (slow > fast)
+        up = isReady & (states == 0) & (fast > slow)
+        return (fast > slow).astype(int), down | up, np.where(down, -1, 1)
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
@@ -68,16 +58,19 @@ class EmaCrossAlphaModel(AlphaModel):
             if symbolData is None:
                 symbolData = SymbolData(added, self.fastPeriod, self.slowPeriod, algorithm, self.resolution)
                 self.symbolDataBySymbol[added.Symbol] = symbolData
+                self.AddSymbol(added.Symbol, symbolData.Fast, symbolData.Slow)
             else:
                 # a security that was already initialized was re-added, reset the indicators
                 symbolData.Fast.Reset()
                 symbolData.Slow.Reset()
+                self.RefreshValues(added.Symbol)
 
         for removed in changes.RemovedSecurities:
             data = self.symbolDataBySymbol.pop(removed.Symbol, None)
             if data is not None:
                 # clean up our consolidators
                 data.RemoveConsolidators()
+                self.RemoveSymbol(removed.Symbol)
 
 
 class SymbolData:
@@ -103,14 +96,6 @@ class SymbolData:
         algorithm.WarmUpIndicator(security.Symbol, self.Fast, resolution);
         algorithm.WarmUpIndicator(security.Symbol, self.Slow, resolution);
 
-        # True if the fast is above the slow, otherwise false.
-        # This is used to prevent emitting the same signal repeatedly
-        self.FastIsOverSlow = False
-        
     def RemoveConsolidators(self):
         self.algorithm.SubscriptionManager.RemoveConsolidator(self.Security.Symbol, self.FastConsolidator)
         self.algorithm.SubscriptionManager.RemoveConsolidator(self.Security.Symbol, self.SlowConsolidator)
-
-    @property
-    def SlowIsOverFast(self):
-        return not self.FastIsOverSlow
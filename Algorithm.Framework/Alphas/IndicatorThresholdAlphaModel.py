@@ -0,0 +1,149 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+class IndicatorThresholdAlphaModel(AlphaModel):
+    '''Base class of the alpha models that emit an insight when the indicator values of a symbol cross thresholds,
+    with a state per symbol that prevents emitting the same signal repeatedly.
+    The values of each symbol are written in numpy arrays when its indicators are updated, and Update applies
+    the state machine of the model, GetStates, as array operations to the symbols with new values only.
+    The state machine must give the same state when it's applied again to the same values'''
+
+    def __init__(self, valueCount, initialState, insightPeriod):
+        '''Initializes a new instance of the IndicatorThresholdAlphaModel class
+        Args:
+            valueCount: The number of values of each symbol
+            initialState: The state of an added symbol
+            insightPeriod: The period of the insights'''
+        self.valueCount = valueCount
+        self.initialState = initialState
+        self.insightPeriod = insightPeriod
+        self.directionByValue = { 1: InsightDirection.Up, 0: InsightDirection.Flat, -1: InsightDirection.Down }
+
+        # each symbol has a slot in the arrays, a slot is reused once its symbol is removed
+        self.slotBySymbol = {}
+        self.symbols = []
+        self.freeSlots = []
+        self.handlersBySymbol = {}
+        self.values = np.zeros((8, valueCount))
+        self.isReady = np.zeros((8, valueCount), dtype = bool)
+        self.states = np.full(8, initialState, dtype = int)
+        self.updated = np.zeros(8, dtype = bool)
+
+    def Update(self, algorithm, data):
+        '''Updates this alpha model with the latest data from the algorithm.
+        This is called each time the algorithm receives data for subscribed securities
+        Args:
+            algorithm: The algorithm instance
+            data: The new data available
+        Returns:
+            The new insights generated'''
+        slots = np.flatnonzero(self.updated)
+        if len(slots) == 0:
+            return []
+        self.updated[slots] = False
+
+        states, emit, directions = self.GetStates(self.values[slots], self.isReady[slots], self.states[slots])
+        self.states[slots] = states
+
+        return [Insight.Price(self.symbols[slot], self.insightPeriod, self.directionByValue[direction])
+                for slot, direction in zip(slots[emit], directions[emit].tolist())]
+
+    def GetStates(self, values, isReady, states):
+        '''Applies the state machine of the model to the symbols with new values
+        Args:
+            values: The values of the symbols (size: N x valueCount)
+            isReady: True for the values of the indicators that are ready (size: N x valueCount)
+            states: The current states of the symbols (size: N)
+        Returns:
+            The new states of the symbols, True for the symbols that emit an insight,
+            and the directions of the insights, 1 for Up, 0 for Flat and -1 for Down (size: N each)'''
+        raise NotImplementedError("IndicatorThresholdAlphaModel.GetStates must be implemented")
+
+    def AddSymbol(self, symbol, *indicators):
+        '''Adds the symbol with one indicator per value, the value of an indicator is written when it's updated.
+        The values without an indicator are written with SetValue. The symbol is evaluated at the next update
+        Args:
+            symbol: The symbol to add
+            indicators: The indicators of the first values of the symbol'''
+        self.RemoveSymbol(symbol)
+
+        if self.freeSlots:
+            slot = self.freeSlots.pop()
+            self.symbols[slot] = symbol
+        else:
+            slot = len(self.symbols)
+            self.symbols.append(symbol)
+            if slot == len(self.states):
+                self.values = np.concatenate([self.values, np.zeros_like(self.values)])
+                self.isReady = np.concatenate([self.isReady, np.zeros_like(self.isReady)])
+                self.states = np.concatenate([self.states, np.full_like(self.states, self.initialState)])
+                self.updated = np.concatenate([self.updated, np.zeros_like(self.updated)])
+        self.slotBySymbol[symbol] = slot
+        self.values[slot] = 0
+        self.isReady[slot] = False
+        self.states[slot] = self.initialState
+
+        handlers = []
+        for index, indicator in enumerate(indicators):
+            handler = self.get_updated_handler(slot, index, indicator)
+            indicator.Updated += handler
+            handlers.append((indicator, handler))
+        self.handlersBySymbol[symbol] = handlers
+        self.RefreshValues(symbol)
+
+    def RemoveSymbol(self, symbol):
+        '''Removes the symbol and stops listening to the updates of its indicators
+        Args:
+            symbol: The symbol to remove'''
+        slot = self.slotBySymbol.pop(symbol, None)
+        if slot is None:
+            return
+
+        for indicator, handler in self.handlersBySymbol.pop(symbol):
+            indicator.Updated -= handler
+        self.symbols[slot] = None
+        self.updated[slot] = False
+        self.freeSlots.append(slot)
+
+    def RefreshValues(self, symbol):
+        '''Reads the current values of the indicators of the symbol again, e.g. after they were reset.
+        The symbol is evaluated at the next update
+        Args:
+            symbol: The symbol of the indicators'''
+        slot = self.slotBySymbol[symbol]
+        for index, (indicator, handler) in enumerate(self.handlersBySymbol[symbol]):
+            self.values[slot, index] = float(indicator.Current.Value)
+            self.isReady[slot, index] = indicator.IsReady
+        self.updated[slot] = True
+
+    def SetValue(self, symbol, index, value, isReady = True):
+        '''Sets a value of the symbol, the symbol is evaluated at the next update
+        Args:
+            symbol: The symbol of the value
+            index: The index of the value
+            value: The new value
+            isReady: True if the value is ready'''
+        slot = self.slotBySymbol[symbol]
+        self.values[slot, index] = float(value)
+        self.isReady[slot, index] = isReady
+        self.updated[slot] = True
+
+    def get_updated_handler(self, slot, index, indicator):
+        '''Gets the handler that writes the value of the indicator in its slot when it's updated'''
+        def handler(sender, updated):
+            self.values[slot, index] = float(updated.Value)
+            self.isReady[slot, index] = indicator.IsReady
+            self.updated[slot] = True
+        return handler
@@ -12,8 +12,12 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorThresholdAlphaModel import IndicatorThresholdAlphaModel
 
-class MacdAlphaModel(AlphaModel):
+# the state of a security without a previous insight, it differs from all the directions
+NoDirection = 2
+
+class MacdAlphaModel(IndicatorThresholdAlphaModel):
     '''Defines a custom alpha model that uses MACD crossovers. The MACD signal line
     is used to generate up/down insights if it's stronger than the bounce threshold.
     If the MACD signal is within the bounce threshold then a flat price insight is returned.'''
@@ -38,6 +42,8 @@ class MacdAlphaModel(AlphaModel):
         self.insightPeriod = Time.Multiply(Extensions.ToTimeSpan(resolution), fastPeriod)
         self.bounceThresholdPercent = 0.01
         self.symbolData = {}
+        # the state of a symbol is the direction of its previous insight, NoDirection before the first one
+        super().__init__(2, NoDirection, self.insightPeriod)
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         movingAverageTypeString = Extensions.GetEnumString(movingAverageType, MovingAverageType)
@@ -51,29 +57,29 @@ class MacdAlphaModel(AlphaModel):
             data: The new data available
         Returns:
             The new insights generated'''
-        insights = []
-
-        for key, sd in self.symbolData.items():
-            if sd.Security.Price == 0:
-                continue
+        # the signal is normalized by the price, so the securities with new data are evaluated too
+        for symbol in data.Keys:
+            sd = self.symbolData.get(symbol)
+            if sd is not None:
+                self.SetValue(symbol, 1, sd.Security.Price)
 
-            direction = InsightDirection.Flat
-            normalized_signal = sd.MACD.Signal.Current.Value / sd.Security.Price
+        return super().Update(algorithm, data)
 
-            if normalized_signal > self.bounceThresholdPercent:
-                direction = InsightDirection.Up
-            elif normalized_signal < -self.bounceThresholdPercent:
-                direction = InsightDirection.Down
 
-            # ignore signal for same direction as previous signal
-            if direction == sd.PreviousDirection:
-                continue
+    def GetStates(self, values, isReady, states):
+        ''' Determines the direction of each security from its MACD signal normalized by its price,
+        a security emits an insight when its direction differs from the direction of its previous insight'''
+        signal = values[:, 0]
+        price = values[:, 1]
+        hasPrice = price != 0
 
-            insight = Insight.Price(sd.Security.Symbol, self.insightPeriod, direction)
-            sd.PreviousDirection = insight.Direction
-            insights.append(insight)
+        normalized_signal = np.divide(signal, price, out = np.zeros_like(signal), where = hasPrice)
+        directions = np.where(normalized_signal > self.bounceThresholdPercent, 1,
+                              np.where(normalized_signal < -self.bounceThresholdPercent, -1, 0))
 
-        return insights
+        # ignore signal for same direction as previous signal
+        emit = hasPrice & (directions != states)
+        return np.where(emit, directions, states), emit, directions
 
 
     def OnSecuritiesChanged(self, algorithm, changes):
@@ -83,13 +89,17 @@ class MacdAlphaModel(AlphaModel):
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
         for added in changes.AddedSecurities:
-            self.symbolData[added.Symbol] = SymbolData(algorithm, added, self.fastPeriod, self.slowPeriod, self.signalPeriod, self.movingAverageType, self.resolution)
+            sd = SymbolData(algorithm, added, self.fastPeriod, self.slowPeriod, self.signalPeriod, self.movingAverageType, self.resolution)
+            self.symbolData[added.Symbol] = sd
+            self.AddSymbol(added.Symbol, sd.MACD.Signal)
+            self.SetValue(added.Symbol, 1, added.Price)
 
         for removed in changes.RemovedSecurities:
             data = self.symbolData.pop(removed.Symbol, None)
             if data is not None:
                 # clean up our consolidator
                 algorithm.SubscriptionManager.RemoveConsolidator(removed.Symbol, data.Consolidator)
+                self.RemoveSymbol(removed.Symbol)
 
 class SymbolData:
     def __init__(self, algorithm, security, fastPeriod, slowPeriod, signalPeriod, movingAverageType, resolution):
@@ -99,5 +109,3 @@ class SymbolData:
         self.Consolidator = algorithm.ResolveConsolidator(security.Symbol, resolution)
         algorithm.RegisterIndicator(security.Symbol, self.MACD, self.Consolidator)
         algorithm.WarmUpIndicator(security.Symbol, self.MACD, resolution)
-
-        self.PreviousDirection = None
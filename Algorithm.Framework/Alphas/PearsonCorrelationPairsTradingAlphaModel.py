@@ -13,12 +13,13 @@
 
 from AlgorithmImports import *
 from Alphas.BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
-from scipy.stats import pearsonr
+from Portfolio.ReturnsWindow import ReturnsWindow
 
 class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     ''' This alpha model is designed to rank every pair combination by its pearson correlation 
     and trade the pair with the hightest correlation
-    This model generates alternating long ratio/short ratio insights emitted as a group'''
+    This model generates alternating long ratio/short ratio insights emitted as a group
+    The latest log prices of each security are kept up to date by a consolidator, so only the added securities request history'''
 
     def __init__(self, lookback = 15,
             resolution = Resolution.Minute,
@@ -35,6 +36,7 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
         self.resolution = resolution
         self.minimumCorrelation = minimumCorrelation
         self.best_pair = ()
+        self.symbolDataBySymbol = {}
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
@@ -48,29 +50,23 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
         for security in changes.RemovedSecurities:
             if security in self.Securities:
                 self.Securities.remove(security)
+            symbolData = self.symbolDataBySymbol.pop(security.Symbol, None)
+            if symbolData is not None:
+                symbolData.RemoveConsolidators(algorithm)
 
-        symbols = [ x.Symbol for x in self.Securities ]
-        
-        history = algorithm.History(symbols, self.lookback, self.resolution).close.unstack(level=0)
+        self.warm_up(algorithm, [x for x in self.Securities if x.Symbol not in self.symbolDataBySymbol])
 
-        if not history.empty:
-
-            df = self.get_price_dataframe(history)
-            stop = len(df.columns)
-
-            corr = dict()
-
-            for i in range(0, stop):
-                for j in range(i+1, stop):
-                    if (j, i) not in corr:
-                        corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
-
-            corr = sorted(corr.items(), key = lambda kv: kv[1])
-            if corr[-1][1] >= self.minimumCorrelation: 
-                self.best_pair = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+        symbols, returns = self.get_log_returns([x.Symbol for x in self.Securities])
+        best_pair = self.get_best_pair(returns)
+        if best_pair is not None:
+            self.best_pair = (symbols[best_pair[0]], symbols[best_pair[1]])
 
         super().OnSecuritiesChanged(algorithm, changes)
 
+        # the best pair can change with any security change, not only to a pair of an added security
+        if self.best_pair:
+            self.TestPair(algorithm, *self.best_pair)
+
     def HasPassedTest(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
         Args:
@@ -81,27 +77,103 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
             True if the statistical test for the pair is successful'''
         return self.best_pair is not None and self.best_pair == (asset1, asset2)
 
-    def get_price_dataframe(self, df):
-        timezones = { x.Symbol.Value: x.Exchange.TimeZone for x in self.Securities }
-
-        # Use log prices
-        df = np.log(df)
-
-        is_single_timeZone = len(set(timezones.values())) == 1
-
-        if not is_single_timeZone:
-            series_dict = dict()
-
-            for column in df:
-                # Change the dataframe index from data time to UTC time
-                to_utc = lambda x: Extensions.ConvertToUtc(x, timezones[column])
-                if self.resolution == Resolution.Daily:
-                    to_utc = lambda x: Extensions.ConvertToUtc(x, timezones[column]).date()
-
-                data = df[[column]]
-                data.index = data.index.map(to_utc)
-                series_dict[column] = data[column]
-
-            df = pd.DataFrame(series_dict).dropna()
-
-        return (df - df.shift(1)).dropna()
+    def warm_up(self, algorithm, securities):
+        '''Creates the symbol data of the securities and fills their log prices with a single history request'''
+        if not securities:
+            return
+
+        for security in securities:
+            symbolData = SymbolData(security.Symbol, security.Exchange.TimeZone, self.resolution, self.lookback)
+            symbolData.RegisterConsolidator(algorithm)
+            self.symbolDataBySymbol[security.Symbol] = symbolData
+
+        history = algorithm.WideHistory([x.Symbol for x in securities], self.lookback, self.resolution)
+        if history.empty:
+            return
+
+        # the times of the history are converted once per time zone
+        keysByTimeZone = {}
+        for security in securities:
+            if str(security.Symbol) not in history.columns:
+                continue
+            symbolData = self.symbolDataBySymbol[security.Symbol]
+            timeZone = security.Exchange.TimeZone.Id
+            if timeZone not in keysByTimeZone:
+                keysByTimeZone[timeZone] = [symbolData.GetKey(time) for time in history.index]
+            for key, close in zip(keysByTimeZone[timeZone], history[security.Symbol].values):
+                if not np.isnan(close):
+                    symbolData.Update(key, close)
+
+    def get_log_returns(self, symbols):
+        '''Gets the log returns of the symbols with prices, at the times all of them have a price
+        Returns:
+            The symbols with prices and the matrix of their log returns, one column per symbol (size: T x N)'''
+        windows = [self.symbolDataBySymbol[symbol].window for symbol in symbols]
+        symbols = [symbol for symbol, window in zip(symbols, windows) if window.Count > 0]
+        windows = [window for window in windows if window.Count > 0]
+        if not windows:
+            return symbols, np.empty((0, 0))
+
+        # the securities usually have prices at the same times, otherwise only the times shared by all of them are kept
+        times = windows[0].Times
+        if all(window.Count == len(times) and np.array_equal(window.Times, times) for window in windows):
+            prices = np.column_stack([window.Values for window in windows])
+        else:
+            prices = pd.concat([window.ToSeries() for window in windows], axis = 1).sort_index().dropna().values
+
+        return symbols, np.diff(prices, axis = 0)
+
+    def get_best_pair(self, returns):
+        '''Gets the pair of columns of the returns with the highest pearson correlation
+        Args:
+            returns: Matrix of the log returns, one column per symbol (size: T x N)
+        Returns:
+            The (i, j) indices of the columns of the best pair, i < j, None if no pair has the minimum correlation'''
+        count = returns.shape[1]
+        if count < 2 or returns.shape[0] < 2:
+            return None
+
+        # constant returns have an undefined correlation
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            correlation = np.corrcoef(returns, rowvar = False)
+
+        rows, columns = np.triu_indices(count, k = 1)
+        upper = correlation[rows, columns]
+        upper[np.isnan(upper)] = -np.inf
+        best = np.argmax(upper)
+        if upper[best] < self.minimumCorrelation:
+            return None
+        return rows[best], columns[best]
+
+class SymbolData:
+    '''Contains the latest log prices of a symbol, indexed by UTC time, or UTC date for daily resolution,
+    so the prices of securities in different time zones are aligned'''
+    def __init__(self, symbol, timeZone, resolution, lookback):
+        self.Symbol = symbol
+        self.timeZone = timeZone
+        self.resolution = resolution
+        self.window = ReturnsWindow(lookback)
+        self.Consolidator = None
+
+    def RegisterConsolidator(self, algorithm):
+        self.Consolidator = algorithm.ResolveConsolidator(self.Symbol, self.resolution)
+        self.Consolidator.DataConsolidated += self.OnDataConsolidated
+        algorithm.SubscriptionManager.AddConsolidator(self.Symbol, self.Consolidator)
+
+    def RemoveConsolidators(self, algorithm):
+        if self.Consolidator is not None:
+            algorithm.SubscriptionManager.RemoveConsolidator(self.Symbol, self.Consolidator)
+
+    def OnDataConsolidated(self, sender, bar):
+        self.Update(self.GetKey(bar.EndTime), bar.Price)
+
+    def GetKey(self, time):
+        utcTime = Extensions.ConvertToUtc(time, self.timeZone)
+        return utcTime.date() if self.resolution == Resolution.Daily else utcTime
+
+    def Update(self, key, price):
+        # the bars of the history can be consolidated again
+        lastKey = self.window.LastTime
+        if lastKey is not None and key <= lastKey:
+            return
+        self.window.Add(key, np.log(float(price)))
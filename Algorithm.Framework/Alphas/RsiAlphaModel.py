@@ -13,9 +13,10 @@
 
 from AlgorithmImports import *
 from QuantConnect.Logging import *
+from Alphas.IndicatorThresholdAlphaModel import IndicatorThresholdAlphaModel
 from enum import Enum
 
-class RsiAlphaModel(AlphaModel):
+class RsiAlphaModel(IndicatorThresholdAlphaModel):
     '''Uses Wilder's RSI to create insights.
     Using default settings, a cross over below 30 or above 70 will trigger a new insight.'''
 
@@ -29,35 +30,11 @@ class RsiAlphaModel(AlphaModel):
         self.resolution = resolution
         self.insightPeriod = Time.Multiply(Extensions.ToTimeSpan(resolution), period)
         self.symbolDataBySymbol ={}
+        super().__init__(1, State.Middle.value, self.insightPeriod)
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         self.Name = '{}({},{})'.format(self.__class__.__name__, period, resolutionString)
 
-    def Update(self, algorithm, data):
-        '''Updates this alpha model with the latest data from the algorithm.
-        This is called each time the algorithm receives data for subscribed securities
-        Args:
-            algorithm: The algorithm instance
-            data: The new data available
-        Returns:
-            The new insights generated'''
-        insights = []
-        for symbol, symbolData in self.symbolDataBySymbol.items():
-            rsi = symbolData.RSI
-            previous_state = symbolData.State
-            state = self.GetState(rsi, previous_state)
-
-            if state != previous_state and rsi.IsReady:
-                if state == State.TrippedLow:
-                    insights.append(Insight.Price(symbol, self.insightPeriod, InsightDirection.Up))
-                if state == State.TrippedHigh:
-                    insights.append(Insight.Price(symbol, self.insightPeriod, InsightDirection.Down))
-
-            symbolData.State = state
-
-        return insights
-
-
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Cleans out old security data and initializes the RSI for any newly added securities.
         Event fired each time the we add/remove securities from the data feed
@@ -71,6 +48,7 @@ class RsiAlphaModel(AlphaModel):
             for subscription in algorithm.SubscriptionManager.Subscriptions:
                 if subscription.Symbol in symbols:
                     self.symbolDataBySymbol.pop(subscription.Symbol, None)
+                    self.RemoveSymbol(subscription.Symbol)
                     subscription.Consolidators.Clear()
 
         # initialize data for added securities
@@ -90,27 +68,28 @@ class RsiAlphaModel(AlphaModel):
                     Log.Trace(f'RsiAlphaModel.OnSecuritiesChanged: {ticker} not found in history data frame.')
                     continue
 
-                for tuple in history.loc[ticker].itertuples():
-                    rsi.Update(tuple.Index, tuple.close)
+                algorithm.WarmUpIndicator(rsi, history.loc[ticker])
 
             self.symbolDataBySymbol[symbol] = SymbolData(symbol, rsi)
+            self.AddSymbol(symbol, rsi)
+
 
+    def GetStates(self, values, isReady, states):
+        ''' Determines the new states. This is basically cross-over detection logic that
+        includes considerations for bouncing using the configured bounce tolerance.
+        A new tripped state emits an insight once the RSI is ready'''
+        rsi = values[:, 0]
+        previous = states
 
-    def GetState(self, rsi, previous):
-        ''' Determines the new state. This is basically cross-over detection logic that
-        includes considerations for bouncing using the configured bounce tolerance.'''
-        if rsi.Current.Value > 70:
-            return State.TrippedHigh
-        if rsi.Current.Value < 30:
-            return State.TrippedLow
-        if previous == State.TrippedLow:
-            if rsi.Current.Value > 35:
-                return State.Middle
-        if previous == State.TrippedHigh:
-            if rsi.Current.Value < 65:
-                return State.Middle
+        states = previous.copy()
+        states[(previous == State.TrippedLow.value) & (rsi > 35)] = State.Middle.value
+        states[(previous == State.TrippedHigh.value) & (rsi < 65)] = State.Middle.value
+        states[rsi < 30] = State.TrippedLow.value
+        states[rsi > 70] = State.TrippedHigh.value
 
-        return previous
+        emit = (states != previous) & (states != State.Middle.value) & isReady[:, 0]
+        directions = np.where(states == State.TrippedLow.value, 1, -1)
+        return states, emit, directions
 
 
 class SymbolData:
@@ -118,7 +97,6 @@ class SymbolData:
     def __init__(self, symbol, rsi):
         self.Symbol = symbol
         self.RSI = rsi
-        self.State = State.Middle
 
 
 class State(Enum):
@@ -18,6 +18,7 @@ using System.Collections.Generic;
 using System.Linq;
 using Python.Runtime;
 using QuantConnect.Algorithm.Framework.Alphas;
+using QuantConnect.Data.UniverseSelection;
 using QuantConnect.Scheduling;
 using QuantConnect.Util;
 
@@ -34,11 +35,26 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
     ///    2. On active Down insight, decrease position size by percent
     ///    3. On active Flat insight, move by percent towards 0
     ///    4. On expired insight, and no other active insight, emits a 0 target'''
+    /// In incremental mode, the percent of each symbol is accumulated as its insights arrive and expire,
+    /// and only the targets of the symbols whose accumulated percent changed are created
     /// </summary>
     public class AccumulativeInsightPortfolioConstructionModel : PortfolioConstructionModel
     {
         private readonly PortfolioBias _portfolioBias;
         private readonly double _percent;
+        private readonly Dictionary<Symbol, AccumulatedPercent> _accumulatedPercentBySymbol = new Dictionary<Symbol, AccumulatedPercent>();
+        private readonly Dictionary<Symbol, double> _percentBySymbol = new Dictionary<Symbol, double>();
+        private readonly HashSet<Symbol> _changedSymbols = new HashSet<Symbol>();
+        // the close time of an insight can change after it arrived, so it's checked when the insight is dequeued
+        private readonly PriorityQueue<Insight, DateTime> _insightsByCloseTime = new PriorityQueue<Insight, DateTime>();
+
+        /// <summary>
+        /// True to accumulate the percent of each symbol as its insights arrive and expire, and only create the targets
+        /// whose percent changed since the last rebalance. False by default.
+        /// Flat targets for expired insights and removed securities are created as usual.
+        /// It should be set before the first insights arrive
+        /// </summary>
+        public bool Incremental { get; set; }
 
         /// <summary>
         /// Initialize a new instance of <see cref="AccumulativeInsightPortfolioConstructionModel"/>
@@ -147,12 +163,60 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         {
         }
 
+        /// <summary>
+        /// Create portfolio targets from the specified insights
+        /// </summary>
+        /// <param name="algorithm">The algorithm instance</param>
+        /// <param name="insights">The insights to create portfolio targets from</param>
+        /// <returns>An enumerable of portfolio targets to be sent to the execution model</returns>
+        public override IEnumerable<IPortfolioTarget> CreateTargets(QCAlgorithm algorithm, Insight[] insights)
+        {
+            if (Incremental)
+            {
+                foreach (var insight in insights.Where(ShouldCreateTargetForInsight))
+                {
+                    AddInsight(insight);
+                }
+            }
+            return base.CreateTargets(algorithm, insights);
+        }
+
+        /// <summary>
+        /// Event fired each time the we add/remove securities from the data feed
+        /// </summary>
+        /// <param name="algorithm">The algorithm instance that experienced the change in securities</param>
+        /// <param name="changes">The security additions and removals from the algorithm</param>
+        public override void OnSecuritiesChanged(QCAlgorithm algorithm, SecurityChanges changes)
+        {
+            base.OnSecuritiesChanged(algorithm, changes);
+
+            foreach (var removed in changes.RemovedSecurities)
+            {
+                _accumulatedPercentBySymbol.Remove(removed.Symbol);
+                _percentBySymbol.Remove(removed.Symbol);
+                _changedSymbols.Remove(removed.Symbol);
+            }
+        }
+
         /// <summary>
         /// Gets the target insights to calculate a portfolio target percent for
         /// </summary>
         /// <returns>An enumerable of the target insights</returns>
         protected override List<Insight> GetTargetInsights()
         {
+            if (Incremental)
+            {
+                RemoveExpiredInsights(Algorithm.UtcTime);
+
+                // the last insight of each symbol whose accumulated percent changed
+                var changedInsights = _changedSymbols
+                    .Where(_accumulatedPercentBySymbol.ContainsKey)
+                    .Select(symbol => _accumulatedPercentBySymbol[symbol].Insights.Last())
+                    .ToList();
+                _changedSymbols.Clear();
+                return changedInsights;
+            }
+
             return InsightCollection.GetActiveInsights(Algorithm.UtcTime)
                 .OrderBy(insight => insight.GeneratedTimeUtc)
                 .ToList();
@@ -165,42 +229,197 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>A target percent for each insight</returns>
         protected override Dictionary<Insight, double> DetermineTargetPercent(List<Insight> activeInsights)
         {
+            if (Incremental)
+            {
+                return DetermineChangedTargetPercent(activeInsights);
+            }
+
             var percentPerSymbol = new Dictionary<Symbol, double>();
 
             foreach (var insight in activeInsights)
             {
                 double targetPercent;
-                if (percentPerSymbol.TryGetValue(insight.Symbol, out targetPercent))
+                percentPerSymbol.TryGetValue(insight.Symbol, out targetPercent);
+                percentPerSymbol[insight.Symbol] = Accumulate(targetPercent, insight);
+            }
+
+            return activeInsights.DistinctBy(insight => insight.Symbol)
+                .ToDictionary(insight => insight, insight => percentPerSymbol[insight.Symbol]);
+        }
+
+        /// <summary>
+        /// Accumulates the insight into the target percent of its symbol
+        /// </summary>
+        /// <param name="targetPercent">The target percent accumulated from the previous insights of the symbol, in generated time order</param>
+        /// <param name="insight">The next insight of the symbol</param>
+        /// <returns>The target percent accumulated with the insight</returns>
+        private double Accumulate(double targetPercent, Insight insight)
+        {
+            if (insight.Direction == InsightDirection.Flat)
+            {
+                // We received a Flat
+                // if adding or subtracting will push past 0, then make it 0
+                if (Math.Abs(targetPercent) < _percent)
+                {
+                    targetPercent = 0;
+                }
+                else
                 {
-                    if (insight.Direction == InsightDirection.Flat)
-                    {
-                        // We received a Flat
-                        // if adding or subtracting will push past 0, then make it 0
-                        if (Math.Abs(targetPercent) < _percent)
-                        {
-                            targetPercent = 0;
-                        }
-                        else
-                        {
-                            // otherwise, we flatten by percent
-                            targetPercent += (targetPercent > 0 ? -_percent : _percent);
-                        }
-                    }
+                    // otherwise, we flatten by percent
+                    targetPercent += (targetPercent > 0 ? -_percent : _percent);
                 }
-                targetPercent += _percent * (int)insight.Direction;
+            }
+            targetPercent += _percent * (int)insight.Direction;
+
+            // adjust to respect portfolio bias
+            if (_portfolioBias != PortfolioBias.LongShort
+                && Math.Sign(targetPercent) != (int)_portfolioBias)
+            {
+                targetPercent = 0;
+            }
+
+            return targetPercent;
+        }
 
-                // adjust to respect portfolio bias
-                if (_portfolioBias != PortfolioBias.LongShort
-                    && Math.Sign(targetPercent) != (int)_portfolioBias)
+        /// <summary>
+        /// Determines the target percent of the symbols whose accumulated percent changed since the last rebalance
+        /// </summary>
+        /// <param name="changedInsights">The last insight of each symbol whose accumulated percent changed</param>
+        /// <returns>A target percent for each insight whose target percent changed</returns>
+        private Dictionary<Insight, double> DetermineChangedTargetPercent(List<Insight> changedInsights)
+        {
+            var result = new Dictionary<Insight, double>();
+            foreach (var insight in changedInsights)
+            {
+                var percent = _accumulatedPercentBySymbol[insight.Symbol].Percent;
+
+                double lastPercent;
+                if (!_percentBySymbol.TryGetValue(insight.Symbol, out lastPercent) || lastPercent != percent)
                 {
-                    targetPercent = 0;
+                    _percentBySymbol[insight.Symbol] = percent;
+                    result[insight] = percent;
                 }
+            }
+            return result;
+        }
 
-                percentPerSymbol[insight.Symbol] = targetPercent;
+        /// <summary>
+        /// Adds the insight to the accumulated percent of its symbol.
+        /// An insight generated after the others of its symbol is accumulated in constant time
+        /// </summary>
+        /// <param name="insight">The new insight</param>
+        private void AddInsight(Insight insight)
+        {
+            AccumulatedPercent accumulated;
+            if (!_accumulatedPercentBySymbol.TryGetValue(insight.Symbol, out accumulated))
+            {
+                _accumulatedPercentBySymbol[insight.Symbol] = accumulated = new AccumulatedPercent();
             }
 
-            return activeInsights.DistinctBy(insight => insight.Symbol)
-                .ToDictionary(insight => insight, insight => percentPerSymbol[insight.Symbol]);
+            var insights = accumulated.Insights;
+            var index = insights.Count;
+            while (index > 0 && insights[index - 1].GeneratedTimeUtc > insight.GeneratedTimeUtc)
+            {
+                index--;
+            }
+            insights.Insert(index, insight);
+            accumulated.Direction += (int)insight.Direction;
+            if (insight.Direction == InsightDirection.Flat)
+            {
+                accumulated.FlatCount++;
+            }
+            UpdateAccumulatedPercent(accumulated, index == insights.Count - 1 ? insight : null);
+
+            _insightsByCloseTime.Enqueue(insight, insight.CloseTimeUtc);
+            _changedSymbols.Add(insight.Symbol);
+        }
+
+        /// <summary>
+        /// Removes the expired insights from the accumulated percent of their symbols
+        /// </summary>
+        /// <param name="utcTime">The current UTC time</param>
+        private void RemoveExpiredInsights(DateTime utcTime)
+        {
+            Insight insight;
+            DateTime closeTimeUtc;
+            while (_insightsByCloseTime.TryPeek(out insight, out closeTimeUtc))
+            {
+                AccumulatedPercent accumulated;
+                if (!_accumulatedPercentBySymbol.TryGetValue(insight.Symbol, out accumulated)
+                    || !accumulated.Insights.Contains(insight))
+                {
+                    // the security was removed
+                    _insightsByCloseTime.Dequeue();
+                    continue;
+                }
+                if (insight.CloseTimeUtc != closeTimeUtc)
+                {
+                    _insightsByCloseTime.Dequeue();
+                    _insightsByCloseTime.Enqueue(insight, insight.CloseTimeUtc);
+                    continue;
+                }
+                if (!insight.IsExpired(utcTime))
+                {
+                    break;
+                }
+
+                _insightsByCloseTime.Dequeue();
+                accumulated.Insights.Remove(insight);
+                accumulated.Direction -= (int)insight.Direction;
+                if (insight.Direction == InsightDirection.Flat)
+                {
+                    accumulated.FlatCount--;
+                }
+                _changedSymbols.Add(insight.Symbol);
+
+                if (accumulated.Insights.Count > 0)
+                {
+                    UpdateAccumulatedPercent(accumulated);
+                }
+                else
+                {
+                    // the base model creates the flat target of the symbol
+                    _accumulatedPercentBySymbol.Remove(insight.Symbol);
+                    _percentBySymbol.Remove(insight.Symbol);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Updates the accumulated percent of a symbol after its insights changed
+        /// </summary>
+        /// <param name="accumulated">The accumulated percent of the symbol</param>
+        /// <param name="lastInsight">The insight appended after the others of the symbol, null to accumulate all the insights again</param>
+        private void UpdateAccumulatedPercent(AccumulatedPercent accumulated, Insight lastInsight = null)
+        {
+            if (_portfolioBias == PortfolioBias.LongShort && accumulated.FlatCount == 0)
+            {
+                // without Flat insights nor bias adjustment, the accumulation is the sum of the directions
+                accumulated.Percent = _percent * accumulated.Direction;
+            }
+            else if (lastInsight != null)
+            {
+                accumulated.Percent = Accumulate(accumulated.Percent, lastInsight);
+            }
+            else
+            {
+                accumulated.Percent = 0;
+                foreach (var insight in accumulated.Insights)
+                {
+                    accumulated.Percent = Accumulate(accumulated.Percent, insight);
+                }
+            }
+        }
+
+        /// <summary>
+        /// The accumulated percent of a symbol and its active insights, in generated time order
+        /// </summary>
+        private class AccumulatedPercent
+        {
+            public List<Insight> Insights { get; } = new List<Insight>();
+            public int Direction { get; set; }
+            public int FlatCount { get; set; }
+            public double Percent { get; set; }
         }
     }
 }
\ No newline at end of file
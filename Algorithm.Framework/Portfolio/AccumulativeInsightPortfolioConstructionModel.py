@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.EqualWeightingPortfolioConstructionModel import *
+from itertools import count
+import heapq
 
 class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConstructionModel):
     '''Provides an implementation of IPortfolioConstructionModel that allocates percent of account
@@ -24,7 +26,9 @@ class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConst
         1. On active Up insight, increase position size by percent
         2. On active Down insight, decrease position size by percent
         3. On active Flat insight, move by percent towards 0
-        4. On expired insight, and no other active insight, emits a 0 target'''
+        4. On expired insight, and no other active insight, emits a 0 target
+    In incremental mode, the percent of each symbol is accumulated as its insights arrive and expire,
+    and only the targets of the symbols whose accumulated percent changed are created'''
 
     def __init__(self,  rebalance = None, portfolioBias = PortfolioBias.LongShort, percent = 0.03):
         '''Initialize a new instance of AccumulativeInsightPortfolioConstructionModel
@@ -40,36 +44,146 @@ class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConst
         self.portfolioBias = portfolioBias
         self.percent = abs(percent)
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
+        self.accumulatedPercentBySymbol = {}
+        self.changedSymbols = set()
+        # the insights are ordered by close time, then by arrival, the close time of an insight can change after it arrived
+        self.insightsByCloseTime = []
+        self.sequence = count()
 
     def DetermineTargetPercent(self, activeInsights):
         '''Will determine the target percent for each insight
         Args:
             activeInsights: The active insights to generate a target for'''
+        if self.Incremental:
+            return self.DetermineChangedTargetPercent(activeInsights)
+
         percentPerSymbol = {}
 
         insights = sorted(self.InsightCollection.GetActiveInsights(self.currentUtcTime), key=lambda insight: insight.GeneratedTimeUtc)
 
         for insight in insights:
-            targetPercent = 0
-            if insight.Symbol in percentPerSymbol:
-                targetPercent = percentPerSymbol[insight.Symbol]
-                if insight.Direction == InsightDirection.Flat:
-                    # We received a Flat
-                    # if adding or subtracting will push past 0, then make it 0
-                    if abs(targetPercent) < self.percent:
-                        targetPercent = 0
-                    else:
-                        # otherwise, we flatten by percent
-                        targetPercent += (-self.percent if targetPercent > 0 else self.percent)
-            targetPercent += self.percent * insight.Direction
-
-            # adjust to respect portfolio bias
-            if self.portfolioBias != PortfolioBias.LongShort and self.sign(targetPercent) != self.portfolioBias:
+            percentPerSymbol[insight.Symbol] = self.Accumulate(percentPerSymbol.get(insight.Symbol, 0), insight)
+
+        return dict((insight, percentPerSymbol[insight.Symbol]) for insight in activeInsights)
+
+    def Accumulate(self, targetPercent, insight):
+        '''Accumulates the insight into the target percent of its symbol
+        Args:
+            targetPercent: The target percent accumulated from the previous insights of the symbol, in generated time order
+            insight: The next insight of the symbol
+        Returns:
+            The target percent accumulated with the insight'''
+        if insight.Direction == InsightDirection.Flat:
+            # We received a Flat
+            # if adding or subtracting will push past 0, then make it 0
+            if abs(targetPercent) < self.percent:
                 targetPercent = 0
+            else:
+                # otherwise, we flatten by percent
+                targetPercent += (-self.percent if targetPercent > 0 else self.percent)
+        targetPercent += self.percent * insight.Direction
 
-            percentPerSymbol[insight.Symbol] = targetPercent
+        # adjust to respect portfolio bias
+        if self.portfolioBias != PortfolioBias.LongShort and self.sign(targetPercent) != self.portfolioBias:
+            targetPercent = 0
 
-        return dict((insight, percentPerSymbol[insight.Symbol]) for insight in activeInsights)
+        return targetPercent
+
+    def GetTargetInsights(self):
+        '''Gets the target insights to calculate a portfolio target percent for.
+        In incremental mode, the insights that expired since the last rebalance are removed from the accumulated percent of their symbols
+        and the last insight of each symbol whose accumulated percent changed is returned
+        Returns:
+            The target insights'''
+        if not self.Incremental:
+            return super().GetTargetInsights()
+
+        self.RemoveExpiredInsights(self.Algorithm.UtcTime)
+
+        changedInsights = [self.accumulatedPercentBySymbol[symbol].insights[-1]
+                           for symbol in self.changedSymbols if symbol in self.accumulatedPercentBySymbol]
+        self.changedSymbols.clear()
+        return changedInsights
+
+    def DetermineChangedTargetPercent(self, changedInsights):
+        '''Will determine the target percent of the symbols whose accumulated percent changed since the last rebalance
+        Args:
+            changedInsights: The last insight of each symbol whose accumulated percent changed'''
+        result = {}
+        for insight in changedInsights:
+            percent = self.accumulatedPercentBySymbol[insight.Symbol].percent
+            if self.percentBySymbol.get(insight.Symbol) != percent:
+                self.percentBySymbol[insight.Symbol] = percent
+                result[insight] = percent
+        return result
+
+    def AddInsight(self, insight):
+        '''Adds the insight to the accumulated percent of its symbol.
+        An insight generated after the others of its symbol is accumulated in constant time
+        Args:
+            insight: The new insight'''
+        accumulated = self.accumulatedPercentBySymbol.get(insight.Symbol)
+        if accumulated is None:
+            accumulated = self.accumulatedPercentBySymbol[insight.Symbol] = AccumulatedPercent()
+
+        insights = accumulated.insights
+        index = len(insights)
+        while index > 0 and insights[index - 1].GeneratedTimeUtc > insight.GeneratedTimeUtc:
+            index -= 1
+        insights.insert(index, insight)
+        accumulated.direction += int(insight.Direction)
+        if insight.Direction == InsightDirection.Flat:
+            accumulated.flatCount += 1
+        self.UpdateAccumulatedPercent(accumulated, insight if index == len(insights) - 1 else None)
+
+        heapq.heappush(self.insightsByCloseTime, (insight.CloseTimeUtc, next(self.sequence), insight))
+        self.changedSymbols.add(insight.Symbol)
+
+    def RemoveExpiredInsights(self, utcTime):
+        '''Removes the expired insights from the accumulated percent of their symbols
+        Args:
+            utcTime: The current UTC time'''
+        while self.insightsByCloseTime:
+            closeTimeUtc, _, insight = self.insightsByCloseTime[0]
+            accumulated = self.accumulatedPercentBySymbol.get(insight.Symbol)
+            if accumulated is None or insight not in accumulated.insights:
+                # the security was removed
+                heapq.heappop(self.insightsByCloseTime)
+                continue
+            if insight.CloseTimeUtc != closeTimeUtc:
+                heapq.heapreplace(self.insightsByCloseTime, (insight.CloseTimeUtc, next(self.sequence), insight))
+                continue
+            if not insight.IsExpired(utcTime):
+                break
+
+            heapq.heappop(self.insightsByCloseTime)
+            accumulated.insights.remove(insight)
+            accumulated.direction -= int(insight.Direction)
+            if insight.Direction == InsightDirection.Flat:
+                accumulated.flatCount -= 1
+            self.changedSymbols.add(insight.Symbol)
+
+            if accumulated.insights:
+                self.UpdateAccumulatedPercent(accumulated)
+            else:
+                # the base model creates the flat target of the symbol
+                del self.accumulatedPercentBySymbol[insight.Symbol]
+                self.percentBySymbol.pop(insight.Symbol, None)
+
+    def UpdateAccumulatedPercent(self, accumulated, lastInsight = None):
+        '''Updates the accumulated percent of a symbol after its insights changed
+        Args:
+            accumulated: The accumulated percent of the symbol
+            lastInsight: The insight appended after the others of the symbol, None to accumulate all the insights again'''
+        if self.portfolioBias == PortfolioBias.LongShort and accumulated.flatCount == 0:
+            # without Flat insights nor bias adjustment, the accumulation is the sum of the directions
+            accumulated.percent = self.percent * accumulated.direction
+        elif lastInsight is not None:
+            accumulated.percent = self.Accumulate(accumulated.percent, lastInsight)
+        else:
+            accumulated.percent = 0
+            for insight in accumulated.insights:
+                accumulated.percent = self.Accumulate(accumulated.percent, insight)
 
     def CreateTargets(self, algorithm, insights):
         '''Create portfolio targets from the specified insights
@@ -79,4 +193,27 @@ class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConst
         Returns:
             An enumerable of portfolio targets to be sent to the execution model'''
         self.currentUtcTime = algorithm.UtcTime
+        if self.Incremental:
+            for insight in insights:
+                if self.ShouldCreateTargetForInsight(insight):
+                    self.AddInsight(insight)
         return super().CreateTargets(algorithm, insights)
+
+    def OnSecuritiesChanged(self, algorithm, changes):
+        '''Event fired each time the we add/remove securities from the data feed
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            changes: The security additions and removals from the algorithm'''
+        super().OnSecuritiesChanged(algorithm, changes)
+        for removed in changes.RemovedSecurities:
+            self.accumulatedPercentBySymbol.pop(removed.Symbol, None)
+            self.percentBySymbol.pop(removed.Symbol, None)
+            self.changedSymbols.discard(removed.Symbol)
+
+class AccumulatedPercent:
+    '''The accumulated percent of a symbol and its active insights, in generated time order'''
+    def __init__(self):
+        self.insights = []
+        self.direction = 0
+        self.flatCount = 0
+        self.percent = 0
@@ -305,14 +305,9 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>An enumerable of the target insights</returns>
         protected override List<Insight> GetTargetInsights()
         {
-            // Get insight that haven't expired of each symbol that is still in the universe
-            var activeInsights = InsightCollection.GetActiveInsights(Algorithm.UtcTime);
-
-            // Get the last generated active insight for each symbol
-            return (from insight in activeInsights
-                    group insight by new { insight.Symbol, insight.SourceModel } into g
-                    select g.OrderBy(x => x.GeneratedTimeUtc).Last())
-                    .OrderBy(x => x.Symbol).ToList();
+            // Get the last generated active insight of each source model for each symbol that is still in the universe
+            return InsightCollection.GetLastActiveInsights(Algorithm.UtcTime)
+                .OrderBy(x => x.Symbol).ToList();
         }
 
         /// <summary>
@@ -13,9 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
-from itertools import groupby
-from numpy import dot, transpose
-from numpy.linalg import inv
+from Portfolio.ReturnsWindow import ReturnsWindow
+from numpy import dot
 
 ### <summary>
 ### Provides an implementation of Black-Litterman portfolio optimization. The model adjusts equilibrium market
@@ -83,7 +82,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
     def DetermineTargetPercent(self, lastActiveInsights):
         targets = {}
 
-        # Get view vectors
+        # Get view vectors, the columns of P follow the order of the symbols in the insights
         P, Q = self.get_views(lastActiveInsights)
         if P is not None:
             returns = dict()
@@ -103,6 +102,10 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             # Calculate prior estimate of the mean and covariance
             Pi, Sigma = self.get_equilibrium_return(returns)
 
+            # Align the columns of P with the assets of the covariance matrix
+            columns = { str(symbol): i for i, symbol in enumerate(self.get_symbols(lastActiveInsights)) }
+            P = P[:, [columns[str(symbol)] for symbol in Sigma.columns]]
+
             # Calculate posterior estimate of the mean and covariance
             Pi, Sigma = self.apply_blacklitterman_master_formula(Pi, Sigma, P, Q)
 
@@ -110,27 +113,26 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             weights = self.optimizer.Optimize(returns, Pi, Sigma)
             weights = pd.Series(weights, index = Sigma.columns)
 
+            # The first insight of each symbol gets its target
+            insightBySymbol = {}
+            for insight in lastActiveInsights:
+                insightBySymbol.setdefault(str(insight.Symbol), insight)
+
             for symbol, weight in weights.items():
-                for insight in lastActiveInsights:
-                    if str(insight.Symbol) == str(symbol):
-                        # don't trust the optimizer
-                        if self.portfolioBias != PortfolioBias.LongShort and self.sign(weight) != self.portfolioBias:
-                            weight = 0
-                        targets[insight] = weight
-                        break
+                insight = insightBySymbol.get(str(symbol))
+                if insight is not None:
+                    # don't trust the optimizer
+                    if self.portfolioBias != PortfolioBias.LongShort and self.sign(weight) != self.portfolioBias:
+                        weight = 0
+                    targets[insight] = weight
 
         return targets
 
     def GetTargetInsights(self):
-        # Get insight that haven't expired of each symbol that is still in the universe
-        activeInsights = self.InsightCollection.GetActiveInsights(self.Algorithm.UtcTime)
-
-        # Get the last generated active insight for each symbol
-        lastActiveInsights = []
-        for sourceModel, f in groupby(sorted(activeInsights, key = lambda ff: ff.SourceModel), lambda fff: fff.SourceModel):
-            for symbol, g in groupby(sorted(list(f), key = lambda gg: gg.Symbol), lambda ggg: ggg.Symbol):
-                lastActiveInsights.append(sorted(g, key = lambda x: x.GeneratedTimeUtc)[-1])
-        return lastActiveInsights
+        # Get the last generated active insight of each source model for each symbol that is still in the universe,
+        # ordered by source model and symbol. The symbols compare their value ignoring case
+        lastActiveInsights = self.InsightCollection.GetLastActiveInsights(self.Algorithm.UtcTime)
+        return sorted(lastActiveInsights, key = lambda x: (x.SourceModel, x.Symbol.Value.upper()))
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
@@ -149,12 +151,11 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         # initialize data for added securities
         addedSymbols = { x.Symbol: x.Exchange.TimeZone for x in changes.AddedSecurities }
-        history = algorithm.History(list(addedSymbols.keys()), self.lookback * self.period, self.resolution)
+        history = algorithm.WideHistory(list(addedSymbols.keys()), self.lookback * self.period, self.resolution)
 
         if history.empty:
             return
 
-        history = history.close.unstack(0)
         symbols = history.columns
 
         for symbol, timezone in addedSymbols.items():
@@ -176,22 +177,23 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             Sigma: Prior/Posterior covariance matrix
             P: A matrix that identifies the assets involved in the views (size: K x N)
             Q: A view vector (size: K x 1)'''
-        ts = self.tau * Sigma
+        covariance = np.asarray(Sigma, dtype=float)
+        ts = self.tau * covariance
 
         # Create the diagonal Sigma matrix of error terms from the expressed views
-        omega = np.dot(np.dot(P, ts), P.T) * np.eye(Q.shape[0])
-        if np.linalg.det(omega) == 0:
+        Pts = np.dot(P, ts)
+        PtsP = np.dot(Pts, P.T)
+        omega = np.diag(PtsP)
+        if np.any(omega == 0):
             return Pi, Sigma
 
-        A = np.dot(np.dot(ts, P.T), inv(np.dot(np.dot(P, ts), P.T) + omega))
+        # A = τΣP'(PτΣP' + Ω)^-1, (PτΣP' + Ω) is symmetric so A' is the solution of (PτΣP' + Ω)A' = PτΣ
+        A = np.linalg.solve(PtsP + np.diag(omega), Pts).T
 
-        Pi = np.squeeze(np.asarray((
-            np.expand_dims(Pi, axis=0).T +
-            np.dot(A, (Q - np.expand_dims(np.dot(P, Pi.T), axis=1))))
-            ))
+        Pi = np.asarray(Pi, dtype=float) + np.dot(A, np.ravel(Q) - np.dot(P, Pi))
 
-        M = ts - np.dot(np.dot(A, P), ts)
-        Sigma = (Sigma + M) * self.delta
+        M = ts - np.dot(A, Pts)
+        Sigma = pd.DataFrame((covariance + M) * self.delta, index = Sigma.index, columns = Sigma.columns)
 
         return Pi, Sigma
 
@@ -219,51 +221,41 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         return equilibrium_return, cov
 
+    def get_symbols(self, insights):
+        '''Gets the symbols of the insights without duplicates, in the order of the insights'''
+        return list({ str(insight.Symbol): insight.Symbol for insight in insights }.values())
+
     def get_views(self, insights):
         '''Generate views from multiple alpha models
         Args
             insights: Array of insight that represent the investors' views
         Returns
-            P: A matrix that identifies the assets involved in the views (size: K x N)
+            P: A matrix that identifies the assets involved in the views (size: K x N), the columns follow the order of the symbols in the insights
             Q: A view vector (size: K x 1)'''
-        try:
-            P = {}
-            Q = {}
-            for model, group in groupby(insights, lambda x: x.SourceModel):
-                group = list(group)
-
-                up_insights_sum = 0.0
-                dn_insights_sum = 0.0
-                for insight in group:
-                    if insight.Direction == InsightDirection.Up:
-                        up_insights_sum = up_insights_sum + np.abs(insight.Magnitude)
-                    if insight.Direction == InsightDirection.Down:
-                        dn_insights_sum = dn_insights_sum + np.abs(insight.Magnitude)
-
-                q = up_insights_sum if up_insights_sum > dn_insights_sum else dn_insights_sum
-                if q == 0:
-                    continue
-
-                Q[model] = q
-
-                # generate the link matrix of views: P
-                P[model] = dict()
-                for insight in group:
-                    value = insight.Direction * np.abs(insight.Magnitude)
-                    P[model][insight.Symbol] = value / q
-                # Add zero for other symbols that are listed but active insight
-                for symbol in self.symbolDataBySymbol.keys():
-                    if symbol not in P[model]:
-                        P[model][symbol] = 0
-
-            Q = np.array([[x] for x in Q.values()])
-            if len(Q) > 0:
-                P = np.array([list(x.values()) for x in P.values()])
-                return P, Q
-        except:
-            pass
-
-        return None, None
+        if len(insights) == 0 or any(insight.Magnitude is None for insight in insights):
+            return None, None
+
+        # Row of each source model and column of each symbol
+        models = {}
+        symbols = {}
+        rows = np.array([models.setdefault(insight.SourceModel, len(models)) for insight in insights])
+        columns = np.array([symbols.setdefault(str(insight.Symbol), len(symbols)) for insight in insights])
+        directions = np.array([int(insight.Direction) for insight in insights], dtype=float)
+        magnitudes = np.abs(np.array([insight.Magnitude for insight in insights], dtype=float))
+
+        # The view of each model is the largest of the sums of the magnitudes of its up and down insights
+        up = np.bincount(rows, weights = magnitudes * (directions > 0), minlength = len(models))
+        down = np.bincount(rows, weights = magnitudes * (directions < 0), minlength = len(models))
+        Q = np.maximum(up, down)
+
+        # generate the link matrix of views: P
+        P = np.zeros((len(models), len(symbols)))
+        P[rows, columns] = directions * magnitudes
+
+        views = Q != 0
+        if not views.any():
+            return None, None
+        return P[views] / Q[views, None], Q[views, None]
 
 
     class BlackLittermanSymbolData:
@@ -272,7 +264,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             self.symbol = symbol
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.window = ReturnsWindow(period)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
@@ -284,24 +276,21 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.Add(value.EndTime, value.Value)
 
         def Add(self, time, value):
-            if self.window.Samples > 0 and self.window[0].EndTime == time:
+            if self.window.LastTime == time:
                 return
 
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            self.window.Add(time, float(value))
 
         @property
         def Return(self):
-            return pd.Series(
-                data = [x.Value for x in self.window],
-                index = [x.EndTime for x in self.window])
+            return self.window.ToSeries()
 
         @property
         def IsReady(self):
             return self.window.IsReady
 
         def __str__(self, **kwargs):
-            return f'{self.roc.Name}: {(1 + self.window[0])**252 - 1:.2%}'
+            return f'{self.roc.Name}: {(1 + self.window.Values[-1])**252 - 1:.2%}'
@@ -31,6 +31,17 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
     public class EqualWeightingPortfolioConstructionModel : PortfolioConstructionModel
     {
         private readonly PortfolioBias _portfolioBias;
+        private Dictionary<Symbol, Insight> _insightBySymbol = new Dictionary<Symbol, Insight>();
+        private readonly Dictionary<Symbol, KeyValuePair<string, double>> _weightBySymbol = new Dictionary<Symbol, KeyValuePair<string, double>>();
+        private readonly Dictionary<string, GroupWeight> _weightByGroup = new Dictionary<string, GroupWeight>();
+        private readonly Dictionary<Symbol, double> _percentBySymbol = new Dictionary<Symbol, double>();
+
+        /// <summary>
+        /// True to only create the targets whose percent changed since the last rebalance. False by default.
+        /// Flat targets for expired insights and removed securities are created as usual.
+        /// It should be set before the first rebalance
+        /// </summary>
+        public bool Incremental { get; set; }
 
         /// <summary>
         /// Initialize a new instance of <see cref="EqualWeightingPortfolioConstructionModel"/>
@@ -117,6 +128,11 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>A target percent for each insight</returns>
         protected override Dictionary<Insight, double> DetermineTargetPercent(List<Insight> activeInsights)
         {
+            if (Incremental)
+            {
+                return DetermineChangedTargetPercent(activeInsights);
+            }
+
             var result = new Dictionary<Insight, double>();
 
             // give equal weighting to each security
@@ -131,6 +147,105 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
             return result;
         }
 
+        /// <summary>
+        /// Will determine the target percent of the insights whose target percent changed since the last call.
+        /// The weights of the insights that are new, changed or expired are updated by difference in the sums of their groups,
+        /// the target percent of the other insights is only determined if the sum of their group or the number of groups changed
+        /// </summary>
+        /// <param name="activeInsights">The active insights to generate a target for</param>
+        /// <returns>A target percent for each insight whose target percent changed</returns>
+        protected Dictionary<Insight, double> DetermineChangedTargetPercent(List<Insight> activeInsights)
+        {
+            var insightBySymbol = new Dictionary<Symbol, Insight>(activeInsights.Count);
+            foreach (var insight in activeInsights)
+            {
+                insightBySymbol[insight.Symbol] = insight;
+            }
+
+            var changedInsights = new List<Insight>();
+            foreach (var insight in insightBySymbol.Values)
+            {
+                Insight previous;
+                if (!_insightBySymbol.TryGetValue(insight.Symbol, out previous) || previous.Id != insight.Id)
+                {
+                    changedInsights.Add(insight);
+                }
+            }
+            var removedSymbols = _insightBySymbol.Keys.Where(symbol => !insightBySymbol.ContainsKey(symbol)).ToList();
+            _insightBySymbol = insightBySymbol;
+
+            var groupCount = GetGroupCount();
+            var changedGroups = new HashSet<string>();
+            foreach (var symbol in removedSymbols)
+            {
+                _percentBySymbol.Remove(symbol);
+                UpdateGroupWeight(symbol, null, changedGroups);
+            }
+            foreach (var insight in changedInsights)
+            {
+                UpdateGroupWeight(insight.Symbol, insight, changedGroups);
+            }
+
+            // the target percent of each group can depend on the number of groups
+            if (GetGroupCount() != groupCount)
+            {
+                changedGroups = new HashSet<string>(_weightByGroup.Keys);
+            }
+            groupCount = GetGroupCount();
+
+            var insights = changedInsights.Concat(changedGroups
+                .Where(group => _weightByGroup.ContainsKey(group))
+                .SelectMany(group => _weightByGroup[group].Symbols.Select(symbol => insightBySymbol[symbol])));
+
+            var result = new Dictionary<Insight, double>();
+            foreach (var insight in insights)
+            {
+                var group = _weightBySymbol[insight.Symbol].Key;
+                var percent = GetTargetPercent(insight, _weightByGroup[group].Weight, groupCount);
+
+                double previousPercent;
+                if (!_percentBySymbol.TryGetValue(insight.Symbol, out previousPercent) || previousPercent != percent)
+                {
+                    _percentBySymbol[insight.Symbol] = percent;
+                    result[insight] = percent;
+                }
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Gets the group of the insight, whose weights are added together to determine the target percent
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <returns>The group of the insight, all insights are in the same group by default</returns>
+        protected virtual string GetWeightingGroup(Insight insight)
+        {
+            return string.Empty;
+        }
+
+        /// <summary>
+        /// Gets the weight of the insight in the sum of its group
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <returns>One if the insight is accounted to the allocation, zero otherwise</returns>
+        protected virtual double GetWeight(Insight insight)
+        {
+            return insight.Direction != InsightDirection.Flat && RespectPortfolioBias(insight) ? 1 : 0;
+        }
+
+        /// <summary>
+        /// Gets the target percent of an insight
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <param name="groupWeight">The sum of the weights of the insights of its group</param>
+        /// <param name="groupCount">The number of groups with a positive sum of weights</param>
+        /// <returns>The target percent of the insight, as determined by <see cref="DetermineTargetPercent"/></returns>
+        protected virtual double GetTargetPercent(Insight insight, double groupWeight, int groupCount)
+        {
+            var percent = groupWeight == 0 ? 0 : 1m / (decimal)groupWeight;
+            return (double)((int)(RespectPortfolioBias(insight) ? insight.Direction : InsightDirection.Flat) * percent);
+        }
+
         /// <summary>
         /// Method that will determine if a given insight respects the portfolio bias
         /// </summary>
@@ -140,5 +255,68 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         {
             return _portfolioBias == PortfolioBias.LongShort || (int)insight.Direction == (int)_portfolioBias;
         }
+
+        /// <summary>
+        /// Replaces the weight of the previous insight of the symbol in the sum of its group by the weight of the new insight
+        /// </summary>
+        /// <param name="symbol">The symbol of the insights</param>
+        /// <param name="insight">The new insight, null if the symbol has no active insight</param>
+        /// <param name="changedGroups">The groups whose sum changed</param>
+        private void UpdateGroupWeight(Symbol symbol, Insight insight, HashSet<string> changedGroups)
+        {
+            KeyValuePair<string, double> previous;
+            if (_weightBySymbol.TryGetValue(symbol, out previous))
+            {
+                _weightBySymbol.Remove(symbol);
+                var groupWeight = _weightByGroup[previous.Key];
+                groupWeight.Symbols.Remove(symbol);
+                if (groupWeight.Symbols.Count == 0)
+                {
+                    // an empty group is removed, so rounding errors don't accumulate in its sum
+                    _weightByGroup.Remove(previous.Key);
+                }
+                else
+                {
+                    groupWeight.Weight -= previous.Value;
+                }
+                if (previous.Value != 0)
+                {
+                    changedGroups.Add(previous.Key);
+                }
+            }
+
+            if (insight != null)
+            {
+                var group = GetWeightingGroup(insight);
+                var weight = GetWeight(insight);
+                _weightBySymbol[symbol] = new KeyValuePair<string, double>(group, weight);
+
+                GroupWeight groupWeight;
+                if (!_weightByGroup.TryGetValue(group, out groupWeight))
+                {
+                    _weightByGroup[group] = groupWeight = new GroupWeight();
+                }
+                groupWeight.Weight += weight;
+                groupWeight.Symbols.Add(symbol);
+                if (weight != 0)
+                {
+                    changedGroups.Add(group);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the number of groups with a positive sum of weights
+        /// </summary>
+        private int GetGroupCount()
+        {
+            return _weightByGroup.Values.Count(groupWeight => groupWeight.Weight > 0);
+        }
+
+        private class GroupWeight
+        {
+            public double Weight { get; set; }
+            public HashSet<Symbol> Symbols { get; } = new HashSet<Symbol>();
+        }
     }
 }
\ No newline at end of file
@@ -31,6 +31,14 @@ class EqualWeightingPortfolioConstructionModel(PortfolioConstructionModel):
         super().__init__()
         self.portfolioBias = portfolioBias
 
+        # When True, only the targets whose percent changed since the last rebalance are created, it should be set before the first rebalance.
+        # Flat targets of expired insights and removed securities are created as usual
+        self.Incremental = False
+        self.insightBySymbol = {}
+        self.weightBySymbol = {}
+        self.weightByGroup = {}
+        self.percentBySymbol = {}
+
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
         rebalancingFunc = rebalance
@@ -45,6 +53,9 @@ class EqualWeightingPortfolioConstructionModel(PortfolioConstructionModel):
         '''Will determine the target percent for each insight
         Args:
             activeInsights: The active insights to generate a target for'''
+        if self.Incremental:
+            return self.DetermineChangedTargetPercent(activeInsights)
+
         result = {}
 
         # give equal weighting to each security
@@ -60,3 +71,98 @@ class EqualWeightingPortfolioConstructionModel(PortfolioConstructionModel):
             insight: The insight to create a target for
         '''
         return self.portfolioBias == PortfolioBias.LongShort or insight.Direction == self.portfolioBias
+
+    def DetermineChangedTargetPercent(self, activeInsights):
+        '''Will determine the target percent of the insights whose target percent changed since the last call.
+        The weights of the insights that are new, changed or expired are updated by difference in the sums of their groups,
+        the target percent of the other insights is only determined if the sum of their group or the number of groups changed
+        Args:
+            activeInsights: The active insights to generate a target for'''
+        insightBySymbol = { insight.Symbol: insight for insight in activeInsights }
+        changedInsights = [insight for symbol, insight in insightBySymbol.items()
+                           if symbol not in self.insightBySymbol or self.insightBySymbol[symbol].Id != insight.Id]
+        removedSymbols = [symbol for symbol in self.insightBySymbol if symbol not in insightBySymbol]
+        self.insightBySymbol = insightBySymbol
+
+        groupCount = self.GetGroupCount()
+        changedGroups = set()
+        for symbol in removedSymbols:
+            self.percentBySymbol.pop(symbol, None)
+            self.UpdateGroupWeight(symbol, None, changedGroups)
+        for insight in changedInsights:
+            self.UpdateGroupWeight(insight.Symbol, insight, changedGroups)
+
+        # the target percent of each group can depend on the number of groups
+        if self.GetGroupCount() != groupCount:
+            changedGroups = set(self.weightByGroup)
+
+        insights = changedInsights + [insightBySymbol[symbol] for group in changedGroups if group in self.weightByGroup
+                                      for symbol in self.weightByGroup[group][1]]
+        groupCount = self.GetGroupCount()
+        result = {}
+        for insight in insights:
+            group = self.weightBySymbol[insight.Symbol][0]
+            percent = self.GetTargetPercent(insight, self.weightByGroup[group][0], groupCount)
+            if self.percentBySymbol.get(insight.Symbol) != percent:
+                self.percentBySymbol[insight.Symbol] = percent
+                result[insight] = percent
+        return result
+
+    def UpdateGroupWeight(self, symbol, insight, changedGroups):
+        '''Replaces the weight of the previous insight of the symbol in the sum of its group by the weight of the new insight
+        Args:
+            symbol: The symbol of the insights
+            insight: The new insight, None if the symbol has no active insight
+            changedGroups: The groups whose sum changed'''
+        previous = self.weightBySymbol.pop(symbol, None)
+        if previous is not None:
+            group, weight = previous
+            groupWeight = self.weightByGroup[group]
+            groupWeight[1].discard(symbol)
+            if not groupWeight[1]:
+                # an empty group is removed, so rounding errors don't accumulate in its sum
+                del self.weightByGroup[group]
+            else:
+                groupWeight[0] -= weight
+            if weight != 0:
+                changedGroups.add(group)
+
+        if insight is not None:
+            group, weight = self.GetWeightingGroup(insight), self.GetWeight(insight)
+            self.weightBySymbol[symbol] = (group, weight)
+            groupWeight = self.weightByGroup.setdefault(group, [0, set()])
+            groupWeight[0] += weight
+            groupWeight[1].add(symbol)
+            if weight != 0:
+                changedGroups.add(group)
+
+    def GetGroupCount(self):
+        '''Gets the number of groups with a positive sum of weights'''
+        return sum(1 for groupWeight in self.weightByGroup.values() if groupWeight[0] > 0)
+
+    def GetWeightingGroup(self, insight):
+        '''Gets the group of the insight, whose weights are added together to determine the target percent
+        Args:
+            insight: The insight to create a target for
+        Returns:
+            The group of the insight, all insights are in the same group by default'''
+        return None
+
+    def GetWeight(self, insight):
+        '''Gets the weight of the insight in the sum of its group
+        Args:
+            insight: The insight to create a target for
+        Returns:
+            One if the insight is accounted to the allocation, zero otherwise'''
+        return 1 if insight.Direction != InsightDirection.Flat and self.RespectPortfolioBias(insight) else 0
+
+    def GetTargetPercent(self, insight, groupWeight, groupCount):
+        '''Gets the target percent of an insight
+        Args:
+            insight: The insight to create a target for
+            groupWeight: The sum of the weights of the insights of its group
+            groupCount: The number of groups with a positive sum of weights
+        Returns:
+            The target percent of the insight, as determined by DetermineTargetPercent'''
+        percent = 0 if groupWeight == 0 else 1.0 / groupWeight
+        return (insight.Direction if self.RespectPortfolioBias(insight) else InsightDirection.Flat) * percent
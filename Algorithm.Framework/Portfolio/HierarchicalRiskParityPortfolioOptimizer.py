@@ -0,0 +1,141 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+
+### <summary>
+### Provides an implementation of the hierarchical risk parity portfolio optimizer (Lopez de Prado, 2016).
+### The securities are clustered by the distance of their correlations, and the weights are split between
+### the halves of the clustered order in inverse proportion to their variance. The weights are long only and add up to 1.
+### </summary>
+class HierarchicalRiskParityPortfolioOptimizer:
+    '''Provides an implementation of the hierarchical risk parity portfolio optimizer (Lopez de Prado, 2016).
+    The securities are clustered by the distance of their correlations, and the weights are split between
+    the halves of the clustered order in inverse proportion to their variance. The weights are long only and add up to 1.
+    It doesn't invert the covariance matrix, so it's stable with many securities and few observations.
+    The clustering costs O(N²) and is reused between optimizations while the correlations of the same securities
+    don't move more than a tolerance from the ones it was computed with'''
+    def __init__(self,
+                 linkage_method = 'single',
+                 correlation_tolerance = 0.05):
+        '''Initialize the HierarchicalRiskParityPortfolioOptimizer
+        Args:
+            linkage_method(str): The scipy linkage method of the clustering. 'single', 'complete', 'average' and 'ward' cost O(N²)
+            correlation_tolerance(float): The largest change of a correlation that keeps the previous clustering'''
+        self.linkage_method = linkage_method
+        self.correlation_tolerance = correlation_tolerance
+        self.symbols = None
+        self.correlation = None
+        self.order = None
+
+    def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
+        '''
+        Perform portfolio optimization for a provided matrix of historical returns. The expected returns are not used
+        args:
+            historicalReturns: Matrix of annualized historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+            expectedReturns: Array of double with the portfolio annualized expected returns (size: K x 1).
+            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K).
+        Returns:
+            Array of double with the portfolio weights (size: K x 1)
+        '''
+        if covariance is None:
+            covariance = historicalReturns.cov()
+        covariance = np.asarray(covariance, dtype=float)
+        size = covariance.shape[0]
+
+        # securities without variance, e.g. without returns, are left out
+        variance = np.diag(covariance)
+        valid = np.isfinite(variance) & (variance > 0)
+        weights = np.zeros(size)
+        if not valid.any():
+            return weights
+
+        indices = np.flatnonzero(valid)
+        if len(indices) < size:
+            covariance = covariance[np.ix_(indices, indices)]
+        covariance = np.nan_to_num(covariance)
+        symbols = list(historicalReturns.columns[indices])
+
+        order = self.get_clustered_order(symbols, self.get_correlation(covariance))
+        weights[indices] = self.get_recursive_bisection(covariance, order)
+        return weights
+
+    def get_correlation(self, covariance):
+        '''Computes the correlation matrix from the covariance matrix'''
+        deviation = np.sqrt(np.diag(covariance))
+        correlation = np.clip(covariance / np.outer(deviation, deviation), -1, 1)
+        np.fill_diagonal(correlation, 1)
+        return correlation
+
+    def get_clustered_order(self, symbols, correlation):
+        '''Gets the order of the securities in the leaves of the clustering tree, where correlated securities are next to each other.
+        The order of the previous optimization is reused if it had the same securities and their correlations are within the tolerance'''
+        if self.order is not None and symbols == self.symbols \
+            and np.abs(correlation - self.correlation).max() <= self.correlation_tolerance:
+            return self.order
+
+        if len(symbols) == 1:
+            order = np.zeros(1, dtype=int)
+        else:
+            # the distance of the correlations is a metric: d = sqrt((1 - ρ) / 2)
+            distance = np.sqrt(np.clip((1 - correlation) / 2, 0, 1))
+            np.fill_diagonal(distance, 0)
+            order = leaves_list(linkage(squareform(distance, checks=False), method=self.linkage_method))
+
+        self.symbols = symbols
+        self.correlation = correlation
+        self.order = order
+        return order
+
+    def get_recursive_bisection(self, covariance, order):
+        '''Splits the weights between the halves of each cluster in inverse proportion to their variance, from the whole order to single securities.
+        In the clustered order the clusters are ranges, the variances of all the clusters of a level are computed at once from the diagonal blocks.
+        The clusters of a level have about the same size, so the levels cost N², N²/2, N²/4...'''
+        covariance = covariance[np.ix_(order, order)]
+        inverse_variance = 1 / np.diag(covariance)
+        # the variance of the inverse variance portfolio of a cluster is u'Cu / (Σu)², with u the inverse variances
+        scaled = covariance * np.outer(inverse_variance, inverse_variance)
+
+        size = len(order)
+        weights = np.ones(size)
+        boundaries = np.array([0, size])
+        while True:
+            starts, ends = boundaries[:-1], boundaries[1:]
+            split = ends - starts > 1
+            if not split.any():
+                break
+            middles = (starts[split] + ends[split]) // 2
+            boundaries = np.sort(np.concatenate([boundaries, middles]))
+
+            starts, sizes = boundaries[:-1], np.diff(boundaries)
+            offsets = np.arange(sizes.max())
+            mask = offsets < sizes[:, None]
+            index = np.minimum(starts[:, None] + offsets, size - 1)
+            blocks = scaled[index[:, :, None], index[:, None, :]]
+            variance = np.einsum('bij,bi,bj->b', blocks, mask, mask) / np.add.reduceat(inverse_variance, starts) ** 2
+
+            right = np.searchsorted(starts, middles)
+            left = right - 1
+            total = variance[left] + variance[right]
+            alpha = np.where(total == 0, 0.5, 1 - variance[left] / np.where(total == 0, 1, total))
+
+            factors = np.ones(len(starts))
+            factors[left] = alpha
+            factors[right] = 1 - alpha
+            weights *= np.repeat(factors, sizes)
+
+        result = np.empty(size)
+        result[order] = weights
+        return result
@@ -128,6 +128,11 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>A target percent for each insight</returns>
         protected override Dictionary<Insight, double> DetermineTargetPercent(List<Insight> activeInsights)
         {
+            if (Incremental)
+            {
+                return DetermineChangedTargetPercent(activeInsights);
+            }
+
             var result = new Dictionary<Insight, double>();
             // We will adjust weights proportionally in case the sum is > 1 so it sums to 1.
             var weightSums = activeInsights.Where(RespectPortfolioBias).Sum(insight => GetValue(insight));
@@ -145,6 +150,31 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
             return result;
         }
 
+        /// <summary>
+        /// Gets the weight of the insight in the sum of its group
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <returns>The value of the insight if it respects the portfolio bias, zero otherwise</returns>
+        protected override double GetWeight(Insight insight)
+        {
+            return RespectPortfolioBias(insight) ? GetValue(insight) : 0;
+        }
+
+        /// <summary>
+        /// Gets the target percent of an insight
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <param name="groupWeight">The sum of the weights of the insights of its group</param>
+        /// <param name="groupCount">The number of groups with a positive sum of weights</param>
+        /// <returns>The target percent of the insight, as determined by <see cref="DetermineTargetPercent"/></returns>
+        protected override double GetTargetPercent(Insight insight, double groupWeight, int groupCount)
+        {
+            var weightFactor = groupWeight > 1 ? 1 / groupWeight : 1.0;
+            return (int)(RespectPortfolioBias(insight) ? insight.Direction : InsightDirection.Flat)
+                   * GetValue(insight)
+                   * weightFactor;
+        }
+
         /// <summary>
         /// Method that will determine which member will be used to compute the weights and gets its value
         /// </summary>
@@ -47,6 +47,9 @@ class InsightWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruc
         '''Will determine the target percent for each insight
         Args:
             activeInsights: The active insights to generate a target for'''
+        if self.Incremental:
+            return self.DetermineChangedTargetPercent(activeInsights)
+
         result = {}
 
         # We will adjust weights proportionally in case the sum is > 1 so it sums to 1.
@@ -58,6 +61,25 @@ class InsightWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruc
             result[insight] = (insight.Direction if self.RespectPortfolioBias(insight) else InsightDirection.Flat) * self.GetValue(insight) * weightFactor
         return result
 
+    def GetWeight(self, insight):
+        '''Gets the weight of the insight in the sum of its group
+        Args:
+            insight: The insight to create a target for
+        Returns:
+            The value of the insight if it respects the portfolio bias, zero otherwise'''
+        return self.GetValue(insight) if self.RespectPortfolioBias(insight) else 0
+
+    def GetTargetPercent(self, insight, groupWeight, groupCount):
+        '''Gets the target percent of an insight
+        Args:
+            insight: The insight to create a target for
+            groupWeight: The sum of the weights of the insights of its group
+            groupCount: The number of groups with a positive sum of weights
+        Returns:
+            The target percent of the insight, as determined by DetermineTargetPercent'''
+        weightFactor = 1 / groupWeight if groupWeight > 1 else 1.0
+        return (insight.Direction if self.RespectPortfolioBias(insight) else InsightDirection.Flat) * self.GetValue(insight) * weightFactor
+
     def GetValue(self, insight):
         '''Method that will determine which member will be used to compute the weights and gets its value
         Args:
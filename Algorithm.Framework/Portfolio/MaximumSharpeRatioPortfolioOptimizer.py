@@ -12,6 +12,8 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Portfolio.PortfolioOptimizerBatch import PortfolioOptimizerBatch
+from Portfolio.QuadraticProgramSolver import QuadraticProgramSolver
 from scipy.optimize import minimize
 
 ### <summary>
@@ -36,6 +38,8 @@ class MaximumSharpeRatioPortfolioOptimizer:
         self.maximum_weight = maximum_weight
         self.risk_free_rate = risk_free_rate
         self.expected_returns = []
+        self.solver = QuadraticProgramSolver()
+        self.previous_weights = None
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
         '''
@@ -52,29 +56,64 @@ class MaximumSharpeRatioPortfolioOptimizer:
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
         expectedReturns = expectedReturns - self.risk_free_rate
+        symbols = covariance.columns
+        covariance = np.asarray(covariance, dtype=float)
+        expectedReturns = np.asarray(expectedReturns, dtype=float)
 
-        size = covariance.columns.size   # K x 1
+        size = symbols.size   # K x 1
         x0 = np.array(size * [1. / size])
         k = expectedReturns.dot(x0)
+        initial_weights = self.get_initial_weights(symbols, x0)
 
         # Sharpe Maximization under Quadratic Constraints
         # https://quant.stackexchange.com/questions/18521/sharpe-maximization-under-quadratic-constraints
-        # (µ − r_f)^T w = k
-        constraints = [
-            {'type': 'eq', 'fun': lambda weights: expectedReturns.dot(weights) - k}]
+        # (µ − r_f)^T w = k and Σw = 1 are linear, the weights are solved from the KKT conditions
+        weights = self.solver.Solve(covariance,
+                                    [expectedReturns, np.ones(size)],
+                                    [k, 1],
+                                    self.minimum_weight, self.maximum_weight, initial_weights)
 
-        # Σw = 1
-        constraints.append(
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)})
+        if weights is None:
+            # (µ − r_f)^T w = k
+            constraints = [
+                {'type': 'eq', 'fun': lambda weights: expectedReturns.dot(weights) - k, 'jac': lambda weights: expectedReturns}]
 
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
-                       constraints = constraints,                                 # Constraints definition
-                       method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
-        sharpe_ratio = expectedReturns.dot(opt['x']) / opt.fun
+            # Σw = 1
+            constraints.append(
+                {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: np.ones(size)})
 
-        return opt['x'] if opt['success'] else x0
+            opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
+                           initial_weights,                                           # Initial guess
+                           jac = lambda weights: 2 * covariance.dot(weights),         # Gradient of the objective function
+                           bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
+                           constraints = constraints,                                 # Constraints definition
+                           method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
+            if not opt['success']:
+                return x0
+            weights = opt['x']
+
+        self.previous_weights = pd.Series(weights, index=symbols)
+        return weights
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None, threads = None):
+        '''
+        Perform a portfolio optimization for each problem, e.g. for resamples of the historical returns
+        args:
+            historicalReturns: Matrix of annualized historical returns (size: K x N), or a list with one per problem.
+            expectedReturns: Array of double with the portfolio annualized expected returns (size: K x 1), or a list with one per problem.
+            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K), or a list with one per problem.
+            threads: The number of worker threads, None to solve the problems in the calling thread.
+        Returns:
+            Matrix of double with the portfolio weights of each problem (size: P x K)
+        '''
+        return PortfolioOptimizerBatch(threads).Optimize(self, historicalReturns, expectedReturns, covariance)
+
+    def get_initial_weights(self, symbols, default):
+        '''Warm starts from the weights of the previous optimization, new securities start from the equal weight'''
+        if self.previous_weights is None:
+            return default
+        weights = self.previous_weights.reindex(symbols).fillna(default[0]).values
+        return np.clip(weights, self.minimum_weight, self.maximum_weight)
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
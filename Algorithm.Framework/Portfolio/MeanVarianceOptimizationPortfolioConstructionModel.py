@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.RollingCovarianceEstimator import RollingCovarianceEstimator
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -26,7 +27,8 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
                  period = 63,
                  resolution = Resolution.Daily,
                  targetReturn = 0.02,
-                 optimizer = None):
+                 optimizer = None,
+                 covarianceShrinkage = None):
         """Initialize the model
         Args:
             rebalance: Rebalancing parameter. If it is a timedelta, date rules or Resolution, it will be converted into a function.
@@ -38,7 +40,9 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
             lookback(int): Historical return lookback period
             period(int): The time interval of history price to calculate the weight
             resolution: The resolution of the history price
-            optimizer(class): Method used to compute the portfolio weights"""
+            optimizer(class): Method used to compute the portfolio weights
+            covarianceShrinkage: None for the sample covariance of the returns, 'ledoit-wolf' or a number between 0 and 1
+                                 to shrink it towards a scaled identity"""
         super().__init__()
         self.lookback = lookback
         self.period = period
@@ -51,6 +55,8 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, targetReturn) if optimizer is None else optimizer
 
         self.symbolDataBySymbol = {}
+        # rolling mean and covariance of the returns of every symbol, updated with each return
+        self.estimator = RollingCovarianceEstimator(period, covarianceShrinkage)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
@@ -88,12 +94,12 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         symbols = [insight.Symbol for insight in activeInsights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-        returns = { str(symbol) : data.Return for symbol, data in self.symbolDataBySymbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The returns, their mean and covariance are kept up to date by the estimator, keyed by the string representation of the symbols in the insights
+        keys = [ str(symbol) for symbol in self.symbolDataBySymbol if symbol in symbols and self.estimator.Contains(str(symbol)) ]
+        returns = self.estimator.Returns(keys)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.Optimize(returns)
+        weights = self.optimizer.Optimize(returns, self.estimator.Mean(keys), self.estimator.Covariance(keys))
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -117,7 +123,8 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         super().OnSecuritiesChanged(algorithm, changes)
         for removed in changes.RemovedSecurities:
             symbolData = self.symbolDataBySymbol.pop(removed.Symbol, None)
-            symbolData.Reset()
+            if symbolData is not None:
+                symbolData.Reset()
 
         # initialize data for added securities
         symbols = [ x.Symbol for x in changes.AddedSecurities ]
@@ -129,44 +136,42 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
             symbol = SymbolCache.GetSymbol(ticker)
 
             if symbol not in self.symbolDataBySymbol:
-                symbolData = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
-                symbolData.WarmUpIndicators(history.loc[ticker])
+                symbolData = self.MeanVarianceSymbolData(symbol, self.lookback, self.estimator)
+                symbolData.WarmUpIndicators(algorithm, history.loc[ticker])
                 self.symbolDataBySymbol[symbol] = symbolData
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, estimator):
             self.symbol = symbol
+            self.key = str(symbol)
+            self.estimator = estimator
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
             self.roc.Reset()
-            self.window.Reset()
+            self.estimator.Remove(self.key)
 
-        def WarmUpIndicators(self, history):
-            for tuple in history.itertuples():
-                self.roc.Update(tuple.Index, tuple.close)
+        def WarmUpIndicators(self, algorithm, history):
+            algorithm.WarmUpIndicator(self.roc, history)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.Add(value.EndTime, value.Value)
 
         def Add(self, time, value):
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            # the annualized return
+            self.estimator.Add(self.key, time, (1 + float(value))**252 - 1)
 
         @property
         def Return(self):
-            return pd.Series(
-                data = [(1 + float(x.Value))**252 - 1 for x in self.window],
-                index = [x.EndTime for x in self.window])
+            return self.estimator.Returns([self.key])[self.key].dropna()
 
         @property
         def IsReady(self):
-            return self.window.IsReady
+            return self.estimator.IsReady(self.key)
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.Name, (1 + self.window[0])**252 - 1)
+            return '{}: {:.2%}'.format(self.roc.Name, self.estimator.Mean([self.key])[self.key])
@@ -12,6 +12,8 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Portfolio.PortfolioOptimizerBatch import PortfolioOptimizerBatch
+from Portfolio.QuadraticProgramSolver import QuadraticProgramSolver
 from scipy.optimize import minimize
 
 ### <summary>
@@ -33,6 +35,8 @@ class MinimumVariancePortfolioOptimizer:
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.solver = QuadraticProgramSolver()
+        self.previous_weights = None
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
         '''
@@ -48,22 +52,64 @@ class MinimumVariancePortfolioOptimizer:
             covariance = historicalReturns.cov()
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
+        covariance = np.asarray(covariance, dtype=float)
+        expectedReturns = np.asarray(expectedReturns, dtype=float)
 
         size = historicalReturns.columns.size   # K x 1
         x0 = np.array(size * [1. / size])
+        initial_weights = self.get_initial_weights(historicalReturns.columns, x0)
 
-        constraints = [
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
-            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expectedReturns)}]
+        # The budget and target constraints are linear, the weights are solved from the KKT conditions
+        weights = self.solver.Solve(covariance,
+                                    [np.ones(size), expectedReturns],
+                                    [1, self.target_return],
+                                    self.minimum_weight, self.maximum_weight, initial_weights)
 
-        # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables
-                       constraints = constraints,                                 # Constraints definition
-                       method='trust-constr')   # Optimization method:  trust-region algorithm for constrained optimization
+        if weights is None:
+            if not (np.all(np.isfinite(covariance)) and np.all(np.isfinite(expectedReturns))):
+                # trust-constr raises for non finite inputs, e.g. the covariance of a security without enough returns
+                return x0
 
-        return opt['x'] if opt['success'] else x0
+            constraints = [
+                {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: np.ones(size)},
+                {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expectedReturns), 'jac': lambda weights: expectedReturns}]
+
+            # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
+            opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
+                           initial_weights,                                           # Initial guess
+                           jac = lambda weights: 2 * covariance.dot(weights),         # Gradient of the objective function
+                           hess = lambda weights: 2 * covariance,                     # Hessian of the objective function
+                           bounds = self.get_boundary_conditions(size),               # Bounds for variables
+                           constraints = constraints,                                 # Constraints definition
+                           method='trust-constr')   # Optimization method:  trust-region algorithm for constrained optimization
+            if not opt['success']:
+                return x0
+            weights = opt['x']
+
+        self.previous_weights = pd.Series(weights, index=historicalReturns.columns)
+        return weights
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None, target_returns = None, threads = None):
+        '''
+        Perform a portfolio optimization for each problem, e.g. for a grid of target returns or for resamples of the historical returns
+        args:
+            historicalReturns: Matrix of annualized historical returns (size: K x N), or a list with one per problem.
+            expectedReturns: Array of double with the portfolio annualized expected returns (size: K x 1), or a list with one per problem.
+            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K), or a list with one per problem.
+            target_returns: The target portfolio return of each problem, None to use the target return of the optimizer.
+            threads: The number of worker threads, None to solve the problems in the calling thread.
+        Returns:
+            Matrix of double with the portfolio weights of each problem (size: P x K)
+        '''
+        target_return = self.target_return if target_returns is None else list(target_returns)
+        return PortfolioOptimizerBatch(threads).Optimize(self, historicalReturns, expectedReturns, covariance, target_return = target_return)
+
+    def get_initial_weights(self, symbols, default):
+        '''Warm starts from the weights of the previous optimization, new securities start from the equal weight'''
+        if self.previous_weights is None:
+            return default
+        weights = self.previous_weights.reindex(symbols).fillna(default[0]).values
+        return np.clip(weights, self.minimum_weight, self.maximum_weight)
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
@@ -86,4 +132,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expectedReturns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expectedReturns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expectedReturns, weights) - self.target_return
@@ -0,0 +1,84 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+### <summary>
+### Solves many portfolio optimization problems with the same optimizer, in a pool of threads.
+### </summary>
+class PortfolioOptimizerBatch:
+    '''Solves many portfolio optimization problems with the same optimizer, in a pool of threads,
+    e.g. a grid of target returns or resamples of the historical returns for robust weights.
+    The problems are split in contiguous chunks, one per thread, and each chunk is solved in order by its own copy of the optimizer,
+    so each problem warm starts from the solution of the previous one, which is close for neighbouring target returns.
+    Threads are used instead of processes because the algorithm runs inside the .NET host: forking the CLR is unsafe and
+    spawned processes would start the Lean launcher. The threads run in parallel while numpy releases the GIL in the linear algebra'''
+    def __init__(self, threads = None):
+        '''Initialize the PortfolioOptimizerBatch
+        Args:
+            threads(int): The number of worker threads. None or 1 solves the problems in the calling thread'''
+        self.threads = threads
+
+    def Optimize(self, optimizer, historicalReturns, expectedReturns = None, covariance = None, **parameters):
+        '''Solves a problem for each value of the arguments given as lists, the other arguments are shared by all the problems.
+        The problems must have the same securities
+        Args:
+            optimizer: The portfolio optimizer, it's copied and left unchanged
+            historicalReturns: Matrix of historical returns (size: K x N), or a list with one per problem
+            expectedReturns: Array of the expected returns (size: K x 1), or a list with one per problem
+            covariance: Covariance matrix of the returns (size: K x K), or a list with one per problem
+            parameters: Attributes of the optimizer set before solving each problem, e.g. target_return, or a list with one per problem
+        Returns:
+            Matrix of double with the portfolio weights of each problem (size: P x K)'''
+        problems = self.get_problems(historicalReturns, expectedReturns, covariance, parameters)
+
+        threads = min(self.threads or 1, len(problems))
+        if threads <= 1:
+            return np.array(solve_problems(deepcopy(optimizer), problems))
+
+        chunks = np.array_split(np.arange(len(problems)), threads)
+        with ThreadPoolExecutor(max_workers = threads) as executor:
+            futures = [executor.submit(solve_problems, deepcopy(optimizer), [problems[i] for i in chunk]) for chunk in chunks]
+            return np.array([weights for future in futures for weights in future.result()])
+
+    def get_problems(self, historicalReturns, expectedReturns, covariance, parameters):
+        '''Gets the arguments of each problem. The moments of shared historical returns are computed once for all the problems'''
+        arguments = dict(parameters, historicalReturns = historicalReturns, expectedReturns = expectedReturns, covariance = covariance)
+        counts = {len(value) for value in arguments.values() if isinstance(value, list)}
+        if len(counts) > 1:
+            raise ValueError(f'PortfolioOptimizerBatch.Optimize: the lists of arguments must have the same length, got {sorted(counts)}')
+        count = counts.pop() if counts else 1
+
+        if not isinstance(historicalReturns, list):
+            if covariance is None:
+                arguments['covariance'] = historicalReturns.cov()
+            if expectedReturns is None:
+                arguments['expectedReturns'] = historicalReturns.mean()
+
+        return [{name: value[i] if isinstance(value, list) else value for name, value in arguments.items()}
+                for i in range(count)]
+
+def solve_problems(optimizer, problems):
+    '''Solves the problems in order with the optimizer'''
+    results = []
+    for problem in problems:
+        problem = dict(problem)
+        historicalReturns = problem.pop('historicalReturns')
+        expectedReturns = problem.pop('expectedReturns')
+        covariance = problem.pop('covariance')
+        for name, value in problem.items():
+            setattr(optimizer, name, value)
+        results.append(np.asarray(optimizer.Optimize(historicalReturns, expectedReturns, covariance), dtype = float))
+    return results
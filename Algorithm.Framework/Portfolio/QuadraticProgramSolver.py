@@ -0,0 +1,194 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+### <summary>
+### Solves the quadratic programs of the portfolio optimizers: minimize the portfolio variance subject to
+### linear equality constraints (budget, target return) and box bounds on the weights.
+### </summary>
+class QuadraticProgramSolver:
+    '''Solves the quadratic programs of the portfolio optimizers: minimize the portfolio variance w'Σw subject to
+    linear equality constraints Aw = b (budget, target return) and box bounds on the weights.
+    When no bound is binding the solution is the closed-form solution of the KKT system, otherwise an active-set method
+    fixes weights at their bounds until the KKT conditions hold. If the active set can't be found from the initial guess,
+    e.g. for a singular covariance of many assets, it is estimated with ADMM iterations (as done by OSQP) and then refined.
+    Returns None when no solution is found or the inputs are not finite, so the caller can fall back to a general purpose solver'''
+    def __init__(self, tolerance = 1e-9, max_iterations = None, admm_iterations = 4000):
+        '''Initialize the QuadraticProgramSolver
+        Args:
+            tolerance(float): The tolerance of the KKT conditions
+            max_iterations(int): The maximum number of active set changes, defaults to twice the number of weights
+            admm_iterations(int): The maximum number of ADMM iterations used to estimate the active set'''
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.admm_iterations = admm_iterations
+
+    def Solve(self, covariance, constraints_matrix, constraints_values, minimum_weight, maximum_weight, initial_weights = None):
+        '''Minimizes w'Σw subject to Aw = b and minimum_weight <= w <= maximum_weight
+        Args:
+            covariance: Covariance matrix Σ (size: K x K)
+            constraints_matrix: Matrix A of the equality constraints (size: M x K)
+            constraints_values: Array b of the equality constraints (size: M)
+            minimum_weight: The lower bound of the weights, scalar or array of size K
+            maximum_weight: The upper bound of the weights, scalar or array of size K
+            initial_weights: Weights of a previous solution used to guess the active bounds, e.g. the weights of the previous rebalance
+        Returns:
+            Array of double with the optimal weights (size: K), or None if it was not found'''
+        covariance = np.asarray(covariance, dtype=float)
+        A = np.atleast_2d(np.asarray(constraints_matrix, dtype=float))
+        b = np.asarray(constraints_values, dtype=float)
+        size = covariance.shape[0]
+        lower = np.broadcast_to(np.asarray(minimum_weight, dtype=float), (size,))
+        upper = np.broadcast_to(np.asarray(maximum_weight, dtype=float), (size,))
+        if size == 0 or np.any(lower > upper):
+            return None
+        if not (np.all(np.isfinite(covariance)) and np.all(np.isfinite(A)) and np.all(np.isfinite(b))):
+            # e.g. the covariance of a security without enough returns, the caller falls back to its default weights
+            return None
+
+        # scaling the objective doesn't change the solution, it keeps the tolerances and ADMM step independent of the returns scale
+        scale = np.abs(np.diag(covariance)).mean()
+        if scale > 0:
+            covariance = covariance / scale
+
+        at_lower = np.zeros(size, dtype=bool)
+        at_upper = np.zeros(size, dtype=bool)
+        if initial_weights is not None:
+            initial_weights = np.asarray(initial_weights, dtype=float)
+            at_lower = initial_weights <= lower + self.tolerance
+            at_upper = ~at_lower & (initial_weights >= upper - self.tolerance)
+
+        weights = self.solve_active_set(covariance, A, b, lower, upper, at_lower, at_upper)
+        if weights is not None:
+            return weights
+
+        weights, at_lower, at_upper = self.solve_admm(covariance, A, b, lower, upper, initial_weights)
+        refined = self.solve_active_set(covariance, A, b, lower, upper, at_lower, at_upper)
+        if refined is not None:
+            return refined
+        return weights if self.is_feasible(weights, A, b, lower, upper, 1e-6) else None
+
+    def solve_active_set(self, covariance, A, b, lower, upper, at_lower, at_upper):
+        '''Active-set method: fixes the free weights out of their bounds and releases the fixed weights
+        whose Lagrange multipliers have the wrong sign until the KKT conditions hold
+        Returns:
+            Array of double with the optimal weights, or None if it did not converge'''
+        at_lower = at_lower.copy()
+        at_upper = at_upper.copy()
+        size = covariance.shape[0]
+        max_iterations = self.max_iterations if self.max_iterations is not None else 2 * size + 10
+
+        for _ in range(max_iterations):
+            weights, multipliers = self.solve_equality_constrained(covariance, A, b, lower, upper, at_lower, at_upper)
+            if weights is None:
+                return None
+
+            free = ~at_lower & ~at_upper
+            below = free & (weights < lower - self.tolerance)
+            above = free & (weights > upper + self.tolerance)
+            if below.any() or above.any():
+                at_lower |= below
+                at_upper |= above
+                continue
+
+            # the objective decreases moving the fixed weight with the largest violation inside its bounds
+            gradient = 2 * covariance.dot(weights) + A.T.dot(multipliers)
+            violation = np.where(at_lower, -gradient, 0) + np.where(at_upper, gradient, 0)
+            index = np.argmax(violation)
+            if violation[index] <= self.tolerance * max(1, np.abs(gradient).max()):
+                return weights if self.is_feasible(weights, A, b, lower, upper, 1e-8) else None
+            at_lower[index] = at_upper[index] = False
+
+        return None
+
+    def solve_equality_constrained(self, covariance, A, b, lower, upper, at_lower, at_upper):
+        '''Solves the KKT system of the free weights, with the fixed weights at their bounds
+        Returns:
+            The weights and the Lagrange multipliers of the equality constraints, or None if the system has no solution'''
+        free = ~at_lower & ~at_upper
+        weights = np.where(at_lower, lower, np.where(at_upper, upper, 0.))
+        count = free.sum()
+        constraints = A.shape[0]
+
+        # [2Σff Af'] [wf]   [-2Σfb wb]
+        # [Af    0 ] [λ ] = [b - Ab wb]
+        kkt = np.zeros((count + constraints, count + constraints))
+        kkt[:count, :count] = 2 * covariance[np.ix_(free, free)]
+        kkt[:count, count:] = A[:, free].T
+        kkt[count:, :count] = A[:, free]
+        rhs = np.concatenate([-2 * covariance[free].dot(weights), b - A.dot(weights)])
+
+        try:
+            solution = np.linalg.solve(kkt, rhs)
+        except np.linalg.LinAlgError:
+            solution = None
+        if solution is None or not np.allclose(kkt.dot(solution), rhs, atol=1e-8):
+            # singular covariance, e.g. more assets than observations: any least squares solution of the KKT system is optimal
+            try:
+                solution = np.linalg.lstsq(kkt, rhs, rcond=None)[0]
+            except np.linalg.LinAlgError:
+                return None, None
+            if not np.allclose(kkt.dot(solution), rhs, atol=1e-8):
+                return None, None
+
+        weights[free] = solution[:count]
+        return weights, solution[count:]
+
+    def solve_admm(self, covariance, A, b, lower, upper, initial_weights):
+        '''Approximates the solution with the ADMM iterations of OSQP for the constraints l <= Cw <= u, where C stacks A over the identity.
+        The linear system is factorized once, each iteration costs two triangular solves
+        Returns:
+            The approximate weights and the bounds that are active'''
+        size = covariance.shape[0]
+        constraints = A.shape[0]
+        sigma, alpha, rho = 1e-6, 1.6, 0.1
+        # equality constraints take a larger step, as in OSQP
+        rho_equality = 1e3 * rho
+
+        factor = cho_factor(2 * covariance + (sigma + rho) * np.eye(size) + rho_equality * A.T.dot(A))
+
+        weights = np.clip(initial_weights if initial_weights is not None else np.full(size, 1. / size), lower, upper)
+        z_equality, z_bounds = b.copy(), weights.copy()
+        y_equality, y_bounds = np.zeros(constraints), np.zeros(size)
+
+        for iteration in range(self.admm_iterations):
+            rhs = sigma * weights + A.T.dot(rho_equality * z_equality - y_equality) + rho * z_bounds - y_bounds
+            solution = cho_solve(factor, rhs)
+            weights = alpha * solution + (1 - alpha) * weights
+
+            relaxed_equality = alpha * A.dot(solution) + (1 - alpha) * z_equality
+            relaxed_bounds = alpha * solution + (1 - alpha) * z_bounds
+            z_equality = b
+            z_bounds = np.clip(relaxed_bounds + y_bounds / rho, lower, upper)
+            y_equality = y_equality + rho_equality * (relaxed_equality - z_equality)
+            y_bounds = y_bounds + rho * (relaxed_bounds - z_bounds)
+
+            if iteration % 10 == 0:
+                primal = max(np.abs(A.dot(weights) - b).max(), np.abs(weights - z_bounds).max())
+                dual = np.abs(2 * covariance.dot(weights) + A.T.dot(y_equality) + y_bounds).max()
+                if primal < 1e-7 and dual < 1e-7:
+                    break
+
+        # active bounds as in the solution polishing of OSQP
+        at_lower = z_bounds - lower < -y_bounds
+        at_upper = ~at_lower & (upper - z_bounds < y_bounds)
+        return z_bounds, at_lower, at_upper
+
+    def is_feasible(self, weights, A, b, lower, upper, tolerance):
+        '''Checks the weights satisfy the equality constraints and the bounds'''
+        return np.all(np.isfinite(weights)) \
+            and np.allclose(A.dot(weights), b, atol=tolerance) \
+            and np.all(weights >= lower - tolerance) \
+            and np.all(weights <= upper + tolerance)
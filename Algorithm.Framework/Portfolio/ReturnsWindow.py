@@ -0,0 +1,101 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+
+### <summary>
+### Fixed size window of the latest returns of a security, oldest first, backed by numpy arrays.
+### </summary>
+class ReturnsWindow:
+    '''Fixed size window of the latest returns of a security, oldest first, backed by numpy arrays.
+    Each return is written twice in a buffer of twice the size, at its position and at its position plus the size,
+    so the window is always a contiguous slice of the buffer: adding a return is O(1) and Values and Times are views, not copies.
+    The views are only valid until the next change of the window'''
+    __slots__ = ['Size', 'Count', 'position', 'times', 'values']
+
+    def __init__(self, size):
+        '''Initialize the ReturnsWindow
+        Args:
+            size(int): The number of returns kept'''
+        if size < 1:
+            raise ValueError(f"ReturnsWindow: size must be positive, got {size}")
+        self.Size = size
+        self.Count = 0
+        # position of the next return in the first half of the buffer
+        self.position = 0
+        self.times = np.empty(2 * size, dtype=object)
+        self.values = np.zeros(2 * size)
+
+    def Add(self, time, value):
+        '''Adds a return, evicting the oldest one if the window is full
+        Args:
+            time: The time of the return
+            value(float): The return
+        Returns:
+            The (time, value) tuple of the evicted return, None if the window was not full'''
+        position = self.position
+        evicted = None
+        if self.Count == self.Size:
+            evicted = (self.times[position], self.values[position])
+        else:
+            self.Count += 1
+
+        self.times[position] = self.times[position + self.Size] = time
+        self.values[position] = self.values[position + self.Size] = value
+        self.position = (position + 1) % self.Size
+        return evicted
+
+    def SetLast(self, value):
+        '''Replaces the value of the latest return'''
+        position = (self.position - 1) % self.Size
+        self.values[position] = self.values[position + self.Size] = value
+
+    def Reset(self):
+        '''Removes all returns'''
+        self.Count = 0
+        self.position = 0
+        self.times[:] = None
+
+    @property
+    def IsReady(self):
+        '''True if the window is full'''
+        return self.Count == self.Size
+
+    @property
+    def LastTime(self):
+        '''The time of the latest return, None if the window is empty'''
+        return self.times[(self.position - 1) % self.Size] if self.Count > 0 else None
+
+    @property
+    def Times(self):
+        '''The times of the returns, oldest first'''
+        return self.times[self.window()]
+
+    @property
+    def Values(self):
+        '''The returns, oldest first'''
+        return self.values[self.window()]
+
+    def ToSeries(self):
+        '''Gets the returns as a pandas.Series indexed by time, oldest first'''
+        window = self.window()
+        return pd.Series(self.values[window].copy(), index = self.times[window])
+
+    def window(self):
+        '''Gets the slice of the buffer holding the returns'''
+        start = (self.position - self.Count) % self.Size
+        return slice(start, start + self.Count)
+
+    def __len__(self):
+        return self.Count
@@ -0,0 +1,270 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+from Portfolio.ReturnsWindow import ReturnsWindow
+
+### <summary>
+### Rolling mean and covariance of the returns of many securities, updated as each return arrives.
+### </summary>
+class RollingCovarianceEstimator:
+    '''Rolling mean and covariance of the returns of many securities, updated as each return arrives.
+    Each security keeps its last `period` returns. The running sums of every pair of securities with returns at the same time
+    are updated when the returns are added or evicted, so a new return costs O(N) instead of recomputing the O(N²T) covariance.
+    The changes are applied per time before reading, the returns of N securities at the same time are a single outer product.
+    Reading the mean and covariance of K securities costs O(K²). Pairs of securities use the times both have a return, like pandas.DataFrame.cov.
+    The sums are of the returns minus the first return of each security, so they don't lose the precision of the covariance
+    when the mean is large compared to the deviations, and they are recomputed from the kept returns every `period` times
+    so the rounding errors of the updates don't accumulate'''
+    def __init__(self, period, shrinkage = None):
+        '''Initialize the RollingCovarianceEstimator
+        Args:
+            period(int): The number of returns kept for each security
+            shrinkage: None for the sample covariance, 'ledoit-wolf' to shrink it towards a scaled identity with the
+                       Ledoit-Wolf intensity, or a float between 0 and 1 for a fixed intensity'''
+        if not (shrinkage is None or shrinkage == 'ledoit-wolf' or 0 <= shrinkage <= 1):
+            raise ValueError(f"RollingCovarianceEstimator: shrinkage must be None, 'ledoit-wolf' or a number between 0 and 1, got {shrinkage}")
+        self.period = period
+        self.shrinkage = shrinkage
+        self.slots = {}
+        self.free_slots = []
+        self.windows = []
+        self.values_by_time = {}
+        self.pending = {}
+        self.counts = np.zeros((0, 0))
+        self.products = np.zeros((0, 0))
+        self.sums = np.zeros((0, 0))
+        self.shifts = np.zeros(0)
+        # number of times applied to the running sums since they were recomputed
+        self.updates = 0
+
+    def Add(self, key, time, value):
+        '''Adds the return of a security, evicting its oldest return when it has `period` of them.
+        The returns of a security are added in time order, a second return at the time of the latest one replaces it
+        Args:
+            key: The security, e.g. the string representation of its symbol
+            time: The time of the return
+            value(float): The return'''
+        slot = self.get_slot(key)
+        window = self.windows[slot]
+        if window.Count == 0:
+            self.shifts[slot] = value
+        if window.LastTime == time:
+            window.SetLast(value)
+        else:
+            evicted = window.Add(time, value)
+            if evicted is not None:
+                self.set_value(slot, evicted[0], None)
+        self.set_value(slot, time, value)
+
+    def Remove(self, key):
+        '''Removes a security and its returns
+        Args:
+            key: The security'''
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        window = self.windows[slot]
+        for time in window.Times:
+            self.set_value(slot, time, None)
+        window.Reset()
+        self.apply_pending()
+        # clear the rounding residue before the slot is reused
+        for matrix in [self.counts, self.products, self.sums]:
+            matrix[slot, :] = 0
+            matrix[:, slot] = 0
+        self.free_slots.append(slot)
+
+    def Contains(self, key):
+        '''True if the estimator has returns of the security'''
+        return key in self.slots
+
+    def IsReady(self, key):
+        '''True if the security has `period` returns'''
+        slot = self.slots.get(key)
+        return slot is not None and self.windows[slot].IsReady
+
+    def Returns(self, keys):
+        '''Gets the returns of the securities
+        Args:
+            keys: The securities
+        Returns:
+            pandas.DataFrame with a row per time and a column per security, NaN where a security has no return at that time'''
+        slots = [self.slots[key] for key in keys]
+        times = sorted({time for slot in slots for time in self.windows[slot].Times})
+        rows = {time: row for row, time in enumerate(times)}
+        values = np.full((len(times), len(slots)), np.nan)
+        for column, slot in enumerate(slots):
+            window = self.windows[slot]
+            values[[rows[time] for time in window.Times], column] = window.Values
+        return pd.DataFrame(values, index=times, columns=list(keys))
+
+    def Mean(self, keys):
+        '''Gets the mean of the returns of the securities
+        Returns:
+            pandas.Series of the mean return keyed by security'''
+        self.apply_pending()
+        slots = [self.slots[key] for key in keys]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = self.shifts[slots] + np.diag(self.sums)[slots] / np.diag(self.counts)[slots]
+        return pd.Series(mean, index=list(keys))
+
+    def Covariance(self, keys):
+        '''Gets the covariance of the returns of the securities, shrunk if requested
+        Returns:
+            pandas.DataFrame of the covariance, NaN for pairs of securities with less than two returns at the same times'''
+        self.apply_pending()
+        slots = np.array([self.slots[key] for key in keys], dtype=int)
+        # the securities are usually every security in order of addition, a slice avoids copying with fancy indexing
+        index = np.s_[:len(slots), :len(slots)] if np.array_equal(slots, np.arange(len(slots))) else np.ix_(slots, slots)
+        counts = self.counts[index]
+        sums = self.sums[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = (self.products[index] - sums * sums.T / counts) / (counts - 1)
+        covariance[counts < 2] = np.nan
+
+        if self.shrinkage is not None and len(slots) > 0 and not np.isnan(covariance).any():
+            covariance = self.shrink(covariance, keys)
+        return pd.DataFrame(covariance, index=list(keys), columns=list(keys))
+
+    def shrink(self, covariance, keys):
+        '''Shrinks the covariance towards the identity scaled by the average variance'''
+        size = covariance.shape[0]
+        target = np.trace(covariance) / size
+        intensity = self.shrinkage
+        if intensity == 'ledoit-wolf':
+            # Ledoit-Wolf (2004) intensity: the variance of the sample covariance over its distance to the target.
+            # The fourth moments only need the norms of the demeaned returns, O(NT) instead of O(N²T)
+            returns = self.Returns(keys)
+            demeaned = np.nan_to_num(returns.values - self.Mean(keys).values)
+            observations = demeaned.shape[0]
+            sample = covariance * (observations - 1) / observations
+            distance = np.sum((sample - target * (observations - 1) / observations * np.eye(size)) ** 2)
+            variance = (np.sum(np.sum(demeaned ** 2, axis=1) ** 2) / observations - np.sum(sample ** 2)) / observations
+            intensity = 0 if distance == 0 else min(max(variance, 0), distance) / distance
+        return (1 - intensity) * covariance + intensity * target * np.eye(size)
+
+    def get_slot(self, key):
+        '''Gets the row/column of the security in the running sums, growing them if needed'''
+        slot = self.slots.get(key)
+        if slot is not None:
+            return slot
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.windows)
+            self.windows.append(ReturnsWindow(self.period))
+            if slot >= self.counts.shape[0]:
+                capacity = max(8, 2 * self.counts.shape[0])
+                self.counts, self.products, self.sums = [self.resize(x, capacity) for x in [self.counts, self.products, self.sums]]
+                self.shifts = np.concatenate([self.shifts, np.zeros(capacity - len(self.shifts))])
+        self.slots[key] = slot
+        return slot
+
+    def resize(self, matrix, capacity):
+        '''Copies the running sums in a larger matrix'''
+        resized = np.zeros((capacity, capacity))
+        resized[:matrix.shape[0], :matrix.shape[1]] = matrix
+        return resized
+
+    def set_value(self, slot, time, value):
+        '''Sets (or removes, with None) the return of a security at a time, keeping the value it had before the pending changes.
+        The value is kept minus the shift of the security'''
+        values = self.values_by_time.setdefault(time, {})
+        self.pending.setdefault(time, {}).setdefault(slot, values.get(slot))
+        if value is None:
+            values.pop(slot, None)
+        else:
+            values[slot] = value - self.shifts[slot]
+
+    def apply_pending(self):
+        '''Updates the running sums with the returns added and removed since the last read.
+        At each time, the pairs of the kept returns K with the removed returns R are removed and the pairs with the added returns A are added'''
+        self.updates += len(self.pending)
+        if self.updates > self.period:
+            self.recompute()
+            return
+
+        for time, changes in self.pending.items():
+            values = self.values_by_time.get(time, {})
+            removed = [(slot, value) for slot, value in changes.items() if value is not None]
+            added = [(slot, values[slot]) for slot in changes if slot in values]
+            kept = [(slot, value) for slot, value in values.items() if slot not in changes]
+
+            self.update_pairs(added, kept, 1)
+            self.update_pairs(added, None, 1)
+            self.update_pairs(removed, kept, -1)
+            self.update_pairs(removed, None, -1)
+
+            if not values:
+                self.values_by_time.pop(time, None)
+        self.pending.clear()
+
+    def recompute(self):
+        '''Recomputes the running sums from the kept returns, dropping the rounding errors of the updates. Costs O(N²T)'''
+        for matrix in [self.counts, self.products, self.sums]:
+            matrix[:] = 0
+        for time in [time for time, values in self.values_by_time.items() if not values]:
+            del self.values_by_time[time]
+        for values in self.values_by_time.values():
+            self.update_pairs(list(values.items()), None, 1)
+        self.pending.clear()
+        self.updates = 0
+
+    def update_pairs(self, first, second, sign):
+        '''Adds (sign = 1) or removes (sign = -1) the products of the pairs of returns of two groups of securities,
+        or of the pairs within the first group, security with itself included, if the second group is None'''
+        if not first or second is not None and not second:
+            return
+        capacity = self.counts.shape[0]
+        other = first if second is None else second
+        if 4 * len(first) * len(other) > capacity * capacity:
+            # large groups, e.g. the returns of every security at a new time: outer products of the full matrices avoid fancy indexing
+            values, mask = self.to_dense(first, capacity)
+            other_values, other_mask = (values, mask) if second is None else self.to_dense(second, capacity)
+            self.counts += sign * np.outer(mask, other_mask)
+            self.products += sign * np.outer(values, other_values)
+            self.sums += sign * np.outer(values, other_mask)
+            if second is not None:
+                self.counts += sign * np.outer(other_mask, mask)
+                self.products += sign * np.outer(other_values, values)
+                self.sums += sign * np.outer(other_values, mask)
+            return
+
+        slots, values = np.array([x[0] for x in first], dtype=int), np.array([x[1] for x in first], dtype=float)
+        if second is None:
+            index = np.ix_(slots, slots)
+            self.counts[index] += sign
+            self.products[index] += sign * np.outer(values, values)
+            self.sums[index] += sign * values[:, None]
+            return
+
+        other_slots, other_values = np.array([x[0] for x in second], dtype=int), np.array([x[1] for x in second], dtype=float)
+        index, transposed = np.ix_(slots, other_slots), np.ix_(other_slots, slots)
+        products = sign * np.outer(values, other_values)
+        self.counts[index] += sign
+        self.counts[transposed] += sign
+        self.products[index] += products
+        self.products[transposed] += products.T
+        self.sums[index] += sign * values[:, None]
+        self.sums[transposed] += sign * other_values[:, None]
+
+    def to_dense(self, group, capacity):
+        '''Gets the returns of a group of securities and its mask as arrays indexed by slot'''
+        values, mask = np.zeros(capacity), np.zeros(capacity)
+        slots = [x[0] for x in group]
+        values[slots] = [x[1] for x in group]
+        mask[slots] = 1
+        return values, mask
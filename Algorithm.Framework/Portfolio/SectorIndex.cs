@@ -0,0 +1,212 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System.Collections.Generic;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Securities;
+
+namespace QuantConnect.Algorithm.Framework.Portfolio
+{
+    /// <summary>
+    /// Keeps the securities of each sector and the ones with holdings, so the framework models don't regroup
+    /// the universe at each time step. The sector code is read once, when the security is added, and the
+    /// securities with holdings are updated when their holdings quantity changes, e.g. on fills
+    /// </summary>
+    public class SectorIndex
+    {
+        private readonly Dictionary<Symbol, string> _sectorCodeBySymbol = new Dictionary<Symbol, string>();
+        private readonly Dictionary<string, Dictionary<Symbol, Security>> _securitiesBySectorCode = new Dictionary<string, Dictionary<Symbol, Security>>();
+        private readonly Dictionary<string, Dictionary<Symbol, Security>> _investedBySectorCode = new Dictionary<string, Dictionary<Symbol, Security>>();
+
+        /// <summary>
+        /// Gets the sector codes with securities
+        /// </summary>
+        public IEnumerable<string> SectorCodes => _securitiesBySectorCode.Keys;
+
+        /// <summary>
+        /// Gets the number of sectors with securities
+        /// </summary>
+        public int SectorCount => _securitiesBySectorCode.Count;
+
+        /// <summary>
+        /// Adds the security to its sector. Securities without a sector code are ignored
+        /// </summary>
+        /// <param name="security">The security to add</param>
+        /// <param name="sectorCode">The sector code of the security</param>
+        /// <returns>True if the security was added</returns>
+        public bool Add(Security security, string sectorCode)
+        {
+            if (string.IsNullOrEmpty(sectorCode))
+            {
+                Remove(security.Symbol);
+                return false;
+            }
+
+            string currentSectorCode;
+            if (_sectorCodeBySymbol.TryGetValue(security.Symbol, out currentSectorCode))
+            {
+                if (currentSectorCode == sectorCode)
+                {
+                    return true;
+                }
+                Remove(security.Symbol);
+            }
+
+            _sectorCodeBySymbol[security.Symbol] = sectorCode;
+            GetOrAddSecurities(_securitiesBySectorCode, sectorCode)[security.Symbol] = security;
+            if (security.Holdings.Quantity != 0)
+            {
+                GetOrAddSecurities(_investedBySectorCode, sectorCode)[security.Symbol] = security;
+            }
+            security.Holdings.QuantityChanged += OnQuantityChanged;
+            return true;
+        }
+
+        /// <summary>
+        /// Removes the security from its sector
+        /// </summary>
+        /// <param name="symbol">The symbol of the security to remove</param>
+        /// <returns>True if the security was removed</returns>
+        public bool Remove(Symbol symbol)
+        {
+            string sectorCode;
+            if (!_sectorCodeBySymbol.TryGetValue(symbol, out sectorCode))
+            {
+                return false;
+            }
+
+            _sectorCodeBySymbol.Remove(symbol);
+            var securities = _securitiesBySectorCode[sectorCode];
+            securities[symbol].Holdings.QuantityChanged -= OnQuantityChanged;
+            RemoveSecurity(_securitiesBySectorCode, sectorCode, symbol);
+            RemoveSecurity(_investedBySectorCode, sectorCode, symbol);
+            return true;
+        }
+
+        /// <summary>
+        /// Determines whether the security is in a sector
+        /// </summary>
+        /// <param name="symbol">The symbol of the security</param>
+        /// <returns>True if the security is in a sector</returns>
+        public bool ContainsKey(Symbol symbol)
+        {
+            return _sectorCodeBySymbol.ContainsKey(symbol);
+        }
+
+        /// <summary>
+        /// Attempts to get the sector code of the security
+        /// </summary>
+        /// <param name="symbol">The symbol of the security</param>
+        /// <param name="sectorCode">The sector code of the security, or null if not found</param>
+        /// <returns>True if the security is in a sector</returns>
+        public bool TryGetSectorCode(Symbol symbol, out string sectorCode)
+        {
+            return _sectorCodeBySymbol.TryGetValue(symbol, out sectorCode);
+        }
+
+        /// <summary>
+        /// Gets the securities of the sector
+        /// </summary>
+        /// <param name="sectorCode">The sector code</param>
+        /// <returns>The securities of the sector</returns>
+        public IReadOnlyCollection<Security> GetSecurities(string sectorCode)
+        {
+            Dictionary<Symbol, Security> securities;
+            return _securitiesBySectorCode.TryGetValue(sectorCode, out securities)
+                ? securities.Values
+                : (IReadOnlyCollection<Security>)new Security[0];
+        }
+
+        /// <summary>
+        /// Gets the securities of the sector with holdings
+        /// </summary>
+        /// <param name="sectorCode">The sector code</param>
+        /// <returns>The securities of the sector with a non-zero holdings quantity</returns>
+        public IReadOnlyCollection<Security> GetInvestedSecurities(string sectorCode)
+        {
+            Dictionary<Symbol, Security> securities;
+            return _investedBySectorCode.TryGetValue(sectorCode, out securities)
+                ? securities.Values
+                : (IReadOnlyCollection<Security>)new Security[0];
+        }
+
+        /// <summary>
+        /// Gets the absolute holdings value of the sector in account currency.
+        /// The value moves with the prices, so it's the sum of the current values of the securities with holdings
+        /// </summary>
+        /// <param name="sectorCode">The sector code</param>
+        /// <returns>The absolute holdings value of the sector</returns>
+        public decimal GetAbsoluteHoldingsValue(string sectorCode)
+        {
+            var absoluteHoldingsValue = 0m;
+            foreach (var security in GetInvestedSecurities(sectorCode))
+            {
+                absoluteHoldingsValue += security.Holdings.AbsoluteHoldingsValue;
+            }
+            return absoluteHoldingsValue;
+        }
+
+        /// <summary>
+        /// Gets the <see cref="CompanyReference.IndustryTemplateCode"/> of the security, the default sector code
+        /// </summary>
+        /// <param name="security">The security</param>
+        /// <returns>The industry template code, or null if the security has no fundamental data</returns>
+        public static string GetIndustryTemplateCode(Security security)
+        {
+            var fundamentals = security.Fundamentals;
+            return fundamentals != null && fundamentals.HasFundamentalData
+                ? fundamentals.CompanyReference?.IndustryTemplateCode
+                : null;
+        }
+
+        private void OnQuantityChanged(object sender, SecurityHoldingQuantityChangedEventArgs args)
+        {
+            var security = args.Security;
+            string sectorCode;
+            if (!_sectorCodeBySymbol.TryGetValue(security.Symbol, out sectorCode))
+            {
+                return;
+            }
+
+            if (security.Holdings.Quantity != 0)
+            {
+                GetOrAddSecurities(_investedBySectorCode, sectorCode)[security.Symbol] = security;
+            }
+            else
+            {
+                RemoveSecurity(_investedBySectorCode, sectorCode, security.Symbol);
+            }
+        }
+
+        private static Dictionary<Symbol, Security> GetOrAddSecurities(Dictionary<string, Dictionary<Symbol, Security>> securitiesBySectorCode, string sectorCode)
+        {
+            Dictionary<Symbol, Security> securities;
+            if (!securitiesBySectorCode.TryGetValue(sectorCode, out securities))
+            {
+                securitiesBySectorCode[sectorCode] = securities = new Dictionary<Symbol, Security>();
+            }
+            return securities;
+        }
+
+        private static void RemoveSecurity(Dictionary<string, Dictionary<Symbol, Security>> securitiesBySectorCode, string sectorCode, Symbol symbol)
+        {
+            Dictionary<Symbol, Security> securities;
+            if (securitiesBySectorCode.TryGetValue(sectorCode, out securities) && securities.Remove(symbol) && securities.Count == 0)
+            {
+                securitiesBySectorCode.Remove(sectorCode);
+            }
+        }
+    }
+}
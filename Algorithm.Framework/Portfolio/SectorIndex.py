@@ -0,0 +1,125 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+### <summary>
+### Keeps the securities of each sector and the ones with holdings, so the framework models don't regroup the universe at each time step.
+### </summary>
+class SectorIndex:
+    '''Keeps the securities of each sector and the ones with holdings, so the framework models don't regroup the universe at each time step.
+    The sector code is read once, when the security is added, and the securities with holdings are updated when their holdings quantity changes, e.g. on fills'''
+    def __init__(self):
+        self.sectorCodeBySymbol = {}
+        self.securitiesBySectorCode = {}
+        self.investedBySectorCode = {}
+        # the same handler object must be used to subscribe and unsubscribe from the holdings events
+        self.quantityChangedHandler = self.OnQuantityChanged
+
+    @property
+    def SectorCodes(self):
+        '''The sector codes with securities'''
+        return self.securitiesBySectorCode.keys()
+
+    @property
+    def SectorCount(self):
+        '''The number of sectors with securities'''
+        return len(self.securitiesBySectorCode)
+
+    def Add(self, security, sectorCode):
+        '''Adds the security to its sector. Securities without a sector code are ignored
+        Args:
+            security: The security to add
+            sectorCode: The sector code of the security
+        Returns:
+            True if the security was added'''
+        symbol = security.Symbol
+        if not sectorCode:
+            self.Remove(symbol)
+            return False
+
+        currentSectorCode = self.sectorCodeBySymbol.get(symbol)
+        if currentSectorCode == sectorCode:
+            return True
+        self.Remove(symbol)
+
+        self.sectorCodeBySymbol[symbol] = sectorCode
+        self.securitiesBySectorCode.setdefault(sectorCode, {})[symbol] = security
+        if security.Holdings.Quantity != 0:
+            self.investedBySectorCode.setdefault(sectorCode, {})[symbol] = security
+        security.Holdings.QuantityChanged += self.quantityChangedHandler
+        return True
+
+    def Remove(self, symbol):
+        '''Removes the security from its sector
+        Args:
+            symbol: The symbol of the security to remove
+        Returns:
+            True if the security was removed'''
+        sectorCode = self.sectorCodeBySymbol.pop(symbol, None)
+        if sectorCode is None:
+            return False
+
+        security = self.remove_security(self.securitiesBySectorCode, sectorCode, symbol)
+        security.Holdings.QuantityChanged -= self.quantityChangedHandler
+        self.remove_security(self.investedBySectorCode, sectorCode, symbol)
+        return True
+
+    def ContainsKey(self, symbol):
+        '''True if the security is in a sector'''
+        return symbol in self.sectorCodeBySymbol
+
+    def GetSectorCode(self, symbol):
+        '''Gets the sector code of the security, None if it's not in a sector'''
+        return self.sectorCodeBySymbol.get(symbol)
+
+    def GetSecurities(self, sectorCode):
+        '''Gets the securities of the sector'''
+        return list(self.securitiesBySectorCode.get(sectorCode, {}).values())
+
+    def GetInvestedSecurities(self, sectorCode):
+        '''Gets the securities of the sector with a non-zero holdings quantity'''
+        return list(self.investedBySectorCode.get(sectorCode, {}).values())
+
+    def GetAbsoluteHoldingsValue(self, sectorCode):
+        '''Gets the absolute holdings value of the sector in account currency.
+        The value moves with the prices, so it's the sum of the current values of the securities with holdings'''
+        return sum(security.Holdings.AbsoluteHoldingsValue for security in self.investedBySectorCode.get(sectorCode, {}).values())
+
+    @staticmethod
+    def GetIndustryTemplateCode(security):
+        '''Gets the industry template code of the security, the default sector code, None if the security has no fundamental data'''
+        fundamentals = security.Fundamentals
+        if fundamentals is None or not fundamentals.HasFundamentalData:
+            return None
+        companyReference = fundamentals.CompanyReference
+        return companyReference.IndustryTemplateCode if companyReference else None
+
+    def OnQuantityChanged(self, sender, args):
+        '''Updates the securities with holdings when the holdings quantity of a security changes'''
+        security = args.Security
+        sectorCode = self.sectorCodeBySymbol.get(security.Symbol)
+        if sectorCode is None:
+            return
+        if security.Holdings.Quantity != 0:
+            self.investedBySectorCode.setdefault(sectorCode, {})[security.Symbol] = security
+        else:
+            self.remove_security(self.investedBySectorCode, sectorCode, security.Symbol)
+
+    def remove_security(self, securitiesBySectorCode, sectorCode, symbol):
+        '''Removes the security from the securities of the sector, and the sector if it's left empty'''
+        securities = securitiesBySectorCode.get(sectorCode)
+        if securities is None:
+            return None
+        security = securities.pop(symbol, None)
+        if not securities:
+            del securitiesBySectorCode[sectorCode]
+        return security
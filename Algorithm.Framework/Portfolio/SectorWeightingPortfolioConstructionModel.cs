@@ -36,7 +36,7 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
     /// </summary>
     public class SectorWeightingPortfolioConstructionModel : EqualWeightingPortfolioConstructionModel
     {
-        private readonly Dictionary<Symbol, string> _sectorCodeBySymbol = new Dictionary<Symbol, string>();
+        private readonly SectorIndex _sectorIndex = new SectorIndex();
 
         /// <summary>
         /// Initialize a new instance of <see cref="SectorWeightingPortfolioConstructionModel"/>
@@ -111,7 +111,7 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>True if the portfolio should create a target for the insight</returns>
         protected override bool ShouldCreateTargetForInsight(Insight insight)
         {
-            return _sectorCodeBySymbol.ContainsKey(insight.Symbol);
+            return _sectorIndex.ContainsKey(insight.Symbol);
         }
 
         /// <summary>
@@ -121,6 +121,11 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>A target percent for each insight</returns>
         protected override Dictionary<Insight, double> DetermineTargetPercent(List<Insight> activeInsights)
         {
+            if (Incremental)
+            {
+                return DetermineChangedTargetPercent(activeInsights);
+            }
+
             var result = new Dictionary<Insight, double>();
 
             var insightBySectorCode = new Dictionary<string, List<Insight>>();
@@ -134,7 +139,8 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
                 }
 
                 List<Insight> insights;
-                var sectorCode = _sectorCodeBySymbol[insight.Symbol];
+                string sectorCode;
+                _sectorIndex.TryGetSectorCode(insight.Symbol, out sectorCode);
                 if (insightBySectorCode.TryGetValue(sectorCode, out insights))
                 {
                     insights.Add(insight);
@@ -165,6 +171,45 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
             return result;
         }
 
+        /// <summary>
+        /// Gets the group of the insight, whose weights are added together to determine the target percent
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <returns>The sector code of the insight symbol</returns>
+        protected override string GetWeightingGroup(Insight insight)
+        {
+            string sectorCode;
+            return _sectorIndex.TryGetSectorCode(insight.Symbol, out sectorCode) ? sectorCode : string.Empty;
+        }
+
+        /// <summary>
+        /// Gets the weight of the insight in the sum of its group
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <returns>One if the insight is accounted to the allocation of its sector, zero otherwise</returns>
+        protected override double GetWeight(Insight insight)
+        {
+            return insight.Direction == InsightDirection.Flat ? 0 : 1;
+        }
+
+        /// <summary>
+        /// Gets the target percent of an insight
+        /// </summary>
+        /// <param name="insight">The insight to create a target for</param>
+        /// <param name="groupWeight">The number of securities of its sector</param>
+        /// <param name="groupCount">The number of sectors</param>
+        /// <returns>The target percent of the insight, as determined by <see cref="DetermineTargetPercent"/></returns>
+        protected override double GetTargetPercent(Insight insight, double groupWeight, int groupCount)
+        {
+            if (insight.Direction == InsightDirection.Flat)
+            {
+                return 0;
+            }
+
+            var sectorPercent = groupCount == 0 ? 0 : 1m / groupCount;
+            return (double)((int)insight.Direction * (sectorPercent / (decimal)groupWeight));
+        }
+
         /// <summary>
         /// Event fired each time the we add/remove securities from the data feed
         /// </summary>
@@ -174,22 +219,14 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         {
             foreach (var security in changes.RemovedSecurities)
             {
-                // Removes the symbol from the _sectorCodeBySymbol dictionary
+                // Removes the symbol from the sector index
                 // since we cannot emit PortfolioTarget for removed securities
-                var symbol = security.Symbol;
-                if (_sectorCodeBySymbol.ContainsKey(symbol))
-                {
-                    _sectorCodeBySymbol.Remove(symbol);
-                }
+                _sectorIndex.Remove(security.Symbol);
             }
 
             foreach (var security in changes.AddedSecurities)
             {
-                var sectorCode = GetSectorCode(security);
-                if (!string.IsNullOrEmpty(sectorCode))
-                {
-                    _sectorCodeBySymbol[security.Symbol] = sectorCode;
-                }
+                _sectorIndex.Add(security, GetSectorCode(security));
             }
             base.OnSecuritiesChanged(algorithm, changes);
         }
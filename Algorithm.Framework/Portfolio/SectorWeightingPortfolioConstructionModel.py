@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from EqualWeightingPortfolioConstructionModel import EqualWeightingPortfolioConstructionModel
+from Portfolio.SectorIndex import SectorIndex
 
 class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstructionModel):
     '''Provides an implementation of IPortfolioConstructionModel that
@@ -32,19 +33,22 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
                               The function returns null if unknown, in which case the function will be called again in the
                               next loop. Returning current time will trigger rebalance.'''
         super().__init__(rebalance)
-        self.sectorCodeBySymbol = dict()
+        self.sectorIndex = SectorIndex()
 
     def ShouldCreateTargetForInsight(self, insight):
         '''Method that will determine if the portfolio construction model should create a
         target for this insight
         Args:
             insight: The insight to create a target for'''
-        return insight.Symbol in self.sectorCodeBySymbol
+        return self.sectorIndex.ContainsKey(insight.Symbol)
 
     def DetermineTargetPercent(self, activeInsights):
         '''Will determine the target percent for each insight
         Args:
             activeInsights: The active insights to generate a target for'''
+        if self.Incremental:
+            return self.DetermineChangedTargetPercent(activeInsights)
+
         result = dict()
 
         insightBySectorCode = dict()
@@ -54,7 +58,7 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
                 result[insight] = 0
                 continue
 
-            sectorCode = self.sectorCodeBySymbol.get(insight.Symbol)
+            sectorCode = self.sectorIndex.GetSectorCode(insight.Symbol)
             insights = insightBySectorCode.pop(sectorCode, list())
 
             insights.append(insight)
@@ -72,20 +76,47 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
 
         return result
 
+    def GetWeightingGroup(self, insight):
+        '''Gets the group of the insight, whose weights are added together to determine the target percent
+        Args:
+            insight: The insight to create a target for
+        Returns:
+            The sector code of the insight symbol'''
+        return self.sectorIndex.GetSectorCode(insight.Symbol)
+
+    def GetWeight(self, insight):
+        '''Gets the weight of the insight in the sum of its group
+        Args:
+            insight: The insight to create a target for
+        Returns:
+            One if the insight is accounted to the allocation of its sector, zero otherwise'''
+        return 0 if insight.Direction == InsightDirection.Flat else 1
+
+    def GetTargetPercent(self, insight, groupWeight, groupCount):
+        '''Gets the target percent of an insight
+        Args:
+            insight: The insight to create a target for
+            groupWeight: The number of securities of its sector
+            groupCount: The number of sectors
+        Returns:
+            The target percent of the insight, as determined by DetermineTargetPercent'''
+        if insight.Direction == InsightDirection.Flat:
+            return 0
+        sectorPercent = 0 if groupCount == 0 else 1.0 / groupCount
+        return insight.Direction * (sectorPercent / groupWeight)
+
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
         for security in changes.RemovedSecurities:
-            # Removes the symbol from the self.sectorCodeBySymbol dictionary
+            # Removes the symbol from the sector index
             # since we cannot emit PortfolioTarget for removed securities
-            self.sectorCodeBySymbol.pop(security.Symbol, None)
+            self.sectorIndex.Remove(security.Symbol)
 
         for security in changes.AddedSecurities:
-            sectorCode = self.GetSectorCode(security)
-            if sectorCode:
-                self.sectorCodeBySymbol[security.Symbol] = sectorCode
+            self.sectorIndex.Add(security, self.GetSectorCode(security))
 
         super().OnSecuritiesChanged(algorithm, changes)
 
@@ -11,8 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 from numpy import dot
 from numpy.linalg import inv
+from Portfolio.PortfolioOptimizerBatch import PortfolioOptimizerBatch
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer with unconstrained mean variance.'''
@@ -34,4 +36,24 @@ class UnconstrainedMeanVariancePortfolioOptimizer:
         if covariance is None:
             covariance = historicalReturns.cov()
 
-        return expectedReturns.dot(inv(covariance))
\ No newline at end of file
+        return expectedReturns.dot(inv(covariance))
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None):
+        '''
+        Perform a portfolio optimization for each problem, e.g. for resamples of the historical returns.
+        The problems are solved at once, as a stack of linear systems
+        args:
+            historicalReturns: Matrix of annualized historical returns (size: K x N), or a list with one per problem.
+            expectedReturns: Array of double with the portfolio annualized expected returns (size: K x 1), or a list with one per problem.
+            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K), or a list with one per problem.
+        Returns:
+            Matrix of double with the portfolio weights of each problem (size: P x K)
+        '''
+        problems = PortfolioOptimizerBatch().get_problems(historicalReturns, expectedReturns, covariance, {})
+        covariances = np.array([np.asarray(problem['historicalReturns'].cov() if problem['covariance'] is None else problem['covariance'], dtype=float)
+                                for problem in problems])
+        expectedReturns = np.array([np.asarray(problem['historicalReturns'].mean() if problem['expectedReturns'] is None else problem['expectedReturns'], dtype=float)
+                                    for problem in problems])
+
+        # the covariance is symmetric, so µ^T Σ^-1 = (Σ^-1 µ)^T
+        return np.linalg.solve(covariances, expectedReturns[:, :, None])[:, :, 0]
\ No newline at end of file
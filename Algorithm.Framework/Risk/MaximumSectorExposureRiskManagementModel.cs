@@ -30,6 +30,7 @@ namespace QuantConnect.Algorithm.Framework.Risk
     {
         private readonly decimal _maximumSectorExposure;
         private readonly PortfolioTargetCollection _targetsCollection;
+        private readonly SectorIndex _sectorIndex = new SectorIndex();
 
         /// <summary>
         /// Initializes a new instance of the <see cref="MaximumSectorExposureRiskManagementModel"/> class
@@ -59,31 +60,50 @@ namespace QuantConnect.Algorithm.Framework.Risk
 
             _targetsCollection.AddRange(targets);
 
-            // Group the securities by their sector
-            var groupBySector = algorithm.UniverseManager.ActiveSecurities
-                .Where(x => x.Value.Fundamentals != null && x.Value.Fundamentals.HasFundamentalData)
-                .GroupBy(x => x.Value.Fundamentals.CompanyReference.IndustryTemplateCode);
+            // If the construction model has created a target, we consider that
+            // value to calculate the security absolute holding value
+            var targetsBySectorCode = new Dictionary<string, List<IPortfolioTarget>>();
+            foreach (var target in _targetsCollection.Values)
+            {
+                string sectorCode;
+                if (_sectorIndex.TryGetSectorCode(target.Symbol, out sectorCode))
+                {
+                    List<IPortfolioTarget> sectorTargets;
+                    if (!targetsBySectorCode.TryGetValue(sectorCode, out sectorTargets))
+                    {
+                        targetsBySectorCode[sectorCode] = sectorTargets = new List<IPortfolioTarget>();
+                    }
+                    sectorTargets.Add(target);
+                }
+            }
 
-            foreach (var securities in groupBySector)
+            // Securities without holdings nor targets don't add to the sector exposure, only the invested ones are visited
+            foreach (var sectorCode in _sectorIndex.SectorCodes)
             {
                 // Compute the sector absolute holdings value
-                // If the construction model has created a target, we consider that
-                // value to calculate the security absolute holding value
+                var quantities = new Dictionary<Symbol, decimal>();
                 var sectorAbsoluteHoldingsValue = 0m;
 
-                foreach (var security in securities)
+                foreach (var security in _sectorIndex.GetInvestedSecurities(sectorCode))
                 {
-                    var absoluteHoldingsValue = security.Value.Holdings.AbsoluteHoldingsValue;
-
-                    IPortfolioTarget target;
-                    if (_targetsCollection.TryGetValue(security.Value.Symbol, out target))
+                    if (!_targetsCollection.ContainsKey(security.Symbol))
                     {
-                        absoluteHoldingsValue = security.Value.Price * Math.Abs(target.Quantity) *
-                            security.Value.SymbolProperties.ContractMultiplier *
-                            security.Value.QuoteCurrency.ConversionRate;
+                        quantities[security.Symbol] = security.Holdings.Quantity;
+                        sectorAbsoluteHoldingsValue += security.Holdings.AbsoluteHoldingsValue;
                     }
+                }
 
-                    sectorAbsoluteHoldingsValue += absoluteHoldingsValue;
+                List<IPortfolioTarget> sectorTargets;
+                if (targetsBySectorCode.TryGetValue(sectorCode, out sectorTargets))
+                {
+                    foreach (var target in sectorTargets)
+                    {
+                        var security = algorithm.Securities[target.Symbol];
+                        quantities[target.Symbol] = target.Quantity;
+                        sectorAbsoluteHoldingsValue += security.Price * Math.Abs(target.Quantity) *
+                            security.SymbolProperties.ContractMultiplier *
+                            security.QuoteCurrency.ConversionRate;
+                    }
                 }
 
                 // If the ratio between the sector absolute holdings value and the maximum sector exposure value
@@ -92,20 +112,11 @@ namespace QuantConnect.Algorithm.Framework.Risk
                 var ratio = sectorAbsoluteHoldingsValue / maximumSectorExposureValue;
                 if (ratio > 1)
                 {
-                    foreach (var security in securities)
+                    foreach (var kvp in quantities)
                     {
-                        var quantity = security.Value.Holdings.Quantity;
-                        var symbol = security.Value.Symbol;
-
-                        IPortfolioTarget target;
-                        if (_targetsCollection.TryGetValue(symbol, out target))
+                        if (kvp.Value != 0)
                         {
-                            quantity = target.Quantity;
-                        }
-
-                        if (quantity != 0)
-                        {
-                            yield return new PortfolioTarget(symbol, quantity / ratio);
+                            yield return new PortfolioTarget(kvp.Key, kvp.Value / ratio);
                         }
                     }
                 }
@@ -119,6 +130,16 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="changes">The security additions and removals from the algorithm</param>
         public override void OnSecuritiesChanged(QCAlgorithm algorithm, SecurityChanges changes)
         {
+            foreach (var security in changes.RemovedSecurities)
+            {
+                _sectorIndex.Remove(security.Symbol);
+            }
+
+            foreach (var security in changes.AddedSecurities)
+            {
+                _sectorIndex.Add(security, SectorIndex.GetIndustryTemplateCode(security));
+            }
+
             var anyFundamentalData = algorithm.ActiveSecurities
                 .Any(kvp => kvp.Value.Fundamentals != null && kvp.Value.Fundamentals.HasFundamentalData);
 
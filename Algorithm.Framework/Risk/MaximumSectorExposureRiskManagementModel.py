@@ -12,7 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from itertools import groupby
+from Portfolio.SectorIndex import SectorIndex
 
 class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that that limits the sector exposure to the specified percentage'''
@@ -26,6 +26,7 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
 
         self.maximumSectorExposure = maximumSectorExposure
         self.targetsCollection = PortfolioTargetCollection()
+        self.sectorIndex = SectorIndex()
 
     def ManageRisk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
@@ -37,31 +38,32 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
 
         risk_targets = list()
 
-        # Group the securities by their sector
-        filtered = list(filter(lambda x: x.Value.Fundamentals is not None and x.Value.Fundamentals.HasFundamentalData, algorithm.UniverseManager.ActiveSecurities))
-        filtered.sort(key = lambda x: x.Value.Fundamentals.CompanyReference.IndustryTemplateCode)
-        groupBySector = groupby(filtered, lambda x: x.Value.Fundamentals.CompanyReference.IndustryTemplateCode)
+        # If the construction model has created a target, we consider that
+        # value to calculate the security absolute holding value
+        targetsBySectorCode = {}
+        for target in self.targetsCollection.Values:
+            sectorCode = self.sectorIndex.GetSectorCode(target.Symbol)
+            if sectorCode is not None:
+                targetsBySectorCode.setdefault(sectorCode, []).append(target)
 
-        for code, securities in groupBySector:
+        # Securities without holdings nor targets don't add to the sector exposure, only the invested ones are visited
+        for sectorCode in self.sectorIndex.SectorCodes:
             # Compute the sector absolute holdings value
-            # If the construction model has created a target, we consider that
-            # value to calculate the security absolute holding value
             quantities = {}
             sectorAbsoluteHoldingsValue = 0
 
-            for security in securities:
-                symbol = security.Value.Symbol
-                quantities[symbol] = security.Value.Holdings.Quantity
-                absoluteHoldingsValue = security.Value.Holdings.AbsoluteHoldingsValue
+            for security in self.sectorIndex.GetInvestedSecurities(sectorCode):
+                symbol = security.Symbol
+                if not self.targetsCollection.ContainsKey(symbol):
+                    quantities[symbol] = security.Holdings.Quantity
+                    sectorAbsoluteHoldingsValue += security.Holdings.AbsoluteHoldingsValue
 
-                if self.targetsCollection.ContainsKey(symbol):
-                    quantities[symbol] = self.targetsCollection[symbol].Quantity
-
-                    absoluteHoldingsValue = (security.Value.Price * abs(quantities[symbol]) *
-                        security.Value.SymbolProperties.ContractMultiplier *
-                        security.Value.QuoteCurrency.ConversionRate)
-
-                sectorAbsoluteHoldingsValue += absoluteHoldingsValue
+            for target in targetsBySectorCode.get(sectorCode, []):
+                security = algorithm.Securities[target.Symbol]
+                quantities[target.Symbol] = target.Quantity
+                sectorAbsoluteHoldingsValue += (security.Price * abs(target.Quantity) *
+                    security.SymbolProperties.ContractMultiplier *
+                    security.QuoteCurrency.ConversionRate)
 
             # If the ratio between the sector absolute holdings value and the maximum sector exposure value
             # exceeds the unity, it means we need to reduce each security of that sector by that ratio
@@ -80,6 +82,12 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
+        for security in changes.RemovedSecurities:
+            self.sectorIndex.Remove(security.Symbol)
+
+        for security in changes.AddedSecurities:
+            self.sectorIndex.Add(security, SectorIndex.GetIndustryTemplateCode(security))
+
         anyFundamentalData = any([
             kvp.Value.Fundamentals is not None and 
             kvp.Value.Fundamentals.HasFundamentalData for kvp in algorithm.ActiveSecurities
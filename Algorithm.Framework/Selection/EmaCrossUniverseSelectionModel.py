@@ -34,8 +34,8 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.slowPeriod = slowPeriod
         self.universeCount = universeCount
         self.tolerance = 0.01
-        # holds our coarse fundamental indicators by symbol
-        self.averages = {}
+        # holds our coarse fundamental averages, a row per symbol
+        self.averages = self.Averages(fastPeriod, slowPeriod)
 
     def SelectCoarse(self, algorithm, coarse):
         '''Defines the coarse fundamental selection function.
@@ -44,46 +44,63 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
             coarse: The coarse fundamental data used to perform filtering</param>
         Returns:
             An enumerable of symbols passing the filter'''
-        filtered = []
+        coarse = self.GetCoarseDataFrame(algorithm, coarse, ['Symbol.ID', 'EndTime', 'AdjustedPrice'])
 
-        for cf in coarse:
-            if cf.Symbol not in self.averages:
-                self.averages[cf.Symbol] = self.SelectionData(cf.Symbol, self.fastPeriod, self.slowPeriod)
-
-            # grab th SelectionData instance for this symbol
-            avg = self.averages.get(cf.Symbol)
-
-            # Update returns true when the indicators are ready, so don't accept until they are
-            # and only pick symbols who have their fastPeriod-day ema over their slowPeriod-day ema
-            if avg.Update(cf.EndTime, cf.AdjustedPrice) and avg.Fast > avg.Slow * (1 + self.tolerance):
-                filtered.append(avg)
+        # Update returns true when the averages are ready, so don't accept until they are
+        # and only pick symbols who have their fastPeriod-day ema over their slowPeriod-day ema
+        fast, slow, isReady = self.averages.Update(coarse['Symbol.ID'].values, coarse.EndTime.values, coarse.AdjustedPrice.values)
+        filtered = np.flatnonzero(isReady & (fast > slow * (1 + self.tolerance)))
 
         # prefer symbols with a larger delta by percentage between the two averages
-        filtered = sorted(filtered, key=lambda avg: avg.ScaledDelta, reverse = True)
+        scaledDelta = (fast[filtered] - slow[filtered]) / ((fast[filtered] + slow[filtered]) / 2)
 
         # we only need to return the symbol and return 'universeCount' symbols
-        return [x.Symbol for x in filtered[:self.universeCount]]
+        return coarse.index[filtered[self.GetTopIndices(scaledDelta, self.universeCount)]].tolist()
+
+    # class used to update the averages of all the coarse symbols at once
+    class Averages:
+        def __init__(self, fastPeriod, slowPeriod):
+            self.fastPeriod = fastPeriod
+            self.slowPeriod = slowPeriod
+            self.fastFactor = 2 / (1 + fastPeriod)
+            self.slowFactor = 2 / (1 + slowPeriod)
+            # the row of each symbol, keyed by security identifier
+            self.keys = pd.Index([], dtype = object)
+            self.fast = np.zeros(0)
+            self.slow = np.zeros(0)
+            self.samples = np.zeros(0, dtype = int)
+            self.times = np.zeros(0, dtype = 'datetime64[ns]')
 
-    # class used to improve readability of the coarse selection function
-    class SelectionData:
-        def __init__(self, symbol, fastPeriod, slowPeriod):
-            self.Symbol = symbol
-            self.FastEma = ExponentialMovingAverage(fastPeriod)
-            self.SlowEma = ExponentialMovingAverage(slowPeriod)
+        # updates the fast and slow exponential moving averages of the symbols, returning them and true when they're both ready
+        def Update(self, keys, times, values):
+            rows = self.get_rows(keys)
 
-        @property
-        def Fast(self):
-            return float(self.FastEma.Current.Value)
+            # the averages are forward only, an older time is ignored
+            updated = ~(times < self.times[rows])
+            rows = rows[updated]
+            values = values[updated]
+            self.times[rows] = times[updated]
+            self.samples[rows] += 1
 
-        @property
-        def Slow(self):
-            return float(self.SlowEma.Current.Value)
+            # the first value is the initial average
+            first = self.samples[rows] == 1
+            self.fast[rows] = np.where(first, values, values * self.fastFactor + self.fast[rows] * (1 - self.fastFactor))
+            self.slow[rows] = np.where(first, values, values * self.slowFactor + self.slow[rows] * (1 - self.slowFactor))
 
-        # computes an object score of how much large the fast is than the slow
-        @property
-        def ScaledDelta(self):
-            return (self.Fast - self.Slow) / ((self.Fast + self.Slow) / 2)
+            rows = self.get_rows(keys)
+            samples = self.samples[rows]
+            return self.fast[rows], self.slow[rows], (samples >= self.fastPeriod) & (samples >= self.slowPeriod)
 
-        # updates the EMAFast and EMASlow indicators, returning true when they're both ready
-        def Update(self, time, value):
-            return self.SlowEma.Update(time, value) & self.FastEma.Update(time, value)
+        # gets the rows of the symbols, adding the new ones
+        def get_rows(self, keys):
+            rows = self.keys.get_indexer(keys)
+            new = rows < 0
+            if new.any():
+                count = new.sum()
+                rows[new] = np.arange(len(self.keys), len(self.keys) + count)
+                self.keys = self.keys.append(pd.Index(keys[new], dtype = object))
+                self.fast = np.concatenate([self.fast, np.zeros(count)])
+                self.slow = np.concatenate([self.slow, np.zeros(count)])
+                self.samples = np.concatenate([self.samples, np.zeros(count, dtype = int)])
+                self.times = np.concatenate([self.times, np.full(count, np.datetime64('NaT'), dtype = 'datetime64[ns]')])
+            return rows
@@ -25,6 +25,8 @@ class FundamentalUniverseSelectionModel:
             universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorthm.UniverseSettings'''
         self.filterFineData = filterFineData
         self.universeSettings = universeSettings
+        # used by the data frames of the fundamental data when the algorithm has no pandas converter
+        self.pandasConverter = None
 
 
     def CreateUniverses(self, algorithm):
@@ -81,3 +83,64 @@ class FundamentalUniverseSelectionModel:
         Returns:
             An enumerable of symbols passing the filter'''
         return [f.Symbol for f in fine]
+
+
+    def GetCoarseDataFrame(self, algorithm, coarse, fields = None):
+        '''Gets the coarse fundamental data as a pandas.DataFrame indexed by symbol, with a column per field.
+        The columns are built in bulk on the C# side, so the selection can filter and rank thousands of securities
+        with vectorized operations instead of reading the attributes of each CoarseFundamental
+        Args:
+            algorithm: The algorithm instance
+            coarse: The coarse fundamental data
+            fields: The names of the CoarseFundamental properties, None for Price, AdjustedPrice, Volume, DollarVolume and HasFundamentalData
+        Returns:
+            A pandas.DataFrame with a row per CoarseFundamental'''
+        return self.get_pandas_converter(algorithm).GetCoarseFundamentalDataFrame(coarse, fields)
+
+
+    def GetFineDataFrame(self, algorithm, fine, fields = None):
+        '''Gets the fine fundamental data as a pandas.DataFrame indexed by symbol, with a column per field.
+        A field is the path of a FineFundamental property, e.g. 'ValuationRatios.PERatio', and multi period fields hold the value of their default period.
+        Fields with a missing parent, e.g. no CompanyReference, are NaN, NaT, False or None depending on their type
+        Args:
+            algorithm: The algorithm instance
+            fine: The fine fundamental data
+            fields: The paths of the FineFundamental properties, None for MarketCap, CompanyReference.CountryId, CompanyReference.PrimaryExchangeID,
+                CompanyReference.IndustryTemplateCode, AssetClassification.MorningstarSectorCode and SecurityReference.IPODate
+        Returns:
+            A pandas.DataFrame with a row per FineFundamental'''
+        return self.get_pandas_converter(algorithm).GetFineFundamentalDataFrame(fine, fields)
+
+
+    @staticmethod
+    def GetTopIndices(values, count):
+        '''Gets the positions of the largest values, largest first, with a partition instead of sorting all the values.
+        Equal values keep their order and NaN values come last, like a stable sort in descending order
+        Args:
+            values: The values to rank, negate them to get the smallest values
+            count: The maximum number of positions
+        Returns:
+            The positions of the largest values'''
+        values = np.where(np.isnan(values), -np.inf, values)
+        if count <= 0:
+            return np.empty(0, dtype = int)
+
+        if count < len(values):
+            # the positions above the count-th largest value, and the first positions equal to it
+            threshold = np.partition(values, len(values) - count)[len(values) - count]
+            above = np.flatnonzero(values > threshold)
+            equal = np.flatnonzero(values == threshold)[:count - len(above)]
+            positions = np.sort(np.concatenate([above, equal]))
+        else:
+            positions = np.arange(len(values))
+
+        return positions[np.argsort(-values[positions], kind = 'stable')]
+
+
+    def get_pandas_converter(self, algorithm):
+        '''Gets the pandas converter of the algorithm, or a new one if the algorithm has none'''
+        if algorithm.PandasConverter is not None:
+            return algorithm.PandasConverter
+        if self.pandasConverter is None:
+            self.pandasConverter = PandasConverter()
+        return self.pandasConverter
@@ -13,7 +13,6 @@
 
 from AlgorithmImports import *
 from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
-from itertools import groupby
 from math import ceil
 
 class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
@@ -25,7 +24,7 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         super().__init__(filterFineData, universeSettings)
         self.numberOfSymbolsCoarse = 1000
         self.numberOfSymbolsFine = 500
-        self.dollarVolumeBySymbol = {}
+        self.dollarVolumeBySymbol = pd.Series(dtype = float)
         self.lastMonth = -1
 
     def SelectCoarse(self, algorithm, coarse):
@@ -36,10 +35,11 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         if algorithm.Time.month == self.lastMonth:
             return Universe.Unchanged
 
-        sortedByDollarVolume = sorted([x for x in coarse if x.HasFundamentalData and x.Volume > 0 and x.Price > 0],
-                                     key = lambda x: x.DollarVolume, reverse=True)[:self.numberOfSymbolsCoarse]
+        coarse = self.GetCoarseDataFrame(algorithm, coarse, ['HasFundamentalData', 'Volume', 'Price', 'DollarVolume'])
+        coarse = coarse[coarse.HasFundamentalData.values & (coarse.Volume.values > 0) & (coarse.Price.values > 0)]
+        top = self.GetTopIndices(coarse.DollarVolume.values, self.numberOfSymbolsCoarse)
 
-        self.dollarVolumeBySymbol = {x.Symbol:x.DollarVolume for x in sortedByDollarVolume}
+        self.dollarVolumeBySymbol = coarse.DollarVolume.iloc[top]
 
         # If no security has met the QC500 criteria, the universe is unchanged.
         # A new selection will be attempted on the next trading day as self.lastMonth is not updated
@@ -47,7 +47,7 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
             return Universe.Unchanged
 
         # return the symbol objects our sorted collection
-        return list(self.dollarVolumeBySymbol.keys())
+        return self.dollarVolumeBySymbol.index.tolist()
 
     def SelectFine(self, algorithm, fine):
         '''Performs fine selection for the QC500 constituents
@@ -56,13 +56,16 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         At least half a year since its initial public offering
         The stock's market cap must be greater than 500 million'''
 
-        sortedBySector = sorted([x for x in fine if x.CompanyReference.CountryId == "USA"
-                                        and x.CompanyReference.PrimaryExchangeID in ["NYS","NAS"]
-                                        and (algorithm.Time - x.SecurityReference.IPODate).days > 180
-                                        and x.MarketCap > 5e8],
-                               key = lambda x: x.CompanyReference.IndustryTemplateCode)
+        fine = self.GetFineDataFrame(algorithm, fine, ['CompanyReference.CountryId', 'CompanyReference.PrimaryExchangeID',
+            'SecurityReference.IPODate', 'MarketCap', 'CompanyReference.IndustryTemplateCode'])
+        # more than 180 days since the IPO
+        age = np.datetime64(algorithm.Time) - fine['SecurityReference.IPODate'].values
+        fine = fine[(fine['CompanyReference.CountryId'].values == "USA")
+                    & np.isin(fine['CompanyReference.PrimaryExchangeID'].values, ["NYS","NAS"])
+                    & (age >= np.timedelta64(181, 'D'))
+                    & (fine.MarketCap.values > 5e8)]
 
-        count = len(sortedBySector)
+        count = len(fine)
 
         # If no security has met the QC500 criteria, the universe is unchanged.
         # A new selection will be attempted on the next trading day as self.lastMonth is not updated
@@ -73,13 +76,16 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.lastMonth = algorithm.Time.month
 
         percent = self.numberOfSymbolsFine / count
+        dollarVolume = self.dollarVolumeBySymbol.reindex(fine.index).values
+        codes = fine['CompanyReference.IndustryTemplateCode'].values
         sortedByDollarVolume = []
 
         # select stocks with top dollar volume in every single sector
-        for code, g in groupby(sortedBySector, lambda x: x.CompanyReference.IndustryTemplateCode):
-            y = sorted(g, key = lambda x: self.dollarVolumeBySymbol[x.Symbol], reverse = True)
-            c = ceil(len(y) * percent)
-            sortedByDollarVolume.extend(y[:c])
-
-        sortedByDollarVolume = sorted(sortedByDollarVolume, key = lambda x: self.dollarVolumeBySymbol[x.Symbol], reverse=True)
-        return [x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbolsFine]]
+        for code in sorted(set(codes), key = str):
+            positions = np.flatnonzero(codes == code)
+            c = ceil(len(positions) * percent)
+            sortedByDollarVolume.append(positions[self.GetTopIndices(dollarVolume[positions], c)])
+
+        sortedByDollarVolume = np.concatenate(sortedByDollarVolume)
+        top = sortedByDollarVolume[self.GetTopIndices(dollarVolume[sortedByDollarVolume], self.numberOfSymbolsFine)]
+        return fine.index[top].tolist()
@@ -41,8 +41,8 @@ class UncorrelatedUniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.historyLength = historyLength
         self.threshold = threshold
 
-        self.cache = dict()
-        self.symbol = list()
+        self.correlations = self.RollingCorrelation(benchmark, windowLength, historyLength)
+        self.symbols = list()
 
     def SelectCoarse(self, algorithm, coarse):
         '''Select stocks with highest Z-Score with fundamental data and positive previous-day price and volume'''
@@ -50,115 +50,267 @@ class UncorrelatedUniverseSelectionModel(FundamentalUniverseSelectionModel):
         # Verify whether the benchmark is present in the Coarse Fundamental
         benchmark = next((x for x in coarse if x.Symbol == self.benchmark), None)
         if benchmark is None:
-            return self.symbol
+            return self.symbols
 
         # Get the symbols with the highest dollar volume
         coarse = sorted([x for x in coarse if x.HasFundamentalData 
                                           and x.Volume * x.Price > 0 
                                           and x.Symbol != self.benchmark],
                         key = lambda x: x.DollarVolume, reverse=True)[:self.numberOfSymbolsCoarse]
-        
-        newSymbols = list()
-        for cf in coarse + [benchmark]:
-            symbol = cf.Symbol
-            data = self.cache.setdefault(symbol, self.SymbolData(self, symbol))
-            data.Update(cf.EndTime, cf.AdjustedPrice)
-            if not data.IsReady:
-                newSymbols.append(symbol)
-
-        # Warm up the dictionary objects of selected symbols and benchmark that do not have enough data
-        if len(newSymbols) > 1:
-            history = algorithm.History(newSymbols, self.historyLength, Resolution.Daily)
+
+        symbols = [x.Symbol for x in coarse]
+        self.correlations.Update(benchmark.EndTime, benchmark.AdjustedPrice, symbols, [x.AdjustedPrice for x in coarse])
+
+        # Warm up the selected symbols and benchmark that do not have enough data
+        newSymbols = self.correlations.GetSymbolsNotReady(symbols)
+        if len(newSymbols) > 0:
+            history = algorithm.WideHistory(newSymbols, self.historyLength, Resolution.Daily)
             if not history.empty:
-                history = history.close.unstack(level=0)
-                for symbol in newSymbols:
-                    self.cache[symbol].Warmup(history)
-
-        # Create a new dictionary with the zScore
-        zScore = dict()
-        benchmark = self.cache[self.benchmark].GetReturns()
-        for cf in coarse:
-            symbol = cf.Symbol
-            value = self.cache[symbol].CalculateZScore(benchmark)
-            if value > 0: zScore[symbol] = value
-
-        # Sort the zScore dictionary by value
+                self.correlations.Warmup(history, newSymbols)
+
+        # Keep the symbols with a positive zScore
+        zScore = [(symbol, value) for symbol, value in zip(symbols, self.correlations.GetZScores(symbols, self.threshold).tolist()) if value > 0]
+
+        # Sort the zScore by value
         if len(zScore) > self.numberOfSymbols:
-            sorted_zScore = sorted(zScore.items(), key=lambda kvp: kvp[1], reverse=True)
-            zScore = dict(sorted_zScore[:self.numberOfSymbols])
+            zScore = sorted(zScore, key=lambda kvp: kvp[1], reverse=True)[:self.numberOfSymbols]
 
         # Return the symbols
-        self.symbols = list(zScore.keys())
+        self.symbols = [symbol for symbol, value in zScore]
         return self.symbols
 
 
-    class SymbolData:
-        '''Contains data specific to a symbol required by this model'''
-        def __init__(self, model, symbol):
-            self.symbol = symbol
-            self.windowLength = model.windowLength
-            self.historyLength = model.historyLength
-            self.threshold = model.threshold
-            self.history = RollingWindow[IndicatorDataPoint](self.historyLength)
-            self.correlation = None
-
-        def Warmup(self, history):
-            '''Save the historical data that will be used to compute the correlation'''
-            symbol = str(self.symbol)
-            if symbol not in history:
+    class RollingCorrelation:
+        '''Rolling correlation of the daily returns of the coarse symbols to the benchmark, and the history of the correlations.
+        The prices and the correlations are matrices with a row per symbol and a column per day of the benchmark, latest last,
+        so a new day updates the correlations of all the symbols in one pass over the last window of returns.
+        The mean and standard deviation of the history of the correlations are kept as running sums'''
+        def __init__(self, benchmark, windowLength, historyLength):
+            '''Initializes a new instance of the RollingCorrelation class
+            Args:
+                benchmark: Symbol of the benchmark
+                windowLength: Number of returns of each correlation
+                historyLength: Number of prices and correlations kept for each symbol'''
+            if historyLength <= windowLength:
+                raise ValueError(f"RollingCorrelation: historyLength must be greater than windowLength, got {historyLength} and {windowLength}")
+            self.benchmark = benchmark
+            self.windowLength = windowLength
+            self.historyLength = historyLength
+
+            self.days = [None] * historyLength
+            self.benchmarkPrices = np.full(historyLength, np.nan)
+
+            # each symbol has a row, a row is reused once its symbol has no price in the history
+            self.slotBySymbol = {}
+            self.symbols = []
+            self.freeSlots = []
+            self.prices = np.full((0, historyLength), np.nan)
+            self.correlations = np.full((0, historyLength), np.nan)
+            self.sums = np.zeros(0)
+            self.squares = np.zeros(0)
+            self.counts = np.zeros(0, dtype = int)
+
+        def Update(self, time, benchmarkPrice, symbols, prices):
+            '''Adds the prices of a day and computes the correlations of the symbols for that day
+            Args:
+                time: The end time of the prices
+                benchmarkPrice: The price of the benchmark
+                symbols: The symbols with a price
+                prices: The prices of the symbols'''
+            day = self.get_day(time)
+            last = self.days[-1]
+            if last is not None and day < last:
                 return
+            if last is None or day > last:
+                self.shift(day)
 
-            # Save the last point before reset
-            last = self.history[0]
-            self.history.Reset()
+            rows = np.array([self.get_slot(symbol) for symbol in symbols], dtype = int)
+            self.benchmarkPrices[-1] = benchmarkPrice
+            self.prices[rows, -1] = prices
+            self.set_correlations(rows, self.historyLength - 1)
 
-            # Uptade window with historical data
-            for time, value in history[symbol].iteritems():
-                self.Update(time, value)
+        def GetSymbolsNotReady(self, symbols):
+            '''Gets the symbols, and the benchmark, without a price at each day of the history'''
+            rows = np.array([self.slotBySymbol[symbol] for symbol in symbols], dtype = int)
+            notReady = np.isnan(self.prices[rows]).any(axis = 1)
+            symbols = [symbol for symbol, missing in zip(symbols, notReady.tolist()) if missing]
+            if np.isnan(self.benchmarkPrices).any():
+                symbols.append(self.benchmark)
+            return symbols
 
-            # Re-add the last point if necessary
-            if last.EndTime > time:
-                self.Update(last.EndTime, last.Value)
+        def Warmup(self, history, symbols):
+            '''Fills the missing prices of the symbols with the historical data and computes their history of correlations
+            Args:
+                history: The daily prices, with a column per symbol
+                symbols: The symbols to warm up'''
+            days = [self.get_day(time) for time in history.index]
 
-        def Update(self, time, value):
-            '''Update the historical data'''
-            self.history.Add(IndicatorDataPoint(self.symbol, time, value))
+            if self.benchmark in symbols and str(self.benchmark) in history.columns:
+                # the days of the history are the days of the benchmark
+                benchmarkDays = [day for day, price in zip(days, history[str(self.benchmark)].values) if not np.isnan(price)]
+                self.reindex(sorted(set(benchmarkDays).union(day for day in self.days if day is not None))[-self.historyLength:])
+                symbols = [self.benchmark] + list(self.slotBySymbol)
 
-        def CalculateZScore(self, benchmark):
-            '''Computes the ZScore'''
-            # Not enough data to compute zScore
-            if not self.IsReady:
-                return 0
+            columnByDay = { day: column for column, day in enumerate(self.days) if day is not None }
+            columns = [columnByDay.get(day) for day in days]
+            source = np.array([column is not None for column in columns])
+            columns = np.array([column for column in columns if column is not None], dtype = int)
+            if len(columns) == 0:
+                return
 
-            returns = pd.DataFrame.from_dict({"A": self.GetReturns(), "B": benchmark})
+            rows = []
+            for symbol in symbols:
+                if str(symbol) not in history.columns:
+                    continue
+                values = history[str(symbol)].values[source]
+                if symbol == self.benchmark:
+                    prices = self.benchmarkPrices
+                else:
+                    rows.append(self.slotBySymbol[symbol])
+                    prices = self.prices[rows[-1]]
+                missing = np.isnan(prices[columns])
+                prices[columns[missing]] = values[missing]
 
-            if self.correlation is None:
-                # Calculate stdev(correlation) using rolling window for all history
-                correlation = returns.rolling(self.windowLength, min_periods = self.windowLength).corr()
-                self.correlation = correlation["B"].dropna().unstack()
-            else:
-                last_correlation = returns.tail(self.windowLength).corr()["B"]
-                self.correlation = self.correlation.append(last_correlation).tail(self.historyLength)
+            if self.benchmark in symbols:
+                rows = list(self.slotBySymbol.values())
+            self.warmup_correlations(np.array(rows, dtype = int))
+
+        def GetZScores(self, symbols, threshold):
+            '''Gets the absolute Z-Score of the latest correlation of the symbols in the history of their correlations.
+            The Z-Score is 0 for the symbols without enough data or with a mean correlation below the threshold
+            Args:
+                symbols: The symbols
+                threshold: The minimum mean correlation
+            Returns:
+                The Z-Scores of the symbols'''
+            rows = np.array([self.slotBySymbol[symbol] for symbol in symbols], dtype = int)
+            sums = self.sums[rows]
+            counts = self.counts[rows]
+
+            with np.errstate(divide = 'ignore', invalid = 'ignore'):
+                mean = sums / counts
+                std = np.sqrt(np.maximum(self.squares[rows] - sums * mean, 0) / (counts - 1))
+                zScores = np.abs(self.correlations[rows, -1] - mean) / std
+
+            isReady = ~np.isnan(self.prices[rows]).any(axis = 1) & (counts > 1) & (mean >= threshold)
+            return np.where(isReady & np.isfinite(zScores), zScores, 0)
 
-            # Calculate the mean of correlation and discard low mean correlation
-            mean = self.correlation.mean()
-            if mean.empty or mean[0] < self.threshold:
-                return 0
+        def shift(self, day):
+            '''Adds a day, evicting the oldest one and the symbols left without prices'''
+            evicted = self.correlations[:, 0]
+            valid = ~np.isnan(evicted)
+            self.sums[valid] -= evicted[valid]
+            self.squares[valid] -= evicted[valid] ** 2
+            self.counts[valid] -= 1
 
-            # Calculate the standard deviation of correlation
-            std = self.correlation.std()
+            for values in (self.prices, self.correlations, self.benchmarkPrices[np.newaxis]):
+                values[:, :-1] = values[:, 1:]
+                values[:, -1] = np.nan
+            self.days = self.days[1:] + [day]
 
-            # Current correlation
-            current = self.correlation.tail(1).unstack()
+            for slot in np.flatnonzero(np.isnan(self.prices[:len(self.symbols)]).all(axis = 1)).tolist():
+                symbol = self.symbols[slot]
+                if symbol is not None:
+                    del self.slotBySymbol[symbol]
+                    self.symbols[slot] = None
+                    self.freeSlots.append(slot)
+                    self.reset(slot)
 
-            # Calculate absolute value of Z-Score for stocks in the Coarse Universe.
-            return abs(current[0] - mean[0]) / std[0]
+        def reindex(self, days):
+            '''Moves the prices and correlations to the columns of the new days, the days without a column are evicted'''
+            days = [None] * (self.historyLength - len(days)) + list(days)
+            columnByDay = { day: column for column, day in enumerate(days) if day is not None }
+            source = [column for column, day in enumerate(self.days) if day in columnByDay]
+            target = [columnByDay[self.days[column]] for column in source]
+
+            for name in ('prices', 'correlations', 'benchmarkPrices'):
+                values = getattr(self, name)
+                reindexed = np.full_like(values, np.nan)
+                reindexed[..., target] = values[..., source]
+                setattr(self, name, reindexed)
+            self.days = days
+            self.update_sums(np.arange(len(self.symbols)))
+
+        def set_correlations(self, rows, column):
+            '''Computes the correlations of the symbols over the window of returns ending at the column'''
+            start = column - self.windowLength
+            prices = self.prices[rows, start:column + 1]
+            benchmarkPrices = self.benchmarkPrices[start:column + 1]
+            correlations = self.correlate(prices[:, 1:] / prices[:, :-1] - 1, benchmarkPrices[1:] / benchmarkPrices[:-1] - 1)
+
+            previous = self.correlations[rows, column]
+            valid = ~np.isnan(previous)
+            self.sums[rows[valid]] -= previous[valid]
+            self.squares[rows[valid]] -= previous[valid] ** 2
+            self.counts[rows[valid]] -= 1
+
+            self.correlations[rows, column] = correlations
+            valid = ~np.isnan(correlations)
+            self.sums[rows[valid]] += correlations[valid]
+            self.squares[rows[valid]] += correlations[valid] ** 2
+            self.counts[rows[valid]] += 1
+
+        def warmup_correlations(self, rows):
+            '''Computes the correlations of the symbols at each day of the history with a window of prices.
+            The correlations computed at previous days are kept when the window is missing prices'''
+            if len(rows) == 0:
+                return
+            for column in range(self.windowLength, self.historyLength):
+                start = column - self.windowLength
+                prices = self.prices[rows, start:column + 1]
+                benchmarkPrices = self.benchmarkPrices[start:column + 1]
+                correlations = self.correlate(prices[:, 1:] / prices[:, :-1] - 1, benchmarkPrices[1:] / benchmarkPrices[:-1] - 1)
+                valid = ~np.isnan(correlations)
+                self.correlations[rows[valid], column] = correlations[valid]
+            self.update_sums(rows)
+
+        def update_sums(self, rows):
+            '''Computes the running sums of the correlations of the symbols from their history'''
+            correlations = self.correlations[rows]
+            self.sums[rows] = np.nansum(correlations, axis = 1)
+            self.squares[rows] = np.nansum(correlations ** 2, axis = 1)
+            self.counts[rows] = (~np.isnan(correlations)).sum(axis = 1)
+
+        def correlate(self, returns, benchmarkReturns):
+            '''Computes the correlation of each row of returns to the benchmark returns, NaN if a return is missing or constant'''
+            returns = returns - returns.mean(axis = 1, keepdims = True)
+            benchmarkReturns = benchmarkReturns - benchmarkReturns.mean()
+            with np.errstate(divide = 'ignore', invalid = 'ignore'):
+                return returns.dot(benchmarkReturns) / np.sqrt((returns ** 2).sum(axis = 1) * (benchmarkReturns ** 2).sum())
+
+        def get_slot(self, symbol):
+            '''Gets the row of the symbol, adding it if necessary'''
+            slot = self.slotBySymbol.get(symbol)
+            if slot is not None:
+                return slot
+
+            if self.freeSlots:
+                slot = self.freeSlots.pop()
+                self.symbols[slot] = symbol
+            else:
+                slot = len(self.symbols)
+                self.symbols.append(symbol)
+                if slot == len(self.sums):
+                    size = max(8, 2 * slot)
+                    for name in ('prices', 'correlations'):
+                        values = np.full((size, self.historyLength), np.nan)
+                        values[:slot] = getattr(self, name)
+                        setattr(self, name, values)
+                    for name in ('sums', 'squares', 'counts'):
+                        values = np.zeros(size, dtype = getattr(self, name).dtype)
+                        values[:slot] = getattr(self, name)
+                        setattr(self, name, values)
+            self.slotBySymbol[symbol] = slot
+            return slot
 
-        def GetReturns(self):
-            '''Get the returns from the rolling window dictionary'''
-            historyDict = {x.EndTime: x.Value for x in self.history}
-            return pd.Series(historyDict).sort_index().pct_change().dropna()
+        def reset(self, slot):
+            '''Clears the prices and correlations of the row'''
+            self.prices[slot] = np.nan
+            self.correlations[slot] = np.nan
+            self.sums[slot] = self.squares[slot] = 0
+            self.counts[slot] = 0
 
-        @property
-        def IsReady(self):
-            return self.history.IsReady
+        @staticmethod
+        def get_day(time):
+            '''Gets the day of the time, the prices of the coarse data and the history are matched by day'''
+            return time.date()
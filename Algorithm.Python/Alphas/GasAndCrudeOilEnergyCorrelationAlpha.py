@@ -138,14 +138,14 @@ class PairsAlphaModel:
             if symbol not in self.symbolDataBySymbol:
                 symbolData = SymbolData(symbol, self.history_days, self.lookback, self.resolution, algorithm)
                 self.symbolDataBySymbol[symbol] = symbolData
-                symbolData.UpdateDailyRateOfChange(history.loc[ticker])
+                symbolData.UpdateDailyRateOfChange(algorithm, history.loc[ticker])
 
         history = algorithm.History(symbols, self.lookback, self.resolution)
         if history.empty: return
         for ticker in tickers:
             symbol = SymbolCache.GetSymbol(ticker)
             if symbol in self.symbolDataBySymbol:
-                self.symbolDataBySymbol[symbol].UpdateRateOfChange(history.loc[ticker])
+                self.symbolDataBySymbol[symbol].UpdateRateOfChange(algorithm, history.loc[ticker])
 
 class SymbolData:
     '''Contains data specific to a symbol required by this model'''
@@ -170,13 +170,11 @@ class SymbolData:
         algorithm.SubscriptionManager.RemoveConsolidator(self.Symbol, self.consolidator)
         algorithm.SubscriptionManager.RemoveConsolidator(self.Symbol, self.dailyConsolidator)
 
-    def UpdateRateOfChange(self, history):
-        for tuple in history.itertuples():
-            self.rocp.Update(tuple.Index, tuple.close)
+    def UpdateRateOfChange(self, algorithm, history):
+        algorithm.WarmUpIndicator(self.rocp, history)
 
-    def UpdateDailyRateOfChange(self, history):
-        for tuple in history.itertuples():
-            self.dailyReturn.Update(tuple.Index, tuple.close)
+    def UpdateDailyRateOfChange(self, algorithm, history):
+        algorithm.WarmUpIndicator(self.dailyReturn, history)
 
     @property
     def Return(self):
@@ -15,7 +15,6 @@ from AlgorithmImports import *
 from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
 
 from math import ceil
-from itertools import chain
 
 class GreenblattMagicFormulaAlpha(QCAlgorithm):
     ''' Alpha Streams: Benchmark Alpha: Pick stocks according to Joel Greenblatt's Magic Formula
@@ -90,7 +89,7 @@ class RateOfChangeAlphaModel(AlphaModel):
         for symbol in symbols:
             symbolData = SymbolData(algorithm, symbol, self.lookback, self.resolution)
             self.symbolDataBySymbol[symbol] = symbolData
-            symbolData.WarmUpIndicators(history.loc[symbol])
+            symbolData.WarmUpIndicators(algorithm, history.loc[symbol])
 
 
 class SymbolData:
@@ -105,9 +104,8 @@ class SymbolData:
     def RemoveConsolidators(self, algorithm):
         algorithm.SubscriptionManager.RemoveConsolidator(self.symbol, self.consolidator)
 
-    def WarmUpIndicators(self, history):
-        for tuple in history.itertuples():
-            self.ROC.Update(tuple.Index, tuple.close)
+    def WarmUpIndicators(self, algorithm, history):
+        algorithm.WarmUpIndicator(self.ROC, history)
 
     @property
     def Return(self):
@@ -144,7 +142,7 @@ class GreenBlattMagicFormulaUniverseSelectionModel(FundamentalUniverseSelectionM
         self.NumberOfSymbolsInPortfolio = 10
 
         self.lastMonth = -1
-        self.dollarVolumeBySymbol = {}
+        self.dollarVolumeBySymbol = pd.Series(dtype = float)
 
     def SelectCoarse(self, algorithm, coarse):
         '''Performs coarse selection for constituents.
@@ -155,12 +153,13 @@ class GreenBlattMagicFormulaUniverseSelectionModel(FundamentalUniverseSelectionM
         self.lastMonth = month
 
         # sort the stocks by dollar volume and take the top 1000
-        top = sorted([x for x in coarse if x.HasFundamentalData],
-                    key=lambda x: x.DollarVolume, reverse=True)[:self.NumberOfSymbolsCoarse]
+        coarse = self.GetCoarseDataFrame(algorithm, coarse, ['HasFundamentalData', 'DollarVolume'])
+        coarse = coarse[coarse.HasFundamentalData.values]
+        top = self.GetTopIndices(coarse.DollarVolume.values, self.NumberOfSymbolsCoarse)
 
-        self.dollarVolumeBySymbol = { i.Symbol: i.DollarVolume for i in top }
+        self.dollarVolumeBySymbol = coarse.DollarVolume.iloc[top]
 
-        return list(self.dollarVolumeBySymbol.keys())
+        return self.dollarVolumeBySymbol.index.tolist()
 
 
     def SelectFine(self, algorithm, fine):
@@ -178,34 +177,40 @@ class GreenBlattMagicFormulaUniverseSelectionModel(FundamentalUniverseSelectionM
         ## The stock must be traded on either the NYSE or NASDAQ
         ## At least half a year since its initial public offering
         ## The stock's market cap must be greater than 500 million
-        filteredFine = [x for x in fine if x.CompanyReference.CountryId == "USA"
-                                        and (x.CompanyReference.PrimaryExchangeID == "NYS" or x.CompanyReference.PrimaryExchangeID == "NAS")
-                                        and (algorithm.Time - x.SecurityReference.IPODate).days > 180
-                                        and x.EarningReports.BasicAverageShares.ThreeMonths * x.EarningReports.BasicEPS.TwelveMonths * x.ValuationRatios.PERatio > 5e8]
-        count = len(filteredFine)
+        fine = self.GetFineDataFrame(algorithm, fine, ['CompanyReference.CountryId', 'CompanyReference.PrimaryExchangeID',
+            'SecurityReference.IPODate', 'EarningReports.BasicAverageShares.ThreeMonths', 'EarningReports.BasicEPS.TwelveMonths',
+            'ValuationRatios.PERatio', 'CompanyReference.IndustryTemplateCode', 'ValuationRatios.EVToEBITDA', 'ValuationRatios.ForwardROA'])
+        age = np.datetime64(algorithm.Time) - fine['SecurityReference.IPODate'].values
+        marketCap = fine['EarningReports.BasicAverageShares.ThreeMonths'].values * fine['EarningReports.BasicEPS.TwelveMonths'].values * fine['ValuationRatios.PERatio'].values
+        fine = fine[(fine['CompanyReference.CountryId'].values == "USA")
+                    & np.isin(fine['CompanyReference.PrimaryExchangeID'].values, ["NYS","NAS"])
+                    & (age >= np.timedelta64(181, 'D'))
+                    & (marketCap > 5e8)]
+        count = len(fine)
         if count == 0: return []
 
-        myDict = dict()
         percent = self.NumberOfSymbolsFine / count
+        dollarVolume = self.dollarVolumeBySymbol.reindex(fine.index).values
+        codes = fine['CompanyReference.IndustryTemplateCode'].values
+        topFine = []
 
         # select stocks with top dollar volume in every single sector
         for key in ["N", "M", "U", "T", "B", "I"]:
-            value = [x for x in filteredFine if x.CompanyReference.IndustryTemplateCode == key]
-            value = sorted(value, key=lambda x: self.dollarVolumeBySymbol[x.Symbol], reverse = True)
-            myDict[key] = value[:ceil(len(value) * percent)]
+            positions = np.flatnonzero(codes == key)
+            topFine.append(positions[self.GetTopIndices(dollarVolume[positions], ceil(len(positions) * percent))])
 
         # stocks in QC500 universe
-        topFine = chain.from_iterable(myDict.values())
+        topFine = np.concatenate(topFine)
 
         #  Magic Formula:
         ## Rank stocks by Enterprise Value to EBITDA (EV/EBITDA)
         ## Rank subset of previously ranked stocks (EV/EBITDA), using the valuation ratio Return on Assets (ROA)
 
         # sort stocks in the security universe of QC500 based on Enterprise Value to EBITDA valuation ratio
-        sortedByEVToEBITDA = sorted(topFine, key=lambda x: x.ValuationRatios.EVToEBITDA , reverse=True)
+        sortedByEVToEBITDA = topFine[self.GetTopIndices(fine['ValuationRatios.EVToEBITDA'].values[topFine], self.NumberOfSymbolsFine)]
 
         # sort subset of stocks that have been sorted by Enterprise Value to EBITDA, based on the valuation ratio Return on Assets (ROA)
-        sortedByROA = sorted(sortedByEVToEBITDA[:self.NumberOfSymbolsFine], key=lambda x: x.ValuationRatios.ForwardROA, reverse=False)
+        sortedByROA = sortedByEVToEBITDA[self.GetTopIndices(-fine['ValuationRatios.ForwardROA'].values[sortedByEVToEBITDA], self.NumberOfSymbolsInPortfolio)]
 
         # retrieve list of securites in portfolio
-        return [f.Symbol for f in sortedByROA[:self.NumberOfSymbolsInPortfolio]]
+        return fine.index[sortedByROA].tolist()
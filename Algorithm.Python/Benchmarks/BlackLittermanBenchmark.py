@@ -0,0 +1,70 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.BlackLittermanOptimizationPortfolioConstructionModel import BlackLittermanOptimizationPortfolioConstructionModel
+from time import perf_counter
+
+### <summary>
+### Daily Black-Litterman rebalances with the views of 20 alpha models on 500 securities.
+### The insights are random, the views, the posterior estimate and the whole target calculation are timed separately
+### </summary>
+class BlackLittermanBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.SetStartDate(2017, 1, 1)
+        self.SetEndDate(2017, 4, 1)
+        self.SetCash(100000)
+        self.AddEquity("SPY", Resolution.Daily)
+
+        self.random = np.random.RandomState(42)
+        self.symbols = [Symbol.Create(f"SYM{i}", SecurityType.Equity, Market.USA) for i in range(500)]
+        self.models = [f"Alpha{i}" for i in range(20)]
+
+        self.pcm = BlackLittermanOptimizationPortfolioConstructionModel()
+        for symbol in self.symbols:
+            self.pcm.symbolDataBySymbol[symbol] = self.pcm.BlackLittermanSymbolData(symbol, self.pcm.lookback, self.pcm.period)
+
+        self.elapsed = {"views": [], "posterior": [], "targets": []}
+
+    def OnEndOfDay(self, symbol):
+        insights = []
+        for model in self.models:
+            magnitudes = self.random.normal(0, 0.01, len(self.symbols))
+            for symbol, magnitude in zip(self.symbols, magnitudes):
+                direction = InsightDirection.Up if magnitude > 0 else InsightDirection.Down
+                insight = Insight.Price(symbol, timedelta(1), direction, float(magnitude))
+                insight.SourceModel = model
+                insight.GeneratedTimeUtc = self.UtcTime
+                insights.append(insight)
+
+        start = perf_counter()
+        targets = self.pcm.DetermineTargetPercent(insights)
+        self.elapsed["targets"].append(perf_counter() - start)
+
+        # the stages, once the returns windows have enough samples for the covariance
+        if len(targets) > 0:
+            start = perf_counter()
+            P, Q = self.pcm.get_views(insights)
+            self.elapsed["views"].append(perf_counter() - start)
+
+            returns = pd.DataFrame({ symbol: self.pcm.symbolDataBySymbol[symbol].Return for symbol in self.symbols })
+            Pi, Sigma = self.pcm.get_equilibrium_return(returns)
+            start = perf_counter()
+            self.pcm.apply_blacklitterman_master_formula(Pi, Sigma, P, Q)
+            self.elapsed["posterior"].append(perf_counter() - start)
+
+    def OnEndOfAlgorithm(self):
+        for name, elapsed in self.elapsed.items():
+            if elapsed:
+                self.Log(f"{len(self.models)} alpha models, {len(self.symbols)} securities, {name}: {len(elapsed)} rebalances, {1000 * np.mean(elapsed):.1f} ms on average")
@@ -0,0 +1,92 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
+from time import perf_counter
+
+### <summary>
+### The selection of the StatelessCoarseUniverseSelectionBenchmark and the CoarseFineUniverseSelectionBenchmark,
+### sorting the CoarseFundamental and FineFundamental objects against a vectorized top-k of the columnar data frames
+### of the FundamentalUniverseSelectionModel. Both selections run on each universe and must pick the same symbols
+### </summary>
+class ColumnarCoarseFineUniverseSelectionBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.UniverseSettings.Resolution = Resolution.Daily
+
+        self.SetStartDate(2017, 11, 1)
+        self.SetEndDate(2018, 1, 1)
+        self.SetCash(50000)
+
+        self.AddUniverse(self.CoarseSelectionFunction, self.FineSelectionFunction)
+
+        self.numberOfSymbols = 250
+        self.numberOfSymbolsFine = 40
+        self.model = FundamentalUniverseSelectionModel(True)
+        self.elapsed = {}
+
+    # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
+    def CoarseSelectionFunction(self, coarse):
+        coarse = list(coarse)
+        return self.measure("coarse", lambda: self.SelectCoarseObjects(coarse), lambda: self.SelectCoarseColumns(coarse))
+
+    # sort the data by P/E ratio and take the top 'NumberOfSymbolsFine'
+    def FineSelectionFunction(self, fine):
+        fine = list(fine)
+        return self.measure("fine", lambda: self.SelectFineObjects(fine), lambda: self.SelectFineColumns(fine))
+
+    def SelectCoarseObjects(self, coarse):
+        selected = [x for x in coarse if (x.HasFundamentalData)]
+        sortedByDollarVolume = sorted(selected, key=lambda x: x.DollarVolume, reverse=True)
+        return [ x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbols] ]
+
+    def SelectCoarseColumns(self, coarse):
+        coarse = self.model.GetCoarseDataFrame(self, coarse, ['HasFundamentalData', 'DollarVolume'])
+        coarse = coarse[coarse.HasFundamentalData.values]
+        return coarse.index[self.model.GetTopIndices(coarse.DollarVolume.values, self.numberOfSymbols)].tolist()
+
+    def SelectFineObjects(self, fine):
+        sortedByPeRatio = sorted(fine, key=lambda x: x.ValuationRatios.PERatio, reverse=True)
+        return [ x.Symbol for x in sortedByPeRatio[:self.numberOfSymbolsFine] ]
+
+    def SelectFineColumns(self, fine):
+        fine = self.model.GetFineDataFrame(self, fine, ['ValuationRatios.PERatio'])
+        return fine.index[self.model.GetTopIndices(fine['ValuationRatios.PERatio'].values, self.numberOfSymbolsFine)].tolist()
+
+    def measure(self, name, objects, columns):
+        results = []
+        for key, select in [(f"{name} objects", objects), (f"{name} columns", columns)]:
+            start = perf_counter()
+            results.append(select())
+            self.elapsed.setdefault(key, []).append(perf_counter() - start)
+
+        if results[0] != results[1]:
+            raise Exception(f"The {name} selections differ: {len(results[0])} symbols from the objects and {len(results[1])} from the columns")
+        return results[1]
+
+    def OnSecuritiesChanged(self, changes):
+        # if we have no changes, do nothing
+        if changes is None: return
+
+        # liquidate removed securities
+        for security in changes.RemovedSecurities:
+            if security.Invested:
+                self.Liquidate(security.Symbol)
+
+        for security in changes.AddedSecurities:
+            self.SetHoldings(security.Symbol, 0.001)
+
+    def OnEndOfAlgorithm(self):
+        for key, elapsed in self.elapsed.items():
+            self.Log(f"{key}: {len(elapsed)} selections, {1000 * np.mean(elapsed):.1f} ms on average")
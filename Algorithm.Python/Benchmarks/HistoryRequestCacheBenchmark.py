@@ -0,0 +1,43 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Rolling history look backs which overlap from one day to the next, like the ones used by alpha and portfolio models.
+### With the history cache enabled only the new bars are read from disk each day, set the 'history-cache'
+### parameter to 'false' to compare against reading the entire window every time
+### </summary>
+class HistoryRequestCacheBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.SetStartDate(2010, 1, 1)
+        self.SetEndDate(2018, 1, 1)
+        self.SetCash(10000)
+        self.symbol = self.AddEquity("SPY").Symbol
+        if self.GetParameter("history-cache") != "false":
+            self.SetHistoryCache(64)
+
+    def OnEndOfDay(self, symbol):
+        # five days of minute bars
+        minuteHistory = self.History([self.symbol], 5 * 390, Resolution.Minute)
+        lastWeekHigh = minuteHistory.loc["SPY"]["high"].max()
+
+        dailyHistory = self.History([self.symbol], 30, Resolution.Daily).loc["SPY"]
+        dailyHistoryHigh = dailyHistory["high"].max()
+        dailyHistoryLow = dailyHistory["low"].min()
+
+    def OnEndOfAlgorithm(self):
+        cache = self.HistoryCache
+        if cache is not None:
+            self.Log(f"History cache hits: {cache.Hits}. Partial hits: {cache.PartialHits}. Misses: {cache.Misses}. Size: {cache.SizeInBytes} bytes")
@@ -0,0 +1,49 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+from scipy.stats import pearsonr
+from time import perf_counter
+
+### <summary>
+### Selection of the most correlated pair of 50, 200 and 500 securities from one year of daily log returns:
+### a pearsonr call for each pair against the correlation matrix of the PearsonCorrelationPairsTradingAlphaModel
+### </summary>
+class PearsonCorrelationPairsBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.SetStartDate(2017, 1, 1)
+        self.SetEndDate(2017, 1, 10)
+        self.SetCash(100000)
+        self.AddEquity("SPY", Resolution.Daily)
+
+        self.model = PearsonCorrelationPairsTradingAlphaModel(252, Resolution.Daily)
+        random = np.random.RandomState(42)
+        market = random.normal(0.0005, 0.01, (251, 1))
+        self.returns = { count: market * random.uniform(0.5, 1.5, count) + random.normal(0, 0.005, (251, count))
+            for count in [50, 200, 500] }
+
+    def OnEndOfAlgorithm(self):
+        for count, returns in self.returns.items():
+            start = perf_counter()
+            df = pd.DataFrame(returns)
+            corr = { (i, j): pearsonr(df.iloc[:,i], df.iloc[:,j])[0] for i in range(count) for j in range(i + 1, count) }
+            pairwise = max(corr, key = corr.get)
+            pairwiseElapsed = perf_counter() - start
+
+            start = perf_counter()
+            vectorized = self.model.get_best_pair(returns)
+            vectorizedElapsed = perf_counter() - start
+
+            self.Log(f"{count} symbols: pairwise {1000 * pairwiseElapsed:.1f} ms {pairwise}, correlation matrix {1000 * vectorizedElapsed:.1f} ms {vectorized}")
@@ -0,0 +1,57 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.HierarchicalRiskParityPortfolioOptimizer import HierarchicalRiskParityPortfolioOptimizer
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from time import perf_counter
+
+### <summary>
+### Daily rebalances of the minimum variance, maximum Sharpe ratio and hierarchical risk parity optimizers for 50, 200 and 1000 assets.
+### The returns are random, each day the one year look back window moves one day forward, like in a rebalancing portfolio model
+### </summary>
+class PortfolioOptimizerBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.SetStartDate(2017, 1, 1)
+        self.SetEndDate(2017, 2, 1)
+        self.SetCash(100000)
+        self.AddEquity("SPY", Resolution.Daily)
+
+        self.lookback = 252
+        random = np.random.RandomState(42)
+        self.returns = {size: pd.DataFrame(random.normal(0.0005, 0.02, (2 * self.lookback, size)))
+                        for size in [50, 200, 1000]}
+
+        # an optimizer per size, so each one warm starts from its own previous rebalance or reuses its own clustering
+        self.optimizers = {}
+        for size in self.returns:
+            self.optimizers[("MinimumVariance", size)] = MinimumVariancePortfolioOptimizer(0, 0.1, 0.001)
+            self.optimizers[("MaximumSharpeRatio", size)] = MaximumSharpeRatioPortfolioOptimizer(0, 0.1)
+            self.optimizers[("HierarchicalRiskParity", size)] = HierarchicalRiskParityPortfolioOptimizer()
+        self.elapsed = {key: [] for key in self.optimizers}
+        self.day = 0
+
+    def OnEndOfDay(self, symbol):
+        for (name, size), optimizer in self.optimizers.items():
+            returns = self.returns[size].iloc[self.day:self.day + self.lookback]
+            start = perf_counter()
+            optimizer.Optimize(returns)
+            self.elapsed[(name, size)].append(perf_counter() - start)
+        self.day += 1
+
+    def OnEndOfAlgorithm(self):
+        for (name, size), elapsed in self.elapsed.items():
+            if elapsed:
+                self.Log(f"{name} {size} assets: {len(elapsed)} rebalances, {1000 * np.mean(elapsed):.1f} ms on average")
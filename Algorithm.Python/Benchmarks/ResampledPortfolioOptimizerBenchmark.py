@@ -0,0 +1,59 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.UnconstrainedMeanVariancePortfolioOptimizer import UnconstrainedMeanVariancePortfolioOptimizer
+from os import cpu_count
+from time import perf_counter
+
+### <summary>
+### Resampled optimization of 100 assets: the optimizers solve a problem per bootstrap resample of the one year returns,
+### and the minimum variance optimizer solves a grid of target returns. Each batch is solved one problem at a time and
+### with the batch API, in a thread pool for the constrained optimizers and as a single stack of linear systems for the unconstrained one
+### </summary>
+class ResampledPortfolioOptimizerBenchmark(QCAlgorithm):
+
+    def Initialize(self):
+        self.SetStartDate(2017, 1, 1)
+        self.SetEndDate(2017, 1, 10)
+        self.SetCash(100000)
+        self.AddEquity("SPY", Resolution.Daily)
+
+        random = np.random.RandomState(42)
+        returns = pd.DataFrame(random.normal(0.0005, 0.02, (252, 100)))
+        self.returns = returns
+        self.resamples = [returns.iloc[random.randint(0, len(returns), len(returns))].reset_index(drop=True) for _ in range(64)]
+        self.target_returns = np.linspace(0.0002, 0.001, 64)
+        self.threads = cpu_count()
+        self.elapsed = {}
+
+    def OnEndOfDay(self, symbol):
+        self.measure("MinimumVariance target returns", lambda: [MinimumVariancePortfolioOptimizer(-0.1, 0.1, x).Optimize(self.returns) for x in self.target_returns],
+                     lambda: MinimumVariancePortfolioOptimizer(-0.1, 0.1).OptimizeBatch(self.returns, target_returns=self.target_returns, threads=self.threads))
+        self.measure("MaximumSharpeRatio resamples", lambda: [MaximumSharpeRatioPortfolioOptimizer(-0.1, 0.1).Optimize(x) for x in self.resamples],
+                     lambda: MaximumSharpeRatioPortfolioOptimizer(-0.1, 0.1).OptimizeBatch(self.resamples, threads=self.threads))
+        self.measure("UnconstrainedMeanVariance resamples", lambda: [UnconstrainedMeanVariancePortfolioOptimizer().Optimize(x) for x in self.resamples],
+                     lambda: UnconstrainedMeanVariancePortfolioOptimizer().OptimizeBatch(self.resamples))
+
+    def measure(self, name, serial, batch):
+        for key, solve in [(f"{name} serial", serial), (f"{name} batch", batch)]:
+            start = perf_counter()
+            solve()
+            self.elapsed.setdefault(key, []).append(perf_counter() - start)
+
+    def OnEndOfAlgorithm(self):
+        self.Log(f"{self.threads} threads")
+        for key, elapsed in self.elapsed.items():
+            self.Log(f"{key}: {len(elapsed)} runs, {1000 * np.mean(elapsed):.1f} ms on average")
@@ -36,6 +36,51 @@ namespace QuantConnect.Algorithm
             set;
         }
 
+        /// <summary>
+        /// Gets the history cache enabled with <see cref="SetHistoryCache(int)"/>, null if disabled.
+        /// Exposes the cache hit and miss counters
+        /// </summary>
+        [DocumentationAttribute(HistoricalData)]
+        public CachingHistoryProvider HistoryCache => HistoryProvider as CachingHistoryProvider;
+
+        /// <summary>
+        /// Keeps the bars read by history requests in memory, so repeated requests with overlapping windows,
+        /// for example the same look back every day, are served from memory and only read the missing data
+        /// </summary>
+        /// <param name="maximumSizeMegabytes">The maximum approximate size of the cache in megabytes, zero disables the cache</param>
+        [DocumentationAttribute(HistoricalData)]
+        public void SetHistoryCache(int maximumSizeMegabytes = 256)
+        {
+            if (HistoryProvider == null)
+            {
+                throw new InvalidOperationException("QCAlgorithm.SetHistoryCache(): the history provider has not been set.");
+            }
+            if (maximumSizeMegabytes < 0)
+            {
+                throw new ArgumentOutOfRangeException(nameof(maximumSizeMegabytes), "QCAlgorithm.SetHistoryCache(): the cache size can not be negative.");
+            }
+
+            var cache = HistoryCache;
+            if (maximumSizeMegabytes == 0)
+            {
+                if (cache != null)
+                {
+                    HistoryProvider = cache.HistoryProvider;
+                }
+                return;
+            }
+
+            var maximumSizeInBytes = maximumSizeMegabytes * 1024L * 1024L;
+            if (cache != null)
+            {
+                cache.MaximumSizeInBytes = maximumSizeInBytes;
+            }
+            else
+            {
+                HistoryProvider = new CachingHistoryProvider(HistoryProvider, maximumSizeInBytes);
+            }
+        }
+
         /// <summary>
         /// Gets whether or not this algorithm is still warming up
         /// </summary>
@@ -643,8 +688,15 @@ namespace QuantConnect.Algorithm
             return config;
         }
         
+        /// <summary>
+        /// Executes the specified history requests without memoizing the resulting slices,
+        /// so they can be streamed and released as they are consumed
+        /// </summary>
+        /// <param name="requests">the history requests to execute</param>
+        /// <param name="timeZone">The time zone of the resulting slices</param>
+        /// <returns>A lazy enumerable of slice satisfying the specified history requests</returns>
         [DocumentationAttribute(HistoricalData)]
-        private IEnumerable<Slice> History(IEnumerable<HistoryRequest> requests, DateTimeZone timeZone)
+        protected IEnumerable<Slice> History(IEnumerable<HistoryRequest> requests, DateTimeZone timeZone)
         {
             var sentMessage = false;
             // filter out any universe securities that may have made it this far
@@ -682,7 +734,7 @@ namespace QuantConnect.Algorithm
         /// <summary>
         /// Helper method to create history requests from a date range
         /// </summary>
-        private IEnumerable<HistoryRequest> CreateDateRangeHistoryRequests(IEnumerable<Symbol> symbols, DateTime startAlgoTz, DateTime endAlgoTz, Resolution? resolution = null, bool? fillForward = null, bool? extendedMarket = null)
+        protected IEnumerable<HistoryRequest> CreateDateRangeHistoryRequests(IEnumerable<Symbol> symbols, DateTime startAlgoTz, DateTime endAlgoTz, Resolution? resolution = null, bool? fillForward = null, bool? extendedMarket = null)
         {
             return symbols.Where(HistoryRequestValid).SelectMany(x =>
             {
@@ -681,6 +681,52 @@ namespace QuantConnect.Algorithm
             WarmUpIndicator(symbol, WrapPythonIndicator(indicator), resolution, selector?.ConvertToDelegate<Func<IBaseData, IBaseData>>());
         }
 
+        /// <summary>
+        /// Warms up a given indicator with a column of a history data frame in a single call,
+        /// instead of updating it row by row from python
+        /// </summary>
+        /// <param name="indicator">The indicator we want to warm up</param>
+        /// <param name="history">The pandas.DataFrame of a single symbol, or a pandas.Series, ordered by time</param>
+        /// <param name="field">The column of the data frame used to update the indicator</param>
+        [DocumentationAttribute(Indicators)]
+        [DocumentationAttribute(HistoricalData)]
+        public void WarmUpIndicator(IndicatorBase<IndicatorDataPoint> indicator, PyObject history, string field = "close")
+        {
+            indicator.WarmUp(PandasConverter.GetTimes(history), PandasConverter.GetValues(history, field));
+        }
+
+        /// <summary>
+        /// Warms up a given bar indicator with the open, high, low and close columns of a history data frame in a single call,
+        /// instead of updating it row by row from python
+        /// </summary>
+        /// <param name="indicator">The indicator we want to warm up</param>
+        /// <param name="history">The pandas.DataFrame of a single symbol ordered by time</param>
+        [DocumentationAttribute(Indicators)]
+        [DocumentationAttribute(HistoricalData)]
+        public void WarmUpIndicator(IndicatorBase<IBaseDataBar> indicator, PyObject history)
+        {
+            foreach (var bar in GetTradeBars(history))
+            {
+                indicator.Update(bar);
+            }
+        }
+
+        /// <summary>
+        /// Warms up a given trade bar indicator with the open, high, low, close and volume columns of a history data frame in a single call,
+        /// instead of updating it row by row from python
+        /// </summary>
+        /// <param name="indicator">The indicator we want to warm up</param>
+        /// <param name="history">The pandas.DataFrame of a single symbol ordered by time</param>
+        [DocumentationAttribute(Indicators)]
+        [DocumentationAttribute(HistoricalData)]
+        public void WarmUpIndicator(IndicatorBase<TradeBar> indicator, PyObject history)
+        {
+            foreach (var bar in GetTradeBars(history))
+            {
+                indicator.Update(bar);
+            }
+        }
+
         /// <summary>
         /// Plot a chart using string series name, with value.
         /// </summary>
@@ -899,6 +945,220 @@ namespace QuantConnect.Algorithm
             return PandasConverter.GetDataFrame(History(symbols, start, end, resolution));
         }
 
+        /// <summary>
+        /// Gets the historical data for the specified symbols holding only the requested fields. The exact number of bars will be returned.
+        /// The symbol must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request, null for the resolution of the subscriptions</param>
+        /// <param name="fields">The data frame columns to return, e.g. ['close', 'volume'], null for all of them</param>
+        /// <returns>A pandas DataFrame containing the requested fields of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject History(PyObject tickers, int periods, Resolution? resolution = null, PyObject fields = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetDataFrame(History(symbols, periods, resolution), fields?.ConvertToStringEnumerable().ToList());
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols over the requested span holding only the requested fields.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request, null for the resolution of the subscriptions</param>
+        /// <param name="fields">The data frame columns to return, e.g. ['close', 'volume'], null for all of them</param>
+        /// <returns>A pandas DataFrame containing the requested fields of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject History(PyObject tickers, TimeSpan span, Resolution? resolution = null, PyObject fields = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetDataFrame(History(symbols, span, resolution), fields?.ConvertToStringEnumerable().ToList());
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates holding only the requested fields.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request, null for the resolution of the subscriptions</param>
+        /// <param name="fields">The data frame columns to return, e.g. ['close', 'volume'], null for all of them</param>
+        /// <returns>A pandas DataFrame containing the requested fields of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject History(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, PyObject fields = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetDataFrame(History(symbols, start, end, resolution), fields?.ConvertToStringEnumerable().ToList());
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols as a pyarrow Table, which requires the pyarrow package.
+        /// The exact number of bars will be returned. The symbol must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A pyarrow Table containing the requested historical data, with the index levels as columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArrow(PyObject tickers, int periods, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetArrowTable(History(symbols, periods, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols over the requested span as a pyarrow Table, which requires the pyarrow package.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A pyarrow Table containing the requested historical data, with the index levels as columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArrow(PyObject tickers, TimeSpan span, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetArrowTable(History(symbols, span, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a pyarrow Table, which requires the pyarrow package.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A pyarrow Table containing the requested historical data, with the index levels as columns</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject HistoryArrow(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetArrowTable(History(symbols, start, end, resolution));
+        }
+
+        /// <summary>
+        /// Writes a pandas DataFrame or pyarrow Table, like the ones returned by History and HistoryArrow, into a parquet file
+        /// so it can be reloaded with <see cref="ReadParquet"/> instead of requesting the history again. Requires the pyarrow package
+        /// </summary>
+        /// <param name="data">The pandas DataFrame or pyarrow Table</param>
+        /// <param name="path">The path of the parquet file</param>
+        [DocumentationAttribute(HistoricalData)]
+        public void ToParquet(PyObject data, string path)
+        {
+            PandasConverter.ToParquet(data, path);
+        }
+
+        /// <summary>
+        /// Reads a parquet file written by <see cref="ToParquet"/>. Requires the pyarrow package
+        /// </summary>
+        /// <param name="path">The path of the parquet file</param>
+        /// <param name="format">'pandas' for a pandas DataFrame indexed like the History data frames or 'arrow' for a pyarrow Table</param>
+        /// <returns>A pandas DataFrame or pyarrow Table containing the data of the file</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject ReadParquet(string path, string format = "pandas")
+        {
+            return PandasConverter.ReadParquet(path, format);
+        }
+
+        /// <summary>
+        /// Gets the historical values of a single field for the specified symbols as a wide data frame indexed by time with one column per symbol.
+        /// Equivalent to History(tickers, periods, resolution).close.unstack(level=0) without building the multi index
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The numeric field to use as values, e.g. 'close' or 'volume'</param>
+        /// <returns>A pandas DataFrame with one column per symbol containing the requested field of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject WideHistory(PyObject tickers, int periods, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetWideDataFrame(History(symbols, periods, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical values of a single field for the specified symbols over the requested span as a wide data frame
+        /// indexed by time with one column per symbol
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The numeric field to use as values, e.g. 'close' or 'volume'</param>
+        /// <returns>A pandas DataFrame with one column per symbol containing the requested field of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject WideHistory(PyObject tickers, TimeSpan span, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetWideDataFrame(History(symbols, span, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical values of a single field for the specified symbols between the specified dates as a wide data frame
+        /// indexed by time with one column per symbol
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="field">The numeric field to use as values, e.g. 'close' or 'volume'</param>
+        /// <returns>A pandas DataFrame with one column per symbol containing the requested field of the historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject WideHistory(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, string field = "close")
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetWideDataFrame(History(symbols, start, end, resolution), field);
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols as a lazy data frame. The exact number of bars will be returned.
+        /// The data is kept in Lean and a column is only converted into a pandas.Series when it is accessed, e.g. history.close
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy data frame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject LazyHistory(PyObject tickers, int periods, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetLazyDataFrame(History(symbols, periods, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols over the requested span as a lazy data frame.
+        /// The data is kept in Lean and a column is only converted into a pandas.Series when it is accessed, e.g. history.close
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="span">The span over which to retrieve recent historical data</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy data frame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject LazyHistory(PyObject tickers, TimeSpan span, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetLazyDataFrame(History(symbols, span, resolution));
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a lazy data frame.
+        /// The data is kept in Lean and a column is only converted into a pandas.Series when it is accessed, e.g. history.close
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <returns>A lazy data frame containing the requested historical data</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public PyObject LazyHistory(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null)
+        {
+            var symbols = tickers.ConvertToSymbolEnumerable();
+            return PandasConverter.GetLazyDataFrame(History(symbols, start, end, resolution));
+        }
+
         /// <summary>
         /// Gets the historical data for the specified symbols between the specified dates. The symbols must exist in the Securities collection.
         /// </summary>
@@ -1322,6 +1582,31 @@ namespace QuantConnect.Algorithm
             return Consolidate(symbol, calendar, tickType, handler.ConvertToDelegate<Action<BaseData>>());
         }
 
+        /// <summary>
+        /// Creates the trade bars of a history data frame of a single symbol from its columns, rows with missing prices are skipped
+        /// </summary>
+        /// <param name="history">The pandas.DataFrame of a single symbol ordered by time</param>
+        /// <returns>The trade bars ending at the times of the data frame index</returns>
+        private IEnumerable<TradeBar> GetTradeBars(PyObject history)
+        {
+            var times = PandasConverter.GetTimes(history);
+            var open = PandasConverter.GetValues(history, "open");
+            var high = PandasConverter.GetValues(history, "high");
+            var low = PandasConverter.GetValues(history, "low");
+            var close = PandasConverter.GetValues(history, "close");
+            var volume = PandasConverter.GetValues(history, "volume", optional: true);
+
+            for (var i = 0; i < times.Length; i++)
+            {
+                if (!double.IsFinite(open[i]) || !double.IsFinite(high[i]) || !double.IsFinite(low[i]) || !double.IsFinite(close[i]))
+                {
+                    continue;
+                }
+                yield return new TradeBar(times[i], Symbol.Empty, open[i].SafeDecimalCast(), high[i].SafeDecimalCast(),
+                    low[i].SafeDecimalCast(), close[i].SafeDecimalCast(), double.IsFinite(volume[i]) ? volume[i].SafeDecimalCast() : 0m, TimeSpan.Zero);
+            }
+        }
+
         /// <summary>
         /// Gets indicator base type
         /// </summary>
@@ -840,7 +840,12 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         /// Set the DateTime Frontier: This is the master time and is
         /// </summary>
         /// <param name="time"></param>
-        public void SetDateTime(DateTime time) => _baseAlgorithm.SetDateTime(time);
+        public void SetDateTime(DateTime time)
+        {
+            _baseAlgorithm.SetDateTime(time);
+            // once per time step, the tickers resolved by the data frames follow the symbol cache
+            PandasData.RefreshSymbolKeys();
+        }
 
         /// <summary>
         /// Set the start date for the backtest
@@ -27,10 +27,20 @@ namespace QuantConnect.Algorithm.Framework.Alphas
     /// </summary>
     public class InsightCollection : ICollection<Insight>
     {
-        // for performance lets keep the next insight expiration time
-        private DateTime? _nextExpiryTime;
         private readonly ConcurrentDictionary<Symbol, List<Insight>> _insights = new ConcurrentDictionary<Symbol, List<Insight>>();
 
+        // for performance lets keep the last generated insight of each source model for each symbol
+        private readonly Dictionary<Symbol, Dictionary<string, Insight>> _lastInsights = new Dictionary<Symbol, Dictionary<string, Insight>>();
+
+        // for performance lets keep the insights ordered by expiration time, removed insights are skipped when they reach the top
+        private readonly PriorityQueue<Insight, DateTime> _insightsByCloseTime = new PriorityQueue<Insight, DateTime>();
+
+        // the insights in the collection, so removed insights are found in the expiration queue without searching the lists
+        private readonly HashSet<Insight> _liveInsights = new HashSet<Insight>();
+
+        // guards the last generated insights, the expiration queue and the live insights
+        private readonly object _indexLock = new object();
+
         /// <summary>Gets the number of elements contained in the <see cref="T:System.Collections.Generic.ICollection`1" />.</summary>
         /// <returns>The number of elements contained in the <see cref="T:System.Collections.Generic.ICollection`1" />.</returns>
         public int Count => _insights.Aggregate(0, (i, kvp) => i + kvp.Value.Count);
@@ -44,12 +54,15 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// <exception cref="T:System.NotSupportedException">The <see cref="T:System.Collections.Generic.ICollection`1" /> is read-only.</exception>
         public void Add(Insight item)
         {
-            _nextExpiryTime = null;
-            _insights.AddOrUpdate(item.Symbol, s => new List<Insight> {item}, (s, list) =>
+            lock (_indexLock)
             {
-                list.Add(item);
-                return list;
-            });
+                _insights.AddOrUpdate(item.Symbol, s => new List<Insight> {item}, (s, list) =>
+                {
+                    list.Add(item);
+                    return list;
+                });
+                AddToIndex(item);
+            }
         }
 
         /// <summary>
@@ -68,8 +81,13 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// <exception cref="T:System.NotSupportedException">The <see cref="T:System.Collections.Generic.ICollection`1" /> is read-only. </exception>
         public void Clear()
         {
-            _nextExpiryTime = null;
-            _insights.Clear();
+            lock (_indexLock)
+            {
+                _insights.Clear();
+                _lastInsights.Clear();
+                _insightsByCloseTime.Clear();
+                _liveInsights.Clear();
+            }
         }
 
         /// <summary>Determines whether the <see cref="T:System.Collections.Generic.ICollection`1" /> contains a specific value.</summary>
@@ -77,13 +95,10 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// <param name="item">The object to locate in the <see cref="T:System.Collections.Generic.ICollection`1" />.</param>
         public bool Contains(Insight item)
         {
-            List<Insight> symbolInsights;
-            if (_insights.TryGetValue(item.Symbol, out symbolInsights))
+            lock (_indexLock)
             {
-                return symbolInsights.Contains(item);
+                return _liveInsights.Contains(item);
             }
-
-            return false;
         }
 
         /// <summary>
@@ -117,24 +132,31 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// <exception cref="T:System.NotSupportedException">The <see cref="T:System.Collections.Generic.ICollection`1" /> is read-only.</exception>
         public bool Remove(Insight item)
         {
-            List<Insight> symbolInsights;
-            if (_insights.TryGetValue(item.Symbol, out symbolInsights))
+            lock (_indexLock)
             {
-                _nextExpiryTime = null;
-
-                if (symbolInsights.Remove(item))
+                List<Insight> symbolInsights;
+                if (_insights.TryGetValue(item.Symbol, out symbolInsights))
                 {
-                    // remove empty list from dictionary
-                    if (symbolInsights.Count == 0)
+                    if (symbolInsights.Remove(item))
                     {
-                        _insights.TryRemove(item.Symbol, out symbolInsights);
-                    }
+                        // remove empty list from dictionary
+                        if (symbolInsights.Count == 0)
+                        {
+                            _insights.TryRemove(item.Symbol, out symbolInsights);
+                        }
 
-                    return true;
+                        // the same insight can be added more than once
+                        if (!symbolInsights.Contains(item))
+                        {
+                            _liveInsights.Remove(item);
+                        }
+                        RemoveFromIndex(item);
+                        return true;
+                    }
                 }
-            }
 
-            return false;
+                return false;
+            }
         }
 
         /// <summary>
@@ -145,7 +167,23 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         public List<Insight> this[Symbol symbol]
         {
             get { return _insights[symbol]; }
-            set { _insights[symbol] = value; }
+            set
+            {
+                lock (_indexLock)
+                {
+                    List<Insight> previous;
+                    if (_insights.TryGetValue(symbol, out previous))
+                    {
+                        _liveInsights.ExceptWith(previous);
+                    }
+                    _insights[symbol] = value;
+                    _lastInsights.Remove(symbol);
+                    foreach (var insight in value)
+                    {
+                        AddToIndex(insight);
+                    }
+                }
+            }
         }
 
         /// <summary>
@@ -181,11 +219,17 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// <param name="symbols">List of symbols that will be removed</param>
         public void Clear(Symbol[] symbols)
         {
-            _nextExpiryTime = null;
-            foreach (var symbol in symbols)
+            lock (_indexLock)
             {
-                List<Insight> insights;
-                _insights.TryRemove(symbol, out insights);
+                foreach (var symbol in symbols)
+                {
+                    List<Insight> insights;
+                    if (_insights.TryRemove(symbol, out insights))
+                    {
+                        _liveInsights.ExceptWith(insights);
+                    }
+                    _lastInsights.Remove(symbol);
+                }
             }
         }
 
@@ -194,18 +238,11 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         /// </summary>
         public DateTime? GetNextExpiryTime()
         {
-            if (Count == 0)
-            {
-                return null;
-            }
-
-            if (_nextExpiryTime != null)
+            lock (_indexLock)
             {
-                return _nextExpiryTime;
+                Insight insight;
+                return TryPeekNextExpiry(out insight) ? insight.CloseTimeUtc : (DateTime?)null;
             }
-
-            _nextExpiryTime = _insights.Min(x => x.Value.Min(i => i.CloseTimeUtc));
-            return _nextExpiryTime;
         }
 
         /// <summary>
@@ -228,6 +265,36 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             return activeInsights;
         }
 
+        /// <summary>
+        /// Gets the last generated active insight of each source model for each symbol.
+        /// It costs a lookup per source model and symbol instead of grouping and sorting every insight
+        /// </summary>
+        /// <param name="utcTime">Time that determines whether the insight has expired</param>
+        /// <returns>Collection of the last generated active insight of each source model for each symbol</returns>
+        public ICollection<Insight> GetLastActiveInsights(DateTime utcTime)
+        {
+            var lastActiveInsights = new List<Insight>();
+            lock (_indexLock)
+            {
+                foreach (var kvp in _lastInsights)
+                {
+                    foreach (var lastInsight in kvp.Value)
+                    {
+                        // the last generated insight can expire before an insight generated earlier with a longer period
+                        var insight = lastInsight.Value.IsActive(utcTime)
+                            ? lastInsight.Value
+                            : FindLastInsight(kvp.Key, lastInsight.Key, utcTime);
+
+                        if (insight != null)
+                        {
+                            lastActiveInsights.Add(insight);
+                        }
+                    }
+                }
+            }
+            return lastActiveInsights;
+        }
+
         /// <summary>
         /// Returns true if there are active insights for a given symbol and time
         /// </summary>
@@ -252,21 +319,190 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         public ICollection<Insight> RemoveExpiredInsights(DateTime utcTime)
         {
             var removedInsights = new List<Insight>();
-            foreach (var kvp in _insights)
+            lock (_indexLock)
             {
-                foreach (var insight in kvp.Value)
+                Insight insight;
+                while (TryPeekNextExpiry(out insight) && insight.IsExpired(utcTime))
                 {
-                    if (insight.IsExpired(utcTime))
+                    _insightsByCloseTime.Dequeue();
+                    _liveInsights.Remove(insight);
+                    removedInsights.Add(insight);
+                }
+                if (removedInsights.Count == 0)
+                {
+                    return removedInsights;
+                }
+
+                // each symbol list is filtered once and the last generated insights of its source models are searched once,
+                // instead of removing and searching for each expired insight
+                foreach (var expiredInsights in removedInsights.GroupBy(x => x.Symbol))
+                {
+                    List<Insight> symbolInsights;
+                    if (!_insights.TryGetValue(expiredInsights.Key, out symbolInsights))
+                    {
+                        continue;
+                    }
+
+                    var expired = new HashSet<Insight>(expiredInsights);
+                    symbolInsights.RemoveAll(expired.Contains);
+                    if (symbolInsights.Count == 0)
                     {
-                        removedInsights.Add(insight);
+                        _insights.TryRemove(expiredInsights.Key, out symbolInsights);
                     }
+                    UpdateLastInsights(expiredInsights.Key, expired);
                 }
             }
-            foreach (var insight in removedInsights)
+            return removedInsights;
+        }
+
+        /// <summary>
+        /// Adds the insight to the last generated insights, to the expiration queue and to the live insights
+        /// </summary>
+        private void AddToIndex(Insight insight)
+        {
+            _liveInsights.Add(insight);
+
+            Dictionary<string, Insight> lastInsights;
+            if (!_lastInsights.TryGetValue(insight.Symbol, out lastInsights))
             {
-                Remove(insight);
+                _lastInsights[insight.Symbol] = lastInsights = new Dictionary<string, Insight>();
             }
-            return removedInsights;
+
+            // like ordering by generated time and taking the last one, the last added insight wins the ties
+            Insight lastInsight;
+            var sourceModel = insight.SourceModel ?? string.Empty;
+            if (!lastInsights.TryGetValue(sourceModel, out lastInsight) || insight.GeneratedTimeUtc >= lastInsight.GeneratedTimeUtc)
+            {
+                lastInsights[sourceModel] = insight;
+            }
+
+            _insightsByCloseTime.Enqueue(insight, insight.CloseTimeUtc);
+        }
+
+        /// <summary>
+        /// Replaces the removed insight in the last generated insights. The expiration queue skips it when it reaches the top
+        /// </summary>
+        private void RemoveFromIndex(Insight insight)
+        {
+            Dictionary<string, Insight> lastInsights;
+            if (!_lastInsights.TryGetValue(insight.Symbol, out lastInsights))
+            {
+                return;
+            }
+
+            Insight lastInsight;
+            var sourceModel = insight.SourceModel ?? string.Empty;
+            if (!lastInsights.TryGetValue(sourceModel, out lastInsight) || lastInsight != insight)
+            {
+                return;
+            }
+
+            lastInsight = FindLastInsight(insight.Symbol, sourceModel, null);
+            if (lastInsight != null)
+            {
+                lastInsights[sourceModel] = lastInsight;
+            }
+            else if (lastInsights.Remove(sourceModel) && lastInsights.Count == 0)
+            {
+                _lastInsights.Remove(insight.Symbol);
+            }
+        }
+
+        /// <summary>
+        /// Replaces the removed insights of a symbol in the last generated insights, searching the insights of the symbol once
+        /// </summary>
+        private void UpdateLastInsights(Symbol symbol, HashSet<Insight> removedInsights)
+        {
+            Dictionary<string, Insight> lastInsights;
+            if (!_lastInsights.TryGetValue(symbol, out lastInsights))
+            {
+                return;
+            }
+
+            var sourceModels = lastInsights.Where(kvp => removedInsights.Contains(kvp.Value)).Select(kvp => kvp.Key).ToList();
+            if (sourceModels.Count == 0)
+            {
+                return;
+            }
+            foreach (var sourceModel in sourceModels)
+            {
+                lastInsights.Remove(sourceModel);
+            }
+
+            List<Insight> insights;
+            if (_insights.TryGetValue(symbol, out insights))
+            {
+                foreach (var insight in insights)
+                {
+                    var sourceModel = insight.SourceModel ?? string.Empty;
+                    if (!sourceModels.Contains(sourceModel))
+                    {
+                        continue;
+                    }
+
+                    Insight lastInsight;
+                    if (!lastInsights.TryGetValue(sourceModel, out lastInsight) || insight.GeneratedTimeUtc >= lastInsight.GeneratedTimeUtc)
+                    {
+                        lastInsights[sourceModel] = insight;
+                    }
+                }
+            }
+
+            if (lastInsights.Count == 0)
+            {
+                _lastInsights.Remove(symbol);
+            }
+        }
+
+        /// <summary>
+        /// Searches the insights of the symbol for the last generated insight of the source model, active at the given time if any
+        /// </summary>
+        private Insight FindLastInsight(Symbol symbol, string sourceModel, DateTime? utcTime)
+        {
+            List<Insight> insights;
+            if (!_insights.TryGetValue(symbol, out insights))
+            {
+                return null;
+            }
+
+            Insight lastInsight = null;
+            foreach (var insight in insights)
+            {
+                if ((insight.SourceModel ?? string.Empty) == sourceModel
+                    && (utcTime == null || insight.IsActive(utcTime.Value))
+                    && (lastInsight == null || insight.GeneratedTimeUtc >= lastInsight.GeneratedTimeUtc))
+                {
+                    lastInsight = insight;
+                }
+            }
+            return lastInsight;
+        }
+
+        /// <summary>
+        /// Gets the insight of the collection that expires first, dropping the removed insights from the top of the expiration queue
+        /// </summary>
+        private bool TryPeekNextExpiry(out Insight insight)
+        {
+            DateTime closeTimeUtc;
+            while (_insightsByCloseTime.TryPeek(out insight, out closeTimeUtc))
+            {
+                if (!_liveInsights.Contains(insight))
+                {
+                    _insightsByCloseTime.Dequeue();
+                    continue;
+                }
+
+                if (insight.CloseTimeUtc != closeTimeUtc)
+                {
+                    // the close time changed after the insight was added
+                    _insightsByCloseTime.Dequeue();
+                    _insightsByCloseTime.Enqueue(insight, insight.CloseTimeUtc);
+                    continue;
+                }
+
+                return true;
+            }
+            return false;
         }
     }
 }
\ No newline at end of file
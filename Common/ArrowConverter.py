@@ -0,0 +1,111 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Lean Arrow Converter
+Builds pyarrow record batches and tables from the columns of the history data prepared by PandasData,
+and writes/reads them to/from parquet files. pyarrow is an optional dependency, it's only imported when used.
+'''
+
+import numpy as np
+
+# Columns holding the levels of the pandas MultiIndex, in order
+indexColumns = ['expiry', 'strike', 'type', 'symbol', 'time']
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("The 'arrow' format requires the pyarrow package, it can be installed with 'pip install pyarrow'")
+    return pyarrow
+
+def _to_array(pa, values, mask):
+    if mask is not None:
+        return pa.array(values, mask=mask)
+    if isinstance(values, np.ndarray):
+        return pa.array(values, from_pandas=True)
+    values = list(values)
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed types, keep their text representation
+        return pa.array([None if x is None else str(x) for x in values])
+
+def to_record_batch(levelNames, levelValues, times, columnNames, columnValues, columnMasks):
+    '''Creates a pyarrow.RecordBatch with a column per index level and per data column'''
+    pa = _import_pyarrow()
+    count = len(times)
+    arrays = [pa.array([value] * count) for value in levelValues]
+    arrays.append(pa.array(times.view('datetime64[ns]')))
+    arrays.extend(_to_array(pa, values, mask) for values, mask in zip(columnValues, columnMasks))
+    return pa.RecordBatch.from_arrays(arrays, names=list(levelNames) + ['time'] + list(columnNames))
+
+def _common_type(pa, first, second):
+    if pa.types.is_null(first):
+        return second
+    if pa.types.is_null(second) or first == second:
+        return first
+    numeric = lambda x: pa.types.is_integer(x) or pa.types.is_floating(x) or pa.types.is_boolean(x)
+    if numeric(first) and numeric(second):
+        return pa.float64()
+    return pa.string()
+
+def to_table(batches):
+    '''Concatenates the record batches of each symbol into a pyarrow.Table, unifying their schemas'''
+    pa = _import_pyarrow()
+    batches = list(batches)
+    if not batches:
+        return pa.table({})
+
+    types = {}
+    for batch in batches:
+        for field in batch.schema:
+            types[field.name] = _common_type(pa, types[field.name], field.type) if field.name in types else field.type
+
+    names = [x for x in indexColumns if x in types] + sorted(x for x in types if x not in indexColumns)
+    schema = pa.schema([(name, types[name]) for name in names])
+
+    unified = []
+    for batch in batches:
+        arrays = []
+        for field in schema:
+            index = batch.schema.get_field_index(field.name)
+            if index < 0:
+                arrays.append(pa.array([None] * batch.num_rows, type=field.type))
+            else:
+                column = batch.column(index)
+                arrays.append(column if column.type == field.type else column.cast(field.type))
+        unified.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    return pa.Table.from_batches(unified, schema=schema)
+
+def to_parquet(data, path):
+    '''Writes a pyarrow.Table or pandas.DataFrame to a parquet file'''
+    pa = _import_pyarrow()
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data)
+    pa.parquet.write_table(table, path)
+
+def read_parquet(path, format):
+    '''Reads a parquet file as a pyarrow.Table or a pandas.DataFrame indexed like the history data frames'''
+    pa = _import_pyarrow()
+    table = pa.parquet.read_table(path)
+    if format == 'arrow':
+        return table
+
+    dataFrame = table.to_pandas()
+    if table.schema.pandas_metadata is None:
+        # written from an arrow history table, restore the index levels
+        index = [x for x in indexColumns if x in dataFrame.columns]
+        if index:
+            dataFrame = dataFrame.set_index(index)
+    return dataFrame
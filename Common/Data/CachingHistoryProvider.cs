@@ -0,0 +1,582 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using NodaTime;
+using QuantConnect.Data.Market;
+using QuantConnect.Interfaces;
+
+namespace QuantConnect.Data
+{
+    /// <summary>
+    /// Provides an implementation of <see cref="IHistoryProvider"/> which keeps the bars read by the wrapped
+    /// history provider in memory, so that overlapping history requests, like the same look back requested every day,
+    /// are served from memory and only the missing tail of the window is read
+    /// </summary>
+    /// <remarks>Only trade and quote bar requests are cached, ticks, custom data and <see cref="DataNormalizationMode.ScaledRaw"/>
+    /// requests are forwarded as is. The splits, dividends, delistings and symbol changed events read along with the bars are cached
+    /// and replayed in the slices they were read in. The cache is bounded by an approximate size in bytes, evicting the least recently used entries</remarks>
+    public class CachingHistoryProvider : HistoryProviderBase
+    {
+        // approximate memory footprint of each cached bar, used to enforce the maximum size of the cache
+        private const int TradeBarSize = 144;
+        private const int QuoteBarSize = 288;
+        private const int AuxiliaryDataSize = 160;
+
+        private readonly object _lock = new();
+        private readonly IHistoryProvider _historyProvider;
+        private readonly Dictionary<CacheKey, LinkedListNode<CacheEntry>> _entries = new();
+        private readonly LinkedList<CacheEntry> _leastRecentlyUsed = new();
+        private long _sizeInBytes;
+        private long _maximumSizeInBytes;
+        private int _hits;
+        private int _partialHits;
+        private int _misses;
+
+        /// <summary>
+        /// Gets the wrapped history provider
+        /// </summary>
+        public IHistoryProvider HistoryProvider => _historyProvider;
+
+        /// <summary>
+        /// Gets the total number of data points read by the wrapped history provider
+        /// </summary>
+        public override int DataPointCount => _historyProvider.DataPointCount;
+
+        /// <summary>
+        /// Gets or sets the maximum approximate size of the cache in bytes
+        /// </summary>
+        public long MaximumSizeInBytes
+        {
+            get { return Interlocked.Read(ref _maximumSizeInBytes); }
+            set
+            {
+                if (value <= 0)
+                {
+                    throw new ArgumentOutOfRangeException(nameof(value), "CachingHistoryProvider: the maximum size of the cache must be positive.");
+                }
+                lock (_lock)
+                {
+                    _maximumSizeInBytes = value;
+                    Evict();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the approximate size of the cached data in bytes
+        /// </summary>
+        public long SizeInBytes => Interlocked.Read(ref _sizeInBytes);
+
+        /// <summary>
+        /// Gets the number of requests fully served from the cache
+        /// </summary>
+        public int Hits => _hits;
+
+        /// <summary>
+        /// Gets the number of requests served from the cache for which only the missing tail was read
+        /// </summary>
+        public int PartialHits => _partialHits;
+
+        /// <summary>
+        /// Gets the number of cacheable requests which had to be read entirely
+        /// </summary>
+        public int Misses => _misses;
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="historyProvider">The history provider to read the data not found in the cache</param>
+        /// <param name="maximumSizeInBytes">The maximum approximate size of the cache in bytes</param>
+        public CachingHistoryProvider(IHistoryProvider historyProvider, long maximumSizeInBytes)
+        {
+            _historyProvider = historyProvider ?? throw new ArgumentNullException(nameof(historyProvider));
+            MaximumSizeInBytes = maximumSizeInBytes;
+
+            _historyProvider.InvalidConfigurationDetected += (sender, args) => { OnInvalidConfigurationDetected(args); };
+            _historyProvider.NumericalPrecisionLimited += (sender, args) => { OnNumericalPrecisionLimited(args); };
+            _historyProvider.StartDateLimited += (sender, args) => { OnStartDateLimited(args); };
+            _historyProvider.DownloadFailed += (sender, args) => { OnDownloadFailed(args); };
+            _historyProvider.ReaderErrorDetected += (sender, args) => { OnReaderErrorDetected(args); };
+        }
+
+        /// <summary>
+        /// Initializes the wrapped history provider
+        /// </summary>
+        /// <param name="parameters">The initialization parameters</param>
+        public override void Initialize(HistoryProviderInitializeParameters parameters)
+        {
+            _historyProvider.Initialize(parameters);
+        }
+
+        /// <summary>
+        /// Gets the history for the requested securities
+        /// </summary>
+        /// <param name="requests">The historical data requests</param>
+        /// <param name="sliceTimeZone">The time zone used when time stamping the slice instances</param>
+        /// <returns>An enumerable of the slices of data covering the span specified in each request</returns>
+        public override IEnumerable<Slice> GetHistory(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone)
+        {
+            var cacheableRequests = new List<HistoryRequest>();
+            var otherRequests = new List<HistoryRequest>();
+            foreach (var request in requests)
+            {
+                (IsCacheable(request) ? cacheableRequests : otherRequests).Add(request);
+            }
+
+            if (cacheableRequests.Count == 0)
+            {
+                return _historyProvider.GetHistory(otherRequests, sliceTimeZone);
+            }
+
+            var cachedSlices = GetCachedHistory(cacheableRequests, sliceTimeZone);
+            if (otherRequests.Count == 0)
+            {
+                return cachedSlices;
+            }
+            return Merge(cachedSlices, _historyProvider.GetHistory(otherRequests, sliceTimeZone));
+        }
+
+        /// <summary>
+        /// Removes all the cached data
+        /// </summary>
+        public void Clear()
+        {
+            lock (_lock)
+            {
+                foreach (var entry in _leastRecentlyUsed)
+                {
+                    entry.Removed = true;
+                }
+                _entries.Clear();
+                _leastRecentlyUsed.Clear();
+                Interlocked.Exchange(ref _sizeInBytes, 0);
+            }
+        }
+
+        private List<Slice> GetCachedHistory(List<HistoryRequest> requests, DateTimeZone sliceTimeZone)
+        {
+            var dataByTime = new SortedDictionary<DateTime, List<BaseData>>();
+
+            lock (_lock)
+            {
+                var entries = new List<CacheEntry>(requests.Count);
+                var readRequests = new List<KeyValuePair<HistoryRequest, CacheEntry>>();
+                foreach (var request in requests)
+                {
+                    var key = new CacheKey(request);
+                    CacheEntry entry;
+
+                    LinkedListNode<CacheEntry> node;
+                    BaseData lastBar = null;
+                    if (_entries.TryGetValue(key, out node) && node.Value.StartTimeUtc <= request.StartTimeUtc
+                        && request.StartTimeUtc <= node.Value.EndTimeUtc
+                        && (request.EndTimeUtc <= node.Value.EndTimeUtc
+                            // the tail is read again from the last actual bar so fill forward continues as it would in a single request
+                            || (lastBar = node.Value.Data.LastOrDefault(x => !x.IsFillForward)) != null))
+                    {
+                        entry = node.Value;
+                        _leastRecentlyUsed.Remove(node);
+                        _leastRecentlyUsed.AddLast(node);
+
+                        if (lastBar == null)
+                        {
+                            Interlocked.Increment(ref _hits);
+                        }
+                        else
+                        {
+                            Interlocked.Increment(ref _partialHits);
+                            var startTimeUtc = lastBar.Time.ConvertToUtc(request.ExchangeHours.TimeZone);
+                            readRequests.Add(new KeyValuePair<HistoryRequest, CacheEntry>(CreateRequest(request, startTimeUtc), entry));
+                            // the auxiliary data up to the previous end is cached already
+                            entry.AuxiliaryDataEndTimeUtc = entry.EndTimeUtc;
+                            entry.EndTimeUtc = request.EndTimeUtc;
+                        }
+                    }
+                    else
+                    {
+                        if (node != null)
+                        {
+                            Remove(node);
+                        }
+
+                        Interlocked.Increment(ref _misses);
+                        entry = new CacheEntry(key, request.StartTimeUtc, request.EndTimeUtc);
+                        _entries[key] = _leastRecentlyUsed.AddLast(entry);
+                        readRequests.Add(new KeyValuePair<HistoryRequest, CacheEntry>(request, entry));
+                    }
+
+                    var lookbackSpan = request.EndTimeUtc - request.StartTimeUtc;
+                    if (lookbackSpan > entry.LookbackSpan)
+                    {
+                        entry.LookbackSpan = lookbackSpan;
+                    }
+                    entries.Add(entry);
+                }
+
+                Read(readRequests, sliceTimeZone);
+
+                // the same auxiliary data can be cached by the trade and quote bar entries of a symbol
+                var auxiliaryData = new HashSet<Tuple<DateTime, Symbol, Type>>();
+                for (var i = 0; i < requests.Count; i++)
+                {
+                    var request = requests[i];
+                    var entry = entries[i];
+                    foreach (var data in entry.AuxiliaryData)
+                    {
+                        if (data.UtcTime <= request.StartTimeUtc || data.UtcTime > request.EndTimeUtc
+                            || !auxiliaryData.Add(Tuple.Create(data.UtcTime, data.Data.Symbol, data.Data.GetType())))
+                        {
+                            continue;
+                        }
+
+                        List<BaseData> sliceData;
+                        if (!dataByTime.TryGetValue(data.UtcTime, out sliceData))
+                        {
+                            dataByTime[data.UtcTime] = sliceData = new List<BaseData>();
+                        }
+                        sliceData.Add(data.Data.Clone());
+                    }
+
+                    for (var j = FindFirstAfter(entry.Data, request.StartTimeLocal); j < entry.Data.Count; j++)
+                    {
+                        var data = entry.Data[j];
+                        if (data.EndTime > request.EndTimeLocal)
+                        {
+                            break;
+                        }
+
+                        var utcTime = data.EndTime.ConvertToUtc(request.ExchangeHours.TimeZone);
+                        List<BaseData> sliceData;
+                        if (!dataByTime.TryGetValue(utcTime, out sliceData))
+                        {
+                            dataByTime[utcTime] = sliceData = new List<BaseData>();
+                        }
+                        // the cached instances are shared between requests, hand out copies
+                        sliceData.Add(data.Clone(data.IsFillForward));
+                    }
+
+                    Trim(entry, request);
+                }
+
+                Evict();
+            }
+
+            return dataByTime
+                .Select(kvp => new Slice(kvp.Key.ConvertFromUtc(sliceTimeZone), kvp.Value, kvp.Key))
+                .ToList();
+        }
+
+        private void Read(List<KeyValuePair<HistoryRequest, CacheEntry>> readRequests, DateTimeZone sliceTimeZone)
+        {
+            // data is matched to its cache entry by symbol and type, so the same pair can't be read twice in the same batch
+            var batches = new List<Dictionary<Tuple<Symbol, Type>, KeyValuePair<HistoryRequest, CacheEntry>>>();
+            foreach (var readRequest in readRequests)
+            {
+                var key = Tuple.Create(readRequest.Key.Symbol, readRequest.Key.DataType);
+                var batch = batches.FirstOrDefault(x => !x.ContainsKey(key));
+                if (batch == null)
+                {
+                    batches.Add(batch = new Dictionary<Tuple<Symbol, Type>, KeyValuePair<HistoryRequest, CacheEntry>>());
+                }
+                batch[key] = readRequest;
+            }
+
+            foreach (var batch in batches)
+            {
+                var tradeBarEntries = batch.Where(x => x.Key.Item2 == typeof(TradeBar)).ToDictionary(x => x.Key.Item1, x => x.Value.Value);
+                var quoteBarEntries = batch.Where(x => x.Key.Item2 == typeof(QuoteBar)).ToDictionary(x => x.Key.Item1, x => x.Value.Value);
+
+                foreach (var slice in _historyProvider.GetHistory(batch.Values.Select(x => x.Key).ToList(), sliceTimeZone))
+                {
+                    foreach (var kvp in slice.Bars)
+                    {
+                        Append(tradeBarEntries, kvp.Key, kvp.Value, TradeBarSize);
+                    }
+                    foreach (var kvp in slice.QuoteBars)
+                    {
+                        Append(quoteBarEntries, kvp.Key, kvp.Value, QuoteBarSize);
+                    }
+
+                    AppendAuxiliaryData(tradeBarEntries, quoteBarEntries, slice.UtcTime, slice.Splits.Values);
+                    AppendAuxiliaryData(tradeBarEntries, quoteBarEntries, slice.UtcTime, slice.Dividends.Values);
+                    AppendAuxiliaryData(tradeBarEntries, quoteBarEntries, slice.UtcTime, slice.Delistings.Values);
+                    AppendAuxiliaryData(tradeBarEntries, quoteBarEntries, slice.UtcTime, slice.SymbolChangedEvents.Values);
+                }
+            }
+        }
+
+        private void AppendAuxiliaryData<T>(Dictionary<Symbol, CacheEntry> tradeBarEntries, Dictionary<Symbol, CacheEntry> quoteBarEntries,
+            DateTime utcTime, IEnumerable<T> auxiliaryData)
+            where T : BaseData
+        {
+            foreach (var data in auxiliaryData)
+            {
+                CacheEntry entry;
+                if (tradeBarEntries.TryGetValue(data.Symbol, out entry))
+                {
+                    AppendAuxiliaryData(entry, utcTime, data);
+                }
+                if (quoteBarEntries.TryGetValue(data.Symbol, out entry))
+                {
+                    AppendAuxiliaryData(entry, utcTime, data);
+                }
+            }
+        }
+
+        private void AppendAuxiliaryData(CacheEntry entry, DateTime utcTime, BaseData data)
+        {
+            // skip the overlap with the data already cached
+            if (utcTime <= entry.AuxiliaryDataEndTimeUtc)
+            {
+                return;
+            }
+
+            entry.AuxiliaryData.Add(new AuxiliaryDataPoint(utcTime, data));
+            if (!entry.Removed)
+            {
+                Interlocked.Add(ref _sizeInBytes, AuxiliaryDataSize);
+            }
+        }
+
+        private void Append(Dictionary<Symbol, CacheEntry> entries, Symbol symbol, BaseData data, int size)
+        {
+            CacheEntry entry;
+            if (!entries.TryGetValue(symbol, out entry))
+            {
+                return;
+            }
+
+            // skip the overlap with the data already cached
+            if (entry.Data.Count == 0 || entry.Data[entry.Data.Count - 1].EndTime < data.EndTime)
+            {
+                entry.Data.Add(data);
+                entry.BarSize = size;
+                if (!entry.Removed)
+                {
+                    Interlocked.Add(ref _sizeInBytes, size);
+                }
+            }
+        }
+
+        private void Trim(CacheEntry entry, HistoryRequest request)
+        {
+            // drop the data no longer covered by the longest look back requested
+            var startTimeUtc = request.EndTimeUtc - entry.LookbackSpan;
+            if (startTimeUtc <= entry.StartTimeUtc)
+            {
+                return;
+            }
+
+            var count = FindFirstAfter(entry.Data, startTimeUtc.ConvertFromUtc(request.ExchangeHours.TimeZone));
+            if (count > 0)
+            {
+                entry.Data.RemoveRange(0, count);
+                if (!entry.Removed)
+                {
+                    Interlocked.Add(ref _sizeInBytes, -(long)count * entry.BarSize);
+                }
+            }
+
+            var auxiliaryCount = entry.AuxiliaryData.FindIndex(x => x.UtcTime > startTimeUtc);
+            if (auxiliaryCount < 0)
+            {
+                auxiliaryCount = entry.AuxiliaryData.Count;
+            }
+            if (auxiliaryCount > 0)
+            {
+                entry.AuxiliaryData.RemoveRange(0, auxiliaryCount);
+                if (!entry.Removed)
+                {
+                    Interlocked.Add(ref _sizeInBytes, -(long)auxiliaryCount * AuxiliaryDataSize);
+                }
+            }
+            entry.StartTimeUtc = startTimeUtc;
+        }
+
+        private void Evict()
+        {
+            while (_leastRecentlyUsed.Count > 0 && _sizeInBytes > _maximumSizeInBytes)
+            {
+                Remove(_leastRecentlyUsed.First);
+            }
+        }
+
+        private void Remove(LinkedListNode<CacheEntry> node)
+        {
+            _leastRecentlyUsed.Remove(node);
+            _entries.Remove(node.Value.Key);
+            node.Value.Removed = true;
+            Interlocked.Add(ref _sizeInBytes, -(long)node.Value.Data.Count * node.Value.BarSize - (long)node.Value.AuxiliaryData.Count * AuxiliaryDataSize);
+        }
+
+        /// <summary>
+        /// Returns the index of the first data point ending after the given time
+        /// </summary>
+        private static int FindFirstAfter(List<BaseData> data, DateTime time)
+        {
+            int low = 0, high = data.Count;
+            while (low < high)
+            {
+                var middle = low + (high - low) / 2;
+                if (data[middle].EndTime <= time)
+                {
+                    low = middle + 1;
+                }
+                else
+                {
+                    high = middle;
+                }
+            }
+            return low;
+        }
+
+        private static bool IsCacheable(HistoryRequest request)
+        {
+            return !request.IsCustomData
+                && request.Resolution != Resolution.Tick
+                && (request.DataType == typeof(TradeBar) || request.DataType == typeof(QuoteBar))
+                // scaled raw prices depend on the end of the request
+                && request.DataNormalizationMode != DataNormalizationMode.ScaledRaw
+                && request.StartTimeUtc < request.EndTimeUtc;
+        }
+
+        private static HistoryRequest CreateRequest(HistoryRequest request, DateTime startTimeUtc)
+        {
+            return new HistoryRequest(startTimeUtc, request.EndTimeUtc, request.DataType, request.Symbol, request.Resolution,
+                request.ExchangeHours, request.DataTimeZone, request.FillForwardResolution, request.IncludeExtendedMarketHours,
+                request.IsCustomData, request.DataNormalizationMode, request.TickType, request.DataMappingMode, request.ContractDepthOffset);
+        }
+
+        /// <summary>
+        /// Merges two enumerables of slices ordered by time, slices with the same time are merged into one
+        /// </summary>
+        private static IEnumerable<Slice> Merge(IEnumerable<Slice> first, IEnumerable<Slice> second)
+        {
+            using var firstEnumerator = first.GetEnumerator();
+            using var secondEnumerator = second.GetEnumerator();
+            var firstHasValue = firstEnumerator.MoveNext();
+            var secondHasValue = secondEnumerator.MoveNext();
+
+            while (firstHasValue || secondHasValue)
+            {
+                if (!secondHasValue || firstHasValue && firstEnumerator.Current.UtcTime < secondEnumerator.Current.UtcTime)
+                {
+                    yield return firstEnumerator.Current;
+                    firstHasValue = firstEnumerator.MoveNext();
+                }
+                else if (!firstHasValue || secondEnumerator.Current.UtcTime < firstEnumerator.Current.UtcTime)
+                {
+                    yield return secondEnumerator.Current;
+                    secondHasValue = secondEnumerator.MoveNext();
+                }
+                else
+                {
+                    var slice = firstEnumerator.Current;
+                    slice.MergeSlice(secondEnumerator.Current);
+                    yield return slice;
+                    firstHasValue = firstEnumerator.MoveNext();
+                    secondHasValue = secondEnumerator.MoveNext();
+                }
+            }
+        }
+
+        private class CacheKey : IEquatable<CacheKey>
+        {
+            private readonly Symbol _symbol;
+            private readonly Type _dataType;
+            private readonly Resolution _resolution;
+            private readonly Resolution? _fillForwardResolution;
+            private readonly bool _includeExtendedMarketHours;
+            private readonly DataNormalizationMode _dataNormalizationMode;
+            private readonly DataMappingMode _dataMappingMode;
+            private readonly uint _contractDepthOffset;
+
+            public CacheKey(HistoryRequest request)
+            {
+                _symbol = request.Symbol;
+                _dataType = request.DataType;
+                _resolution = request.Resolution;
+                _fillForwardResolution = request.FillForwardResolution;
+                _includeExtendedMarketHours = request.IncludeExtendedMarketHours;
+                _dataNormalizationMode = request.DataNormalizationMode;
+                _dataMappingMode = request.DataMappingMode;
+                _contractDepthOffset = request.ContractDepthOffset;
+            }
+
+            public bool Equals(CacheKey other)
+            {
+                return other != null
+                    && _symbol == other._symbol
+                    && _dataType == other._dataType
+                    && _resolution == other._resolution
+                    && _fillForwardResolution == other._fillForwardResolution
+                    && _includeExtendedMarketHours == other._includeExtendedMarketHours
+                    && _dataNormalizationMode == other._dataNormalizationMode
+                    && _dataMappingMode == other._dataMappingMode
+                    && _contractDepthOffset == other._contractDepthOffset;
+            }
+
+            public override bool Equals(object obj)
+            {
+                return Equals(obj as CacheKey);
+            }
+
+            public override int GetHashCode()
+            {
+                return HashCode.Combine(_symbol, _dataType, _resolution, _fillForwardResolution, _includeExtendedMarketHours,
+                    _dataNormalizationMode, _dataMappingMode, _contractDepthOffset);
+            }
+        }
+
+        private class CacheEntry
+        {
+            public CacheKey Key { get; }
+            public List<BaseData> Data { get; } = new();
+            public List<AuxiliaryDataPoint> AuxiliaryData { get; } = new();
+            public DateTime AuxiliaryDataEndTimeUtc { get; set; }
+            public DateTime StartTimeUtc { get; set; }
+            public DateTime EndTimeUtc { get; set; }
+            public TimeSpan LookbackSpan { get; set; }
+            public int BarSize { get; set; }
+            public bool Removed { get; set; }
+
+            public CacheEntry(CacheKey key, DateTime startTimeUtc, DateTime endTimeUtc)
+            {
+                Key = key;
+                StartTimeUtc = startTimeUtc;
+                EndTimeUtc = endTimeUtc;
+            }
+        }
+
+        /// <summary>
+        /// Splits, dividends, delistings and symbol changed events with the time of the slice they were read in
+        /// </summary>
+        private class AuxiliaryDataPoint
+        {
+            public DateTime UtcTime { get; }
+            public BaseData Data { get; }
+
+            public AuxiliaryDataPoint(DateTime utcTime, BaseData data)
+            {
+                UtcTime = utcTime;
+                Data = data;
+            }
+        }
+    }
+}
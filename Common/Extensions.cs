@@ -2811,6 +2811,36 @@ namespace QuantConnect
             }
         }
 
+        /// <summary>
+        /// Gets Enumerable of <see cref="string"/> from a PyObject
+        /// </summary>
+        /// <param name="pyObject">PyObject containing a string or an iterable of strings</param>
+        /// <returns>Enumerable of string</returns>
+        public static IEnumerable<string> ConvertToStringEnumerable(this PyObject pyObject)
+        {
+            using (Py.GIL())
+            {
+                if (PyString.IsStringType(pyObject))
+                {
+                    yield return pyObject.As<string>();
+                    yield break;
+                }
+
+                using var iterator = pyObject.GetIterator();
+                foreach (PyObject item in iterator)
+                {
+                    if (!PyString.IsStringType(item))
+                    {
+                        throw new ArgumentException(
+                            "Argument type should be a string or a list of strings. " +
+                            $"Object: {item}. Type: {item.GetPythonType()}"
+                        );
+                    }
+                    yield return item.GetAndDispose<string>();
+                }
+            }
+        }
+
         /// <summary>
         /// Converts an IEnumerable to a PyList
         /// </summary>
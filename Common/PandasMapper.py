@@ -19,32 +19,134 @@ Allowing support for indexing of Lean created Indexes with tickers like "SPY", S
 '''
 
 import pandas as pd
+from collections import OrderedDict
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
 AddReference("QuantConnect.Common")
 from QuantConnect import *
 
+# Column names created by PandasData, these are never tickers so we skip the symbol lookup
+reserved = frozenset([
+    'open', 'high', 'low', 'close', 'lastprice', 'volume', 'value',
+    'askopen', 'askhigh', 'asklow', 'askclose', 'askprice', 'asksize', 'quantity', 'suspicious',
+    'bidopen', 'bidhigh', 'bidlow', 'bidclose', 'bidprice', 'bidsize', 'exchange', 'openinterest'])
+
+# Attribute set on DataFrames, Series and Indexes that should not have their keys remapped
+mappingDisabledAttribute = '_lean_mapping_disabled'
+
+class SymbolKeyCache:
+    '''Bounded LRU cache of ticker and Symbol keys to their SecurityIdentifier string.
+    Ticker entries, including failed lookups, are dropped when Lean refreshes the cache with a new SymbolCache version,
+    which it does once per time step and when it creates pandas data, so indexing never reads the SymbolCache version
+    '''
+    def __init__(self, maxSize = 10000):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.tickers = OrderedDict()
+        self.symbols = OrderedDict()
+        self.version = None
+
+    def refresh(self, version):
+        '''Drops the ticker entries if the SymbolCache version changed since the last refresh'''
+        if version != self.version:
+            self.tickers.clear()
+            self.version = version
+
+    def clear(self):
+        self.tickers.clear()
+        self.symbols.clear()
+        self.version = None
+
+    def get_ticker_sid(self, ticker):
+        '''Gets the SecurityIdentifier string of the ticker or None if the ticker is not in the SymbolCache.
+        SID strings are not tickers so they resolve to None once and are then served from the cache'''
+        if ticker in self.tickers:
+            self.hits += 1
+            self.tickers.move_to_end(ticker)
+            return self.tickers[ticker]
+
+        self.misses += 1
+        kvp = SymbolCache.TryGetSymbol(ticker, None)
+        sid = str(kvp[1].ID) if kvp[0] else None
+        self._add(self.tickers, ticker, sid)
+        return sid
+
+    def get_symbol_sid(self, symbol):
+        '''Gets the SecurityIdentifier string of the Symbol, which never changes for a given Symbol'''
+        sid = self.symbols.get(symbol)
+        if sid is not None:
+            self.hits += 1
+            self.symbols.move_to_end(symbol)
+            return sid
+
+        self.misses += 1
+        sid = str(symbol.ID)
+        self._add(self.symbols, symbol, sid)
+        return sid
+
+    def _add(self, cache, key, sid):
+        cache[key] = sid
+        if len(cache) > self.maxSize:
+            cache.popitem(last = False)
+
+keyCache = SymbolKeyCache()
+
+def disable_mapping(obj):
+    '''Disables the remapping of tickers and Symbols to SIDs when indexing the given DataFrame or Series.
+    Useful for frames that are not indexed by Lean symbols and are accessed in tight loops
+    '''
+    set_mapping(obj, False)
+    return obj
+
+def enable_mapping(obj):
+    '''Enables the remapping of tickers and Symbols to SIDs again for the given DataFrame or Series'''
+    set_mapping(obj, True)
+    return obj
+
+def set_mapping(obj, enabled):
+    targets = [obj]
+    if isinstance(obj, pd.DataFrame):
+        targets += [obj.index, obj.columns]
+    elif isinstance(obj, pd.Series):
+        targets.append(obj.index)
+    for target in targets:
+        # bypass pandas __setattr__ so DataFrames never mistake the flag for a column
+        object.__setattr__(target, mappingDisabledAttribute, not enabled)
+
+def is_mapping_disabled(obj):
+    # indexers (loc, iloc, at...) keep a reference to the object they index
+    if isinstance(obj, (pd.core.indexing._LocationIndexer, pd.core.indexing._ScalarAccessIndexer)):
+        obj = obj.obj
+    return getattr(obj, '__dict__', {}).get(mappingDisabledAttribute, False)
+
 def mapper(key):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
-    Symbol SecurityIdentifier.If cannot map, returns the object
+    Symbol SecurityIdentifier.If cannot map, returns the object.
+    Containers are returned as is when none of their items were mapped
     '''
+    return map_key(key)
+
+def map_key(key):
     keyType = type(key)
     if keyType is Symbol:
-        return str(key.ID)
+        return keyCache.get_symbol_sid(key)
     if keyType is str:
-        reserved = ['high', 'low', 'open', 'close']
         if key in reserved:
             return key
-        kvp = SymbolCache.TryGetSymbol(key, None)
-        if kvp[0]:
-            return str(kvp[1].ID)
-    if keyType is list:
-        return [mapper(x) for x in key]
-    if keyType is tuple:
-        return tuple([mapper(x) for x in key])
+        sid = keyCache.get_ticker_sid(key)
+        return key if sid is None else sid
+    if keyType is list or keyType is tuple:
+        mapped = [map_key(x) for x in key]
+        if all(x is y for x, y in zip(mapped, key)):
+            return key
+        return mapped if keyType is list else tuple(mapped)
     if keyType is dict:
-        return { k: mapper(v) for k, v in key.items()}
+        mapped = { k: map_key(v) for k, v in key.items()}
+        if all(mapped[k] is v for k, v in key.items()):
+            return key
+        return mapped
     return key
 
 def wrap_keyerror_function(f):
@@ -53,6 +155,9 @@ def wrap_keyerror_function(f):
     If this fails we fall back to the original key and try it as well, if they both fail we throw our error.
     '''
     def wrapped_function(*args, **kwargs):
+        if is_mapping_disabled(args[0]):
+            return f(*args, **kwargs)
+
         # Map args & kwargs and execute function
         try:
             newargs = args
@@ -66,6 +171,9 @@ def wrap_keyerror_function(f):
             return f(*newargs, **newkwargs)
         except KeyError as e:
             mKey = [arg for arg in newargs if isinstance(arg, str)]
+            # Nothing was mapped, the original call would fail the same way
+            if newargs is args and newkwargs is kwargs:
+                raise KeyError(f"No key found for either mapped or original key. Mapped Key: {mKey}; Original Key: {mKey}")
 
         # Execute original
         # Allows for df, Series, etc indexing for keys like 'SPY' if they exist
@@ -87,7 +195,7 @@ def wrap_bool_function(f):
 
         # Try the original args; if true just return true
         originalResult = f(*args, **kwargs)
-        if originalResult:
+        if originalResult or is_mapping_disabled(args[0]):
             return originalResult
 
         # Try our mapped args; return this result regardless
@@ -99,6 +207,8 @@ def wrap_bool_function(f):
         if len(kwargs) > 0:
             newkwargs = mapper(kwargs)
 
+        if newargs is args and newkwargs is kwargs:
+            return originalResult
         return f(*newargs, **newkwargs)
 
     wrapped_function.__name__ = f.__name__
@@ -122,6 +232,71 @@ if (int(pd.__version__.split('.')[0]) < 1):
 # Wrap __contains__ to support Python syntax like 'SPY' in DataFrame 
 pd.core.indexes.base.Index.__contains__ = wrap_bool_function(pd.core.indexes.base.Index.__contains__)
 
+class LazyDataFrame:
+    '''History result that keeps the data in Lean and converts a column into a pandas.Series only when it is accessed,
+    e.g. history.close or history['close']. A column only holds the rows where it has data.
+    Any other usage converts the full pandas.DataFrame once and delegates to it
+    '''
+    def __init__(self, data):
+        self._data = data
+        self._columns = set(str(column) for column in data.Columns)
+        self._series = {}
+        self._frame = None
+
+    @property
+    def empty(self):
+        if self._frame is not None:
+            return self._frame.empty
+        return self._data.IsEmpty
+
+    def to_frame(self):
+        '''Converts all the data into a pandas.DataFrame'''
+        if self._frame is None:
+            self._frame = self._data.GetDataFrame()
+            self._series.clear()
+        return self._frame
+
+    def _get_column(self, column):
+        if self._frame is not None:
+            return self._frame[column]
+        series = self._series.get(column)
+        if series is None:
+            series = self._data.GetColumn(column)
+            self._series[column] = series
+        return series
+
+    def _is_column(self, key):
+        return type(key) is str and key in self._columns
+
+    def __getitem__(self, key):
+        if self._is_column(key):
+            return self._get_column(key)
+        if type(key) is list and len(key) > 0 and all(self._is_column(x) for x in key):
+            return pd.DataFrame({ column: self._get_column(column) for column in key }, columns = key)
+        return self.to_frame()[key]
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not defined by this class
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self._columns:
+            return self._get_column(name)
+        return getattr(self.to_frame(), name)
+
+    def __contains__(self, key):
+        if self._is_column(key):
+            return not self._get_column(key).empty
+        return key in self.to_frame()
+
+    def __len__(self):
+        return len(self.to_frame())
+
+    def __iter__(self):
+        return iter(self.to_frame())
+
+    def __repr__(self):
+        return repr(self.to_frame())
+
 # For compatibility with PandasData.cs usage of this module (Previously wrapped classes)
 FrozenList = pdFrozenList
 Index = pd.Index
@@ -0,0 +1,248 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using QuantConnect.Data.Fundamental;
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Reflection;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Typed columns of fundamental data, one per field, filled in C# and handed to numpy in a single copy per column.
+    /// A field is the name of a property or a path of nested properties, e.g. 'ValuationRatios.PERatio'
+    /// </summary>
+    internal class FundamentalColumns
+    {
+        private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+        // bounds of the datetime64[ns] range, the minimum int64 is NaT
+        private static readonly long MinTicks = (long.MinValue + 1) / 100;
+        private static readonly long MaxTicks = long.MaxValue / 100;
+        private static readonly ConcurrentDictionary<PropertyInfo, Func<object, object>> Getters = new ConcurrentDictionary<PropertyInfo, Func<object, object>>();
+
+        private readonly Column[] _columns;
+
+        /// <summary>
+        /// The default fields of the coarse fundamental data frames
+        /// </summary>
+        public static readonly string[] DefaultCoarseFields = { "Price", "AdjustedPrice", "Volume", "DollarVolume", "HasFundamentalData" };
+
+        /// <summary>
+        /// The default fields of the fine fundamental data frames
+        /// </summary>
+        public static readonly string[] DefaultFineFields =
+        {
+            "MarketCap",
+            "CompanyReference.CountryId",
+            "CompanyReference.PrimaryExchangeID",
+            "CompanyReference.IndustryTemplateCode",
+            "AssetClassification.MorningstarSectorCode",
+            "SecurityReference.IPODate"
+        };
+
+        /// <summary>
+        /// Creates the columns of the fields of a type
+        /// </summary>
+        /// <param name="type">The type of the rows, e.g. <see cref="FineFundamental"/></param>
+        /// <param name="fields">The fields of the columns</param>
+        /// <param name="count">The number of rows</param>
+        public FundamentalColumns(Type type, IEnumerable<string> fields, int count)
+        {
+            _columns = fields.Select(field => new Column(type, field, count)).ToArray();
+        }
+
+        /// <summary>
+        /// Reads the fields of a row. Fields with a null parent property are NaN, NaT, False or None depending on their type
+        /// </summary>
+        /// <param name="row">The index of the row</param>
+        /// <param name="data">The data of the row</param>
+        public void Set(int row, object data)
+        {
+            foreach (var column in _columns)
+            {
+                column.Set(row, data);
+            }
+        }
+
+        /// <summary>
+        /// Converts the columns to a dictionary of numpy arrays keyed by field, text columns are python lists
+        /// </summary>
+        /// <returns>A <see cref="PyDict"/> with a value per column</returns>
+        public PyDict ToPyDict()
+        {
+            using (Py.GIL())
+            {
+                var dictionary = new PyDict();
+                foreach (var column in _columns)
+                {
+                    using var values = column.ToPython();
+                    dictionary.SetItem(column.Name, values);
+                }
+                return dictionary;
+            }
+        }
+
+        /// <summary>
+        /// Gets a compiled getter of the property, cached for all the columns
+        /// </summary>
+        private static Func<object, object> GetGetter(PropertyInfo property)
+        {
+            return Getters.GetOrAdd(property, x =>
+            {
+                var instance = Expression.Parameter(typeof(object), "instance");
+                var value = Expression.Property(Expression.Convert(instance, x.DeclaringType), x);
+                return Expression.Lambda<Func<object, object>>(Expression.Convert(value, typeof(object)), instance).Compile();
+            });
+        }
+
+        private enum ColumnType
+        {
+            Number,
+            Boolean,
+            Time,
+            Text
+        }
+
+        private class Column
+        {
+            private readonly Func<object, object>[] _getters;
+            private readonly ColumnType _type;
+            private readonly double[] _numbers;
+            private readonly byte[] _booleans;
+            private readonly long[] _times;
+            private readonly string[] _texts;
+
+            public string Name { get; }
+
+            public Column(Type type, string field, int count)
+            {
+                Name = field;
+                var getters = new List<Func<object, object>>();
+                foreach (var name in field.Split('.'))
+                {
+                    var property = type.GetProperty(name, BindingFlags.Public | BindingFlags.Instance);
+                    if (property == null)
+                    {
+                        throw new ArgumentException($"FundamentalColumns: {type.Name} does not have a public {name} property, in field '{field}'");
+                    }
+                    getters.Add(GetGetter(property));
+                    type = property.PropertyType;
+                }
+                _getters = getters.ToArray();
+
+                type = Nullable.GetUnderlyingType(type) ?? type;
+                if (type == typeof(bool))
+                {
+                    _type = ColumnType.Boolean;
+                    _booleans = new byte[count];
+                }
+                else if (type == typeof(DateTime))
+                {
+                    _type = ColumnType.Time;
+                    _times = new long[count];
+                }
+                else if (type == typeof(decimal) || type.IsPrimitive && type != typeof(char) || typeof(MultiPeriodField).IsAssignableFrom(type))
+                {
+                    _type = ColumnType.Number;
+                    _numbers = new double[count];
+                }
+                else
+                {
+                    _type = ColumnType.Text;
+                    _texts = new string[count];
+                }
+            }
+
+            public void Set(int row, object data)
+            {
+                var value = data;
+                for (var i = 0; i < _getters.Length && value != null; i++)
+                {
+                    value = _getters[i](value);
+                }
+
+                switch (_type)
+                {
+                    case ColumnType.Number:
+                        _numbers[row] = value switch
+                        {
+                            null => double.NaN,
+                            // the value of the default period
+                            MultiPeriodField field => (double)field.Value,
+                            _ => Convert.ToDouble(value, CultureInfo.InvariantCulture)
+                        };
+                        break;
+
+                    case ColumnType.Boolean:
+                        _booleans[row] = value is true ? (byte)1 : (byte)0;
+                        break;
+
+                    case ColumnType.Time:
+                        _times[row] = ToNanoseconds(value);
+                        break;
+
+                    default:
+                        _texts[row] = value?.ToString();
+                        break;
+                }
+            }
+
+            public PyObject ToPython()
+            {
+                switch (_type)
+                {
+                    case ColumnType.Number:
+                        return PandasData.ToNumpyArray(_numbers, "float64");
+
+                    case ColumnType.Boolean:
+                        return PandasData.ToNumpyArray(_booleans, "bool");
+
+                    case ColumnType.Time:
+                        using (var nanoseconds = PandasData.ToNumpyArray(_times, "int64"))
+                        {
+                            return nanoseconds.InvokeMethod("view", new PyString("datetime64[ns]"));
+                        }
+
+                    default:
+                        return new PyList(_texts.Select(x => x == null ? PyObject.None : (PyObject)new PyString(x)).ToArray());
+                }
+            }
+
+            /// <summary>
+            /// Converts a time to nanoseconds since the epoch, dates out of the datetime64[ns] range are clamped
+            /// so a missing date, e.g. <see cref="DateTime.MinValue"/>, still compares as a date far in the past
+            /// </summary>
+            private static long ToNanoseconds(object value)
+            {
+                if (value == null)
+                {
+                    return long.MinValue;
+                }
+
+                var ticks = ((DateTime)value).Ticks - EpochTicks;
+                if (ticks < MinTicks)
+                {
+                    return long.MinValue + 1;
+                }
+                return ticks > MaxTicks ? long.MaxValue : ticks * 100;
+            }
+        }
+    }
+}
@@ -0,0 +1,111 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using QuantConnect.Data;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Keeps history data on the C# side so it can be converted into pandas objects one column at a time.
+    /// Used by the python PandasMapper.LazyDataFrame
+    /// </summary>
+    public class LazyPandasData
+    {
+        private readonly PandasConverter _converter;
+        private readonly List<Slice> _slices;
+        private List<string> _columns;
+
+        /// <summary>
+        /// True if there is no data to convert
+        /// </summary>
+        public bool IsEmpty { get; }
+
+        /// <summary>
+        /// Gets the names of the columns the data can be converted into
+        /// </summary>
+        public List<string> Columns
+        {
+            get
+            {
+                if (_columns == null)
+                {
+                    var columns = new HashSet<string>();
+                    var seen = new HashSet<Symbol>();
+                    foreach (var slice in _slices)
+                    {
+                        foreach (var key in slice.Keys)
+                        {
+                            if (seen.Add(key))
+                            {
+                                columns.UnionWith(new PandasData(slice[key]).Columns);
+                            }
+                        }
+                    }
+                    _columns = columns.OrderBy(x => x).ToList();
+                }
+                return _columns;
+            }
+        }
+
+        /// <summary>
+        /// Creates a new instance of <see cref="LazyPandasData"/>
+        /// </summary>
+        /// <param name="converter">The converter used to create the pandas objects</param>
+        /// <param name="data">The history data, it's enumerated once</param>
+        public LazyPandasData(PandasConverter converter, IEnumerable<Slice> data)
+        {
+            _converter = converter;
+            _slices = data.Where(x => x.Keys.Count > 0).ToList();
+            IsEmpty = _slices.Count == 0;
+        }
+
+        /// <summary>
+        /// Converts a single column of the data into a pandas.Series indexed like the full data frame.
+        /// Only the rows where the column has data are included
+        /// </summary>
+        /// <param name="column">The column name</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.Series</returns>
+        public PyObject GetColumn(string column)
+        {
+            column = column.ToLowerInvariant();
+            using (Py.GIL())
+            {
+                using var dataFrame = _converter.GetDataFrame(_slices, new[] { column });
+                using var columns = dataFrame.GetAttr("columns");
+                using var pyColumn = column.ToPython();
+                if (columns.InvokeMethod("__contains__", pyColumn).As<bool>())
+                {
+                    return dataFrame.GetItem(pyColumn);
+                }
+
+                // none of the symbols have data for this column
+                dynamic pandas = Py.Import("pandas");
+                return pandas.Series(dtype: "float64", name: column);
+            }
+        }
+
+        /// <summary>
+        /// Converts all the data into a pandas.DataFrame
+        /// </summary>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetDataFrame()
+        {
+            return _converter.GetDataFrame(_slices);
+        }
+    }
+}
@@ -15,6 +15,8 @@
 
 using Python.Runtime;
 using QuantConnect.Data;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.UniverseSelection;
 using QuantConnect.Indicators;
 using System;
 using System.Collections.Generic;
@@ -28,6 +30,8 @@ namespace QuantConnect.Python
     public class PandasConverter
     {
         private static dynamic _pandas;
+        private static PyObject _lazyDataFrame;
+        private static dynamic _arrowConverter;
 
         /// <summary>
         /// Creates an instance of <see cref="PandasConverter"/>.
@@ -50,35 +54,39 @@ namespace QuantConnect.Python
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
         public PyObject GetDataFrame(IEnumerable<Slice> data)
         {
-            var maxLevels = 0;
-            var sliceDataDict = new Dictionary<Symbol, PandasData>();
+            return GetDataFrame(data, null);
+        }
 
-            foreach (var slice in data)
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a lazy data frame that keeps the data on the C# side
+        /// and only converts a column into a pandas.Series when it is accessed
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <returns><see cref="PyObject"/> containing a PandasMapper.LazyDataFrame</returns>
+        public PyObject GetLazyDataFrame(IEnumerable<Slice> data)
+        {
+            var lazyData = new LazyPandasData(this, data);
+            using (Py.GIL())
             {
-                foreach (var key in slice.Keys)
+                if (_lazyDataFrame == null)
                 {
-                    var baseData = slice[key];
-
-                    PandasData value;
-                    if (!sliceDataDict.TryGetValue(key, out value))
-                    {
-                        sliceDataDict.Add(key, value = new PandasData(baseData));
-                        maxLevels = Math.Max(maxLevels, value.Levels);
-                    }
-
-                    if (value.IsCustomData)
-                    {
-                        value.Add(baseData);
-                    }
-                    else
-                    {
-                        var ticks = slice.Ticks.ContainsKey(key) ? slice.Ticks[key] : null;
-                        var tradeBars = slice.Bars.ContainsKey(key) ? slice.Bars[key] : null;
-                        var quoteBars = slice.QuoteBars.ContainsKey(key) ? slice.QuoteBars[key] : null;
-                        value.Add(ticks, tradeBars, quoteBars);
-                    }
+                    _lazyDataFrame = Py.Import("PandasMapper").GetAttr("LazyDataFrame");
                 }
+                return _lazyDataFrame.Invoke(lazyData.ToPython());
             }
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a pandas.DataFrame holding only the requested columns.
+        /// The values of any other column are never read nor converted
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="columns">The names of the columns to convert, e.g. 'close', null for all of them</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetDataFrame(IEnumerable<Slice> data, IEnumerable<string> columns)
+        {
+            int maxLevels;
+            var sliceDataDict = GetPandasDataBySymbol(data, columns, out maxLevels);
 
             using (Py.GIL())
             {
@@ -91,6 +99,68 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a wide pandas.DataFrame of a single field, indexed by time with one column per symbol.
+        /// Equivalent to history.close.unstack(level=0) but built without the multi index: timestamps are aligned in C#
+        /// and the values are handed to numpy as a single 2-D array. Missing values are NaN and, if a symbol has
+        /// more than one value for the same time (e.g. ticks), the last one is kept
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="field">The numeric field to use as values, e.g. 'close' or 'volume'</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetWideDataFrame(IEnumerable<Slice> data, string field = "close")
+        {
+            field = field.ToLowerInvariant();
+
+            int maxLevels;
+            var sliceDataDict = GetPandasDataBySymbol(data, new[] { field }, out maxLevels);
+
+            var columns = new List<KeyValuePair<string, Tuple<long[], double[]>>>();
+            foreach (var kvp in sliceDataDict)
+            {
+                long[] symbolTimes;
+                double[] symbolValues;
+                if (kvp.Value.TryGetNumericColumn(field, out symbolTimes, out symbolValues))
+                {
+                    columns.Add(new KeyValuePair<string, Tuple<long[], double[]>>(kvp.Key.ID.ToString(), Tuple.Create(symbolTimes, symbolValues)));
+                }
+            }
+            // same order as the symbol level of the unstacked multi index
+            columns.Sort((x, y) => string.CompareOrdinal(x.Key, y.Key));
+
+            var times = columns.SelectMany(x => x.Value.Item1).Distinct().ToArray();
+            Array.Sort(times);
+
+            var matrix = new double[times.Length * columns.Count];
+            Array.Fill(matrix, double.NaN);
+            for (var j = 0; j < columns.Count; j++)
+            {
+                var symbolTimes = columns[j].Value.Item1;
+                var symbolValues = columns[j].Value.Item2;
+                for (var i = 0; i < symbolTimes.Length; i++)
+                {
+                    var row = Array.BinarySearch(times, symbolTimes[i]);
+                    matrix[row * columns.Count + j] = symbolValues[i];
+                }
+            }
+
+            using (Py.GIL())
+            {
+                if (columns.Count == 0)
+                {
+                    return _pandas.DataFrame();
+                }
+
+                dynamic pyTimes = PandasData.ToNumpyArray(times, "int64");
+                dynamic pyValues = PandasData.ToNumpyArray(matrix, "float64");
+                using var symbols = new PyList(columns.Select(x => (PyObject)new PyString(x.Key)).ToArray());
+
+                var index = _pandas.DatetimeIndex(pyTimes.view("datetime64[ns]"), name: "time");
+                var pyColumns = _pandas.Index(symbols, name: "symbol");
+                return _pandas.DataFrame(pyValues.reshape(times.Length, columns.Count), index: index, columns: pyColumns);
+            }
+        }
+
         /// <summary>
         /// Converts an enumerable of <see cref="IBaseData"/> in a pandas.DataFrame
         /// </summary>
@@ -186,6 +256,218 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a pyarrow.Table instead of a pandas.DataFrame.
+        /// The table has the same columns as the history data frame plus a column per index level, with one record batch per symbol.
+        /// Requires the pyarrow package
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="columns">The names of the columns to hold, null for all of them</param>
+        /// <returns><see cref="PyObject"/> containing a pyarrow.Table</returns>
+        public PyObject GetArrowTable(IEnumerable<Slice> data, IEnumerable<string> columns = null)
+        {
+            int maxLevels;
+            var sliceDataDict = GetPandasDataBySymbol(data, columns, out maxLevels);
+
+            using (Py.GIL())
+            {
+                using var batches = new PyList(sliceDataDict.Values.Select(x => x.ToArrowRecordBatch(maxLevels)).ToArray());
+                return GetArrowConverter().to_table(batches);
+            }
+        }
+
+        /// <summary>
+        /// Writes a pyarrow.Table or a pandas.DataFrame into a parquet file, so it can be reloaded with <see cref="ReadParquet"/>
+        /// without requesting and converting the history again. Requires the pyarrow package
+        /// </summary>
+        /// <param name="data">The pyarrow.Table or pandas.DataFrame</param>
+        /// <param name="path">The path of the parquet file</param>
+        public void ToParquet(PyObject data, string path)
+        {
+            using (Py.GIL())
+            {
+                GetArrowConverter().to_parquet(data, path);
+            }
+        }
+
+        /// <summary>
+        /// Reads a parquet file written by <see cref="ToParquet"/>. Requires the pyarrow package
+        /// </summary>
+        /// <param name="path">The path of the parquet file</param>
+        /// <param name="format">'pandas' to get a pandas.DataFrame indexed like the history data frames, 'arrow' to get a pyarrow.Table</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame or a pyarrow.Table</returns>
+        public PyObject ReadParquet(string path, string format = "pandas")
+        {
+            using (Py.GIL())
+            {
+                return GetArrowConverter().read_parquet(path, format);
+            }
+        }
+
+        /// <summary>
+        /// Gets the times of the index of a pandas.DataFrame or pandas.Series, e.g. a history data frame, in a single copy.
+        /// For a multi index the 'time' level is used
+        /// </summary>
+        /// <param name="data">The pandas.DataFrame or pandas.Series</param>
+        /// <returns>The times of the index</returns>
+        public DateTime[] GetTimes(PyObject data)
+        {
+            return PandasData.GetIndexTimes(data);
+        }
+
+        /// <summary>
+        /// Gets the values of a column of a pandas.DataFrame, or the values of a pandas.Series, as doubles in a single copy
+        /// </summary>
+        /// <param name="data">The pandas.DataFrame or pandas.Series</param>
+        /// <param name="column">The name of the column, ignored for a pandas.Series</param>
+        /// <param name="optional">True to get zeros if the pandas.DataFrame does not have the column, otherwise a KeyError is raised</param>
+        /// <returns>The values of the column</returns>
+        public double[] GetValues(PyObject data, string column = null, bool optional = false)
+        {
+            return PandasData.GetColumnValues(data, column, optional);
+        }
+
+        /// <summary>
+        /// Gets the values of a 2-D numpy.ndarray or pandas.DataFrame as doubles in a single copy.
+        /// A 1-D numpy.ndarray or pandas.Series is read as a single column
+        /// </summary>
+        /// <param name="data">The numpy.ndarray, pandas.DataFrame or pandas.Series</param>
+        /// <returns>The values indexed by row and column</returns>
+        public double[,] GetMatrix(PyObject data)
+        {
+            return PandasData.GetMatrixValues(data);
+        }
+
+        /// <summary>
+        /// Converts a 2-D array of doubles into a 2-D numpy.ndarray in a single copy
+        /// </summary>
+        /// <param name="values">The values indexed by row and column</param>
+        /// <returns><see cref="PyObject"/> containing a numpy.ndarray</returns>
+        public PyObject GetNumpyArray(double[,] values)
+        {
+            return PandasData.ToNumpyMatrix(values);
+        }
+
+        /// <summary>
+        /// Converts coarse fundamental data in a pandas.DataFrame indexed by symbol, with a column per field.
+        /// The columns are read in C# and handed to numpy in a single copy each, so universe selections can filter
+        /// and rank thousands of securities with vectorized operations instead of reading the properties of each object
+        /// </summary>
+        /// <param name="data">An enumerable of <see cref="CoarseFundamental"/>, or a python iterable of them</param>
+        /// <param name="fields">The names of the <see cref="CoarseFundamental"/> properties, null for the price, adjusted price,
+        /// volume, dollar volume and has fundamental data</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetCoarseFundamentalDataFrame(PyObject data, string[] fields = null)
+        {
+            return GetFundamentalDataFrame<CoarseFundamental>(data, fields ?? FundamentalColumns.DefaultCoarseFields);
+        }
+
+        /// <summary>
+        /// Converts fine fundamental data in a pandas.DataFrame indexed by symbol, with a column per field.
+        /// A field is the path of a <see cref="FineFundamental"/> property, e.g. 'ValuationRatios.PERatio', multi period fields hold
+        /// the value of their default period. Fields with a null parent property are NaN, NaT, False or None depending on their type
+        /// </summary>
+        /// <param name="data">An enumerable of <see cref="FineFundamental"/>, or a python iterable of them</param>
+        /// <param name="fields">The paths of the <see cref="FineFundamental"/> properties, null for the market cap, country,
+        /// primary exchange, industry template code, Morningstar sector code and IPO date</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetFineFundamentalDataFrame(PyObject data, string[] fields = null)
+        {
+            return GetFundamentalDataFrame<FineFundamental>(data, fields ?? FundamentalColumns.DefaultFineFields);
+        }
+
+        /// <summary>
+        /// Converts fundamental data in a pandas.DataFrame indexed by symbol, with a column per field
+        /// </summary>
+        private static PyObject GetFundamentalDataFrame<T>(PyObject data, string[] fields)
+            where T : BaseData
+        {
+            using (Py.GIL())
+            {
+                IEnumerable<T> enumerable;
+                List<T> rows;
+                if (data.TryConvert(out enumerable))
+                {
+                    rows = enumerable.ToList();
+                }
+                else
+                {
+                    // a python iterable, e.g. a filter of the universe data
+                    rows = new List<T>();
+                    using var iterator = data.GetIterator();
+                    foreach (PyObject item in iterator)
+                    {
+                        rows.Add(item.GetAndDispose<T>());
+                    }
+                }
+
+                var columns = new FundamentalColumns(typeof(T), fields, rows.Count);
+                for (var i = 0; i < rows.Count; i++)
+                {
+                    columns.Set(i, rows[i]);
+                }
+
+                using var pyColumns = columns.ToPyDict();
+                using var symbols = new PyList(rows.Select(x => x.Symbol.ToPython()).ToArray());
+                var index = _pandas.Index(symbols, dtype: "object", name: "symbol");
+                return _pandas.DataFrame(pyColumns, index: index);
+            }
+        }
+
+        /// <summary>
+        /// Organizes the data of each symbol into <see cref="PandasData"/>
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="columns">The names of the columns to hold, null for all of them</param>
+        /// <param name="maxLevels">The maximum number of levels of the multi index required by the symbols</param>
+        /// <returns>Dictionary of <see cref="PandasData"/> keyed by symbol</returns>
+        private static Dictionary<Symbol, PandasData> GetPandasDataBySymbol(IEnumerable<Slice> data, IEnumerable<string> columns, out int maxLevels)
+        {
+            maxLevels = 0;
+            var sliceDataDict = new Dictionary<Symbol, PandasData>();
+
+            foreach (var slice in data)
+            {
+                foreach (var key in slice.Keys)
+                {
+                    var baseData = slice[key];
+
+                    PandasData value;
+                    if (!sliceDataDict.TryGetValue(key, out value))
+                    {
+                        sliceDataDict.Add(key, value = new PandasData(baseData, columns));
+                        maxLevels = Math.Max(maxLevels, value.Levels);
+                    }
+
+                    if (value.IsCustomData)
+                    {
+                        value.Add(baseData);
+                    }
+                    else
+                    {
+                        var ticks = slice.Ticks.ContainsKey(key) ? slice.Ticks[key] : null;
+                        var tradeBars = slice.Bars.ContainsKey(key) ? slice.Bars[key] : null;
+                        var quoteBars = slice.QuoteBars.ContainsKey(key) ? slice.QuoteBars[key] : null;
+                        value.Add(ticks, tradeBars, quoteBars);
+                    }
+                }
+            }
+
+            return sliceDataDict;
+        }
+
+        /// <summary>
+        /// Gets the ArrowConverter python module
+        /// </summary>
+        private static dynamic GetArrowConverter()
+        {
+            if (_arrowConverter == null)
+            {
+                _arrowConverter = Py.Import("ArrowConverter");
+            }
+            return _arrowConverter;
+        }
+
         /// <summary>
         /// Returns a string that represent the current object
         /// </summary>
@@ -21,8 +21,10 @@ using System;
 using System.Collections;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Reflection;
+using System.Runtime.InteropServices;
 
 namespace QuantConnect.Python
 {
@@ -32,13 +34,18 @@ namespace QuantConnect.Python
     public class PandasData
     {
         private static dynamic _pandas;
+        private static dynamic _helpers;
+        private static dynamic _arrow;
+        private static dynamic _keyCache;
+        private static int _keyCacheVersion;
         private readonly static HashSet<string> _baseDataProperties = typeof(BaseData).GetProperties().ToHashSet(x => x.Name.ToLowerInvariant());
         private readonly static ConcurrentDictionary<Type, List<MemberInfo>> _membersByType = new ConcurrentDictionary<Type, List<MemberInfo>>();
 
         private readonly Symbol _symbol;
-        private readonly Dictionary<string, Tuple<List<DateTime>, List<object>>> _series;
+        private readonly Dictionary<string, Serie> _series;
 
         private readonly List<MemberInfo> _members;
+        private readonly bool _isProjection;
 
         /// <summary>
         /// Gets true if this is a custom data request, false for normal QC data
@@ -50,19 +57,27 @@ namespace QuantConnect.Python
         /// </summary>
         public int Levels { get; } = 2;
 
+        /// <summary>
+        /// Gets the names of the columns this instance holds
+        /// </summary>
+        public IEnumerable<string> Columns => _series.Keys;
+
         /// <summary>
         /// Initializes an instance of <see cref="PandasData"/>
         /// </summary>
         public PandasData(object data)
+            : this(data, null)
         {
-            if (_pandas == null)
-            {
-                using (Py.GIL())
-                {
-                    // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
-                    _pandas = Py.Import("PandasMapper");
-                }
-            }
+        }
+
+        /// <summary>
+        /// Initializes an instance of <see cref="PandasData"/> that only holds the requested columns
+        /// </summary>
+        /// <param name="data">The data used to determine the type and symbol</param>
+        /// <param name="requestedColumns">The names of the columns to hold, null for all of them. Values of other columns are ignored</param>
+        public PandasData(object data, IEnumerable<string> requestedColumns)
+        {
+            Initialize();
 
             // in the case we get a list/collection of data we take the first data point to determine the type
             // but it's also possible to get a data which supports enumerating we don't care about those cases
@@ -128,7 +143,14 @@ namespace QuantConnect.Python
                 columns.UnionWith(keys);
             }
 
-            _series = columns.ToDictionary(k => k, v => Tuple.Create(new List<DateTime>(), new List<object>()));
+            if (requestedColumns != null)
+            {
+                _isProjection = true;
+                columns.IntersectWith(requestedColumns.Select(x => x.ToLowerInvariant()));
+                _members = _members.Where(x => columns.Contains(x.Name.ToLowerInvariant())).ToList();
+            }
+
+            _series = columns.ToDictionary(k => k, v => new Serie());
         }
 
         /// <summary>
@@ -137,10 +159,10 @@ namespace QuantConnect.Python
         /// <param name="baseData"><see cref="IBaseData"/> object that contains security data</param>
         public void Add(object baseData)
         {
+            var endTime = ((IBaseData) baseData).EndTime;
             foreach (var member in _members)
             {
                 var key = member.Name.ToLowerInvariant();
-                var endTime = ((IBaseData) baseData).EndTime;
                 var propertyMember = member as PropertyInfo;
                 if (propertyMember != null)
                 {
@@ -157,10 +179,23 @@ namespace QuantConnect.Python
             var storage = (baseData as DynamicData)?.GetStorageDictionary();
             if (storage != null)
             {
-                var endTime = ((IBaseData) baseData).EndTime;
                 var value = ((IBaseData) baseData).Value;
                 AddToSeries("value", endTime, value);
 
+                if (_isProjection)
+                {
+                    // only read the requested keys
+                    foreach (var key in _series.Keys)
+                    {
+                        object storageValue;
+                        if (key != "value" && storage.TryGetValue(key, out storageValue))
+                        {
+                            AddToSeries(key, endTime, storageValue);
+                        }
+                    }
+                    return;
+                }
+
                 foreach (var kvp in storage.Where(x => x.Key != "value"))
                 {
                     AddToSeries(kvp.Key, endTime, kvp.Value);
@@ -252,78 +287,185 @@ namespace QuantConnect.Python
         /// <returns>pandas.DataFrame object</returns>
         public PyObject ToPandasDataFrame(int levels = 2)
         {
-            var empty = new PyString(string.Empty);
-            var list = Enumerable.Repeat<PyObject>(empty, 5).ToList();
-            list[3] = _symbol.ID.ToString().ToPython();
-
-            if (_symbol.SecurityType == SecurityType.Future)
-            {
-                list[0] = _symbol.ID.Date.ToPython();
-                list[3] = _symbol.ID.ToString().ToPython();
-            }
-            if (_symbol.SecurityType.IsOption())
+            using (Py.GIL())
             {
-                list[0] = _symbol.ID.Date.ToPython();
-                list[1] = _symbol.ID.StrikePrice.ToPython();
-                list[2] = _symbol.ID.OptionRight.ToString().ToPython();
+                var empty = new PyString(string.Empty);
+                var list = Enumerable.Repeat<PyObject>(empty, 4).ToList();
                 list[3] = _symbol.ID.ToString().ToPython();
+
+                if (_symbol.SecurityType == SecurityType.Future)
+                {
+                    list[0] = _symbol.ID.Date.ToPython();
+                    list[3] = _symbol.ID.ToString().ToPython();
+                }
+                if (_symbol.SecurityType.IsOption())
+                {
+                    list[0] = _symbol.ID.Date.ToPython();
+                    list[1] = _symbol.ID.StrikePrice.ToPython();
+                    list[2] = _symbol.ID.OptionRight.ToString().ToPython();
+                    list[3] = _symbol.ID.ToString().ToPython();
+                }
+
+                // Create the index labels
+                var names = "expiry,strike,type,symbol,time";
+                if (levels == 2)
+                {
+                    names = "symbol,time";
+                    list.RemoveRange(0, 3);
+                }
+                if (levels == 3)
+                {
+                    names = "expiry,symbol,time";
+                    list.RemoveRange(1, 2);
+                }
+
+                using var splitNames = new PyList(names.Split(',').Select(x => (PyObject)new PyString(x)).ToArray());
+                using var constantLevels = new PyList(list.ToArray());
+
+                // creating the pandas MultiIndex is expensive so we keep a cache, most columns share the same time index
+                var indexCache = new List<KeyValuePair<long[], PyObject>>();
+
+                // Returns a dictionary keyed by column name where values are pandas.Series objects
+                var pyDict = new PyDict();
+                foreach (var kvp in _series)
+                {
+                    var serie = kvp.Value;
+                    if (serie.ShouldFilter()) continue;
+
+                    var times = serie.Times.ToArray();
+                    PyObject index = null;
+                    foreach (var cached in indexCache)
+                    {
+                        if (new ReadOnlySpan<long>(cached.Key).SequenceEqual(new ReadOnlySpan<long>(times)))
+                        {
+                            index = cached.Value;
+                            break;
+                        }
+                    }
+                    if (index == null)
+                    {
+                        using var pyTimes = ToNumpyArray(times, "int64");
+                        index = _helpers.to_multi_index(pyTimes, constantLevels, splitNames);
+                        indexCache.Add(new KeyValuePair<long[], PyObject>(times, index));
+                    }
+
+                    // Adds pandas.Series value keyed by the column name
+                    pyDict.SetItem(kvp.Key, _pandas.Series(serie.GetValues(), index));
+                }
+                _series.Clear();
+
+                // Create the DataFrame
+                return _pandas.DataFrame(pyDict);
             }
+        }
+
+        /// <summary>
+        /// Get a pyarrow.RecordBatch of the current <see cref="PandasData"/> state.
+        /// The index levels are columns and there is one row per time, ticks sharing the same time take one row each
+        /// </summary>
+        /// <param name="levels">Number of levels of the multi index</param>
+        /// <returns>pyarrow.RecordBatch object</returns>
+        public PyObject ToArrowRecordBatch(int levels = 2)
+        {
+            var series = _series.Where(x => !x.Value.ShouldFilter()).OrderBy(x => x.Key, StringComparer.Ordinal).ToList();
 
-            // Create the index labels
-            var names = "expiry,strike,type,symbol,time";
-            if (levels == 2)
+            // the n-th value of a time in a serie goes into the n-th row of that time
+            var rowsPerTime = new SortedDictionary<long, int>();
+            foreach (var kvp in series)
             {
-                names = "symbol,time";
-                list.RemoveRange(0, 3);
+                var times = kvp.Value.Times;
+                for (var i = 0; i < times.Count;)
+                {
+                    var j = i + 1;
+                    while (j < times.Count && times[j] == times[i]) j++;
+
+                    int rows;
+                    if (!rowsPerTime.TryGetValue(times[i], out rows) || rows < j - i)
+                    {
+                        rowsPerTime[times[i]] = j - i;
+                    }
+                    i = j;
+                }
             }
-            if (levels == 3)
+
+            var rowTimes = new long[rowsPerTime.Values.Sum()];
+            var firstRow = new Dictionary<long, int>(rowsPerTime.Count);
+            var row = 0;
+            foreach (var kvp in rowsPerTime)
             {
-                names = "expiry,symbol,time";
-                list.RemoveRange(1, 2);
+                firstRow[kvp.Key] = row;
+                for (var i = 0; i < kvp.Value; i++)
+                {
+                    rowTimes[row++] = kvp.Key;
+                }
             }
 
-            Func<object, bool> filter = x =>
-            {
-                var isNaNOrZero = x is double && ((double)x).IsNaNOrZero();
-                var isNullOrWhiteSpace = x is string && string.IsNullOrWhiteSpace((string)x);
-                var isFalse = x is bool && !(bool)x;
-                return x == null || isNaNOrZero || isNullOrWhiteSpace || isFalse;
-            };
-            Func<DateTime, PyTuple> selector = x =>
-            {
-                list[list.Count - 1] = x.ToPython();
-                return new PyTuple(list.ToArray());
-            };
-            // creating the pandas MultiIndex is expensive so we keep a cash
-            var indexCache = new Dictionary<List<DateTime>, dynamic>(new ListComparer<DateTime>());
             using (Py.GIL())
             {
-                // Returns a dictionary keyed by column name where values are pandas.Series objects
-                var pyDict = new PyDict();
-                var splitNames = names.Split(',');
-                foreach (var kvp in _series)
+                using var levelNames = new PyList();
+                using var levelValues = new PyList();
+                // levels that don't apply to the symbol are null
+                var isOption = _symbol.SecurityType.IsOption();
+                if (levels > 2)
                 {
-                    var values = kvp.Value.Item2;
-                    if (values.All(filter)) continue;
+                    levelNames.Append("expiry".ToPython());
+                    levelValues.Append(isOption || _symbol.SecurityType == SecurityType.Future ? _symbol.ID.Date.ToPython() : PyObject.None);
+                }
+                if (levels == 5)
+                {
+                    levelNames.Append("strike".ToPython());
+                    levelValues.Append(isOption ? ((double)_symbol.ID.StrikePrice).ToPython() : PyObject.None);
+                    levelNames.Append("type".ToPython());
+                    levelValues.Append(isOption ? _symbol.ID.OptionRight.ToString().ToPython() : PyObject.None);
+                }
+                levelNames.Append("symbol".ToPython());
+                levelValues.Append(_symbol.ID.ToString().ToPython());
 
-                    dynamic index;
-                    if (!indexCache.TryGetValue(kvp.Value.Item1, out index))
+                using var columnNames = new PyList();
+                using var columnValues = new PyList();
+                using var columnMasks = new PyList();
+                foreach (var kvp in series)
+                {
+                    var times = kvp.Value.Times;
+                    var rows = new int[times.Count];
+                    for (var i = 0; i < times.Count; i++)
                     {
-                        var tuples = kvp.Value.Item1.Select(selector).ToArray();
-                        index = _pandas.MultiIndex.from_tuples(tuples, names: splitNames);
-                        indexCache[kvp.Value.Item1] = index;
+                        rows[i] = i > 0 && times[i] == times[i - 1] ? rows[i - 1] + 1 : firstRow[times[i]];
                     }
 
-                    // Adds pandas.Series value keyed by the column name
-                    pyDict.SetItem(kvp.Key, _pandas.Series(values, index));
+                    PyObject mask;
+                    columnNames.Append(kvp.Key.ToPython());
+                    columnValues.Append(kvp.Value.GetValues(rows, rowTimes.Length, out mask).ToPython());
+                    columnMasks.Append(mask ?? PyObject.None);
                 }
                 _series.Clear();
 
-                // Create the DataFrame
-                return _pandas.DataFrame(pyDict);
+                using var pyTimes = ToNumpyArray(rowTimes, "int64");
+                return _arrow.to_record_batch(levelNames, levelValues, pyTimes, columnNames, columnValues, columnMasks);
             }
         }
 
+        /// <summary>
+        /// Gets the times and values of a numeric column without converting them into python objects
+        /// </summary>
+        /// <param name="column">The column name</param>
+        /// <param name="times">The time of each value as nanoseconds since the unix epoch</param>
+        /// <param name="values">The values of the column</param>
+        /// <returns>True if the column exists, has data and is numeric</returns>
+        public bool TryGetNumericColumn(string column, out long[] times, out double[] values)
+        {
+            Serie serie;
+            if (_series.TryGetValue(column, out serie) && !serie.ShouldFilter() && serie.TryGetDoubles(out values))
+            {
+                times = serie.Times.ToArray();
+                return true;
+            }
+
+            times = null;
+            values = null;
+            return false;
+        }
+
         /// <summary>
         /// Adds data to dictionary
         /// </summary>
@@ -332,16 +474,277 @@ namespace QuantConnect.Python
         /// <param name="input"><see cref="Object"/> to add to the value associated with the specific key. Can be null.</param>
         private void AddToSeries(string key, DateTime time, object input)
         {
-            Tuple<List<DateTime>, List<object>> value;
+            Serie value;
+            if (TryGetSerie(key, out value))
+            {
+                value.Add(time, input);
+            }
+        }
+
+        /// <summary>
+        /// Adds a decimal to dictionary without boxing it
+        /// </summary>
+        /// <param name="key">The key of the value to get</param>
+        /// <param name="time"><see cref="DateTime"/> object to add to the value associated with the specific key</param>
+        /// <param name="input">The value to add to the value associated with the specific key</param>
+        private void AddToSeries(string key, DateTime time, decimal input)
+        {
+            Serie value;
+            if (TryGetSerie(key, out value))
+            {
+                value.Add(time, input);
+            }
+        }
+
+        /// <summary>
+        /// Adds a boolean to dictionary, only boxing it if the column was requested
+        /// </summary>
+        /// <param name="key">The key of the value to get</param>
+        /// <param name="time"><see cref="DateTime"/> object to add to the value associated with the specific key</param>
+        /// <param name="input">The value to add to the value associated with the specific key</param>
+        private void AddToSeries(string key, DateTime time, bool input)
+        {
+            Serie value;
+            if (TryGetSerie(key, out value))
+            {
+                value.Add(time, input);
+            }
+        }
+
+        /// <summary>
+        /// Gets the serie of the given column. Columns that were not requested are ignored
+        /// </summary>
+        private bool TryGetSerie(string key, out Serie value)
+        {
             if (_series.TryGetValue(key, out value))
             {
-                value.Item1.Add(time);
-                value.Item2.Add(input is decimal ? input.ConvertInvariant<double>() : input);
+                return true;
             }
-            else
+            if (!_isProjection)
             {
                 throw new ArgumentException($"PandasData.AddToSeries(): {key} key does not exist in series dictionary.");
             }
+            return false;
+        }
+
+        /// <summary>
+        /// Gets the time index of a pandas DataFrame or Series in a single block copy.
+        /// For a multi index the 'time' level is used
+        /// </summary>
+        /// <param name="data">The pandas DataFrame or Series</param>
+        /// <returns>The times of the index</returns>
+        internal static DateTime[] GetIndexTimes(PyObject data)
+        {
+            Initialize();
+            using (Py.GIL())
+            {
+                using PyObject nanoseconds = _helpers.get_times(data);
+                var epochTicks = new DateTime(1970, 1, 1).Ticks;
+                return FromNumpyArray<long>(nanoseconds)
+                    .Select(x => new DateTime(epochTicks + x / 100))
+                    .ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Gets the values of a column of a pandas DataFrame, or the values of a pandas Series, as doubles in a single block copy
+        /// </summary>
+        /// <param name="data">The pandas DataFrame or Series</param>
+        /// <param name="column">The column name, ignored for a pandas Series</param>
+        /// <param name="optional">True to get zeros if the DataFrame does not have the column, otherwise a KeyError is raised</param>
+        /// <returns>The values of the column</returns>
+        internal static double[] GetColumnValues(PyObject data, string column, bool optional = false)
+        {
+            Initialize();
+            using (Py.GIL())
+            {
+                using PyObject values = _helpers.get_values(data, column, optional);
+                return FromNumpyArray<double>(values);
+            }
+        }
+
+        /// <summary>
+        /// Gets the values of a 2-D numpy array or pandas DataFrame as doubles in a single block copy.
+        /// A 1-D array or pandas Series is read as a single column
+        /// </summary>
+        /// <param name="data">The numpy array, pandas DataFrame or pandas Series</param>
+        /// <returns>The values, indexed by row and column</returns>
+        internal static double[,] GetMatrixValues(PyObject data)
+        {
+            Initialize();
+            using (Py.GIL())
+            {
+                using PyObject array = _helpers.get_matrix(data);
+                using var shape = array.GetAttr("shape");
+                var values = new double[shape[0].As<int>(), shape[1].As<int>()];
+                CopyFromNumpyArray(array, values);
+                return values;
+            }
+        }
+
+        /// <summary>
+        /// Copies a 2-D buffer into a new 2-D numpy array in a single block copy
+        /// </summary>
+        /// <param name="values">The values to copy, indexed by row and column</param>
+        /// <returns>A numpy.ndarray holding a copy of the values</returns>
+        internal static PyObject ToNumpyMatrix(double[,] values)
+        {
+            Initialize();
+            using (Py.GIL())
+            {
+                var handle = GCHandle.Alloc(values, GCHandleType.Pinned);
+                try
+                {
+                    using var address = handle.AddrOfPinnedObject().ToInt64().ToPython();
+                    using var rows = values.GetLength(0).ToPython();
+                    using var columns = values.GetLength(1).ToPython();
+                    return _helpers.to_matrix(address, rows, columns);
+                }
+                finally
+                {
+                    handle.Free();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Copies a contiguous numpy array into a new C# array in a single block copy
+        /// </summary>
+        /// <param name="array">The contiguous numpy array, its dtype must match <typeparamref name="T"/></param>
+        /// <returns>A copy of the values of the numpy array</returns>
+        private static T[] FromNumpyArray<T>(PyObject array)
+            where T : struct
+        {
+            var values = new T[array.Length()];
+            CopyFromNumpyArray(array, values);
+            return values;
+        }
+
+        /// <summary>
+        /// Copies a contiguous numpy array into a C# array of the same size and element type in a single block copy
+        /// </summary>
+        /// <param name="array">The contiguous numpy array</param>
+        /// <param name="values">The destination array</param>
+        private static void CopyFromNumpyArray(PyObject array, Array values)
+        {
+            if (values.Length == 0)
+            {
+                return;
+            }
+
+            var handle = GCHandle.Alloc(values, GCHandleType.Pinned);
+            try
+            {
+                using var address = handle.AddrOfPinnedObject().ToInt64().ToPython();
+                _helpers.copy_to(array, address);
+            }
+            finally
+            {
+                handle.Free();
+            }
+        }
+
+        /// <summary>
+        /// Copies a contiguous buffer into a new numpy array in a single block copy, without creating python objects per value
+        /// </summary>
+        /// <param name="values">The values to copy</param>
+        /// <param name="dtype">The numpy dtype matching the element type of <paramref name="values"/></param>
+        /// <returns>A numpy.ndarray holding a copy of the values</returns>
+        internal static PyObject ToNumpyArray<T>(T[] values, string dtype)
+            where T : struct
+        {
+            Initialize();
+            var handle = GCHandle.Alloc(values, GCHandleType.Pinned);
+            try
+            {
+                using var address = handle.AddrOfPinnedObject().ToInt64().ToPython();
+                using var count = values.Length.ToPython();
+                using var pyDtype = dtype.ToPython();
+                return _helpers.to_array(address, count, pyDtype);
+            }
+            finally
+            {
+                handle.Free();
+            }
+        }
+
+        /// <summary>
+        /// Imports the python modules used to create the pandas objects
+        /// </summary>
+        private static void Initialize()
+        {
+            if (_pandas == null)
+            {
+                using (Py.GIL())
+                {
+                    // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
+                    _pandas = Py.Import("PandasMapper");
+                    // Helpers to move typed C# buffers from and to numpy in a single copy and build the index from arrays
+                    _helpers = PyModule.FromString("PandasDataHelpers",
+                        "import ctypes\n" +
+                        "import numpy as np\n" +
+                        "import pandas as pd\n" +
+                        "def to_array(address, count, dtype):\n" +
+                        "    dtype = np.dtype(dtype)\n" +
+                        "    buffer = (ctypes.c_char * (count * dtype.itemsize)).from_address(address)\n" +
+                        "    return np.frombuffer(buffer, dtype=dtype, count=count).copy()\n" +
+                        "def to_matrix(address, rows, columns):\n" +
+                        "    return to_array(address, rows * columns, 'float64').reshape(rows, columns)\n" +
+                        "def get_matrix(data):\n" +
+                        "    values = np.asarray(getattr(data, 'values', data), dtype='float64')\n" +
+                        "    if values.ndim == 1:\n" +
+                        "        values = values.reshape(-1, 1)\n" +
+                        "    if values.ndim != 2:\n" +
+                        "        raise ValueError(f'Expected a 1-D or 2-D array but got {values.ndim} dimensions')\n" +
+                        "    return np.ascontiguousarray(values)\n" +
+                        "def copy_to(values, address):\n" +
+                        "    ctypes.memmove(address, values.ctypes.data, values.nbytes)\n" +
+                        "def to_multi_index(times, levels, names):\n" +
+                        "    arrays = [np.full(len(times), level, dtype=object) for level in levels]\n" +
+                        "    arrays.append(times.view('datetime64[ns]'))\n" +
+                        "    return pd.MultiIndex.from_arrays(arrays, names=names)\n" +
+                        "def get_times(data):\n" +
+                        "    index = data.index\n" +
+                        "    if isinstance(index, pd.MultiIndex):\n" +
+                        "        index = index.get_level_values('time' if 'time' in index.names else -1)\n" +
+                        "    return np.ascontiguousarray(pd.DatetimeIndex(index).values.astype('datetime64[ns]').view('int64'))\n" +
+                        "def get_values(data, column, optional):\n" +
+                        "    if optional and not isinstance(data, pd.Series) and column not in data.columns:\n" +
+                        "        return np.zeros(len(data))\n" +
+                        "    values = data if isinstance(data, pd.Series) else data[column]\n" +
+                        "    return np.ascontiguousarray(values.values, dtype='float64')");
+                    // Builds pyarrow record batches, pyarrow is only imported when used
+                    _arrow = Py.Import("ArrowConverter");
+                    // The symbol keys resolved by PandasMapper, refreshed here instead of on each indexing call
+                    _keyCache = _pandas.keyCache;
+                    _keyCacheVersion = SymbolCache.Version;
+                    _keyCache.refresh(_keyCacheVersion);
+                }
+            }
+            RefreshSymbolKeys();
+        }
+
+        /// <summary>
+        /// Drops the tickers resolved by the PandasMapper module if the <see cref="SymbolCache"/> changed since the last refresh.
+        /// Called by the engine once per time step and whenever pandas data is created, so indexing a data frame never reads the SymbolCache
+        /// </summary>
+        public static void RefreshSymbolKeys()
+        {
+            // nothing is cached before the PandasMapper module is imported
+            if (_keyCache == null)
+            {
+                return;
+            }
+
+            var version = SymbolCache.Version;
+            if (version != _keyCacheVersion)
+            {
+                using (Py.GIL())
+                {
+                    _keyCache.refresh(version);
+                }
+                _keyCacheVersion = version;
+            }
         }
 
         /// <summary>
@@ -356,5 +759,216 @@ namespace QuantConnect.Python
                 ? baseType.GetProperties().Select(x => x.Name.ToLowerInvariant())
                 : Enumerable.Empty<string>();
         }
+
+        /// <summary>
+        /// Holds the values of a single column in a typed contiguous buffer while possible,
+        /// falling back to boxed values only for columns that hold non numeric data
+        /// </summary>
+        private class Serie
+        {
+            // python datetime has microsecond precision, we truncate the same way so the index matches
+            private const long TicksPerMicrosecond = TimeSpan.TicksPerMillisecond / 1000;
+            private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+
+            private SerieType _type;
+            private List<double> _doubles;
+            private List<long> _longs;
+            private List<object> _objects;
+
+            /// <summary>
+            /// The time of each value as nanoseconds since the unix epoch
+            /// </summary>
+            public List<long> Times { get; } = new List<long>();
+
+            /// <summary>
+            /// Adds a new value to the end of the serie
+            /// </summary>
+            public void Add(DateTime time, decimal input)
+            {
+                AddTime(time);
+                AddDouble(input.ConvertInvariant<double>());
+            }
+
+            /// <summary>
+            /// Adds a new value to the end of the serie
+            /// </summary>
+            public void Add(DateTime time, object input)
+            {
+                AddTime(time);
+
+                if (input is decimal decimalValue)
+                {
+                    AddDouble(decimalValue.ConvertInvariant<double>());
+                }
+                else if (input is double doubleValue)
+                {
+                    AddDouble(doubleValue);
+                }
+                else if (input is long || input is int)
+                {
+                    var longValue = Convert.ToInt64(input, CultureInfo.InvariantCulture);
+                    if (_type == SerieType.Empty)
+                    {
+                        _type = SerieType.Long;
+                        _longs = new List<long>();
+                    }
+                    if (_type == SerieType.Long)
+                    {
+                        _longs.Add(longValue);
+                        return;
+                    }
+                    AddObject(input);
+                }
+                else
+                {
+                    AddObject(input);
+                }
+            }
+
+            /// <summary>
+            /// True if the serie has no meaningful values and should not be part of the data frame
+            /// </summary>
+            public bool ShouldFilter()
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        return _doubles.All(x => x.IsNaNOrZero());
+                    case SerieType.Long:
+                        // non null integer values are never filtered
+                        return false;
+                    case SerieType.Object:
+                        return _objects.All(x =>
+                        {
+                            var isNaNOrZero = x is double && ((double)x).IsNaNOrZero();
+                            var isNullOrWhiteSpace = x is string && string.IsNullOrWhiteSpace((string)x);
+                            var isFalse = x is bool && !(bool)x;
+                            return x == null || isNaNOrZero || isNullOrWhiteSpace || isFalse;
+                        });
+                    default:
+                        return true;
+                }
+            }
+
+            /// <summary>
+            /// Gets the values of this serie, a numpy array for numeric series
+            /// </summary>
+            public object GetValues()
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        return ToNumpyArray(_doubles.ToArray(), "float64");
+                    case SerieType.Long:
+                        return ToNumpyArray(_longs.ToArray(), "int64");
+                    default:
+                        return _objects;
+                }
+            }
+
+            /// <summary>
+            /// Gets the values of this serie placed in the given rows of a column of the given length.
+            /// Missing values are NaN for double series, masked for integer series and null otherwise
+            /// </summary>
+            /// <param name="rows">The row of each value</param>
+            /// <param name="rowCount">The length of the column</param>
+            /// <param name="mask">numpy boolean array flagging the missing values of integer series, null otherwise</param>
+            public object GetValues(int[] rows, int rowCount, out PyObject mask)
+            {
+                mask = null;
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        var doubles = new double[rowCount];
+                        Array.Fill(doubles, double.NaN);
+                        for (var i = 0; i < rows.Length; i++)
+                        {
+                            doubles[rows[i]] = _doubles[i];
+                        }
+                        return ToNumpyArray(doubles, "float64");
+                    case SerieType.Long:
+                        var longs = new long[rowCount];
+                        // one byte per value, read as a numpy bool
+                        var missing = new byte[rowCount];
+                        Array.Fill(missing, (byte)1);
+                        for (var i = 0; i < rows.Length; i++)
+                        {
+                            longs[rows[i]] = _longs[i];
+                            missing[rows[i]] = 0;
+                        }
+                        mask = ToNumpyArray(missing, "bool");
+                        return ToNumpyArray(longs, "int64");
+                    default:
+                        var objects = new object[rowCount];
+                        for (var i = 0; i < rows.Length; i++)
+                        {
+                            objects[rows[i]] = _objects[i];
+                        }
+                        return objects.ToList();
+                }
+            }
+
+            /// <summary>
+            /// Gets the values of a numeric serie as doubles
+            /// </summary>
+            public bool TryGetDoubles(out double[] values)
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        values = _doubles.ToArray();
+                        return true;
+                    case SerieType.Long:
+                        values = _longs.Select(x => (double)x).ToArray();
+                        return true;
+                    default:
+                        values = null;
+                        return false;
+                }
+            }
+
+            private void AddTime(DateTime time)
+            {
+                Times.Add((time.Ticks - EpochTicks) / TicksPerMicrosecond * 1000);
+            }
+
+            private void AddDouble(double value)
+            {
+                if (_type == SerieType.Empty)
+                {
+                    _type = SerieType.Double;
+                    _doubles = new List<double>();
+                }
+                if (_type == SerieType.Double)
+                {
+                    _doubles.Add(value);
+                    return;
+                }
+                AddObject(value);
+            }
+
+            private void AddObject(object input)
+            {
+                if (_type != SerieType.Object)
+                {
+                    // mixed types or non numeric data, box what we have so far, keeping the previous behavior
+                    _objects = _type == SerieType.Double
+                        ? _doubles.Select(x => (object)x).ToList()
+                        : _type == SerieType.Long ? _longs.Select(x => (object)x).ToList() : new List<object>();
+                    _doubles = null;
+                    _longs = null;
+                    _type = SerieType.Object;
+                }
+                _objects.Add(input is decimal ? input.ConvertInvariant<double>() : input);
+            }
+        }
+
+        private enum SerieType
+        {
+            Empty,
+            Double,
+            Long,
+            Object
+        }
     }
 }
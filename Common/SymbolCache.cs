@@ -18,6 +18,7 @@ using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -30,6 +31,13 @@ namespace QuantConnect
     {
         // we aggregate the two maps into a class so we can assign a new one as an atomic operation
         private static Cache _cache = new Cache();
+        private static int _version;
+
+        /// <summary>
+        /// Gets a number that changes every time a mapping is added, removed or the cache is cleared.
+        /// Allows consumers to invalidate lookups they have cached, like the python pandas mapper
+        /// </summary>
+        public static int Version => _version;
 
         /// <summary>
         /// Adds a mapping for the specified ticker
@@ -38,8 +46,18 @@ namespace QuantConnect
         /// <param name="symbol">The symbol object that maps to the string ticker symbol</param>
         public static void Set(string ticker, Symbol symbol)
         {
+            Symbol existingSymbol;
+            string existingTicker;
+            if (_cache.Symbols.TryGetValue(ticker, out existingSymbol) && existingSymbol == symbol
+                && _cache.Tickers.TryGetValue(symbol, out existingTicker) && existingTicker == ticker)
+            {
+                // nothing changed
+                return;
+            }
+
             _cache.Symbols[ticker] = symbol;
             _cache.Tickers[symbol] = ticker;
+            Interlocked.Increment(ref _version);
         }
 
         /// <summary>
@@ -108,6 +126,7 @@ namespace QuantConnect
         public static bool TryRemove(Symbol symbol)
         {
             string ticker;
+            Interlocked.Increment(ref _version);
             return _cache.Tickers.TryRemove(symbol, out ticker) && _cache.Symbols.TryRemove(ticker, out symbol);
         }
 
@@ -119,6 +138,7 @@ namespace QuantConnect
         public static bool TryRemove(string ticker)
         {
             Symbol symbol;
+            Interlocked.Increment(ref _version);
             return _cache.Symbols.TryRemove(ticker, out symbol) && _cache.Tickers.TryRemove(symbol, out ticker);
         }
 
@@ -128,6 +148,7 @@ namespace QuantConnect
         public static void Clear()
         {
             _cache = new Cache();
+            Interlocked.Increment(ref _version);
         }
 
         private static Tuple<bool, Symbol, InvalidOperationException> TryGetSymbol(string ticker)
@@ -236,6 +236,30 @@ namespace QuantConnect.Indicators
             throw new NotSupportedException($"{GetType().Name} does not support the `Update(DateTime, decimal)` method. Use one of the following methods instead: {string.Join(", ", suggestions)}");
         }
 
+        /// <summary>
+        /// Updates the state of this indicator with a sequence of values in a single call, e.g. to warm it up with
+        /// the columns of a history data frame. The values must be in time order, values that are not finite are skipped
+        /// </summary>
+        /// <param name="times">The time associated with each value</param>
+        /// <param name="values">The values to use to update this indicator</param>
+        /// <returns>True if this indicator is ready, false otherwise</returns>
+        public bool WarmUp(DateTime[] times, double[] values)
+        {
+            if (times.Length != values.Length)
+            {
+                throw new ArgumentException($"{GetType().Name}.WarmUp(): expected the same number of times and values but got {times.Length} and {values.Length}.");
+            }
+
+            for (var i = 0; i < times.Length; i++)
+            {
+                if (double.IsFinite(values[i]))
+                {
+                    Update(times[i], values[i].SafeDecimalCast());
+                }
+            }
+            return IsReady;
+        }
+
         /// <summary>
         /// Resets this indicator to its initial state
         /// </summary>
@@ -197,6 +197,63 @@ namespace QuantConnect.Research
             }
         }
 
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a sequence of pandas DataFrames,
+        /// each one holding the data of a chunk of the date range. The data is read in a single pass and each chunk is converted
+        /// as it arrives, so memory usage is bounded by the chunk size instead of the whole date range
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="chunk">The time span covered by each data frame, five days by default</param>
+        /// <returns>An iterable of pandas DataFrames with the requested historical data, chunks without data are skipped</returns>
+        public IEnumerable<PyObject> HistoryIter(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, TimeSpan? chunk = null)
+        {
+            var chunkSpan = chunk ?? TimeSpan.FromDays(5);
+            if (chunkSpan <= TimeSpan.Zero)
+            {
+                throw new ArgumentException("QuantBook.HistoryIter(): the chunk time span must be positive.", nameof(chunk));
+            }
+
+            var symbols = tickers.ConvertToSymbolEnumerable().ToList();
+            // stream the slices straight from the history provider, the public History methods memoize them
+            var history = History(CreateDateRangeHistoryRequests(symbols, start, end, resolution), TimeZone);
+            return GetDataFrameChunks(history, start, chunkSpan);
+        }
+
+        /// <summary>
+        /// Groups the slices into chunks of the given time span and converts each of them into a pandas DataFrame
+        /// </summary>
+        private IEnumerable<PyObject> GetDataFrameChunks(IEnumerable<Slice> history, DateTime start, TimeSpan chunkSpan)
+        {
+            var chunkEnd = start + chunkSpan;
+            var slices = new List<Slice>();
+            foreach (var slice in history)
+            {
+                if (slice.Time > chunkEnd)
+                {
+                    if (slices.Count > 0)
+                    {
+                        yield return PandasConverter.GetDataFrame(slices);
+                        slices = new List<Slice>();
+                    }
+                    // skip the chunks without data
+                    chunkEnd += new TimeSpan((slice.Time - chunkEnd).Ticks / chunkSpan.Ticks * chunkSpan.Ticks);
+                    if (slice.Time > chunkEnd)
+                    {
+                        chunkEnd += chunkSpan;
+                    }
+                }
+                slices.Add(slice);
+            }
+
+            if (slices.Count > 0)
+            {
+                yield return PandasConverter.GetDataFrame(slices);
+            }
+        }
+
         /// <summary>
         /// Python implementation of GetFundamental, get fundamental data for input symbols or tickers
         /// </summary>
@@ -584,6 +641,54 @@ namespace QuantConnect.Research
             return Indicator(indicator, history, selector);
         }
 
+        /// <summary>
+        /// Evaluates an indicator over many price series in a single call, e.g. to screen a universe.
+        /// Each column of <paramref name="prices"/> is a series, it is pushed through the indicator after a reset.
+        /// The loop runs in C# on a single copy of the prices, no python object is created per value
+        /// </summary>
+        /// <param name="indicator">Indicator</param>
+        /// <param name="prices">2-D numpy.ndarray or pandas.DataFrame with a row per time and a column per series, e.g. from
+        /// <see cref="QCAlgorithm.WideHistory(PyObject, int, Resolution?, string)"/>. A 1-D numpy.ndarray or pandas.Series is a single series.
+        /// The times of a pandas index are used as the time of the updates</param>
+        /// <returns>2-D numpy.ndarray with the same shape as <paramref name="prices"/> holding the value of the indicator after each update,
+        /// NaN where the indicator is not ready or the price is missing</returns>
+        public PyObject IndicatorValues(IndicatorBase<IndicatorDataPoint> indicator, PyObject prices)
+        {
+            var values = PandasConverter.GetMatrix(prices);
+            var rows = values.GetLength(0);
+            var columns = values.GetLength(1);
+
+            DateTime[] times;
+            using (Py.GIL())
+            {
+                times = prices.HasAttr("index")
+                    ? PandasConverter.GetTimes(prices)
+                    : Enumerable.Range(0, rows).Select(i => Time.BeginningOfTime.AddDays(i)).ToArray();
+            }
+
+            var result = new double[rows, columns];
+            for (var column = 0; column < columns; column++)
+            {
+                indicator.Reset();
+                for (var row = 0; row < rows; row++)
+                {
+                    var value = values[row, column];
+                    if (double.IsFinite(value))
+                    {
+                        indicator.Update(times[row], value.SafeDecimalCast());
+                        if (indicator.IsReady)
+                        {
+                            result[row, column] = (double)indicator.Current.Value;
+                            continue;
+                        }
+                    }
+                    result[row, column] = double.NaN;
+                }
+            }
+
+            return PandasConverter.GetNumpyArray(result);
+        }
+
         /// <summary>
         /// Gets Portfolio Statistics from a pandas.DataFrame with equity and benchmark values
         /// </summary>
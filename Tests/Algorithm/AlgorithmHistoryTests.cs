@@ -440,6 +440,34 @@ class Test(PythonData):
             Assert.AreEqual(0, openInterests.Count);
         }
 
+        [Test]
+        public void PythonHistoryReturnsOnlyRequestedFields()
+        {
+            var algorithm = GetAlgorithm(new DateTime(2013, 10, 8));
+            algorithm.SetPandasConverter();
+            var spy = algorithm.AddEquity("SPY", Resolution.Minute).Symbol;
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+def Test(algorithm, symbol):
+    full = algorithm.History([symbol], 60, Resolution.Minute)
+    projected = algorithm.History([symbol], 60, Resolution.Minute, fields=['close', 'volume'])
+    if sorted(projected.columns) != ['close', 'volume']:
+        return False
+    # the resolution defaults to the one of the subscription
+    defaulted = algorithm.History([symbol], 60, fields=['close', 'volume'])
+    # a single positional field binds to the fields overload
+    single = algorithm.History([symbol], 60, Resolution.Minute, 'close')
+    return projected.equals(full[['close', 'volume']]) and defaulted.equals(projected) and single.equals(full[['close']])").GetAttr("Test");
+
+                Assert.IsTrue((bool)test(algorithm, spy));
+            }
+        }
+
         private QCAlgorithm GetAlgorithm(DateTime dateTime)
         {
             var algorithm = new QCAlgorithm();
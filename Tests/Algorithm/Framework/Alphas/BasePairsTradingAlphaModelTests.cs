@@ -62,5 +62,108 @@ namespace QuantConnect.Tests.Algorithm.Framework.Alphas
             Assert.Ignore("The CommonAlphaModelTests need to be refactored to support multiple securities with different prices for each security");
             return null;
         }
+
+        [Test]
+        public void RemovedPairIsReplacedByTheLastPair()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)GetPairsModule().removed_pair_is_replaced_by_the_last_pair());
+            }
+        }
+
+        [Test]
+        public void PairEmitsOnceItsMeanIsReadyAndWhenItsRatioChangesSide()
+        {
+            using (Py.GIL())
+            {
+                var signals = ((PyObject)GetPairsModule().get_signals_by_phase()).As<List<string>>();
+
+                // warm up, ready, stays above the mean, crosses below, stays below, crosses above
+                CollectionAssert.AreEqual(new[] { "", "Down,Up", "", "Up,Down", "", "Down,Up" }, signals);
+            }
+        }
+
+        private static dynamic GetPairsModule()
+        {
+            return PyModule.FromString("BasePairsTradingAlphaModelPairsTests", @"
+from AlgorithmImports import *
+from BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
+
+symbols = [Symbol.Create(ticker, SecurityType.Equity, Market.USA) for ticker in ['AIG', 'BAC', 'IBM', 'SPY']]
+
+class Price:
+    def __init__(self, value):
+        self.Value = value
+
+class Prices:
+    '''The prices of a slice'''
+    def __init__(self, prices):
+        self.prices = {symbol: Price(value) for symbol, value in prices.items()}
+    def ContainsKey(self, symbol):
+        return symbol in self.prices
+    def __getitem__(self, symbol):
+        return self.prices[symbol]
+
+def create_pairs(keys, period):
+    pairs = BasePairsTradingAlphaModel.Pairs(timedelta(1), 1, period)
+    for key in keys:
+        pairs.Add(*key)
+    return pairs
+
+def get_state(pairs, key):
+    position = pairs.positionByKey[key]
+    return pairs.mean[position], pairs.samples[position], pairs.state[position], tuple(pairs.slots[position])
+
+def get_signals(insights):
+    return sorted((str(insight.Symbol), 'Up' if insight.Direction == InsightDirection.Up else 'Down') for insight in insights)
+
+def removed_pair_is_replaced_by_the_last_pair():
+    '''Removes a pair in the middle, the last pair moves to its position keeping its mean, sample count and state,
+    and the pairs keep updating like the pairs of a model that never had the removed pair'''
+    keys = [(symbols[0], symbols[1]), (symbols[1], symbols[2]), (symbols[2], symbols[3]), (symbols[0], symbols[3])]
+    pairs = create_pairs(keys, 5)
+    expected = create_pairs([keys[0], keys[2], keys[3]], 5)
+    random = np.random.RandomState(5)
+
+    def update():
+        # the last security misses some prices, so the pairs have different sample counts
+        prices = Prices({symbol: 100 + 10 * random.randn() for symbol in symbols if symbol != symbols[3] or random.rand() < 0.7})
+        return get_signals(pairs.Update(prices)), get_signals(expected.Update(prices))
+
+    for _ in range(20):
+        update()
+    last = get_state(pairs, keys[3])
+    if last[1] < 5 or last[2] == 0 or last[1] == get_state(pairs, keys[0])[1]:
+        # the state of the last pair must be distinguishable
+        return False
+
+    pairs.Remove(keys[1])
+    if pairs.positionByKey[keys[3]] != 1 or get_state(pairs, keys[3]) != last or len(pairs) != 3:
+        return False
+    if {symbol: keys for symbol, keys in pairs.keysBySymbol.items()} != expected.keysBySymbol:
+        return False
+
+    for _ in range(20):
+        signals, expected_signals = update()
+        if signals != expected_signals:
+            return False
+    return all(get_state(pairs, key)[:3] == get_state(expected, key)[:3] for key in expected)
+
+def get_signals_by_phase():
+    '''Gets the signals of a pair while its mean isn't ready, when it's ready, and when the ratio stays on a side of the mean or crosses it'''
+    pairs = create_pairs([(symbols[0], symbols[1])], 500)
+
+    def update(ratio, count):
+        signals = []
+        for _ in range(count):
+            signals += pairs.Update(Prices({symbols[0]: 100 * ratio, symbols[1]: 100}))
+        return ','.join(direction for symbol, direction in get_signals(signals))
+
+    # the ratio swings 20% around its mean, before the 500 samples of the mean it can't emit
+    warmup = ','.join(filter(None, [update(1.2 if i % 2 else 0.8, 1) for i in range(499)]))
+    return [warmup, update(1.2, 1), update(1.2, 10), update(0.8, 1), update(0.8, 10), update(1.2, 1)]
+");
+        }
     }
 }
\ No newline at end of file
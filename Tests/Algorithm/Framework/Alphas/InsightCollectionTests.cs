@@ -15,6 +15,7 @@
 
 using System;
 using System.Linq;
+using System.Threading.Tasks;
 using Newtonsoft.Json;
 using NUnit.Framework;
 using QuantConnect.Algorithm.Framework.Alphas;
@@ -109,5 +110,125 @@ namespace QuantConnect.Tests.Algorithm.Framework.Alphas
 
             Assert.IsTrue(equals.All((x) => x));
         }
+
+        [Test]
+        public void GetLastActiveInsightsReturnsTheLastGeneratedActiveInsightOfEachSourceModel()
+        {
+            var aapl = Symbol.Create("AAPL", SecurityType.Equity, "usa");
+            var spy = Symbol.Create("SPY", SecurityType.Equity, "usa");
+            var insightCollection = new InsightCollection();
+
+            var first = GetInsight(aapl, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 10));
+            var second = GetInsight(aapl, "A", new DateTime(2019, 1, 2), new DateTime(2019, 1, 3));
+            var other = GetInsight(aapl, "B", new DateTime(2019, 1, 1), new DateTime(2019, 1, 10));
+            var spyInsight = GetInsight(spy, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 10));
+            insightCollection.AddRange(new[] { first, second, other, spyInsight });
+
+            CollectionAssert.AreEquivalent(new[] { second, other, spyInsight },
+                insightCollection.GetLastActiveInsights(new DateTime(2019, 1, 2)));
+
+            // the last generated insight expired, the first one is still active
+            CollectionAssert.AreEquivalent(new[] { first, other, spyInsight },
+                insightCollection.GetLastActiveInsights(new DateTime(2019, 1, 4)));
+
+            insightCollection.Clear(new[] { spy });
+            insightCollection.Remove(other);
+            CollectionAssert.AreEquivalent(new[] { second },
+                insightCollection.GetLastActiveInsights(new DateTime(2019, 1, 2)));
+        }
+
+        [Test]
+        public void RemoveExpiredInsightsRemovesTheInsightsInOrderOfExpiration()
+        {
+            var aapl = Symbol.Create("AAPL", SecurityType.Equity, "usa");
+            var spy = Symbol.Create("SPY", SecurityType.Equity, "usa");
+            var insightCollection = new InsightCollection();
+
+            var insights = new[]
+            {
+                GetInsight(aapl, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 5)),
+                GetInsight(spy, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 3)),
+                GetInsight(aapl, "B", new DateTime(2019, 1, 1), new DateTime(2019, 1, 2)),
+                GetInsight(spy, "B", new DateTime(2019, 1, 1), new DateTime(2019, 1, 4))
+            };
+            insightCollection.AddRange(insights);
+            Assert.AreEqual(new DateTime(2019, 1, 2), insightCollection.GetNextExpiryTime());
+
+            // removed insights don't expire
+            insightCollection.Remove(insights[1]);
+            CollectionAssert.AreEqual(new[] { insights[2], insights[3] },
+                insightCollection.RemoveExpiredInsights(new DateTime(2019, 1, 4, 12, 0, 0)));
+
+            Assert.AreEqual(new DateTime(2019, 1, 5), insightCollection.GetNextExpiryTime());
+            Assert.AreEqual(1, insightCollection.Count);
+
+            insightCollection.RemoveExpiredInsights(new DateTime(2019, 1, 6));
+            Assert.IsNull(insightCollection.GetNextExpiryTime());
+        }
+
+        [Test]
+        public void RemoveExpiredInsightsUpdatesTheLastActiveInsights()
+        {
+            var aapl = Symbol.Create("AAPL", SecurityType.Equity, "usa");
+            var spy = Symbol.Create("SPY", SecurityType.Equity, "usa");
+            var insightCollection = new InsightCollection();
+
+            var first = GetInsight(aapl, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 10));
+            var second = GetInsight(aapl, "A", new DateTime(2019, 1, 2), new DateTime(2019, 1, 3));
+            var third = GetInsight(aapl, "A", new DateTime(2019, 1, 3), new DateTime(2019, 1, 4));
+            var other = GetInsight(aapl, "B", new DateTime(2019, 1, 1), new DateTime(2019, 1, 4));
+            var spyInsight = GetInsight(spy, "A", new DateTime(2019, 1, 1), new DateTime(2019, 1, 2));
+            insightCollection.AddRange(new[] { first, second, third, other, spyInsight });
+
+            // insights of cleared symbols don't expire
+            insightCollection.Clear(new[] { spy });
+            CollectionAssert.AreEquivalent(new[] { second, third, other },
+                insightCollection.RemoveExpiredInsights(new DateTime(2019, 1, 5)));
+
+            Assert.IsFalse(insightCollection.Contains(third));
+            Assert.IsTrue(insightCollection.Contains(first));
+            CollectionAssert.AreEquivalent(new[] { first },
+                insightCollection.GetLastActiveInsights(new DateTime(2019, 1, 5)));
+            Assert.AreEqual(new DateTime(2019, 1, 10), insightCollection.GetNextExpiryTime());
+        }
+
+        [Test]
+        public void InsightsCanBeAddedWhileExpiredInsightsAreRemoved()
+        {
+            var symbols = Enumerable.Range(0, 10).Select(i => Symbol.Create($"A{i}", SecurityType.Equity, "usa")).ToList();
+            var start = new DateTime(2019, 1, 1);
+            var insightCollection = new InsightCollection();
+
+            var adding = Task.Run(() =>
+            {
+                for (var i = 0; i < 10000; i++)
+                {
+                    insightCollection.Add(GetInsight(symbols[i % symbols.Count], "A", start, start.AddMinutes(1 + i % 100)));
+                }
+            });
+            var removed = 0;
+            while (!adding.IsCompleted)
+            {
+                removed += insightCollection.RemoveExpiredInsights(start.AddMinutes(50)).Count;
+                insightCollection.GetLastActiveInsights(start.AddMinutes(50));
+            }
+            adding.Wait();
+            removed += insightCollection.RemoveExpiredInsights(start.AddMinutes(50)).Count;
+
+            // the insights closing before the minute 50 expired
+            Assert.AreEqual(4900, removed);
+            Assert.AreEqual(5100, insightCollection.Count);
+            Assert.AreEqual(start.AddMinutes(50), insightCollection.GetNextExpiryTime());
+        }
+
+        private static Insight GetInsight(Symbol symbol, string sourceModel, DateTime generatedTimeUtc, DateTime closeTimeUtc)
+        {
+            return new Insight(symbol, closeTimeUtc - generatedTimeUtc, InsightType.Price, InsightDirection.Up)
+            {
+                SourceModel = sourceModel,
+                GeneratedTimeUtc = generatedTimeUtc,
+                CloseTimeUtc = closeTimeUtc
+            };
+        }
     }
 }
@@ -0,0 +1,88 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class PearsonCorrelationPairsTradingAlphaModelTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("PearsonCorrelationPairsTradingAlphaModelTests", @"
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+from PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+
+def get_returns(seed):
+    '''Log returns of 5 securities driven by a common factor with different loadings and noise'''
+    random = np.random.RandomState(seed)
+    factor = random.normal(0, 0.01, 30)
+    loadings = random.uniform(-1, 1, 5)
+    noise = random.uniform(0.001, 0.008, 5)
+    return pd.DataFrame(np.outer(factor, loadings) + random.normal(0, 1, (30, 5)) * noise)
+
+def reference_best_pair(returns, minimumCorrelation):
+    '''The pair with the highest pearson correlation, tested pair by pair like the model did before the vectorized selection'''
+    corr = dict()
+    stop = len(returns.columns)
+    for i in range(0, stop):
+        for j in range(i + 1, stop):
+            corr[(i, j)] = pearsonr(returns.iloc[:, i], returns.iloc[:, j])[0]
+    corr = sorted(corr.items(), key = lambda kv: kv[1])
+    return corr[-1][0] if corr[-1][1] >= minimumCorrelation else None
+
+def best_pair_matches_reference(minimumCorrelation):
+    '''Compares the best pair of many synthetic return frames, and counts the frames without a pair with the minimum correlation'''
+    model = PearsonCorrelationPairsTradingAlphaModel(minimumCorrelation = minimumCorrelation)
+    withoutPair = 0
+    for seed in range(50):
+        returns = get_returns(seed)
+        expected = reference_best_pair(returns, minimumCorrelation)
+        best_pair = model.get_best_pair(returns.values)
+        if best_pair is not None:
+            best_pair = (int(best_pair[0]), int(best_pair[1]))
+        if best_pair != expected:
+            return -1
+        withoutPair += expected is None
+    return withoutPair
+");
+            }
+        }
+
+        [TestCase(0, 0, 0)]
+        [TestCase(0.5, 1, 49)]
+        [TestCase(0.95, 50, 50)]
+        public void BestPairMatchesPairByPairPearsonCorrelation(double minimumCorrelation, int minimumWithoutPair, int maximumWithoutPair)
+        {
+            using (Py.GIL())
+            {
+                // -1 if a best pair doesn't match, otherwise the number of frames without a pair with the minimum correlation
+                var withoutPair = (int)_module.best_pair_matches_reference(minimumCorrelation);
+
+                Assert.GreaterOrEqual(withoutPair, minimumWithoutPair);
+                Assert.LessOrEqual(withoutPair, maximumWithoutPair);
+            }
+        }
+    }
+}
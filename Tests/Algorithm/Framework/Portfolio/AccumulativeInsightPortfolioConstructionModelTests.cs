@@ -330,6 +330,102 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             AssertTargets(new List<IPortfolioTarget>(), targets);
         }
 
+        [TestCase(Language.Python)]
+        [TestCase(Language.CSharp)]
+        public void IncrementalModeOnlyEmitsChangedSymbols(Language language)
+        {
+            SetPortfolioConstruction(language, _algorithm, incremental: true);
+
+            SetUtcTime(_algorithm.Time);
+            var insights = new[]
+            {
+                GetInsight(Symbols.SPY, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10)),
+                GetInsight(Symbols.IBM, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10))
+            };
+            var targets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, insights).ToList();
+            AssertTargets(new List<IPortfolioTarget>
+            {
+                PortfolioTarget.Percent(_algorithm, Symbols.SPY, (decimal)DefaultPercent),
+                PortfolioTarget.Percent(_algorithm, Symbols.IBM, (decimal)DefaultPercent)
+            }, targets);
+
+            // One minute later, only IBM accumulates
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            insights = new[] { GetInsight(Symbols.IBM, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10)) };
+            targets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, insights).ToList();
+            AssertTargets(new List<IPortfolioTarget> { PortfolioTarget.Percent(_algorithm, Symbols.IBM, 2 * (decimal)DefaultPercent) }, targets);
+
+            // the new SPY insights cancel each other, so its accumulated percent doesn't change
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            insights = new[]
+            {
+                GetInsight(Symbols.SPY, InsightDirection.Down, _algorithm.UtcTime, TimeSpan.FromMinutes(10)),
+                GetInsight(Symbols.SPY, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10))
+            };
+            targets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, insights).ToList();
+            AssertTargets(new List<IPortfolioTarget>(), targets);
+
+            // the first insights expire
+            SetUtcTime(_algorithm.Time.AddMinutes(9));
+            targets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, new Insight[0]).ToList();
+            AssertTargets(new List<IPortfolioTarget>
+            {
+                PortfolioTarget.Percent(_algorithm, Symbols.SPY, 0),
+                PortfolioTarget.Percent(_algorithm, Symbols.IBM, (decimal)DefaultPercent)
+            }, targets);
+
+            targets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, new Insight[0]).ToList();
+            AssertTargets(new List<IPortfolioTarget>(), targets);
+        }
+
+        [Test]
+        public void PythonIncrementalModeOnlyTargetsTheLastInsightOfChangedSymbols()
+        {
+            SetPortfolioConstruction(Language.Python, _algorithm, incremental: true);
+            dynamic instance;
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString("PythonIncrementalModeOnlyTargetsTheLastInsightOfChangedSymbols", @"
+from AccumulativeInsightPortfolioConstructionModel import AccumulativeInsightPortfolioConstructionModel
+
+class TargetInsightsRecordingModel(AccumulativeInsightPortfolioConstructionModel):
+    def GetTargetInsights(self):
+        self.targetInsights = list(super().GetTargetInsights())
+        return self.targetInsights
+");
+                instance = module.GetAttr("TargetInsightsRecordingModel").Invoke();
+                instance.SetAttr("Incremental", true.ToPython());
+                _algorithm.SetPortfolioConstruction(new PortfolioConstructionModelPythonWrapper(instance));
+                _algorithm.PortfolioConstruction.OnSecuritiesChanged(_algorithm,
+                    SecurityChangesTests.AddedNonInternal(_algorithm.Securities.Values.ToArray()));
+            }
+
+            SetUtcTime(_algorithm.Time);
+            _algorithm.PortfolioConstruction.CreateTargets(_algorithm, new[]
+            {
+                GetInsight(Symbols.SPY, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10)),
+                GetInsight(Symbols.IBM, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10))
+            }).ToList();
+
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            var first = GetInsight(Symbols.IBM, InsightDirection.Up, _algorithm.UtcTime, TimeSpan.FromMinutes(10));
+            var last = GetInsight(Symbols.IBM, InsightDirection.Down, _algorithm.UtcTime, TimeSpan.FromMinutes(10));
+            _algorithm.PortfolioConstruction.CreateTargets(_algorithm, new[] { first, last }).ToList();
+            using (Py.GIL())
+            {
+                var targetInsights = ((PyObject)instance.targetInsights).As<List<Insight>>();
+                CollectionAssert.AreEqual(new[] { last }, targetInsights);
+            }
+
+            // nothing changed since the last rebalance
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            _algorithm.PortfolioConstruction.CreateTargets(_algorithm, new Insight[0]).ToList();
+            using (Py.GIL())
+            {
+                Assert.AreEqual(0, (int)instance.targetInsights.__len__());
+            }
+        }
+
         [Test]
         [TestCase(Language.Python)]
         [TestCase(Language.CSharp)]
@@ -468,15 +564,16 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             return insight;
         }
 
-        private void SetPortfolioConstruction(Language language, QCAlgorithm algorithm, PortfolioBias bias= PortfolioBias.LongShort)
+        private void SetPortfolioConstruction(Language language, QCAlgorithm algorithm, PortfolioBias bias= PortfolioBias.LongShort, bool incremental = false)
         {
-            algorithm.SetPortfolioConstruction(new AccumulativeInsightPortfolioConstructionModel((Func<DateTime,DateTime>)null, bias));
+            algorithm.SetPortfolioConstruction(new AccumulativeInsightPortfolioConstructionModel((Func<DateTime,DateTime>)null, bias) { Incremental = incremental });
             if (language == Language.Python)
             {
                 using (Py.GIL())
                 {
                     var name = nameof(AccumulativeInsightPortfolioConstructionModel);
                     var instance = Py.Import(name).GetAttr(name).Invoke(((object)null).ToPython(), ((int)bias).ToPython());
+                    instance.SetAttr("Incremental", incremental.ToPython());
                     var model = new PortfolioConstructionModelPythonWrapper(instance);
                     algorithm.SetPortfolioConstruction(model);
                 }
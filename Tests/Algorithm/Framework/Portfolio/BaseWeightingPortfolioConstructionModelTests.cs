@@ -38,6 +38,11 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
 
         public virtual double? Weight => Algorithm.Securities.Count == 0 ? default(double) : 1d / Algorithm.Securities.Count;
 
+        /// <summary>
+        /// True to create the portfolio construction models with their incremental mode enabled
+        /// </summary>
+        protected bool Incremental { get; set; }
+
         [OneTimeSetUp]
         public virtual void SetUp()
         {
@@ -161,6 +166,63 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             AssertTargets(expectedTargets, actualTargets);
         }
 
+        [Test]
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void IncrementalTargetsMatchFullTargets(Language language)
+        {
+            SetPortfolioConstruction(language);
+            var fullModel = Algorithm.PortfolioConstruction;
+
+            Incremental = true;
+            var incrementalModel = GetPortfolioConstructionModel(language, Resolution.Daily);
+            Incremental = false;
+            incrementalModel.OnSecuritiesChanged(Algorithm, SecurityChangesTests.AddedNonInternal(Algorithm.Securities.Values.ToArray()));
+
+            var fullQuantities = new Dictionary<Symbol, decimal>();
+            var incrementalQuantities = new Dictionary<Symbol, decimal>();
+            void AssertSameTargets(IEnumerable<Insight> insights)
+            {
+                var array = insights.ToArray();
+                foreach (var target in fullModel.CreateTargets(Algorithm, array))
+                {
+                    fullQuantities[target.Symbol] = target.Quantity;
+                }
+                // the incremental model only creates the targets that changed
+                foreach (var target in incrementalModel.CreateTargets(Algorithm, array))
+                {
+                    incrementalQuantities[target.Symbol] = target.Quantity;
+                }
+                CollectionAssert.AreEquivalent(fullQuantities, incrementalQuantities);
+            }
+
+            var symbols = Algorithm.Securities.Keys.OrderBy(symbol => symbol.Value).ToList();
+
+            // insights are added
+            AssertSameTargets(symbols.Select((symbol, i) => GetInsight(symbol, InsightDirection.Up, Algorithm.UtcTime, weight: 0.05 * (i + 1))));
+
+            // the insights of every other symbol change direction, one of them to flat
+            SetUtcTime(Algorithm.Time.AddMinutes(1));
+            AssertSameTargets(symbols.Where((symbol, i) => i % 2 == 0)
+                .Select((symbol, i) => GetInsight(symbol, i == 0 ? InsightDirection.Flat : InsightDirection.Down, Algorithm.UtcTime, weight: 0.1)));
+
+            // short insights override the first symbols until they expire
+            SetUtcTime(Algorithm.Time.AddMinutes(1));
+            AssertSameTargets(symbols.Take(2).Select(symbol => GetInsight(symbol, InsightDirection.Up, Algorithm.UtcTime, Time.OneMinute, 0.2)));
+
+            SetUtcTime(Algorithm.Time.AddMinutes(2));
+            AssertSameTargets(Enumerable.Empty<Insight>());
+
+            // the insights of the last symbol expire, the others are renewed
+            SetUtcTime(Algorithm.Time.AddDays(1));
+            AssertSameTargets(symbols.Take(symbols.Count - 1).Select(symbol => GetInsight(symbol, InsightDirection.Down, Algorithm.UtcTime, weight: 0.1)));
+
+            // every insight expires
+            SetUtcTime(Algorithm.Time.AddDays(2));
+            AssertSameTargets(Enumerable.Empty<Insight>());
+            Assert.IsTrue(incrementalQuantities.Values.All(quantity => quantity == 0));
+        }
+
         [Test]
         [TestCase(Language.CSharp, InsightDirection.Up)]
         [TestCase(Language.CSharp, InsightDirection.Down)]
@@ -365,6 +365,63 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.DoesNotThrow(() => SetPortfolioConstruction(language, _algorithm, Expiry.EndOfWeek));
         }
 
+        [Test]
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void IncrementalTargetsMatchFullTargets(Language language)
+        {
+            SetPortfolioConstruction(language, _algorithm);
+            var fullModel = _algorithm.PortfolioConstruction;
+            SetPortfolioConstruction(language, _algorithm, incremental: true);
+            var incrementalModel = _algorithm.PortfolioConstruction;
+
+            var fullQuantities = new Dictionary<Symbol, decimal>();
+            var incrementalQuantities = new Dictionary<Symbol, decimal>();
+            void AssertSameTargets(IEnumerable<Insight> insights)
+            {
+                var array = insights.ToArray();
+                foreach (var target in fullModel.CreateTargets(_algorithm, array))
+                {
+                    fullQuantities[target.Symbol] = target.Quantity;
+                }
+                // the incremental model only creates the targets that changed
+                foreach (var target in incrementalModel.CreateTargets(_algorithm, array))
+                {
+                    incrementalQuantities[target.Symbol] = target.Quantity;
+                }
+                CollectionAssert.AreEquivalent(fullQuantities, incrementalQuantities);
+            }
+
+            var symbols = _algorithm.Securities.Keys.OrderBy(symbol => symbol.Value).ToList();
+
+            // insights are added, their confidences add up to more than one
+            AssertSameTargets(symbols.Select((symbol, i) => GetInsight(symbol, InsightDirection.Up, _algorithm.UtcTime, confidence: 0.3 * (i + 1))));
+
+            // the first insight changes direction and the second one to flat
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            AssertSameTargets(new[]
+            {
+                GetInsight(symbols[0], InsightDirection.Down, _algorithm.UtcTime, confidence: 0.1),
+                GetInsight(symbols[1], InsightDirection.Flat, _algorithm.UtcTime, confidence: 0.1)
+            });
+
+            // a short insight overrides the last symbol until it expires
+            SetUtcTime(_algorithm.Time.AddMinutes(1));
+            AssertSameTargets(new[] { GetInsight(symbols[2], InsightDirection.Down, _algorithm.UtcTime, Time.OneMinute, 0.5) });
+
+            SetUtcTime(_algorithm.Time.AddMinutes(2));
+            AssertSameTargets(Enumerable.Empty<Insight>());
+
+            // the insights of the last symbol expire, the others are renewed
+            SetUtcTime(_algorithm.Time.AddDays(1));
+            AssertSameTargets(symbols.Take(2).Select(symbol => GetInsight(symbol, InsightDirection.Up, _algorithm.UtcTime, confidence: 0.2)));
+
+            // every insight expires
+            SetUtcTime(_algorithm.Time.AddDays(2));
+            AssertSameTargets(Enumerable.Empty<Insight>());
+            Assert.IsTrue(incrementalQuantities.Values.All(quantity => quantity == 0));
+        }
+
         private Security GetSecurity(Symbol symbol)
         {
             var config = SecurityExchangeHours.AlwaysOpen(DateTimeZone.Utc);
@@ -388,16 +445,17 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             return insight;
         }
 
-        private void SetPortfolioConstruction(Language language, QCAlgorithm algorithm, dynamic paramenter = null)
+        private void SetPortfolioConstruction(Language language, QCAlgorithm algorithm, dynamic paramenter = null, bool incremental = false)
         {
             paramenter = paramenter ?? Resolution.Daily;
-            algorithm.SetPortfolioConstruction(new ConfidenceWeightedPortfolioConstructionModel(paramenter));
+            algorithm.SetPortfolioConstruction(new ConfidenceWeightedPortfolioConstructionModel(paramenter) { Incremental = incremental });
             if (language == Language.Python)
             {
                 using (Py.GIL())
                 {
                     var name = nameof(ConfidenceWeightedPortfolioConstructionModel);
                     var instance = Py.Import(name).GetAttr(name).Invoke(((object)paramenter).ToPython());
+                    instance.SetAttr("Incremental", incremental.ToPython());
                     var model = new PortfolioConstructionModelPythonWrapper(instance);
                     algorithm.SetPortfolioConstruction(model);
                 }
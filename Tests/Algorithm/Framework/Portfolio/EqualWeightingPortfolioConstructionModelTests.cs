@@ -209,6 +209,49 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             AssertTargets(expectedTargets, actualTargets);
         }
 
+        [Test]
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void IncrementalModeOnlyEmitsChangedTargets(Language language)
+        {
+            SetPortfolioConstruction(language);
+
+            IPortfolioConstructionModel model;
+            if (language == Language.CSharp)
+            {
+                model = new EqualWeightingPortfolioConstructionModel(Resolution.Daily) { Incremental = true };
+            }
+            else
+            {
+                using (Py.GIL())
+                {
+                    const string name = nameof(EqualWeightingPortfolioConstructionModel);
+                    var instance = Py.Import(name).GetAttr(name).Invoke(Resolution.Daily.ToPython());
+                    instance.SetAttr("Incremental", true.ToPython());
+                    model = new PortfolioConstructionModelPythonWrapper(instance);
+                }
+            }
+            Algorithm.SetPortfolioConstruction(model);
+            model.OnSecuritiesChanged(Algorithm, SecurityChangesTests.AddedNonInternal(Algorithm.Securities.Values.ToArray()));
+
+            var insights = Algorithm.Securities.Keys.Select(x => GetInsight(x, InsightDirection.Up, Algorithm.UtcTime));
+            var targets = model.CreateTargets(Algorithm, insights.ToArray()).ToList();
+            Assert.AreEqual(Algorithm.Securities.Count, targets.Count);
+
+            // new insights with the same directions don't change any target
+            SetUtcTime(Algorithm.Time.AddMinutes(1));
+            insights = Algorithm.Securities.Keys.Select(x => GetInsight(x, InsightDirection.Up, Algorithm.UtcTime));
+            targets = model.CreateTargets(Algorithm, insights.ToArray()).ToList();
+            Assert.AreEqual(0, targets.Count);
+
+            // only the target of the security with a new direction is emitted
+            SetUtcTime(Algorithm.Time.AddMinutes(1));
+            targets = model.CreateTargets(Algorithm, new[] { GetInsight(Symbols.SPY, InsightDirection.Down, Algorithm.UtcTime) }).ToList();
+            Assert.AreEqual(1, targets.Count);
+            Assert.AreEqual(Symbols.SPY, targets[0].Symbol);
+            Assert.Less(targets[0].Quantity, 0);
+        }
+
         public override Insight GetInsight(Symbol symbol, InsightDirection direction, DateTime generatedTimeUtc, TimeSpan? period = null, double? weight = 0.01)
         {
             period = period ?? TimeSpan.FromDays(1);
@@ -222,13 +265,14 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
         {
             if (language == Language.CSharp)
             {
-                return new EqualWeightingPortfolioConstructionModel(paramenter);
+                return new EqualWeightingPortfolioConstructionModel(paramenter) { Incremental = Incremental };
             }
 
             using (Py.GIL())
             {
                 const string name = nameof(EqualWeightingPortfolioConstructionModel);
                 var instance = Py.Import(name).GetAttr(name).Invoke(((object)paramenter).ToPython());
+                instance.SetAttr("Incremental", Incremental.ToPython());
                 return new PortfolioConstructionModelPythonWrapper(instance);
             }
         }
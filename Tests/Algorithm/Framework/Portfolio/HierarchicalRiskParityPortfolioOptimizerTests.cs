@@ -0,0 +1,153 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class HierarchicalRiskParityPortfolioOptimizerTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("HierarchicalRiskParityPortfolioOptimizerTests", @"
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import linkage
+from scipy.spatial.distance import squareform
+from HierarchicalRiskParityPortfolioOptimizer import HierarchicalRiskParityPortfolioOptimizer
+
+covariance = np.array([[0.040, 0.018, 0.002, 0.001, 0.010],
+                       [0.018, 0.030, 0.001, 0.002, 0.008],
+                       [0.002, 0.001, 0.090, 0.045, 0.004],
+                       [0.001, 0.002, 0.045, 0.060, 0.003],
+                       [0.010, 0.008, 0.004, 0.003, 0.020]])
+symbols = ['A', 'B', 'C', 'D', 'E']
+
+def optimize(optimizer, covariance, columns = symbols):
+    return optimizer.Optimize(pd.DataFrame(columns=columns), covariance=covariance)
+
+def reference_weights(covariance):
+    '''Hierarchical risk parity as listed by Lopez de Prado (2016): quasi-diagonalization and recursive bisection'''
+    deviation = np.sqrt(np.diag(covariance))
+    correlation = covariance / np.outer(deviation, deviation)
+    distance = np.sqrt(np.clip((1 - correlation) / 2, 0, 1))
+    np.fill_diagonal(distance, 0)
+    link = linkage(squareform(distance, checks=False), 'single').astype(int)
+
+    # quasi-diagonalization: replace each cluster by the two items it joins until only securities are left
+    count = link[-1, 3]
+    order = [link[-1, 0], link[-1, 1]]
+    while max(order) >= count:
+        expanded = []
+        for item in order:
+            expanded += [item] if item < count else [link[item - count, 0], link[item - count, 1]]
+        order = expanded
+
+    def cluster_variance(items):
+        cluster = covariance[np.ix_(items, items)]
+        weights = 1 / np.diag(cluster)
+        weights /= weights.sum()
+        return weights.dot(cluster).dot(weights)
+
+    weights = np.ones(len(order))
+    clusters = [order]
+    while clusters:
+        clusters = [half for cluster in clusters for half in (cluster[:len(cluster) // 2], cluster[len(cluster) // 2:]) if len(cluster) > 1]
+        for left, right in zip(clusters[::2], clusters[1::2]):
+            left_variance, right_variance = cluster_variance(left), cluster_variance(right)
+            alpha = 1 - left_variance / (left_variance + right_variance)
+            weights[left] *= alpha
+            weights[right] *= 1 - alpha
+    return weights
+
+def weights_are_long_only_and_add_up_to_one():
+    weights = optimize(HierarchicalRiskParityPortfolioOptimizer(), covariance)
+    return bool(np.all(weights > 0) and abs(weights.sum() - 1) < 1e-12)
+
+def zero_variance_asset_has_no_weight():
+    with_constant = np.zeros((6, 6))
+    with_constant[:5, :5] = covariance
+    weights = optimize(HierarchicalRiskParityPortfolioOptimizer(), with_constant, symbols + ['F'])
+    expected = optimize(HierarchicalRiskParityPortfolioOptimizer(), covariance)
+    return bool(weights[5] == 0 and np.allclose(weights[:5], expected, rtol=0, atol=1e-12))
+
+def matches_reference_allocation():
+    weights = optimize(HierarchicalRiskParityPortfolioOptimizer('single'), covariance)
+    return bool(np.allclose(weights, reference_weights(covariance), rtol=0, atol=1e-12))
+
+def clustering_is_reused(change, same_symbols):
+    '''Optimizes twice, the second time with the correlations moved by about the change, and checks if the clustering was reused'''
+    optimizer = HierarchicalRiskParityPortfolioOptimizer(correlation_tolerance = 0.05)
+    optimize(optimizer, covariance)
+    order = optimizer.order
+
+    deviation = np.sqrt(np.diag(covariance))
+    moved = covariance + change * np.outer(deviation, deviation) * (1 - np.eye(5))
+    weights = optimize(optimizer, moved, symbols if same_symbols else ['V', 'W', 'X', 'Y', 'Z'])
+
+    # the bisection uses the current covariance even when the clustering is reused
+    expected = optimizer.get_recursive_bisection(moved, optimizer.order)
+    return optimizer.order is order and bool(np.allclose(weights, expected, rtol=0, atol=1e-12))
+");
+            }
+        }
+
+        [Test]
+        public void WeightsAreLongOnlyAndAddUpToOne()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.weights_are_long_only_and_add_up_to_one());
+            }
+        }
+
+        [Test]
+        public void ZeroVarianceAssetHasNoWeight()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.zero_variance_asset_has_no_weight());
+            }
+        }
+
+        [Test]
+        public void MatchesReferenceAllocation()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.matches_reference_allocation());
+            }
+        }
+
+        [TestCase(0.01, true, true)]
+        [TestCase(0.1, true, false)]
+        [TestCase(0.01, false, false)]
+        [TestCase(0, false, false)]
+        public void ClusteringIsReusedWithinToleranceForSameSymbols(double change, bool sameSymbols, bool expected)
+        {
+            using (Py.GIL())
+            {
+                Assert.AreEqual(expected, (bool)_module.clustering_is_reused(change, sameSymbols));
+            }
+        }
+    }
+}
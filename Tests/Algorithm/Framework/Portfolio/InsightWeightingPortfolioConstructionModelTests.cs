@@ -94,13 +94,14 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
         {
             if (language == Language.CSharp)
             {
-                return new InsightWeightingPortfolioConstructionModel(paramenter);
+                return new InsightWeightingPortfolioConstructionModel(paramenter) { Incremental = Incremental };
             }
 
             using (Py.GIL())
             {
                 const string name = nameof(InsightWeightingPortfolioConstructionModel);
                 var instance = Py.Import(name).GetAttr(name).Invoke(((object)paramenter).ToPython());
+                instance.SetAttr("Incremental", Incremental.ToPython());
                 return new PortfolioConstructionModelPythonWrapper(instance);
             }
         }
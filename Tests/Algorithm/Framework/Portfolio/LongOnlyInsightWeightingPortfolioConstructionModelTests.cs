@@ -29,13 +29,14 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
         {
             if (language == Language.CSharp)
             {
-                return new InsightWeightingPortfolioConstructionModel(paramenter, PortfolioBias.Long);
+                return new InsightWeightingPortfolioConstructionModel(paramenter, PortfolioBias.Long) { Incremental = Incremental };
             }
 
             using (Py.GIL())
             {
                 const string name = nameof(InsightWeightingPortfolioConstructionModel);
                 var instance = Py.Import(name).GetAttr(name).Invoke(((object)paramenter).ToPython(), ((int)PortfolioBias.Long).ToPython());
+                instance.SetAttr("Incremental", Incremental.ToPython());
                 return new PortfolioConstructionModelPythonWrapper(instance);
             }
         }
@@ -0,0 +1,92 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class PortfolioOptimizerBatchTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("PortfolioOptimizerBatchTests", @"
+import numpy as np
+import pandas as pd
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.UnconstrainedMeanVariancePortfolioOptimizer import UnconstrainedMeanVariancePortfolioOptimizer
+
+random = np.random.RandomState(7)
+returns = pd.DataFrame(random.normal(0.001, 0.02, (100, 8)), columns = ['S%d' % i for i in range(8)])
+resamples = [returns.iloc[random.randint(0, len(returns), len(returns))].reset_index(drop = True) for _ in range(12)]
+
+def minimum_variance_grid_matches_optimize(threads):
+    target_returns = np.linspace(returns.mean().min(), returns.mean().max(), 12)
+    batch = MinimumVariancePortfolioOptimizer(-0.5, 0.5).OptimizeBatch(returns, target_returns = target_returns, threads = threads)
+    expected = [MinimumVariancePortfolioOptimizer(-0.5, 0.5, x).Optimize(returns) for x in target_returns]
+    return bool(batch.shape == (12, 8) and np.allclose(batch, expected, atol = 1e-6))
+
+def maximum_sharpe_resamples_match_optimize(threads):
+    batch = MaximumSharpeRatioPortfolioOptimizer(-0.5, 0.5).OptimizeBatch(resamples, threads = threads)
+    expected = [MaximumSharpeRatioPortfolioOptimizer(-0.5, 0.5).Optimize(x) for x in resamples]
+    return bool(batch.shape == (12, 8) and np.allclose(batch, expected, atol = 1e-6))
+
+def unconstrained_resamples_match_optimize():
+    batch = UnconstrainedMeanVariancePortfolioOptimizer().OptimizeBatch(resamples)
+    expected = [UnconstrainedMeanVariancePortfolioOptimizer().Optimize(x) for x in resamples]
+    return bool(batch.shape == (12, 8) and np.allclose(batch, expected))
+");
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(1)]
+        [TestCase(4)]
+        public void MinimumVarianceTargetReturnsGridMatchesOptimize(int threads)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.minimum_variance_grid_matches_optimize(threads));
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(1)]
+        [TestCase(4)]
+        public void MaximumSharpeRatioResamplesMatchOptimize(int threads)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.maximum_sharpe_resamples_match_optimize(threads));
+            }
+        }
+
+        [Test]
+        public void UnconstrainedMeanVarianceResamplesMatchOptimize()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.unconstrained_resamples_match_optimize());
+            }
+        }
+    }
+}
@@ -0,0 +1,153 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class QuadraticProgramSolverTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("QuadraticProgramSolverTests", @"
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from QuadraticProgramSolver import QuadraticProgramSolver
+from Portfolio.BlackLittermanOptimizationPortfolioConstructionModel import BlackLittermanOptimizationPortfolioConstructionModel
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+
+covariance = np.array([[0.040, 0.006, 0.012, 0.004],
+                       [0.006, 0.090, 0.018, 0.010],
+                       [0.012, 0.018, 0.160, 0.020],
+                       [0.004, 0.010, 0.020, 0.010]])
+expected_returns = np.array([0.05, 0.10, 0.15, 0.02])
+
+def solve(target_return, minimum_weight, maximum_weight):
+    return QuadraticProgramSolver().Solve(covariance, [np.ones(4), expected_returns], [1, target_return], minimum_weight, maximum_weight)
+
+def satisfies_constraints(target_return, minimum_weight, maximum_weight):
+    weights = solve(target_return, minimum_weight, maximum_weight)
+    return weights is not None and bool(abs(weights.sum() - 1) < 1e-8 \
+        and abs(expected_returns.dot(weights) - target_return) < 1e-8 \
+        and weights.min() >= minimum_weight - 1e-8 \
+        and weights.max() <= maximum_weight + 1e-8)
+
+def is_infeasible(target_return, minimum_weight, maximum_weight):
+    return solve(target_return, minimum_weight, maximum_weight) is None
+
+def matches_scipy(target_return, minimum_weight, maximum_weight):
+    weights = solve(target_return, minimum_weight, maximum_weight)
+    constraints = [
+        {'type': 'eq', 'fun': lambda w: np.sum(w) - 1},
+        {'type': 'eq', 'fun': lambda w: expected_returns.dot(w) - target_return}]
+    opt = minimize(lambda w: w.dot(covariance).dot(w), np.full(4, 0.25),
+                   bounds = [(minimum_weight, maximum_weight)] * 4,
+                   constraints = constraints, method = 'SLSQP', options = {'ftol': 1e-12})
+    # the quadratic program reaches the exact optimum, it can't have a larger variance than the scipy solution
+    return bool(opt['success'] \
+        and np.allclose(weights, opt['x'], atol = 1e-4) \
+        and weights.dot(covariance).dot(weights) <= opt['fun'] + 1e-10)
+
+# the last security was just added, its covariance with the others is NaN
+sparse_returns = pd.DataFrame(np.random.RandomState(3).normal(0.001, 0.02, (20, 4)), columns = ['A', 'B', 'C', 'D'])
+sparse_returns.iloc[:-1, 3] = np.nan
+
+def rejects_non_finite_covariance():
+    return QuadraticProgramSolver().Solve(sparse_returns.cov(), [np.ones(4), expected_returns], [1, 0.06], 0, 1) is None
+
+def falls_back_to_equal_weights(name):
+    if name == 'BlackLitterman':
+        model = BlackLittermanOptimizationPortfolioConstructionModel()
+        Pi, Sigma = model.get_equilibrium_return(sparse_returns)
+        Pi, Sigma = model.apply_blacklitterman_master_formula(Pi, Sigma, np.array([[1., 0., 0., 0.]]), np.array([0.01]))
+        weights = model.optimizer.Optimize(sparse_returns, Pi, Sigma)
+    else:
+        optimizer = MaximumSharpeRatioPortfolioOptimizer() if name == 'MaximumSharpeRatio' else MinimumVariancePortfolioOptimizer()
+        weights = optimizer.Optimize(sparse_returns)
+    return bool(np.allclose(weights, 0.25))
+");
+            }
+        }
+
+        [TestCase(0.06, 0, 1)]
+        [TestCase(0.04, 0, 1)]
+        [TestCase(0.10, 0, 0.4)]
+        [TestCase(0.05, 0.1, 0.5)]
+        [TestCase(0.03, -1, 1)]
+        [TestCase(0.12, -0.5, 1)]
+        public void SolutionSatisfiesEqualityAndBoundConstraints(double targetReturn, double minimumWeight, double maximumWeight)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.satisfies_constraints(targetReturn, minimumWeight, maximumWeight));
+            }
+        }
+
+        [TestCase(0.20, 0, 1)]
+        [TestCase(0.01, 0, 1)]
+        [TestCase(0.12, 0, 0.4)]
+        [TestCase(0.03, 0.1, 0.5)]
+        public void ReturnsNoneForInfeasibleTargetReturn(double targetReturn, double minimumWeight, double maximumWeight)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.is_infeasible(targetReturn, minimumWeight, maximumWeight));
+            }
+        }
+
+        [TestCase(0.06, 0, 1)]
+        [TestCase(0.04, 0, 1)]
+        [TestCase(0.10, 0, 0.4)]
+        [TestCase(0.05, 0.1, 0.5)]
+        [TestCase(0.03, -1, 1)]
+        [TestCase(0.12, -0.5, 1)]
+        public void MatchesScipyMinimizeWeights(double targetReturn, double minimumWeight, double maximumWeight)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.matches_scipy(targetReturn, minimumWeight, maximumWeight));
+            }
+        }
+
+        [Test]
+        public void ReturnsNoneForNonFiniteCovariance()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.rejects_non_finite_covariance());
+            }
+        }
+
+        [TestCase("MaximumSharpeRatio")]
+        [TestCase("MinimumVariance")]
+        [TestCase("BlackLitterman")]
+        public void OptimizersFallBackToEqualWeightsForNonFiniteCovariance(string optimizer)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.falls_back_to_equal_weights(optimizer));
+            }
+        }
+    }
+}
@@ -109,6 +109,29 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(expected, actual, 0.000001);
         }
 
+        [Test]
+        public void PythonReturnsWindowKeepsTheLatestReturnsInOrder()
+        {
+            var code = @"
+from Portfolio.ReturnsWindow import ReturnsWindow
+
+def GetReturns():
+    window = ReturnsWindow(3)
+    evicted = [window.Add(time, 10. * time) for time in range(5)]
+    window.SetLast(-1)
+    return list(window.Times), list(window.Values), [x[0] for x in evicted if x is not None], window.IsReady";
+
+            using (Py.GIL())
+            {
+                var result = PyModule.FromString("GetReturns", code).GetAttr("GetReturns").Invoke();
+
+                CollectionAssert.AreEqual(new[] { 2, 3, 4 }, result.GetItem(0).As<int[]>());
+                CollectionAssert.AreEqual(new[] { 20d, 30d, -1d }, result.GetItem(1).As<double[]>());
+                CollectionAssert.AreEqual(new[] { 0, 1 }, result.GetItem(2).As<int[]>());
+                Assert.IsTrue(result.GetItem(3).As<bool>());
+            }
+        }
+
         [Test]
         public void DuplicateKeyPortfolioConstructionModelDoesNotThrow()
         {
@@ -0,0 +1,116 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class RollingCovarianceEstimatorTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("RollingCovarianceEstimatorTests", @"
+import numpy as np
+import pandas as pd
+from Portfolio.RollingCovarianceEstimator import RollingCovarianceEstimator
+
+def add_and_remove(estimator, offset, steps, period, seed):
+    '''Adds returns around the offset, randomly skipping and removing securities, and keeps the expected returns in a DataFrame'''
+    random = np.random.RandomState(seed)
+    keys = ['S%d' % i for i in range(6)]
+    returns = {key: {} for key in keys}
+    for time in range(steps):
+        for key in keys:
+            if random.rand() < 0.9:
+                value = offset + 0.01 * random.randn()
+                estimator.Add(key, time, value)
+                returns[key][time] = value
+                if len(returns[key]) > period:
+                    del returns[key][min(returns[key])]
+        if random.rand() < 0.01:
+            key = keys[random.randint(len(keys))]
+            estimator.Remove(key)
+            returns[key] = {}
+        if time % 7 == 0:
+            # reads apply the pending changes
+            estimator.Covariance([key for key in keys if estimator.Contains(key)])
+    return pd.DataFrame({key: pd.Series(values) for key, values in returns.items() if values})
+
+def matches_pandas(offset, steps, period):
+    estimator = RollingCovarianceEstimator(period)
+    returns = add_and_remove(estimator, offset, steps, period, 1)
+    keys = list(returns.columns)
+    covariance = returns.cov().values
+    return bool(np.allclose(estimator.Mean(keys).values, returns.mean().values, rtol=1e-12, atol=1e-15)
+        and np.allclose(estimator.Covariance(keys).values, covariance, rtol=1e-9, atol=1e-9 * np.abs(covariance).max()))
+
+def matches_ledoit_wolf(offset, steps, period):
+    estimator = RollingCovarianceEstimator(period, 'ledoit-wolf')
+    random = np.random.RandomState(2)
+    keys = ['S%d' % i for i in range(6)]
+    returns = []
+    for time in range(steps):
+        values = offset + 0.01 * random.randn(len(keys))
+        for key, value in zip(keys, values):
+            estimator.Add(key, time, value)
+        returns.append(values)
+    returns = np.array(returns[-period:])
+
+    # Ledoit and Wolf (2004), as in sklearn.covariance.ledoit_wolf
+    observations, size = returns.shape
+    demeaned = returns - returns.mean(axis=0)
+    sample = demeaned.T.dot(demeaned) / observations
+    target = np.trace(sample) / size
+    distance = np.sum((sample - target * np.eye(size)) ** 2)
+    variance = np.sum([np.sum((np.outer(x, x) - sample) ** 2) for x in demeaned]) / observations ** 2
+    intensity = min(variance, distance) / distance
+
+    covariance = np.cov(returns, rowvar=False)
+    expected = (1 - intensity) * covariance + intensity * np.trace(covariance) / size * np.eye(size)
+    return bool(np.allclose(estimator.Covariance(keys).values, expected, rtol=1e-9, atol=1e-9 * np.abs(expected).max()))
+");
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(1)]
+        [TestCase(100)]
+        public void MeanAndCovarianceMatchPandasAfterManyUpdates(double offset)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.matches_pandas(offset, 2000, 50));
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(1)]
+        [TestCase(100)]
+        public void LedoitWolfShrinkageMatchesReference(double offset)
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.matches_ledoit_wolf(offset, 500, 50));
+            }
+        }
+    }
+}
@@ -0,0 +1,86 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using NUnit.Framework;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Securities;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class SectorIndexTests
+    {
+        [Test]
+        public void KeepsTheSecuritiesWithHoldingsOfEachSector()
+        {
+            var msft = GetSecurity(Symbols.MSFT, 10m);
+            var ibm = GetSecurity(Symbols.IBM, 20m);
+            var spy = GetSecurity(Symbols.SPY, 30m);
+
+            var sectorIndex = new SectorIndex();
+            Assert.IsTrue(sectorIndex.Add(msft, "A"));
+            Assert.IsTrue(sectorIndex.Add(ibm, "A"));
+            Assert.IsTrue(sectorIndex.Add(spy, "B"));
+            Assert.IsFalse(sectorIndex.Add(GetSecurity(Symbols.AAPL, 1m), null));
+
+            Assert.AreEqual(2, sectorIndex.SectorCount);
+            CollectionAssert.AreEquivalent(new[] { msft, ibm }, sectorIndex.GetSecurities("A"));
+            Assert.AreEqual(0m, sectorIndex.GetAbsoluteHoldingsValue("A"));
+
+            // fills update the securities with holdings
+            msft.Holdings.SetHoldings(10m, 5);
+            spy.Holdings.SetHoldings(30m, -2);
+            CollectionAssert.AreEqual(new[] { msft }, sectorIndex.GetInvestedSecurities("A"));
+            Assert.AreEqual(50m, sectorIndex.GetAbsoluteHoldingsValue("A"));
+            Assert.AreEqual(60m, sectorIndex.GetAbsoluteHoldingsValue("B"));
+
+            msft.Holdings.SetHoldings(10m, 0);
+            Assert.IsEmpty(sectorIndex.GetInvestedSecurities("A"));
+
+            // removed securities leave their sector and stop being tracked
+            Assert.IsTrue(sectorIndex.Remove(Symbols.SPY));
+            spy.Holdings.SetHoldings(30m, 1);
+            Assert.AreEqual(1, sectorIndex.SectorCount);
+            Assert.IsFalse(sectorIndex.ContainsKey(Symbols.SPY));
+            Assert.AreEqual(0m, sectorIndex.GetAbsoluteHoldingsValue("B"));
+
+            string sectorCode;
+            Assert.IsTrue(sectorIndex.Add(ibm, "C"));
+            Assert.IsTrue(sectorIndex.TryGetSectorCode(Symbols.IBM, out sectorCode));
+            Assert.AreEqual("C", sectorCode);
+            CollectionAssert.AreEquivalent(new[] { "A", "C" }, sectorIndex.SectorCodes.ToList());
+        }
+
+        private static Security GetSecurity(Symbol symbol, decimal price)
+        {
+            var timezone = TimeZones.NewYork;
+            var security = new Security(
+                SecurityExchangeHours.AlwaysOpen(timezone),
+                new SubscriptionDataConfig(typeof(TradeBar), symbol, Resolution.Daily, timezone, timezone, true, false, false),
+                new Cash(Currencies.USD, 0, 1),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache()
+            );
+            security.SetMarketPrice(new Tick(new DateTime(2018, 8, 7), symbol, price, price));
+            return security;
+        }
+    }
+}
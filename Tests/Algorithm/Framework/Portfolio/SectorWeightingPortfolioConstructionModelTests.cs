@@ -282,13 +282,14 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
         {
             if (language == Language.CSharp)
             {
-                return new SectorWeightingPortfolioConstructionModel(paramenter);
+                return new SectorWeightingPortfolioConstructionModel(paramenter) { Incremental = Incremental };
             }
 
             using (Py.GIL())
             {
                 const string name = nameof(SectorWeightingPortfolioConstructionModel);
                 var instance = Py.Import(name).GetAttr(name).Invoke(((object)paramenter).ToPython());
+                instance.SetAttr("Incremental", Incremental.ToPython());
                 return new PortfolioConstructionModelPythonWrapper(instance);
             }
         }
@@ -0,0 +1,136 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Selection
+{
+    [TestFixture]
+    public class UncorrelatedUniverseSelectionModelTests
+    {
+        private dynamic _module;
+
+        [OneTimeSetUp]
+        public void Setup()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("UncorrelatedUniverseSelectionModelTests", @"
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from UncorrelatedUniverseSelectionModel import UncorrelatedUniverseSelectionModel
+
+window_length, history_length, threshold, number_of_symbols = 5, 12, 0.3, 3
+benchmark = 'SPY'
+symbols = ['S%d' % i for i in range(8)]
+
+# the returns of the symbols follow the benchmark with different noise, so their correlations are above and below the threshold
+random = np.random.RandomState(11)
+days = 40
+benchmark_returns = random.normal(0, 0.01, days)
+returns = np.array([benchmark_returns + random.normal(0, 0.004 * (i + 1), days) for i in range(len(symbols))])
+prices = pd.DataFrame(100 * np.cumprod(1 + returns, axis = 1).T, columns = symbols)
+prices[benchmark] = 100 * np.cumprod(1 + benchmark_returns)
+times = [datetime(2020, 1, 1) + timedelta(i) for i in range(days)]
+
+class Coarse:
+    def __init__(self, symbol, time, price, dollar_volume):
+        self.Symbol = symbol
+        self.EndTime = time
+        self.Price = self.AdjustedPrice = price
+        self.Volume = 1000
+        self.DollarVolume = dollar_volume
+        self.HasFundamentalData = True
+
+class Algorithm:
+    def WideHistory(self, symbols, periods, resolution):
+        return pd.DataFrame()
+
+def reference_z_scores(day):
+    '''Z-Scores of the latest correlation of each symbol, computed with pandas rolling correlations like the model did
+    before the rolling correlation engine: the correlations of the last history length days, once the prices of the
+    history length days are known'''
+    z_scores = {}
+    for symbol in symbols:
+        if day < history_length - 1:
+            z_scores[symbol] = 0
+            continue
+        frame = pd.DataFrame({'A': prices[symbol][:day + 1], 'B': prices[benchmark][:day + 1]}).pct_change().dropna()
+        correlation = frame.rolling(window_length, min_periods = window_length).corr()['B'].dropna().unstack()['A']
+        correlation = correlation.tail(history_length)
+        mean = correlation.mean()
+        z_scores[symbol] = 0 if mean < threshold else abs(correlation.iloc[-1] - mean) / correlation.std()
+    return z_scores
+
+def matches_reference(first_day, last_day):
+    '''Runs the model from the first day and compares the selected symbols and the Z-Scores from the first to the last day'''
+    model = UncorrelatedUniverseSelectionModel(benchmark, len(symbols), number_of_symbols, window_length, history_length, threshold)
+    algorithm = Algorithm()
+    for day in range(last_day + 1):
+        coarse = [Coarse(symbol, times[day], prices[symbol][day], 1000 * (i + 1)) for i, symbol in enumerate(symbols + [benchmark])]
+        selected = model.SelectCoarse(algorithm, coarse)
+        if day < first_day:
+            continue
+
+        expected = reference_z_scores(day)
+        z_scores = model.correlations.GetZScores(symbols, threshold)
+        if not np.allclose(z_scores, [expected[symbol] for symbol in symbols], rtol = 1e-9, atol = 1e-12):
+            return False
+
+        positive = sorted([kvp for kvp in expected.items() if kvp[1] > 0], key = lambda kvp: kvp[1], reverse = True)
+        if sorted(selected) != sorted(symbol for symbol, value in positive[:number_of_symbols]):
+            return False
+    return True
+
+def selects_symbols(day):
+    '''Checks the scenario isn't trivial: some symbols are selected and some are discarded by the threshold'''
+    values = reference_z_scores(day).values()
+    return any(value > 0 for value in values) and any(value == 0 for value in values)
+");
+            }
+        }
+
+        [Test]
+        public void ScenarioSelectsAndDiscardsSymbols()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.selects_symbols(20));
+                Assert.IsTrue((bool)_module.selects_symbols(39));
+            }
+        }
+
+        [Test]
+        public void MatchesPandasRollingCorrelationWhileTheHistoryGrows()
+        {
+            using (Py.GIL())
+            {
+                // the symbols are ready at the day 11 with 7 correlations, the history of correlations is full at the day 16
+                Assert.IsTrue((bool)_module.matches_reference(0, 23));
+            }
+        }
+
+        [Test]
+        public void MatchesPandasRollingCorrelationOnceTheHistoryIsFull()
+        {
+            using (Py.GIL())
+            {
+                Assert.IsTrue((bool)_module.matches_reference(24, 39));
+            }
+        }
+    }
+}
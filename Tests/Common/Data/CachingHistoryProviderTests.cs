@@ -0,0 +1,179 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NodaTime;
+using NUnit.Framework;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Securities;
+using HistoryRequest = QuantConnect.Data.HistoryRequest;
+
+namespace QuantConnect.Tests.Common.Data
+{
+    [TestFixture]
+    public class CachingHistoryProviderTests
+    {
+        private static readonly DateTime Start = new DateTime(2013, 10, 7, 13, 30, 0);
+
+        [Test]
+        public void ServesOverlappingRequestsFromCache()
+        {
+            var provider = new MinuteBarHistoryProvider();
+            var cache = new CachingHistoryProvider(provider, 1024 * 1024);
+
+            var first = cache.GetHistory(new[] { GetRequest(Symbols.SPY, 0, 60) }, TimeZones.NewYork).ToList();
+            // the same look back a few minutes later only reads the missing tail
+            var second = cache.GetHistory(new[] { GetRequest(Symbols.SPY, 10, 70) }, TimeZones.NewYork).ToList();
+            // contained in the cached window
+            var third = cache.GetHistory(new[] { GetRequest(Symbols.SPY, 20, 50) }, TimeZones.NewYork).ToList();
+
+            Assert.AreEqual(1, cache.Misses);
+            Assert.AreEqual(1, cache.PartialHits);
+            Assert.AreEqual(1, cache.Hits);
+            Assert.AreEqual(2, provider.Requests.Count);
+            Assert.AreEqual(Start.AddMinutes(59), provider.Requests[1].StartTimeUtc);
+
+            AssertAreEqual(provider.GetHistory(new[] { GetRequest(Symbols.SPY, 0, 60) }, TimeZones.NewYork), first);
+            AssertAreEqual(provider.GetHistory(new[] { GetRequest(Symbols.SPY, 10, 70) }, TimeZones.NewYork), second);
+            AssertAreEqual(provider.GetHistory(new[] { GetRequest(Symbols.SPY, 20, 50) }, TimeZones.NewYork), third);
+        }
+
+        [Test]
+        public void ReadsEntireWindowWhenStartIsNotCached()
+        {
+            var provider = new MinuteBarHistoryProvider();
+            var cache = new CachingHistoryProvider(provider, 1024 * 1024);
+
+            cache.GetHistory(new[] { GetRequest(Symbols.SPY, 10, 60) }, TimeZones.NewYork).ToList();
+            var history = cache.GetHistory(new[] { GetRequest(Symbols.SPY, 0, 60), GetRequest(Symbols.AAPL, 0, 60) }, TimeZones.NewYork).ToList();
+
+            Assert.AreEqual(3, cache.Misses);
+            Assert.AreEqual(0, cache.PartialHits + cache.Hits);
+            Assert.AreEqual(60, history.Count);
+            Assert.IsTrue(history.All(slice => slice.Bars.Count == 2));
+        }
+
+        [Test]
+        public void EvictsLeastRecentlyUsedEntries()
+        {
+            var provider = new MinuteBarHistoryProvider();
+            // room for a single 60 bar entry
+            var cache = new CachingHistoryProvider(provider, 100 * 144);
+
+            cache.GetHistory(new[] { GetRequest(Symbols.SPY, 0, 60) }, TimeZones.NewYork).ToList();
+            cache.GetHistory(new[] { GetRequest(Symbols.AAPL, 0, 60) }, TimeZones.NewYork).ToList();
+            cache.GetHistory(new[] { GetRequest(Symbols.AAPL, 0, 60) }, TimeZones.NewYork).ToList();
+            cache.GetHistory(new[] { GetRequest(Symbols.SPY, 0, 60) }, TimeZones.NewYork).ToList();
+
+            Assert.AreEqual(1, cache.Hits);
+            Assert.AreEqual(3, cache.Misses);
+            Assert.AreEqual(60 * 144, cache.SizeInBytes);
+
+            cache.Clear();
+            Assert.AreEqual(0, cache.SizeInBytes);
+        }
+
+        [Test]
+        public void CachedHistoryKeepsCorporateActions()
+        {
+            var provider = new MinuteBarHistoryProvider();
+            // a split inside the first window, a dividend at its end, read again with the tail, and a split in the tail
+            provider.AuxiliaryData.Add(new Split(Symbols.SPY, Start.AddMinutes(30), 30m, 0.5m, SplitType.SplitOccurred));
+            provider.AuxiliaryData.Add(new Dividend(Symbols.SPY, Start.AddMinutes(60), 0.25m, 60m));
+            provider.AuxiliaryData.Add(new Split(Symbols.SPY, Start.AddMinutes(65), 65m, 0.5m, SplitType.SplitOccurred));
+            var cache = new CachingHistoryProvider(provider, 1024 * 1024);
+
+            foreach (var window in new[] { (0, 60), (10, 70), (20, 50), (40, 70) })
+            {
+                var request = GetRequest(Symbols.SPY, window.Item1, window.Item2);
+                var expected = provider.GetHistory(new[] { request }, TimeZones.NewYork).ToList();
+                var actual = cache.GetHistory(new[] { request }, TimeZones.NewYork).ToList();
+
+                AssertAreEqual(expected, actual);
+                CollectionAssert.AreEqual(GetAuxiliaryData(expected), GetAuxiliaryData(actual));
+            }
+            Assert.AreEqual(3, cache.Hits + cache.PartialHits);
+        }
+
+        private static List<string> GetAuxiliaryData(List<Slice> slices)
+        {
+            return slices
+                .SelectMany(slice => slice.Splits.Values.Cast<BaseData>().Concat(slice.Dividends.Values)
+                    .Select(data => $"{slice.UtcTime:O} {data.GetType().Name} {data.Symbol} {data.EndTime:O} {data.Value}"))
+                .ToList();
+        }
+
+        private static void AssertAreEqual(IEnumerable<Slice> expected, List<Slice> actual)
+        {
+            var expectedBars = expected.SelectMany(slice => slice.Bars.Values).ToList();
+            var actualBars = actual.SelectMany(slice => slice.Bars.Values).ToList();
+
+            Assert.AreEqual(expectedBars.Count, actualBars.Count);
+            for (var i = 0; i < expectedBars.Count; i++)
+            {
+                Assert.AreEqual(expectedBars[i].Symbol, actualBars[i].Symbol);
+                Assert.AreEqual(expectedBars[i].EndTime, actualBars[i].EndTime);
+                Assert.AreEqual(expectedBars[i].Close, actualBars[i].Close);
+            }
+        }
+
+        private static HistoryRequest GetRequest(Symbol symbol, int startMinute, int endMinute)
+        {
+            return new HistoryRequest(Start.AddMinutes(startMinute), Start.AddMinutes(endMinute), typeof(TradeBar), symbol,
+                Resolution.Minute, SecurityExchangeHours.AlwaysOpen(TimeZones.Utc), TimeZones.Utc, null, false, false,
+                DataNormalizationMode.Adjusted, TickType.Trade);
+        }
+
+        /// <summary>
+        /// Emits one trade bar per minute of each request, closing at the minutes since <see cref="Start"/>, and the auxiliary data in the requested window
+        /// </summary>
+        private class MinuteBarHistoryProvider : HistoryProviderBase
+        {
+            public List<HistoryRequest> Requests { get; } = new();
+
+            public List<BaseData> AuxiliaryData { get; } = new();
+
+            public override int DataPointCount => 0;
+
+            public override void Initialize(HistoryProviderInitializeParameters parameters)
+            {
+            }
+
+            public override IEnumerable<Slice> GetHistory(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone)
+            {
+                var requestList = requests.ToList();
+                Requests.AddRange(requestList);
+
+                return requestList
+                    .SelectMany(request => Enumerable.Range(0, (int)(request.EndTimeUtc - request.StartTimeUtc).TotalMinutes)
+                        .Select(i =>
+                        {
+                            var time = request.StartTimeUtc.AddMinutes(i);
+                            var price = (decimal)(time - Start).TotalMinutes;
+                            return (BaseData)new TradeBar(time, request.Symbol, price, price, price, price, 100, Time.OneMinute);
+                        })
+                        .Concat(AuxiliaryData.Where(data => data.Symbol == request.Symbol
+                            && data.EndTime > request.StartTimeUtc && data.EndTime <= request.EndTimeUtc)))
+                    .GroupBy(data => data.EndTime)
+                    .OrderBy(group => group.Key)
+                    .Select(group => new Slice(group.Key.ConvertFromUtc(sliceTimeZone), group.ToList<BaseData>(), group.Key))
+                    .ToList();
+            }
+        }
+    }
+}
@@ -199,5 +199,24 @@ namespace QuantConnect.Tests.Common
             Assert.IsFalse(SymbolCache.TryGetSymbol("SPY", out symbol));
             Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.SPY, out ticker));
         }
+
+        [Test]
+        public void VersionChangesOnlyWhenMappingsChange()
+        {
+            var version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreEqual(version, SymbolCache.Version);
+
+            SymbolCache.TryRemove("SPY");
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            SymbolCache.Clear();
+            Assert.AreNotEqual(version, SymbolCache.Version);
+        }
     }
 }
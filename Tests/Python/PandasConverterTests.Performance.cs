@@ -0,0 +1,191 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Logging;
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public partial class PandasConverterTests
+    {
+        private const string EqualsModule = @"
+import pandas as pd
+
+def Equals(dataFrame, other):
+    pd.testing.assert_frame_equal(dataFrame.sort_index(axis=1), other.sort_index(axis=1))
+    return True";
+
+        [TestCase(1)]
+        [TestCase(3)]
+        public void ColumnarConversionMatchesTupleBasedConversion(int symbolCount)
+        {
+            var symbols = Enumerable.Range(0, symbolCount)
+                .Select(i => Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA))
+                .ToList();
+            var slices = GetTradeAndQuoteBarSlices(symbols, 100, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                dynamic module = PyModule.FromString("testModule", EqualsModule);
+                var dataFrame = _converter.GetDataFrame(slices);
+                var legacy = LegacyDataFrame(slices);
+
+                Assert.IsTrue((bool)module.Equals(dataFrame, legacy));
+            }
+        }
+
+        [Test, Explicit("Performance test")]
+        public void ColumnarConversionPerformance()
+        {
+            var symbols = Enumerable.Range(0, 500)
+                .Select(i => Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA))
+                .ToList();
+            var slices = GetTradeAndQuoteBarSlices(symbols, 2000, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                dynamic module = PyModule.FromString("testModule", EqualsModule);
+
+                var stopwatch = Stopwatch.StartNew();
+                var dataFrame = _converter.GetDataFrame(slices);
+                stopwatch.Stop();
+                var columnarElapsed = stopwatch.ElapsedMilliseconds;
+
+                stopwatch.Restart();
+                var legacy = LegacyDataFrame(slices);
+                stopwatch.Stop();
+
+                Log.Trace($"PandasConverterTests.ColumnarConversionPerformance(): columnar conversion took {columnarElapsed}ms. " +
+                    $"Tuple based index and boxed series took {stopwatch.ElapsedMilliseconds}ms. Slices: {slices.Count}. Symbols: {symbols.Count}");
+
+                Assert.IsTrue((bool)module.Equals(dataFrame, legacy));
+            }
+        }
+
+        /// <summary>
+        /// Builds the data frame of trade and quote bars the way the converter used to:
+        /// one boxed value per cell, one python tuple per row and a MultiIndex.from_tuples per column
+        /// </summary>
+        private static PyObject LegacyDataFrame(IEnumerable<Slice> slices)
+        {
+            var seriesBySymbol = new Dictionary<Symbol, Dictionary<string, Tuple<List<DateTime>, List<object>>>>();
+            foreach (var slice in slices)
+            {
+                foreach (var symbol in slice.Keys)
+                {
+                    Dictionary<string, Tuple<List<DateTime>, List<object>>> series;
+                    if (!seriesBySymbol.TryGetValue(symbol, out series))
+                    {
+                        seriesBySymbol[symbol] = series = new Dictionary<string, Tuple<List<DateTime>, List<object>>>();
+                    }
+
+                    Action<string, DateTime, decimal> add = (key, time, value) =>
+                    {
+                        Tuple<List<DateTime>, List<object>> serie;
+                        if (!series.TryGetValue(key, out serie))
+                        {
+                            series[key] = serie = Tuple.Create(new List<DateTime>(), new List<object>());
+                        }
+                        serie.Item1.Add(time);
+                        serie.Item2.Add(value.ConvertInvariant<double>());
+                    };
+
+                    var tradeBar = slice.Bars.ContainsKey(symbol) ? slice.Bars[symbol] : null;
+                    var quoteBar = slice.QuoteBars.ContainsKey(symbol) ? slice.QuoteBars[symbol] : null;
+                    if (tradeBar != null)
+                    {
+                        add("open", tradeBar.EndTime, tradeBar.Open);
+                        add("high", tradeBar.EndTime, tradeBar.High);
+                        add("low", tradeBar.EndTime, tradeBar.Low);
+                        add("close", tradeBar.EndTime, tradeBar.Close);
+                        add("volume", tradeBar.EndTime, tradeBar.Volume);
+                    }
+                    if (quoteBar != null)
+                    {
+                        if (tradeBar == null)
+                        {
+                            add("open", quoteBar.EndTime, quoteBar.Open);
+                            add("high", quoteBar.EndTime, quoteBar.High);
+                            add("low", quoteBar.EndTime, quoteBar.Low);
+                            add("close", quoteBar.EndTime, quoteBar.Close);
+                        }
+                        add("askopen", quoteBar.EndTime, quoteBar.Ask.Open);
+                        add("askhigh", quoteBar.EndTime, quoteBar.Ask.High);
+                        add("asklow", quoteBar.EndTime, quoteBar.Ask.Low);
+                        add("askclose", quoteBar.EndTime, quoteBar.Ask.Close);
+                        add("asksize", quoteBar.EndTime, quoteBar.LastAskSize);
+                        add("bidopen", quoteBar.EndTime, quoteBar.Bid.Open);
+                        add("bidhigh", quoteBar.EndTime, quoteBar.Bid.High);
+                        add("bidlow", quoteBar.EndTime, quoteBar.Bid.Low);
+                        add("bidclose", quoteBar.EndTime, quoteBar.Bid.Close);
+                        add("bidsize", quoteBar.EndTime, quoteBar.LastBidSize);
+                    }
+                }
+            }
+
+            dynamic pandas = Py.Import("pandas");
+            var names = new[] { "symbol", "time" };
+            var dataFrames = new List<PyObject>();
+            foreach (var kvp in seriesBySymbol)
+            {
+                var id = kvp.Key.ID.ToString().ToPython();
+                var pyDict = new PyDict();
+                foreach (var serie in kvp.Value)
+                {
+                    // the legacy conversion skips the columns whose values are all zero
+                    if (serie.Value.Item2.All(x => ((double)x).IsNaNOrZero())) continue;
+
+                    var tuples = serie.Value.Item1.Select(x => new PyTuple(new[] { id, x.ToPython() })).ToArray();
+                    var index = pandas.MultiIndex.from_tuples(tuples, names: names);
+                    pyDict.SetItem(serie.Key, pandas.Series(serie.Value.Item2, index));
+                }
+                dataFrames.Add(pandas.DataFrame(pyDict));
+            }
+            return pandas.concat(dataFrames.ToArray(), Py.kw("sort", true));
+        }
+
+        private static List<Slice> GetTradeAndQuoteBarSlices(List<Symbol> symbols, int count, Resolution resolution)
+        {
+            var period = resolution.ToTimeSpan();
+            var time = new DateTime(2013, 10, 7, 9, 30, 0);
+            var slices = new List<Slice>(count);
+            for (var i = 0; i < count; i++)
+            {
+                var data = new List<BaseData>();
+                foreach (var symbol in symbols)
+                {
+                    var price = 100m + i % 17;
+                    data.Add(new TradeBar(time, symbol, price, price + 1, price - 1, price + 0.5m, 1000 + i, period));
+                    data.Add(new QuoteBar(time, symbol,
+                        new Bar(price - 0.1m, price + 0.9m, price - 1.1m, price + 0.4m), 10 + i,
+                        new Bar(price + 0.1m, price + 1.1m, price - 0.9m, price + 0.6m), 20 + i,
+                        period));
+                }
+                time += period;
+                slices.Add(new Slice(time, data, time));
+            }
+            return slices;
+        }
+    }
+}
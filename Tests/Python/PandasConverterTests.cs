@@ -19,6 +19,7 @@ using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Data.Custom;
 using QuantConnect.Data.Custom.IconicTypes;
+using QuantConnect.Data.Fundamental;
 using QuantConnect.Data.Market;
 using QuantConnect.Data.UniverseSelection;
 using QuantConnect.Lean.Engine.DataFeeds;
@@ -26,6 +27,7 @@ using QuantConnect.Python;
 using QuantConnect.Securities;
 using System;
 using System.Globalization;
+using System.IO;
 using System.Collections.Generic;
 using System.Linq;
 using QuantConnect.Tests.Common.Data.UniverseSelection;
@@ -3633,6 +3635,293 @@ def DataFrameIsEmpty():
             }
         }
 
+        [Test]
+        public void LazyDataFrameConvertsColumnsOnDemand()
+        {
+            var symbols = new[] { Symbols.SPY, Symbols.AAPL };
+            var slices = GetTradeAndQuoteBarSlices(symbols.ToList(), 10, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+def Test(lazy, dataFrame):
+    if lazy.empty or 'close' not in lazy:
+        return False
+    if not lazy.close.equals(dataFrame.close) or not lazy['askclose'].equals(dataFrame['askclose']):
+        return False
+    # columns were converted without converting the full frame
+    if lazy._frame is not None:
+        return False
+    # any other usage converts the full frame
+    return lazy.shape == dataFrame.shape and lazy.loc['SPY'].equals(dataFrame.loc['SPY'])").GetAttr("Test");
+
+                SymbolCache.Set("SPY", Symbols.SPY);
+                var lazy = _converter.GetLazyDataFrame(slices);
+                var dataFrame = _converter.GetDataFrame(slices);
+
+                Assert.IsTrue((bool)test(lazy, dataFrame));
+            }
+        }
+
+        [Test]
+        public void DataFrameWithRequestedColumnsOnlyHoldsThem()
+        {
+            var slices = GetTradeAndQuoteBarSlices(new List<Symbol> { Symbols.SPY, Symbols.AAPL }, 10, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+def Test(projected, dataFrame):
+    if sorted(projected.columns) != ['askclose', 'close']:
+        return False
+    return projected.equals(dataFrame[['askclose', 'close']])").GetAttr("Test");
+
+                // column names are not case sensitive and unknown columns are ignored
+                var projected = _converter.GetDataFrame(slices, new[] { "close", "AskClose", "unknown" });
+                var dataFrame = _converter.GetDataFrame(slices);
+
+                Assert.IsTrue((bool)test(projected, dataFrame));
+            }
+        }
+
+        [TestCase(1)]
+        [TestCase(2)]
+        public void WideDataFrameMatchesUnstackedColumn(int aaplPeriod)
+        {
+            var time = new DateTime(2013, 10, 7, 9, 30, 0);
+            var slices = new List<Slice>();
+            for (var i = 0; i < 20; i++)
+            {
+                var data = new List<BaseData> { new TradeBar(time, Symbols.SPY, 100 + i, 101 + i, 99 + i, 100.5m + i, 1000, Time.OneMinute) };
+                // AAPL is missing some bars, the wide frame has NaN where the unstacked frame does
+                if (i % aaplPeriod == 0)
+                {
+                    data.Add(new TradeBar(time, Symbols.AAPL, 10 + i, 11 + i, 9 + i, 10.5m + i, 2000, Time.OneMinute));
+                }
+                time += Time.OneMinute;
+                slices.Add(new Slice(time, data, time));
+            }
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+def Test(wide, dataFrame):
+    expected = dataFrame.close.unstack(level=0)
+    return wide.equals(expected) and list(wide.columns) == list(expected.columns) \
+        and wide.index.names == expected.index.names and wide.columns.names == expected.columns.names").GetAttr("Test");
+
+                var wide = _converter.GetWideDataFrame(slices);
+                var dataFrame = _converter.GetDataFrame(slices);
+
+                Assert.IsTrue((bool)test(wide, dataFrame));
+            }
+        }
+
+        [TestCase(1)]
+        [TestCase(3)]
+        public void ArrowTableMatchesDataFrame(int symbolCount)
+        {
+            var symbols = Enumerable.Range(0, symbolCount)
+                .Select(i => Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA))
+                .ToList();
+            var slices = GetTradeAndQuoteBarSlices(symbols, 50, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                // pyarrow is optional, it's not part of the foundation image
+                try
+                {
+                    Py.Import("pyarrow").Dispose();
+                }
+                catch (PythonException)
+                {
+                    Assert.Ignore("The pyarrow package is not installed");
+                }
+
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import pandas as pd
+import pyarrow as pa
+
+def Test(table, dataFrame, converter, path):
+    assert isinstance(table, pa.Table)
+    assert table.column_names[:2] == ['symbol', 'time']
+    expected = dataFrame.sort_index(axis=1)
+    pd.testing.assert_frame_equal(table.to_pandas().set_index(['symbol', 'time']).sort_index(axis=1), expected)
+    # the parquet file is read back as the history data frame
+    converter.ToParquet(table, path)
+    pd.testing.assert_frame_equal(converter.ReadParquet(path, 'pandas').sort_index(axis=1), expected)
+    return True").GetAttr("Test");
+
+                var path = Path.Combine(Path.GetTempPath(), $"{nameof(ArrowTableMatchesDataFrame)}{symbolCount}.parquet");
+                try
+                {
+                    var table = _converter.GetArrowTable(slices);
+                    var dataFrame = _converter.GetDataFrame(slices);
+
+                    Assert.IsTrue((bool)test(table, dataFrame, _converter, path));
+                }
+                finally
+                {
+                    File.Delete(path);
+                }
+            }
+        }
+
+        [TestCase(1)]
+        [TestCase(3)]
+        public void IndicatorWarmUpWithDataFrameMatchesUpdates(int symbolCount)
+        {
+            var symbols = Enumerable.Range(0, symbolCount)
+                .Select(i => Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA))
+                .ToList();
+            var slices = GetTradeAndQuoteBarSlices(symbols, 50, Resolution.Minute);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+def Test(dataFrame, symbol):
+    return dataFrame.loc[symbol], dataFrame.loc[symbol].close").GetAttr("Test");
+
+                var dataFrame = _converter.GetDataFrame(slices);
+                foreach (var symbol in symbols)
+                {
+                    var expected = new SimpleMovingAverage(10);
+                    foreach (var bar in slices.Select(x => x.Bars[symbol]))
+                    {
+                        expected.Update(bar.EndTime, bar.Close);
+                    }
+
+                    var result = test(dataFrame, symbol);
+                    PyObject frame = result[0];
+                    PyObject series = result[1];
+
+                    var fromFrame = new SimpleMovingAverage(10);
+                    Assert.IsTrue(fromFrame.WarmUp(_converter.GetTimes(frame), _converter.GetValues(frame, "close")));
+                    var fromSeries = new SimpleMovingAverage(10);
+                    Assert.IsTrue(fromSeries.WarmUp(_converter.GetTimes(series), _converter.GetValues(series)));
+
+                    foreach (var actual in new[] { fromFrame, fromSeries })
+                    {
+                        Assert.AreEqual(expected.Samples, actual.Samples);
+                        Assert.AreEqual(expected.Current.Time, actual.Current.Time);
+                        Assert.AreEqual(expected.Current.Value, actual.Current.Value);
+                    }
+                }
+            }
+        }
+
+        [Test]
+        public void LazyDataFrameHandlesEmptyData()
+        {
+            using (Py.GIL())
+            {
+                dynamic lazy = _converter.GetLazyDataFrame(Enumerable.Empty<Slice>());
+                Assert.IsTrue((bool)lazy.empty);
+                Assert.IsTrue((bool)lazy.to_frame().empty);
+            }
+        }
+
+        [Test]
+        public void CoarseFundamentalDataFrameMatchesProperties()
+        {
+            var time = new DateTime(2020, 1, 6);
+            var coarse = Enumerable.Range(0, 5)
+                .Select(i => new CoarseFundamental
+                {
+                    Symbol = Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA),
+                    EndTime = time,
+                    Value = 10 + i,
+                    Volume = 1000 * i,
+                    DollarVolume = 10000m * i + 0.5m,
+                    HasFundamentalData = i % 2 == 0,
+                    PriceFactor = 0.5m
+                })
+                .ToList();
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import numpy as np
+
+def Test(converter, coarse):
+    for data in [coarse, filter(lambda x: True, coarse)]:
+        frame = converter.GetCoarseFundamentalDataFrame(data)
+        assert list(frame.columns) == ['Price', 'AdjustedPrice', 'Volume', 'DollarVolume', 'HasFundamentalData']
+        assert frame.index.name == 'symbol'
+        assert [str(x) for x in frame.index] == [str(x.Symbol) for x in coarse]
+        assert frame.HasFundamentalData.dtype == np.bool_
+        assert np.array_equal(frame.HasFundamentalData.values, [x.HasFundamentalData for x in coarse])
+        for column in ['Price', 'AdjustedPrice', 'Volume', 'DollarVolume']:
+            assert np.array_equal(frame[column].values, [float(getattr(x, column)) for x in coarse]), column
+
+    frame = converter.GetCoarseFundamentalDataFrame(coarse, ['DollarVolume', 'EndTime'])
+    assert list(frame.columns) == ['DollarVolume', 'EndTime']
+    assert (frame.EndTime == np.datetime64('2020-01-06')).all()
+    # the symbols of the index are returned by the selections
+    return frame.index[np.argmax(frame.DollarVolume.values)]").GetAttr("Test");
+
+                PyObject symbol = test(_converter, coarse.ToPython());
+                Assert.AreEqual(coarse.Last().Symbol, symbol.As<Symbol>());
+            }
+        }
+
+        [Test]
+        public void FineFundamentalDataFrameReadsNestedFields()
+        {
+            var time = new DateTime(2020, 1, 6);
+            var fine = Enumerable.Range(0, 3)
+                .Select(i => new FineFundamental
+                {
+                    Symbol = Symbol.Create($"TEST{i}", SecurityType.Equity, Market.USA),
+                    EndTime = time,
+                    Value = 100,
+                    CompanyReference = new CompanyReference { CountryId = "USA", IndustryTemplateCode = i == 1 ? null : "N" },
+                    SecurityReference = new SecurityReference { IPODate = time.AddDays(-i) },
+                    CompanyProfile = new CompanyProfile { MarketCap = 1000 * i },
+                    ValuationRatios = new ValuationRatios { PERatio = 1.5m * i },
+                    EarningReports = new EarningReports { BasicEPS = new BasicEPS { TwelveMonths = 2m * i, ThreeMonths = 1m } }
+                })
+                .ToList();
+            // fields with a null parent property are missing values
+            fine[2].CompanyReference = null;
+            fine[2].SecurityReference.IPODate = DateTime.MinValue;
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import numpy as np
+import pandas as pd
+
+def Test(converter, fine):
+    frame = converter.GetFineFundamentalDataFrame(fine)
+    assert list(frame.columns) == ['MarketCap', 'CompanyReference.CountryId', 'CompanyReference.PrimaryExchangeID',
+        'CompanyReference.IndustryTemplateCode', 'AssetClassification.MorningstarSectorCode', 'SecurityReference.IPODate']
+    assert np.array_equal(frame.MarketCap.values, [0, 1000, 2000])
+    assert list(frame['CompanyReference.CountryId']) == ['USA', 'USA', None]
+    assert list(frame['CompanyReference.IndustryTemplateCode']) == ['N', None, None]
+    ipo = frame['SecurityReference.IPODate']
+    assert ipo.iloc[1] == pd.Timestamp('2020-01-05')
+    # dates before the datetime64 range are clamped, so they still compare as dates far in the past
+    assert ipo.iloc[2] == pd.Timestamp.min
+
+    frame = converter.GetFineFundamentalDataFrame(fine, ['ValuationRatios.PERatio', 'EarningReports.BasicEPS', 'EarningReports.BasicEPS.ThreeMonths'])
+    assert np.array_equal(frame['ValuationRatios.PERatio'].values, [0, 1.5, 3])
+    assert np.array_equal(frame['EarningReports.BasicEPS'].values, [0, 2, 4])
+    assert np.array_equal(frame['EarningReports.BasicEPS.ThreeMonths'].values, [1, 1, 1])
+    return True").GetAttr("Test");
+
+                Assert.IsTrue((bool)test(_converter, fine.ToPython()));
+                Assert.Throws<ArgumentException>(() => _converter.GetFineFundamentalDataFrame(fine.ToPython(), new[] { "ValuationRatios.Missing" }));
+            }
+        }
+
         public IEnumerable<Slice> GetHistory<T>(Symbol symbol, Resolution resolution, IEnumerable<T> data)
             where T : IBaseData
         {
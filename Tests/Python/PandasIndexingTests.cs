@@ -71,5 +71,35 @@ namespace QuantConnect.Tests.Python
                 Assert.IsTrue(exception.Contains("No key found for either mapped or original key. Mapped Key: ['AAPL R735QTJ8XC9X']; Original Key: ['aapl']", StringComparison.InvariantCulture));
             }
         }
+
+        [Test]
+        public void CachedTickerLookupIsInvalidated()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_cached_ticker_lookup_is_invalidated();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void TickerWithSpaceIsMapped()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_ticker_with_space_is_mapped();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void MappingCanBeDisabledPerDataFrame()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapping_disabled();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
     }
 }
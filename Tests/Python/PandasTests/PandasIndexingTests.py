@@ -14,6 +14,7 @@
 from AlgorithmImports import *
 from QuantConnect.Tests import *
 from QuantConnect.Tests.Python import *
+import PandasMapper
 
 # TODO: Rename to PandasResearchTests and keep this class for QB related tests; rename py module to PandasTests
 class PandasIndexingTests():
@@ -58,3 +59,39 @@ class PandasDataFrameTests():
         except KeyError as e:
             return str(e)
 
+
+    def test_cached_ticker_lookup_is_invalidated(self):
+        # A failed lookup is cached, it has to be dropped once the ticker is added to the SymbolCache
+        SymbolCache.TryRemove("AAPL")
+        aapldf = PandasConverter().GetDataFrame(PythonTestingUtils.GetSlices(self.aapl))
+        try:
+            aapldf.loc["AAPL"]
+            return False
+        except KeyError:
+            pass
+
+        SymbolCache.Set("AAPL", self.aapl)
+        # the engine refreshes the resolved tickers once per time step
+        PandasData.RefreshSymbolKeys()
+        return not aapldf.loc["AAPL"].empty
+
+    def test_ticker_with_space_is_mapped(self):
+        # A ticker with a space looks like a SID string, it must still be resolved through the SymbolCache
+        SymbolCache.Set("SPY US", self.spy)
+        PandasData.RefreshSymbolKeys()
+        try:
+            return not self.spydf.loc["SPY US"].empty
+        finally:
+            SymbolCache.TryRemove("SPY US")
+
+    def test_mapping_disabled(self):
+        df = self.spydf.lastprice.unstack(level=0)
+        PandasMapper.disable_mapping(df)
+        try:
+            df["SPY"]
+            return False
+        except KeyError:
+            pass
+
+        # SIDs still work since they are the actual column keys
+        return not df[str(self.spy.ID)].empty
@@ -0,0 +1,64 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+Micro-benchmark of the symbol key resolution done by PandasMapper when indexing Lean created data frames.
+Runs the indexing patterns used by the framework models inside per-symbol loops and reports the time per call.
+
+To run as a solo script follow the instructions in PandasMapperTests.py to load the QuantConnect Dlls
+'''
+
+from clr import AddReference
+AddReference("QuantConnect.Common")
+AddReference("QuantConnect.Tests")
+
+from QuantConnect import *
+from QuantConnect.Python import PandasConverter
+from QuantConnect.Tests import Symbols
+from QuantConnect.Tests.Python import PythonTestingUtils
+
+import PandasMapper
+import pandas as pd
+from timeit import timeit
+
+spy = Symbols.SPY
+aapl = Symbols.AAPL
+SymbolCache.Set("SPY", spy)
+SymbolCache.Set("AAPL", aapl)
+
+pdConverter = PandasConverter()
+df = pd.concat([pdConverter.GetDataFrame(PythonTestingUtils.GetSlices(spy)),
+                pdConverter.GetDataFrame(PythonTestingUtils.GetSlices(aapl))])
+wide = df.lastprice.unstack(level=0)
+sid = str(spy.ID)
+
+iterations = 2000
+
+def report(name, statement):
+    elapsed = timeit(statement, number = iterations)
+    print(f'{name:<45}{1e6 * elapsed / iterations:10.2f} us/call')
+
+report("df.loc[ticker]", lambda: df.loc["SPY"])
+report("df.loc[Symbol]", lambda: df.loc[spy])
+report("df.loc[SID]", lambda: df.loc[sid])
+report("df['lastprice'] (reserved column)", lambda: df['lastprice'])
+report("wide[ticker]", lambda: wide["SPY"])
+report("ticker in wide", lambda: "SPY" in wide)
+report("missing ticker (negative cache)", lambda: "MSFT" in wide)
+
+PandasMapper.disable_mapping(wide)
+report("wide[SID] with mapping disabled", lambda: wide[sid])
+
+cache = PandasMapper.keyCache
+print(f'Symbol key cache hits: {cache.hits} misses: {cache.misses}')
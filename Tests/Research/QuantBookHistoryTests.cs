@@ -19,6 +19,9 @@ using QuantConnect.Securities;
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using NodaTime;
+using QuantConnect.Data;
+using QuantConnect.Interfaces;
 using QuantConnect.Research;
 using QuantConnect.Logging;
 
@@ -80,6 +83,49 @@ namespace QuantConnect.Tests.Research
             }
         }
 
+        [TestCase(1, 4)]
+        [TestCase(2, 2)]
+        [TestCase(10, 1)]
+        public void ChunkedQuantBookHistoryMatchesSingleHistory(int chunkDays, int expectedChunks)
+        {
+            using (Py.GIL())
+            {
+                var securityTestHistory = _module.SecurityHistoryTest(new DateTime(2013, 10, 11), SecurityType.Equity, "SPY");
+
+                var result = securityTestHistory.test_chunked_daterange(new DateTime(2013, 10, 7), new DateTime(2013, 10, 11), TimeSpan.FromDays(chunkDays));
+
+                Assert.AreEqual(expectedChunks, (int)result[0]);
+                Assert.IsTrue((bool)result[1]);
+            }
+        }
+
+        [Test]
+        public void ChunkedQuantBookHistoryDoesNotKeepEarlierChunksAlive()
+        {
+            var qb = new QuantBook();
+            var spy = qb.AddEquity("SPY").Symbol;
+            var historyProvider = new SliceTrackingHistoryProvider(qb.HistoryProvider);
+            qb.SetHistoryProvider(historyProvider);
+
+            using (Py.GIL())
+            {
+                using var chunks = qb.HistoryIter(spy.ToPython(), new DateTime(2013, 10, 7), new DateTime(2013, 10, 11), chunk: TimeSpan.FromDays(1))
+                    .GetEnumerator();
+
+                Assert.IsTrue(chunks.MoveNext());
+                // the last slice read belongs to the next chunk
+                var firstChunkSlices = historyProvider.Slices.Take(historyProvider.Slices.Count - 1).ToList();
+                Assert.IsNotEmpty(firstChunkSlices);
+
+                Assert.IsTrue(chunks.MoveNext());
+                GC.Collect();
+                GC.WaitForPendingFinalizers();
+                GC.Collect();
+
+                Assert.IsFalse(firstChunkSlices.Any(slice => slice.IsAlive));
+            }
+        }
+
         [Test]
         [TestCase(2014, 5, 9, "Nifty", "NIFTY")]
         public void CustomDataQuantBookHistoryTests(int year, int month, int day, string customDataType, string symbol)
@@ -344,5 +390,35 @@ namespace QuantConnect.Tests.Research
                 qb.GetOptionHistory(future, default(DateTime), DateTime.MaxValue, Resolution.Minute);
             });
         }
+
+        /// <summary>
+        /// Streams the slices of the underlying history provider keeping only weak references to them
+        /// </summary>
+        private class SliceTrackingHistoryProvider : HistoryProviderBase
+        {
+            private readonly IHistoryProvider _historyProvider;
+
+            public List<WeakReference> Slices { get; } = new();
+
+            public override int DataPointCount => _historyProvider.DataPointCount;
+
+            public SliceTrackingHistoryProvider(IHistoryProvider historyProvider)
+            {
+                _historyProvider = historyProvider;
+            }
+
+            public override void Initialize(HistoryProviderInitializeParameters parameters)
+            {
+            }
+
+            public override IEnumerable<Slice> GetHistory(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone)
+            {
+                foreach (var slice in _historyProvider.GetHistory(requests, sliceTimeZone))
+                {
+                    Slices.Add(new WeakReference(slice));
+                    yield return slice;
+                }
+            }
+        }
     }
 }
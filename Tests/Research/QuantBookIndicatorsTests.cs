@@ -67,6 +67,9 @@ namespace QuantConnect.Tests.Research
                 var dfBB = indicatorTest.test_bollinger_bands(symbol, startDate, endDate, Resolution.Daily);
                 Assert.IsTrue(GetDataFrameLength(dfBB) > 0);
 
+                // Tests a data point indicator over a numpy array
+                Assert.IsTrue((bool)indicatorTest.test_indicator_values(symbol, startDate, endDate, Resolution.Daily));
+
                 // Tests a bar indicator
                 var dfATR = indicatorTest.test_average_true_range(symbol, startDate, endDate, Resolution.Daily);
                 Assert.IsTrue(GetDataFrameLength(dfATR) > 0);
@@ -34,6 +34,11 @@ class SecurityHistoryTest():
         history = self.qb.History([self.symbol], start, end)
         return history[self.column].unstack(level=0)
 
+    def test_chunked_daterange(self, start, end, chunk):
+        chunks = list(self.qb.HistoryIter([self.symbol], start, end, chunk=chunk))
+        history = self.qb.History([self.symbol], start, end)
+        return len(chunks), pd.concat(chunks).equals(history)
+
 class OptionHistoryTest(SecurityHistoryTest):
     def test_daterange_overload(self, end, start = None):
         if start is None:
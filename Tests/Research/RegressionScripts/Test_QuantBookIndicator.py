@@ -21,6 +21,8 @@ from QuantConnect.Data import *
 from QuantConnect.Research import *
 from QuantConnect.Indicators import *
 
+import numpy as np
+
 class IndicatorTest():
     def __init__(self, start_date, security_type, symbol):
         self.qb = QuantBook()
@@ -40,4 +42,14 @@ class IndicatorTest():
 
     def test_on_balance_volume(self, symbol, start, end, resolution):
         ind = OnBalanceVolume(symbol)
-        return self.qb.Indicator(ind, symbol, start, end, resolution)
\ No newline at end of file
+        return self.qb.Indicator(ind, symbol, start, end, resolution)
+
+    def test_indicator_values(self, symbol, start, end, resolution):
+        wide = self.qb.WideHistory([symbol], start, end, resolution)
+        expected = wide.rolling(10).mean().values
+        # data frames and numpy arrays give the same values
+        for prices in [wide, wide.values]:
+            values = self.qb.IndicatorValues(SimpleMovingAverage(10), prices)
+            if values.shape != wide.shape or not np.allclose(values, expected, equal_nan=True):
+                return False
+        return len(wide) > 10